@@ -0,0 +1,98 @@
+"""
+Builds a synthetic Resource project with a large binary artifact (256 MB by default) in its Lifecycle directory with each copy strategy
+(see LMCTL_BUILD_COPY_STRATEGY), reporting the time taken and the bytes written to disk by the build.
+
+Bytes written counts the content of each file under the _lmctl directory of the project which does not share its inode with a source file,
+so hardlinks are not counted. Reflinked files are counted, although they share their content on disk, so "auto" on a filesystem supporting
+reflinks writes less than reported.
+
+Usage:
+    python benchmarks/build_copy_strategy.py [--size-mb 256]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from unittest.mock import patch
+from lmctl.project.source.core import Project, BuildOptions
+from lmctl.project.processes.common import BUILD_COPY_STRATEGY_ENV_VAR
+
+PROJECT_YAML = """\
+schema: '2.0'
+name: benchmark
+version: '1.0'
+type: Resource
+resource-manager: brent
+"""
+
+DESCRIPTOR_YAML = """\
+description: benchmark
+lifecycle:
+  Install: {}
+default-driver:
+  ansible:
+    selector:
+      infrastructure-type:
+      - '*'
+"""
+
+def write_file(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(content)
+
+def create_project(project_path, size_mb):
+    write_file(os.path.join(project_path, 'lmproject.yml'), PROJECT_YAML.encode())
+    write_file(os.path.join(project_path, 'Definitions', 'lm', 'resource.yaml'), DESCRIPTOR_YAML.encode())
+    write_file(os.path.join(project_path, 'Lifecycle', 'ansible', 'scripts', 'Install.yaml'), b'- hosts: all\n')
+    image_path = os.path.join(project_path, 'Lifecycle', 'images', 'image.qcow2')
+    write_file(image_path, b'')
+    with open(image_path, 'ab') as f:
+        for _ in range(size_mb):
+            f.write(os.urandom(1024 * 1024))
+
+def bytes_written(project_path):
+    workspace_path = os.path.join(project_path, '_lmctl')
+    source_inodes = set()
+    for root, dirs, names in os.walk(project_path):
+        if root == project_path and '_lmctl' in dirs:
+            dirs.remove('_lmctl')
+        for name in names:
+            source_inodes.add(os.stat(os.path.join(root, name)).st_ino)
+    written = 0
+    for root, _, names in os.walk(workspace_path):
+        for name in names:
+            stat = os.stat(os.path.join(root, name))
+            if stat.st_ino not in source_inodes:
+                written += stat.st_size
+    return written
+
+def build(project_path, strategy):
+    with patch.dict(os.environ, {BUILD_COPY_STRATEGY_ENV_VAR: strategy}):
+        start = time.perf_counter()
+        build_options = BuildOptions()
+        # Keep the compiled content, so it can be measured
+        build_options.incremental = True
+        Project(project_path).build(build_options)
+        return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size-mb', type=int, default=256)
+    args = parser.parse_args()
+    results = []
+    for strategy in ['copy', 'auto']:
+        with tempfile.TemporaryDirectory() as work_dir:
+            project_path = os.path.join(work_dir, 'benchmark')
+            create_project(project_path, args.size_mb)
+            seconds = build(project_path, strategy)
+            results.append({
+                'strategy': strategy,
+                'build_seconds': round(seconds, 3),
+                'bytes_written': bytes_written(project_path)
+            })
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures the startup time of the CLI for a number of command paths, each run (with "--help", so nothing is sent to an environment)
+in a new interpreter. Reports the median time to import the CLI and run the command, and the number of lmctl modules imported.
+
+Each path is run with commands registered lazily (as the CLI is) and with every command module imported up front first (as the CLI used to).
+
+Usage:
+    python benchmarks/cli_startup.py [--runs 10]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+COMMAND_PATHS = [
+    [],
+    ['get'],
+    ['get', 'processes'],
+    ['create', 'intent'],
+    ['project'],
+    ['project', 'build'],
+    ['pkg', 'push'],
+    ['login'],
+]
+
+RUN_SCRIPT = '''
+import sys, time, json, importlib
+start = time.perf_counter()
+if sys.argv[1] == 'eager':
+    from lmctl.cli.commands.registry import COMMAND_MODULES, TOP_LEVEL_COMMANDS
+    for module_name in COMMAND_MODULES + [import_path.partition(':')[0] for import_path, _ in TOP_LEVEL_COMMANDS]:
+        importlib.import_module(module_name)
+from lmctl.cli.entry import cli
+imported = time.perf_counter()
+try:
+    cli(sys.argv[2:] + ['--help'], prog_name='lmctl')
+except SystemExit:
+    pass
+end = time.perf_counter()
+print(json.dumps({'import': imported - start, 'total': end - start, 'modules': len([m for m in sys.modules if m.startswith('lmctl')])}))
+'''
+
+def run(mode, command_path):
+    result = subprocess.run([sys.executable, '-c', RUN_SCRIPT, mode] + command_path, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+def measure(mode, command_path, runs):
+    results = [run(mode, command_path) for _ in range(runs)]
+    return {
+        'import_seconds': round(statistics.median(r['import'] for r in results), 4),
+        'total_seconds': round(statistics.median(r['total'] for r in results), 4),
+        'lmctl_modules': results[0]['modules']
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+    results = []
+    for command_path in COMMAND_PATHS:
+        results.append({
+            'command': ' '.join(['lmctl'] + command_path),
+            'lazy': measure('lazy', command_path, args.runs),
+            'eager': measure('eager', command_path, args.runs)
+        })
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
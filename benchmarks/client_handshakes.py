@@ -0,0 +1,61 @@
+"""
+Counts the connections (TCP handshakes) opened by TNCOClient for 1,000 `descriptors.get` calls
+against a local stub server, with and without pooled sessions.
+
+Usage:
+    python benchmarks/client_handshakes.py [--calls 1000]
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from lmctl.client import TNCOClient
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        body = json.dumps({'name': 'assembly::example::1.0', 'description': 'benchmark'}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def run(calls: int, use_sessions: bool):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.lock = threading.Lock()
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = TNCOClient(f'http://127.0.0.1:{server.server_port}', use_sessions=use_sessions)
+        start = time.perf_counter()
+        for _ in range(calls):
+            client.descriptors.get('assembly::example::1.0')
+        duration = time.perf_counter() - start
+        client.close()
+        return {'use_sessions': use_sessions, 'calls': calls, 'connections': server.connections, 'seconds': round(duration, 3)}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=1000)
+    args = parser.parse_args()
+    results = [run(args.calls, use_sessions=False), run(args.calls, use_sessions=True)]
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+"""
+Times lmctl commands against a local stand-in for the CP4NA orchestration APIs (tests/common/simulations/lm_http_stub.py), so the time
+spent by lmctl itself (startup, authentication, HTTP transport and serialization) can be tracked from one version to the next.
+
+Each command is run in a new process with the lmctl CLI, so any installed version may be measured by passing its executable with --lmctl.
+Each run is given a new stub (so every push creates the same content) and an empty token cache (so every run authenticates).
+
+Operations:
+    auth            lmctl login --print, with each of legacy login, OAuth client credentials and Zen API key auth
+    get             lmctl get descriptors, listing --descriptors descriptors
+    project-push    lmctl project push of an Assembly with a Resource subproject and --behaviour configurations and tests
+    project-test    lmctl project test of the same project, running each test
+    pkg-push        lmctl pkg push of the package built from the same project
+
+Reports the median, min and max time of each operation, with the number of requests received by the stub, as JSON (for regression tracking).
+
+Usage:
+    python benchmarks/cp4na_operations.py [--runs 5] [--latency 0.005] [--payload-padding 0] [--descriptors 500] [--behaviour 10]
+                                          [--resource-kb 1024] [--certfile cert.pem --keyfile key.pem] [--lmctl /path/to/lmctl]
+                                          [--operations auth,get] [--output results.json]
+"""
+import argparse
+import json
+import os
+import platform
+import shlex
+import shutil
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tests.common.simulations.lm_http_stub import LmHttpStub, STUB_USERNAME, STUB_PASSWORD, STUB_CLIENT_ID, STUB_CLIENT_SECRET, STUB_API_KEY
+
+DEFAULT_LMCTL = [sys.executable, '-c', 'from lmctl.cli.entry import init_cli; init_cli()']
+ENVIRONMENT_NAME = 'stub'
+PROJECT_NAME = 'benchmark'
+
+CONFIG_YAML = """\
+environments:
+  {name}:
+    tnco:
+      address: {address}
+      secure: true
+      username: {username}
+      password: {password}
+"""
+
+LMPROJECT_YAML = """\
+schema: '2.0'
+name: {name}
+version: '1.0'
+type: Assembly
+contains:
+  - name: res
+    type: Resource
+    directory: res
+    resource-manager: brent2.1
+"""
+
+RESOURCE_YAML = """\
+description: generated Resource for benchmarking
+infrastructure:
+  Openstack:
+    template:
+      file: example.yaml
+default-driver:
+  ansible:
+    infrastructure-type:
+      - '*'
+"""
+
+INFRASTRUCTURE_YAML = """\
+tosca_definitions_version: tosca_simple_yaml_1_0
+description: generated infrastructure for benchmarking
+topology_template: {}
+"""
+
+
+def write_file(path, content, mode='w'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, mode) as f:
+        f.write(content)
+
+
+def generate_project(project_path, behaviour, resource_kb):
+    descriptor_name = 'assembly::{0}::1.0'.format(PROJECT_NAME)
+    write_file(os.path.join(project_path, 'lmproject.yml'), LMPROJECT_YAML.format(name=PROJECT_NAME))
+    write_file(os.path.join(project_path, 'Descriptor', 'assembly.yml'), 'description: generated Assembly for benchmarking\n')
+    for index in range(behaviour):
+        write_file(os.path.join(project_path, 'Behaviour', 'Configurations', 'config-{0}.json'.format(index)), json.dumps({
+            'name': 'config-{0}'.format(index),
+            'descriptorName': descriptor_name,
+            'properties': {'property{0}'.format(i): 'value-{0}'.format(i) for i in range(20)}
+        }, indent=2))
+        write_file(os.path.join(project_path, 'Behaviour', 'Tests', 'test-{0}.json'.format(index)), json.dumps({
+            'name': 'test-{0}'.format(index),
+            'stages': [{'name': 'Stage One', 'steps': [{'stepDefinitionName': 'Utilities::SleepForTime', 'properties': {'sleepTime': '1', 'timeUnit': 'seconds'}}]}],
+            'assemblyActors': [{'instanceName': 'actor', 'assemblyConfigurationRef': 'config-{0}'.format(index), 'initialState': 'Active', 'uninstallOnExit': True, 'provided': False}]
+        }, indent=2))
+    resource_path = os.path.join(project_path, 'Contains', 'res')
+    write_file(os.path.join(resource_path, 'Definitions', 'lm', 'resource.yml'), RESOURCE_YAML)
+    write_file(os.path.join(resource_path, 'Definitions', 'infrastructure', 'example.yaml'), INFRASTRUCTURE_YAML)
+    write_file(os.path.join(resource_path, 'Lifecycle', 'ansible', 'scripts', 'Install.yaml'), '---\n- name: Install\n  hosts: all\n  gather_facts: False\n')
+    # Random content, so the Resource package does not compress away to nothing
+    write_file(os.path.join(resource_path, 'Lifecycle', 'ansible', 'files', 'payload.bin'), os.urandom(resource_kb * 1024), mode='wb')
+
+
+class Runner:
+
+    def __init__(self, lmctl_cmd, work_dir, args):
+        self.lmctl_cmd = lmctl_cmd
+        self.work_dir = work_dir
+        self.args = args
+        self.project_path = os.path.join(work_dir, 'project')
+        self.config_path = os.path.join(work_dir, 'lmctl-config.yaml')
+        self.ssl_context = None
+        if args.certfile is not None:
+            self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            self.ssl_context.load_cert_chain(args.certfile, keyfile=args.keyfile)
+
+    def lmctl(self, cmd_args, env, check=True):
+        result = subprocess.run(self.lmctl_cmd + cmd_args, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+        if check and result.returncode != 0:
+            raise RuntimeError('lmctl {0} failed with exit code {1}:\n{2}'.format(' '.join(cmd_args), result.returncode, result.stdout[-4000:]))
+        return result
+
+    def version(self):
+        return self.lmctl(['--version'], dict(os.environ)).stdout.strip()
+
+    def __env(self, run_dir):
+        env = dict(os.environ)
+        env['LMCONFIG'] = self.config_path
+        env['LMCTL_TOKEN_CACHE_DIR'] = os.path.join(run_dir, 'tokens')
+        env['HOME'] = run_dir
+        # Allows the stub to be served over http
+        env['LMCTL_ALLOW_ALL_SCHEMES'] = 'true'
+        return env
+
+    def __new_stub(self):
+        stub = LmHttpStub(latency=self.args.latency, payload_padding=self.args.payload_padding, ssl_context=self.ssl_context).start()
+        write_file(self.config_path, CONFIG_YAML.format(name=ENVIRONMENT_NAME, address=stub.address, username=STUB_USERNAME, password=STUB_PASSWORD))
+        return stub
+
+    def measure(self, operation, prepare_stub, command_for):
+        timings = []
+        requests = None
+        for run in range(self.args.runs):
+            run_dir = tempfile.mkdtemp(dir=self.work_dir)
+            stub = self.__new_stub()
+            try:
+                prepare_stub(stub)
+                cmd_args = command_for(stub)
+                start = time.perf_counter()
+                self.lmctl(cmd_args, self.__env(run_dir))
+                timings.append(time.perf_counter() - start)
+                requests = sum(stub.request_counts.values())
+            finally:
+                stub.stop()
+                shutil.rmtree(run_dir)
+        return {
+            'operation': operation,
+            'runs': len(timings),
+            'median_seconds': round(statistics.median(timings), 4),
+            'min_seconds': round(min(timings), 4),
+            'max_seconds': round(max(timings), 4),
+            'requests': requests
+        }
+
+    def build_pkg(self):
+        self.lmctl(['project', 'build', '--project', self.project_path], dict(os.environ))
+        build_dir = os.path.join(self.project_path, '_lmctl', 'build')
+        pkg_names = [name for name in os.listdir(build_dir) if name.endswith('.tgz') or name.endswith('.csar')]
+        return os.path.join(build_dir, pkg_names[0])
+
+
+def no_preparation(stub):
+    pass
+
+
+def run_operations(runner, operations):
+    results = []
+    if 'auth' in operations:
+        results.append(runner.measure('auth-legacy', no_preparation,
+            lambda stub: ['login', stub.address, '--auth-address', stub.address, '--username', STUB_USERNAME, '--pwd', STUB_PASSWORD, '--print']))
+        results.append(runner.measure('auth-client-credentials', no_preparation,
+            lambda stub: ['login', stub.address, '--client', STUB_CLIENT_ID, '--client-secret', STUB_CLIENT_SECRET, '--print']))
+        results.append(runner.measure('auth-zen', no_preparation,
+            lambda stub: ['login', stub.address, '--zen', '--auth-address', stub.zen_auth_address, '--username', STUB_USERNAME, '--api-key', STUB_API_KEY, '--print']))
+    if 'get' in operations:
+        results.append(runner.measure('get-descriptors', lambda stub: stub.add_descriptors(runner.args.descriptors),
+            lambda stub: ['get', 'descriptors', '-e', ENVIRONMENT_NAME, '-o', 'json']))
+    if 'project-push' in operations:
+        results.append(runner.measure('project-push', no_preparation,
+            lambda stub: ['project', 'push', ENVIRONMENT_NAME, '--project', runner.project_path]))
+    if 'project-test' in operations:
+        results.append(runner.measure('project-test', no_preparation,
+            lambda stub: ['project', 'test', ENVIRONMENT_NAME, '--project', runner.project_path, '--parallel', str(max(1, runner.args.behaviour))]))
+    if 'pkg-push' in operations:
+        pkg_path = runner.build_pkg()
+        results.append(runner.measure('pkg-push', no_preparation,
+            lambda stub: ['pkg', 'push', pkg_path, ENVIRONMENT_NAME]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0.005, help='seconds added to each response of the stub')
+    parser.add_argument('--payload-padding', type=int, default=0, help='bytes added to each descriptor and item of a listing returned by the stub')
+    parser.add_argument('--descriptors', type=int, default=500, help='number of descriptors listed by the "get" operation')
+    parser.add_argument('--behaviour', type=int, default=10, help='number of behaviour configurations and tests in the project')
+    parser.add_argument('--resource-kb', type=int, default=1024, help='size of the random file included in the Resource package')
+    parser.add_argument('--certfile', default=None, help='certificate (PEM) to serve the stub over https with, so TLS handshakes are included')
+    parser.add_argument('--keyfile', default=None, help='private key of the certificate, if not included in the --certfile')
+    parser.add_argument('--lmctl', default=None, help='lmctl executable to measure (defaults to the lmctl importable by this interpreter)')
+    parser.add_argument('--operations', default='auth,get,project-push,project-test,pkg-push')
+    parser.add_argument('--output', default=None, help='also write the results to this file')
+    args = parser.parse_args()
+    lmctl_cmd = shlex.split(args.lmctl) if args.lmctl is not None else DEFAULT_LMCTL
+    operations = [operation.strip() for operation in args.operations.split(',')]
+    work_dir = tempfile.mkdtemp()
+    try:
+        runner = Runner(lmctl_cmd, work_dir, args)
+        generate_project(runner.project_path, args.behaviour, args.resource_kb)
+        report = {
+            'lmctl': runner.version(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'settings': {
+                'runs': args.runs,
+                'latency': args.latency,
+                'payload_padding': args.payload_padding,
+                'descriptors': args.descriptors,
+                'behaviour': args.behaviour,
+                'resource_kb': args.resource_kb,
+                'https': args.certfile is not None
+            },
+            'results': run_operations(runner, operations)
+        }
+    finally:
+        shutil.rmtree(work_dir)
+    output = json.dumps(report, indent=2)
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    print(output)
+
+if __name__ == '__main__':
+    main()
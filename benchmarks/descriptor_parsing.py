@@ -0,0 +1,108 @@
+"""
+Compares reading a corpus of large generated descriptors with the ruamel round-trip loader (DescriptorParser(), used where descriptors
+are re-written) against the read-only loader (DescriptorParser(read_only=True), used where they are only inspected, e.g. by push).
+
+Each descriptor has a number of properties, lifecycle transitions, operations and composed resources, so its size grows with --scale.
+Reports the median time to read the whole corpus with each parser, and the speedup of the read-only parser.
+
+Usage:
+    python benchmarks/descriptor_parsing.py [--descriptors 20] [--scale 200] [--runs 5]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import lmctl.utils.descriptors as descriptor_utils
+
+def generate_descriptor(index, scale):
+    lines = [
+        'name: assembly::benchmark-{0}::1.0'.format(index),
+        'description: generated descriptor {0} for benchmarking'.format(index),
+        'properties:'
+    ]
+    for i in range(scale):
+        lines.extend([
+            '  property{0}:'.format(i),
+            '    type: string',
+            '    description: generated property {0}'.format(i),
+            '    required: {0}'.format('true' if i % 2 == 0 else 'false'),
+            '    default: value-{0}'.format(i)
+        ])
+    lines.append('lifecycle:')
+    for transition in ['Create', 'Install', 'Configure', 'Start', 'Stop', 'Uninstall', 'Delete']:
+        lines.extend([
+            '  {0}:'.format(transition),
+            '    drivers:',
+            '      ansible:',
+            '        selector:',
+            '          infrastructure-type:',
+            '          - \'*\''
+        ])
+    lines.append('operations:')
+    for i in range(scale // 10):
+        lines.extend([
+            '  operation{0}:'.format(i),
+            '    properties:',
+            '      input{0}:'.format(i),
+            '        type: string'
+        ])
+    lines.append('composition:')
+    for i in range(scale // 4):
+        lines.extend([
+            '  resource{0}:'.format(i),
+            '    type: resource::resource-{0}::1.0'.format(i),
+            '    quantity: 1',
+            '    properties:',
+            '      deploymentLocation:',
+            '        value: ${deploymentLocation}',
+            '      property{0}:'.format(i),
+            '        value: ${{property{0}}}'.format(i)
+        ])
+    return '\n'.join(lines) + '\n'
+
+def write_corpus(directory, descriptors, scale):
+    paths = []
+    for index in range(descriptors):
+        path = os.path.join(directory, 'descriptor-{0}.yml'.format(index))
+        with open(path, 'w') as f:
+            f.write(generate_descriptor(index, scale))
+        paths.append(path)
+    return paths
+
+def measure(parser, paths, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for path in paths:
+            parser.read_from_file(path).get_name()
+        timings.append(time.perf_counter() - start)
+    return round(statistics.median(timings), 4)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--descriptors', type=int, default=20)
+    parser.add_argument('--scale', type=int, default=200)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+    corpus_dir = tempfile.mkdtemp()
+    try:
+        paths = write_corpus(corpus_dir, args.descriptors, args.scale)
+        corpus_bytes = sum(os.path.getsize(path) for path in paths)
+        round_trip_seconds = measure(descriptor_utils.DescriptorParser(), paths, args.runs)
+        read_only_seconds = measure(descriptor_utils.DescriptorParser(read_only=True), paths, args.runs)
+    finally:
+        shutil.rmtree(corpus_dir)
+    print(json.dumps({
+        'descriptors': args.descriptors,
+        'corpus_kb': round(corpus_bytes / 1024, 1),
+        'fast_loader': descriptor_utils.FastSafeLoader.__name__,
+        'round_trip_seconds': round_trip_seconds,
+        'read_only_seconds': read_only_seconds,
+        'speedup': round(round_trip_seconds / read_only_seconds, 1) if read_only_seconds > 0 else None
+    }, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Compares creating a package tgz of synthetic build content (a random, already compressed "image" of 256 MB by default and
+text files) with tarfile "w:gz" on a single core (as builds used to) against ArchiveCompression, which compresses on multiple cores
+and stores already compressed files.
+
+Reports the time taken and the size of the package produced by each.
+
+Usage:
+    python benchmarks/pkg_build_compression.py [--size-mb 256] [--workers 4] [--level 9]
+"""
+import argparse
+import json
+import os
+import tarfile
+import tempfile
+import time
+from lmctl.utils.compression import ArchiveCompression
+
+TEXT_CONTENT = b'- name: install\n  hosts: all\n  tasks:\n  - debug: msg="installing"\n'
+
+def write_content(content_dir, size_mb):
+    names = []
+    with open(os.path.join(content_dir, 'image.qcow2'), 'wb') as f:
+        for _ in range(size_mb):
+            f.write(os.urandom(1024 * 1024))
+    names.append('image.qcow2')
+    for i in range(50):
+        name = 'playbook{0}.yaml'.format(i)
+        with open(os.path.join(content_dir, name), 'wb') as f:
+            f.write(TEXT_CONTENT * 10000)
+        names.append(name)
+    return names
+
+def single_core(content_dir, names, pkg_path, level):
+    start = time.perf_counter()
+    with tarfile.open(pkg_path, mode='w:gz', compresslevel=level) as pkg_tar:
+        for name in names:
+            pkg_tar.add(os.path.join(content_dir, name), arcname=name)
+    return time.perf_counter() - start
+
+def multi_core(content_dir, names, pkg_path, level, workers):
+    start = time.perf_counter()
+    with ArchiveCompression(level=level, workers=workers).open_tgz(pkg_path) as pkg_tar:
+        for name in names:
+            pkg_tar.add(os.path.join(content_dir, name), arcname=name)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size-mb', type=int, default=256)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--level', type=int, default=9)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as work_dir:
+        content_dir = os.path.join(work_dir, 'content')
+        os.makedirs(content_dir)
+        names = write_content(content_dir, args.size_mb)
+        single_path = os.path.join(work_dir, 'single.tgz')
+        multi_path = os.path.join(work_dir, 'multi.tgz')
+        single_seconds = single_core(content_dir, names, single_path, args.level)
+        multi_seconds = multi_core(content_dir, names, multi_path, args.level, args.workers)
+        result = {
+            'level': args.level,
+            'workers': args.workers,
+            'single_core_seconds': round(single_seconds, 3),
+            'single_core_bytes': os.path.getsize(single_path),
+            'multi_core_seconds': round(multi_seconds, 3),
+            'multi_core_bytes': os.path.getsize(multi_path)
+        }
+    print(json.dumps(result, indent=2))
+
+if __name__ == '__main__':
+    main()
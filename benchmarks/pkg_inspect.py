@@ -0,0 +1,92 @@
+"""
+Compares inspecting a synthetic package (1 GB by default) by extracting it to a temporary directory (as Pkg.inspect used to)
+against reading only its meta with Pkg.inspect, for:
+
+- a tgz built with the meta as the first member (as lmctl builds them)
+- a tgz with the meta as the last member (as older versions of lmctl built them)
+- a csar
+
+Usage:
+    python benchmarks/pkg_inspect.py [--size-mb 1024]
+"""
+import argparse
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import zipfile
+from lmctl.project.package.core import Pkg
+
+META_YAML = """\
+schema: '2.0'
+name: benchmark
+version: '1.0'
+type: Resource
+resource-manager: brent
+"""
+
+def write_resource_zip(path, size_mb):
+    # Random content, so the resource does not compress away to nothing
+    with zipfile.ZipFile(path, mode='w', compression=zipfile.ZIP_STORED) as res_zip:
+        with res_zip.open('Lifecycle/image.qcow2', mode='w', force_zip64=True) as image:
+            for _ in range(size_mb):
+                image.write(os.urandom(1024 * 1024))
+
+def build_packages(work_dir, size_mb):
+    content_dir = os.path.join(work_dir, 'content')
+    os.makedirs(content_dir)
+    meta_path = os.path.join(content_dir, 'lmpkg.yml')
+    with open(meta_path, 'w') as f:
+        f.write(META_YAML)
+    res_zip_path = os.path.join(content_dir, 'benchmark.zip')
+    write_resource_zip(res_zip_path, size_mb)
+    packages = {}
+    for layout, meta_first in [('tgz-meta-first', True), ('tgz-meta-last', False)]:
+        pkg_path = os.path.join(work_dir, f'{layout}.tgz')
+        with tarfile.open(pkg_path, mode='w:gz', compresslevel=1) as pkg_tar:
+            if meta_first:
+                pkg_tar.add(meta_path, arcname='lmpkg.yml')
+            pkg_tar.add(res_zip_path, arcname='benchmark.zip')
+            if not meta_first:
+                pkg_tar.add(meta_path, arcname='lmpkg.yml')
+        packages[layout] = pkg_path
+    csar_path = os.path.join(work_dir, 'package.csar')
+    with zipfile.ZipFile(csar_path, mode='w') as pkg_zip:
+        pkg_zip.write(res_zip_path, arcname='benchmark.zip')
+        pkg_zip.write(meta_path, arcname='lmpkg.yml')
+    packages['csar'] = csar_path
+    shutil.rmtree(content_dir)
+    return packages
+
+def inspect_by_extracting(pkg_path):
+    extract_dir = tempfile.mkdtemp()
+    try:
+        return Pkg(pkg_path).open(extract_dir).inspect()
+    finally:
+        shutil.rmtree(extract_dir)
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return round(time.perf_counter() - start, 3)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size-mb', type=int, default=1024)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as work_dir:
+        packages = build_packages(work_dir, args.size_mb)
+        results = []
+        for layout, pkg_path in packages.items():
+            results.append({
+                'layout': layout,
+                'package_mb': round(os.path.getsize(pkg_path) / (1024 * 1024)),
+                'extract_seconds': timed(inspect_by_extracting, pkg_path),
+                'inspect_seconds': timed(lambda path: Pkg(path).inspect(), pkg_path)
+            })
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
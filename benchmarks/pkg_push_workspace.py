@@ -0,0 +1,106 @@
+"""
+Compares preparing a synthetic Resource package (1 GB by default) for a push by extracting it to a temporary directory
+(as Pkg.push used to) against expanding it into a push workspace, which leaves the Resource package in the archive, then reading
+the Resource package as it would be uploaded, for both a tgz and a csar.
+
+Reports the time taken and the bytes written to disk by each.
+
+Usage:
+    python benchmarks/pkg_push_workspace.py [--size-mb 1024]
+"""
+import argparse
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import zipfile
+from lmctl.project.package.core import Pkg
+from lmctl.project.package.workspace import PushWorkspace, ArchiveContentFiles
+
+READ_SIZE = 1024 * 1024
+
+META_YAML = """\
+schema: '2.0'
+name: benchmark
+version: '1.0'
+type: Resource
+resource-manager: brent2.1
+"""
+
+def write_resource_zip(path, size_mb):
+    # Random content, so the resource does not compress away to nothing
+    with zipfile.ZipFile(path, mode='w', compression=zipfile.ZIP_STORED) as res_zip:
+        with res_zip.open('Lifecycle/image.qcow2', mode='w', force_zip64=True) as image:
+            for _ in range(size_mb):
+                image.write(os.urandom(1024 * 1024))
+
+def build_packages(work_dir, size_mb):
+    content_dir = os.path.join(work_dir, 'content')
+    os.makedirs(content_dir)
+    with open(os.path.join(content_dir, 'lmpkg.yml'), 'w') as f:
+        f.write(META_YAML)
+    with open(os.path.join(content_dir, 'resource.yaml'), 'w') as f:
+        f.write('name: resource::benchmark::1.0\n')
+    write_resource_zip(os.path.join(content_dir, 'benchmark.zip'), size_mb)
+    tgz_path = os.path.join(work_dir, 'package.tgz')
+    with tarfile.open(tgz_path, mode='w:gz', compresslevel=1) as pkg_tar:
+        for name in ['lmpkg.yml', 'resource.yaml', 'benchmark.zip']:
+            pkg_tar.add(os.path.join(content_dir, name), arcname=name)
+    csar_path = os.path.join(work_dir, 'package.csar')
+    with zipfile.ZipFile(csar_path, mode='w') as pkg_zip:
+        for name in ['lmpkg.yml', 'resource.yaml', 'benchmark.zip']:
+            pkg_zip.write(os.path.join(content_dir, name), arcname=name)
+    shutil.rmtree(content_dir)
+    return {'tgz': tgz_path, 'csar': csar_path}
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+def read_fully(res_pkg):
+    while res_pkg.read(READ_SIZE):
+        pass
+
+def extract(pkg_path):
+    extract_dir = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        pkg_content = Pkg(pkg_path).open(extract_dir)
+        with open(os.path.join(pkg_content.tree.root_path, 'benchmark.zip'), 'rb') as res_pkg:
+            read_fully(res_pkg)
+        return time.perf_counter() - start, directory_size(extract_dir)
+    finally:
+        shutil.rmtree(extract_dir)
+
+def stream(pkg_path):
+    with PushWorkspace() as workspace:
+        start = time.perf_counter()
+        content_files = ArchiveContentFiles(pkg_path, workspace)
+        content_files.expand()
+        with content_files.open(os.path.join(workspace.path, 'benchmark.zip')) as res_pkg:
+            read_fully(res_pkg)
+        return time.perf_counter() - start, directory_size(workspace.path)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size-mb', type=int, default=1024)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as work_dir:
+        packages = build_packages(work_dir, args.size_mb)
+        results = []
+        for layout, pkg_path in packages.items():
+            extract_seconds, extract_bytes = extract(pkg_path)
+            stream_seconds, stream_bytes = stream(pkg_path)
+            results.append({
+                'layout': layout,
+                'package_mb': round(os.path.getsize(pkg_path) / (1024 * 1024)),
+                'extract_seconds': round(extract_seconds, 3),
+                'extract_bytes_written': extract_bytes,
+                'workspace_seconds': round(stream_seconds, 3),
+                'workspace_bytes_written': stream_bytes
+            })
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
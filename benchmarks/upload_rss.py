@@ -0,0 +1,94 @@
+"""
+Measures the peak RSS of pushing a large synthetic resource package (2 GB by default) with
+LmResourcePkgDriver.onboard_package to a local stub server, which reads and discards the upload.
+
+Each upload runs in its own process, so the peak RSS of one does not hide the other.
+With --compare-legacy, the package is also uploaded with requests "files=", which builds the whole multipart body in memory.
+
+Usage:
+    python benchmarks/upload_rss.py [--size-mb 2048] [--compare-legacy]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+READ_SIZE = 1024 * 1024
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        remaining = int(self.headers.get('Content-Length', 0))
+        while remaining > 0:
+            chunk = self.rfile.read(min(READ_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            self.server.bytes_received += len(chunk)
+        self.send_response(201)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+def upload(mode: str, package_path: str):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.bytes_received = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    address = f'http://127.0.0.1:{server.server_port}'
+    try:
+        start = time.perf_counter()
+        if mode == 'legacy':
+            import requests
+            with open(package_path, 'rb') as package:
+                response = requests.post(f'{address}/api/resource-manager/resource-packages', files={'file': package})
+            response.raise_for_status()
+        else:
+            from lmctl.drivers.lm import LmResourcePkgDriver
+            LmResourcePkgDriver(address).onboard_package(package_path)
+        duration = time.perf_counter() - start
+        return {'mode': mode, 'package_mb': round(os.path.getsize(package_path) / (1024 * 1024)), 'bytes_received': server.bytes_received,
+                'peak_rss_mb': peak_rss_mb(), 'seconds': round(duration, 3)}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def run_in_subprocess(mode: str, package_path: str):
+    output = subprocess.check_output([sys.executable, __file__, '--child', mode, '--package', package_path])
+    return json.loads(output)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size-mb', type=int, default=2048)
+    parser.add_argument('--compare-legacy', action='store_true')
+    parser.add_argument('--child', choices=['streaming', 'legacy'], help=argparse.SUPPRESS)
+    parser.add_argument('--package', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child is not None:
+        print(json.dumps(upload(args.child, args.package)))
+        return
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        package_path = os.path.join(tmp_dir, 'synthetic-package.zip')
+        # A sparse file, so creating it is quick and does not need the disk space
+        with open(package_path, 'wb') as package:
+            package.truncate(args.size_mb * 1024 * 1024)
+        modes = ['streaming', 'legacy'] if args.compare_legacy else ['streaming']
+        results = [run_in_subprocess(mode, package_path) for mode in modes]
+    print(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
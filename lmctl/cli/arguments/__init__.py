@@ -5,4 +5,5 @@ from .set_param import *
 from .ignore_missing import *
 from .tnco_secrets import *
 from .output_file import *
-from .object_group import *
\ No newline at end of file
+from .object_group import *
+from .wait import *
\ No newline at end of file
@@ -1,10 +1,11 @@
 import click
 from typing import Sequence, Any
-from lmctl.cli.format import OutputFormat, Table, Column, JsonFormat, YamlFormat, TableFormat
+from lmctl.cli.format import OutputFormat, Table, Column, JsonFormat, YamlFormat, TableFormat, NdjsonFormat
 
 JSON_VALUE = 'json'
 YAML_VALUE = 'yaml'
 TABLE_VALUE = 'table'
+NDJSON_VALUE = 'ndjson'
 
 __all__ = (
     'OutputFormatOption',
@@ -21,6 +22,7 @@ class OutputFormatOption(click.Option):
             default: str = None,
             show_default: bool = True,
             default_columns: Sequence[Column] = None,
+            allow_ndjson: bool = False,
             **kwargs):
         param_decls = [p for p in param_decls]
 
@@ -28,6 +30,8 @@ class OutputFormatOption(click.Option):
             YAML_VALUE: YamlFormat(),
             JSON_VALUE: JsonFormat()
         }
+        if allow_ndjson:
+            self.formatters[NDJSON_VALUE] = NdjsonFormat()
         if default_columns is not None:
             self.formatters[TABLE_VALUE] = TableFormat(table=Table(default_columns))
         if default is None:
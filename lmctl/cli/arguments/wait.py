@@ -0,0 +1,42 @@
+import click
+from typing import Sequence
+
+__all__ = (
+    'WaitOption',
+    'WaitTimeoutOption',
+    'WAIT_PARAM_NAME',
+    'WAIT_TIMEOUT_PARAM_NAME',
+)
+
+WAIT_PARAM_NAME = 'wait'
+WAIT_TIMEOUT_PARAM_NAME = 'timeout'
+
+class WaitOption(click.Option):
+
+    def __init__(
+            self, 
+            param_decls: Sequence[str] = ['--wait'],
+            help: str = 'Wait for the resulting process to finish, exiting with an error if it does not complete successfully', 
+            **kwargs):
+        param_decls = [p for p in param_decls]
+        super().__init__(
+            param_decls,
+            is_flag=True,
+            help=help,
+            **kwargs
+        )
+
+class WaitTimeoutOption(click.Option):
+
+    def __init__(
+            self, 
+            param_decls: Sequence[str] = ['--timeout'],
+            help: str = 'Maximum number of seconds to wait for processes to finish (waits indefinitely by default)', 
+            **kwargs):
+        param_decls = [p for p in param_decls]
+        super().__init__(
+            param_decls,
+            type=click.FloatRange(min=0),
+            help=help,
+            **kwargs
+        )
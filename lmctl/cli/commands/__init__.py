@@ -1,33 +1,34 @@
-from .env import env as env_group
-from .pkg import pkg as pkg_group
-from .project import project as project_group
-from .deployment_location import deployment as deployment_group
-from .resourcedriver import resourcedriver as resourcedriver_group
-from .infrastructure_key import key as key_group
-from .lifecycledriver import lifecycledriver as lifecycledriver_group
-from .vimdriver import vimdriver as vimdriver_group
-from .login import login as login_cmd
-from .logdir import logdir as logdir_cmd
-from .whoami import whoami as whoami_cmd
+import importlib
+import importlib.util
 
 # Actions
 from .actions import *
-from .assemblies import *
-from .assembly_components import *
-from .behaviour_assembly_configurations import *
-from .behaviour_projects import *
-from .behaviour_scenarios import *
-from .resource_cluster import *
-from .config import *
-from .deployment_location import *
-from .descriptors import *
-from .descriptor_templates import *
-from .env import *
-from .infrastructure_key import *
-from .intents import *
-from .processes import *
-from .permission_type import *
-from .resourcedriver import *
-from .resource_managers import *
-from .resource_packages import *
-from .object_groups import *
\ No newline at end of file
+
+# Command modules are imported when first used (see registry.py), rather than with this package, so the CLI starts quickly.
+# The names this package used to import from them are still available
+_GROUPS = {
+    'env_group': ('.env', 'env'),
+    'pkg_group': ('.pkg', 'pkg'),
+    'project_group': ('.project', 'project'),
+    'deployment_group': ('.deployment_location', 'deployment'),
+    'resourcedriver_group': ('.resourcedriver', 'resourcedriver'),
+    'key_group': ('.infrastructure_key', 'key'),
+    'lifecycledriver_group': ('.lifecycledriver', 'lifecycledriver'),
+    'vimdriver_group': ('.vimdriver', 'vimdriver'),
+    'login_cmd': ('.login', 'login'),
+    'logdir_cmd': ('.logdir', 'logdir'),
+    'whoami_cmd': ('.whoami', 'whoami'),
+}
+
+def __getattr__(name):
+    if name in _GROUPS:
+        module_name, attribute = _GROUPS[name]
+        return getattr(importlib.import_module(module_name, __name__), attribute)
+    # Leave submodules to be imported as normal
+    if not name.startswith('__') and importlib.util.find_spec(f'{__name__}.{name}') is None:
+        from .registry import COMMAND_MODULES
+        for module_name in COMMAND_MODULES:
+            module = importlib.import_module(module_name)
+            if name in getattr(module, '__all__', ()):
+                return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
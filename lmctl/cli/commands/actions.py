@@ -80,6 +80,10 @@ def update():
 def use():
     pass
 
+@action_group(help='Wait for processes or other supported objects')
+def wait():
+    pass
+
 
 
 # Get all groups in this module, except base classes such as SuperGroup
@@ -70,7 +70,8 @@ The request can include the following parameters:
 @tnco_builder.make_create_command(
     result_prefix=accepted_process_prefix,
     additional_help=create_help_str,
-    allow_object_group=True
+    allow_object_group=True,
+    allow_wait=True
 )
 @set_param_option('--prop', 'prop_values', help='Directly set a property passed to the request')
 def create_assembly(tnco_client: TNCOClient, obj: Dict[str, Any], prop_values: Dict[str, Any] = None, object_group_id: str = None):
@@ -96,7 +97,8 @@ The request can include the following parameters:
     identifiers=[id_opt, name_arg],
     result_prefix=accepted_process_prefix,
     additional_help=update_help_str,
-    allow_patch=False
+    allow_patch=False,
+    allow_wait=True
 )
 @click.argument(name_arg.param_name, required=False)
 @click.option(*id_opt.param_opts, help='Reference the target Assembly by ID instead of name')
@@ -131,7 +133,7 @@ def get_assembly(tnco_client: TNCOClient, identity: Identity, object_group_id: s
     if identifier_param_used == name_contains_opt.param_name:
         return api.all_with_name_containing(identity.value, object_group_id=object_group_id).get('assemblies', [])
     elif identifier_param_used == top_N_opt.param_name:
-        return api.get_topN(object_group_id=object_group_id)
+        return api.iter_topN(object_group_id=object_group_id)
     elif identifier_param_used == id_opt.param_name:
         return api.get(identity.value)
     else:
@@ -146,7 +148,8 @@ def missing_detector(e: Exception) -> Tuple[bool, str]:
 @tnco_builder.make_delete_command(
     identifiers=[name_arg, id_opt],
     missing_detector=missing_detector,
-    result_prefix=accepted_process_prefix
+    result_prefix=accepted_process_prefix,
+    allow_wait=True
 )
 @click.argument(name_arg.param_name, required=False)
 @click.option(*id_opt.param_opts, help='Reference the target Assembly by ID instead of name')
@@ -66,7 +66,8 @@ def build_heal(tnco_builder, a_or_an = 'a', help_prefix_extra = ''):
         additional_identifiers={
             'assembly_identity': (True, [assembly_name_opt, assembly_id_opt])
         },
-        pass_file_content=True
+        pass_file_content=True,
+        allow_wait=True
     )
     @click.argument(name_arg.param_name, required=False)
     @click.option(*id_opt.param_opts, help=f'Reference the target {tnco_builder.display_name} by ID instead of name/metric key')
@@ -103,6 +104,7 @@ def build_heal(tnco_builder, a_or_an = 'a', help_prefix_extra = ''):
 
         process_id = tnco_client.assemblies.intent_heal(obj)
         io.print(f'{accepted_process_prefix}{process_id}')
+        return process_id
 
     return do_heal
 
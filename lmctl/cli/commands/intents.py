@@ -1,9 +1,11 @@
 import click
 from .assemblies import accepted_process_prefix
 from .actions import create
-from .utils import TNCOCommandBuilder, pass_io, shallow_merge_objs
+from .utils import TNCOCommandBuilder, pass_io, shallow_merge_objs, wait_for_processes
 from lmctl.client import TNCOClient
-from lmctl.cli.arguments import set_param_option
+from lmctl.client.bulk_intents import DEFAULT_INTENT_CONCURRENCY
+from lmctl.cli.arguments import set_param_option, output_format_option, WaitOption, WaitTimeoutOption
+from lmctl.cli.format import Column, OutputFormat, TableFormat
 from lmctl.cli.io import IOController
 from typing import Dict, Any
 
@@ -39,6 +41,30 @@ def generate_intent(intent_type: str):
         intent['clusterName'] = 'cluster-to-scale'
     return intent
 
+def _failure_reason(result: Dict[str, Any]) -> str:
+    if result.get('error') is not None:
+        return result['error']
+    if result.get('waitError') is not None:
+        return result['waitError']
+    if result.get('processStatus') not in (None, 'Completed'):
+        return result.get('statusReason')
+    return None
+
+bulk_columns = [
+    Column('index', header='#'),
+    Column('intentType', header='Intent'),
+    Column('assemblyName', header='Assembly'),
+    Column('processId', header='Process'),
+    Column('processStatus', header='Status'),
+    Column('error', header='Error', accessor=_failure_reason),
+]
+
+def _validate_rate_limit(ctx: click.Context, param: click.Parameter, value: float) -> float:
+    # click.FloatRange(min_open=True) is only available from click 8
+    if value is not None and value <= 0:
+        raise click.BadParameter(f'must be greater than 0 but was: {value}', ctx=ctx, param=param)
+    return value
+
 @tnco_builder.make_general_command(
     group=create,
     short_help=f'Request an intent of any type on an Assembly',
@@ -48,16 +74,64 @@ def generate_intent(intent_type: str):
         \n\nThe properties of a request depend on the type of intent being performed.\
         \n\nKnown types: createAssembly, changeAssemblyState, upgradeAssembly, deleteAssembly, healAssembly, scaleOutAssembly, scaleInAssembly, adoptAssembly
         \n\nNote: your chosen type is not validated against this list so if a new type of intent has been added in CP4NA, this command is still usable
+        \n\nTo request many intents at once, use "-f, --file" with a manifest including an "intents" list, each entry an intent request with an "intentType" attribute. \
+        Up to "--concurrency" intents are submitted at once sharing one authenticated session with the environment, and the outcome of each is reported in one result (see "-o, --output")
     ''',
     pass_file_content=True,
     allow_object_group=True
 )
 @set_param_option()
+@click.option('--concurrency', type=click.IntRange(min=1), default=DEFAULT_INTENT_CONCURRENCY, show_default=True, help='Maximum number of intents from a manifest submitted at once')
+@click.option('--rate-limit', type=float, callback=_validate_rate_limit, help='Maximum number of intents from a manifest submitted each second (no limit by default)')
+@click.option('--wait', cls=WaitOption, help='Wait for the resulting process (or all processes, when using a manifest) to finish, exiting with an error if any do not complete successfully')
+@click.option('--timeout', cls=WaitTimeoutOption)
+@output_format_option(default_columns=bulk_columns, help='Format of the result when using a manifest')
 @pass_io
-def create_intent(tnco_client: TNCOClient, io: IOController, obj: Dict[str, Any], set_values: Dict[str, Any], object_group_id: str = None):
+def create_intent(
+        tnco_client: TNCOClient, 
+        io: IOController, 
+        obj: Dict[str, Any], 
+        set_values: Dict[str, Any], 
+        concurrency: int,
+        rate_limit: float,
+        wait: bool,
+        timeout: float,
+        output_format: OutputFormat,
+        object_group_id: str = None
+    ):
+    if 'intents' in obj:
+        if set_values is not None and len(set_values) > 0:
+            raise click.UsageError(message='Do not use "--set" with a manifest of intents', ctx=click.get_current_context())
+        intents = obj.get('intents')
+        if not isinstance(intents, list):
+            raise click.UsageError(message='"intents" in contents of "-f, --file" must be a list', ctx=click.get_current_context())
+        _submit_manifest(tnco_client, io, intents, concurrency, rate_limit, wait, timeout, output_format, object_group_id)
+        return
     intent_request = shallow_merge_objs(obj, set_values)
     intent_name = intent_request.pop('intentType', None)
     if intent_name is None:
         raise click.UsageError(message='Must include "intentType" in contents of "-f, --file" or with "--set intentType=<type>"', ctx=click.get_current_context())
     process_id = tnco_client.assemblies.intent(intent_name, intent_request, object_group_id=object_group_id)
     io.print(f'{accepted_process_prefix}{process_id}')
+    if wait:
+        wait_for_processes(tnco_client, [process_id], timeout=timeout)
+
+def _submit_manifest(tnco_client: TNCOClient, io: IOController, intents, concurrency: int, rate_limit: float, wait: bool, timeout: float, output_format: OutputFormat, object_group_id: str):
+    results = tnco_client.assemblies.submit_intents(
+        intents, 
+        concurrency=concurrency, 
+        rate_limit=rate_limit, 
+        object_group_id=object_group_id, 
+        wait=wait, 
+        wait_timeout=timeout
+    )
+    if isinstance(output_format, TableFormat):
+        io.print(output_format.convert_list([r.to_dict() for r in results]))
+    else:
+        io.print(output_format.convert_element(results.to_dict()))
+    if not results.succeeded:
+        msg = f'Error: {len(results.failed)} of {len(results)} intent(s) did not succeed'
+        if results.timed_out:
+            msg += f' (timed out after {timeout} seconds waiting for processes)'
+        io.print_error(msg)
+        exit(1)
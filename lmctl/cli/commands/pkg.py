@@ -1,9 +1,8 @@
 import click
 import logging
-import shutil
-import os
 import lmctl.cli.lifecycle as lifecycle_cli
 import lmctl.project.package.core as pkgs
+import lmctl.project.ledger as push_ledger
 from lmctl.cli.controller import get_global_controller
 from lmctl.cli.format import determine_format_class
 from .utils.object_groups import object_group_options
@@ -26,21 +25,20 @@ PUSH_HEADER = 'Push'
 @click.option('--armname', default='defaultrm', help='if using ansible-rm packaging the name of ARM to upload Resources to must be provided')
 @click.option('--pwd', '--api-key', default=None, help='password/api_key used for authenticating with CP4NA orchestration. Only required if the environment is secure and a username has been included in your configuration file with no password (api_key when using auth_mode=zen)')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
+@click.option('--parallel', 'parallelism', default=1, type=click.IntRange(min=1), show_default=True, help='number of subprojects, and behaviour configurations or scenarios of each project, to push concurrently')
+@click.option('--changed-only', default=False, is_flag=True, help='skip descriptors, behaviour and Resource packages unchanged since they were last pushed to the environment from this machine')
 @object_group_options()
-def push(package, environment, config, armname, pwd, autocorrect, object_group_name = None, object_group_id = None):
+def push(package, environment, config, armname, pwd, autocorrect, parallelism, changed_only, object_group_name = None, object_group_id = None):
     """Pushes an existing Assembly/Resource package to a target CP4NA orchestration (and ARM) environment"""
     logger.debug('Pushing package at: {0}'.format(package))
-    pkg, pkg_content = lifecycle_cli.get_pkg_and_open(package)
-    try:
-        env_sessions = lifecycle_cli.build_sessions_for_pkg(pkg_content.meta, environment, pwd, armname, config)
-        ctl = get_global_controller(override_config_path=config)
-        tnco_client = ctl.get_tnco_client(environment_group_name=environment, input_pwd=pwd)
-        object_group_id = lifecycle_cli.resolve_object_group(tnco_client, object_group_id, object_group_name)
-        controller = lifecycle_cli.ExecutionController(PUSH_HEADER)
-        controller.start(package)
-        exec_push(controller, pkg, env_sessions, allow_autocorrect=autocorrect, object_group_id=object_group_id)
-    finally:
-        cleanup_pkg(pkg_content)
+    pkg, pkg_meta = lifecycle_cli.get_pkg_and_read_meta(package)
+    env_sessions = lifecycle_cli.build_sessions_for_pkg(pkg_meta, environment, pwd, armname, config)
+    ctl = get_global_controller(override_config_path=config)
+    tnco_client = ctl.get_tnco_client(environment_group_name=environment, input_pwd=pwd)
+    object_group_id = lifecycle_cli.resolve_object_group(tnco_client, object_group_id, object_group_name)
+    controller = lifecycle_cli.ExecutionController(PUSH_HEADER)
+    controller.start(package)
+    exec_push(controller, pkg, env_sessions, allow_autocorrect=autocorrect, object_group_id=object_group_id, parallelism=parallelism, changed_only=changed_only)
     controller.finalise()
 
 
@@ -50,17 +48,10 @@ def push(package, environment, config, armname, pwd, autocorrect, object_group_n
 @click.option('-f', '--format', 'output_format', default='yaml', help='format of output [yaml, json]')
 def inspect(package, config, output_format):
     logger.debug('Inspecting package at: {0}'.format(package))
-    pkg_content = lifecycle_cli.open_pkg(package)
-    try:
-        inspection_report = pkg_content.inspect()
-        result = format_inspection_report(output_format, inspection_report)
-        click.echo(result)
-    finally:
-        cleanup_pkg(pkg_content)
-    
-def cleanup_pkg(pkg):
-    if os.path.exists(pkg.tree.root_path):
-        shutil.rmtree(pkg.tree.root_path)
+    # Only the meta is read from the package, nothing is extracted
+    inspection_report = lifecycle_cli.inspect_pkg(package)
+    result = format_inspection_report(output_format, inspection_report)
+    click.echo(result)
 
 def format_inspection_report(output_format, inspection_report):
     inspection_report_tpl = inspection_report.to_dict()
@@ -69,9 +60,12 @@ def format_inspection_report(output_format, inspection_report):
     result = formatter.convert_element(inspection_report_tpl)
     return result
 
-def exec_push(controller, pkg, env_sessions, allow_autocorrect=False, object_group_id=None):
+def exec_push(controller, pkg, env_sessions, allow_autocorrect=False, object_group_id=None, parallelism=1, changed_only=False):
     push_options = pkgs.PushOptions()
     push_options.object_group_id = object_group_id
+    push_options.parallelism = parallelism
+    push_options.changed_only = changed_only
+    push_options.push_ledger = push_ledger.PushLedger.for_environment(env_sessions.lm.env, existing_only=not changed_only)
     push_options.allow_autocorrect = allow_autocorrect
     push_options.journal_consumer = controller.consumer
     return controller.execute(pkg.push, env_sessions, push_options)
@@ -1,16 +1,18 @@
 import click
-from .utils import TNCOCommandBuilder, Identity, Identifier, pass_io
-from .actions import get, retry, rollback, cancel
+from .utils import TNCOCommandBuilder, Identity, Identifier, pass_io, wait_for_processes
+from .actions import get, retry, rollback, cancel, wait
 from lmctl.client import TNCOClient
 from lmctl.cli.format import Column
 from typing import List
 from lmctl.cli.io import IOController
+from lmctl.cli.arguments import WaitTimeoutOption
 
 __all__ = (
     'get_process',
     'retry_process',
     'rollback_process',
     'cancel_process',
+    'wait_process',
 )
 
 tnco_builder = TNCOCommandBuilder(
@@ -86,7 +88,7 @@ def get_process(
         query_params['intentTypes'] = ','.join(intent_types)
     if limit is not None:
         query_params['limit'] = limit
-    return api.query(object_group_id=object_group_id, **query_params)
+    return api.iter_query(object_group_id=object_group_id, **query_params)
 
 accepted_process_prefix = 'Accepted -'
 
@@ -173,4 +175,26 @@ def cancel_process(
     obj["processId"] = identity.value
     response = tnco_client.assemblies.intent_cancel(obj)
     io.print(f'{accepted_process_prefix} Cancel request for process: {identity.value}')
-    return
\ No newline at end of file
+    return
+
+wait_help_suffix = f'''\
+Status changes of each {tnco_builder.display_name} are printed as they are seen. Exits with an error if any {tnco_builder.display_name} does not reach the "Completed" status
+or the "--timeout" is reached before they all finish.
+\n\nWait for processes by ID: lmctl wait {tnco_builder.singular} 6ad3327e-79df-464f-af48-3283f871584d 9a8d7a05-4d19-4b2e-8b8b-d2b6e7c2d1b0 --timeout 600
+'''
+
+@tnco_builder.make_general_command(
+    group=wait,
+    short_help=f'Wait for one or more Processes to finish',
+    help_prefix=f'Wait for one or more Processes to finish',
+    help_suffix=wait_help_suffix,
+    allow_file_input=False
+)
+@click.argument('ids', nargs=-1, required=True)
+@click.option('--timeout', cls=WaitTimeoutOption)
+def wait_process(
+        tnco_client: TNCOClient,
+        ids: List[str],
+        timeout: float = None
+        ):
+    wait_for_processes(tnco_client, ids, timeout=timeout)
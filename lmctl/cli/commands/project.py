@@ -3,6 +3,7 @@ import click
 import logging
 import os
 import lmctl.project.package.core as pkgs
+import lmctl.project.ledger as push_ledger
 import lmctl.project.source.core as project_sources
 import lmctl.project.source.creator as creator
 import lmctl.project.types as project_types
@@ -41,33 +42,51 @@ def exec_validate(controller, project, allow_autocorrect=False):
     return validation_result
 
 
-def exec_build(controller, project, allow_autocorrect=False):
+def exec_build(controller, project, allow_autocorrect=False, incremental=False, compression_level=None):
     build_options = project_sources.BuildOptions()
     build_options.allow_autocorrect = allow_autocorrect
+    build_options.incremental = incremental
+    build_options.compression_level = compression_level
     build_options.journal_consumer = controller.consumer
     build_result = controller.execute(project.build, build_options)
     controller.process_validation_result(build_result.validation_result)
     return build_result
 
 
-def exec_push(controller, pkg, env_sessions, object_group_id = None):
+def exec_build_recursive(controller, root_path, allow_autocorrect=False, incremental=False, compression_level=None, parallelism=None):
+    build_options = project_sources.RecursiveBuildOptions()
+    build_options.allow_autocorrect = allow_autocorrect
+    build_options.incremental = incremental
+    build_options.compression_level = compression_level
+    build_options.parallelism = parallelism
+    build_options.journal_consumer = controller.consumer
+    build_result = controller.execute(project_sources.Project.build_recursive, root_path, build_options)
+    controller.process_recursive_build_result(build_result)
+    return build_result
+
+
+def exec_push(controller, pkg, env_sessions, object_group_id = None, parallelism = 1, changed_only = False):
     push_options = pkgs.PushOptions()
     push_options.object_group_id = object_group_id
+    push_options.parallelism = parallelism
+    push_options.changed_only = changed_only
+    push_options.push_ledger = push_ledger.PushLedger.for_environment(env_sessions.lm.env, existing_only=not changed_only)
     push_options.journal_consumer = controller.consumer
     return controller.execute(pkg.push, env_sessions, push_options)
 
 
-def exec_test(controller, pkg_content, env_sessions, tests):
-    test_options = pkgs.TestOptions(tests)
+def exec_test(controller, pkg_content, env_sessions, tests, parallelism = 1):
+    test_options = pkgs.TestOptions(tests, parallelism=parallelism)
     test_options.journal_consumer = controller.consumer
     test_report = controller.execute(pkg_content.test, env_sessions, test_options)
     controller.process_test_report(test_report)
 
 
-def exec_pull(controller, project, env_sessions):
+def exec_pull(controller, project, env_sessions, parallelism = 1):
     pull_options = project_sources.PullOptions()
+    pull_options.parallelism = parallelism
     pull_options.journal_consumer = controller.consumer
-    controller.execute(project.pull, env_sessions, pull_options)
+    return controller.execute(project.pull, env_sessions, pull_options)
 
 
 @project.command(help='Validate sources of a Project')
@@ -86,13 +105,24 @@ def validate(project_path, autocorrect):
 @project.command(help='Build distributable package for Project')
 @click.option('--project', 'project_path',  default='./', help='File location of project')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
-def build(project_path, autocorrect):
+@click.option('--incremental', default=False, is_flag=True, help='only stage and compile the sources of the project, and each subproject, changed since the last incremental build')
+@click.option('--compression-level', default=None, type=click.IntRange(min=0, max=9), help='compression level (0-9) of the package and the Resource packages/CSARs within it, 0 stores all content uncompressed')
+@click.option('--recursive', 'recursive_root', default=None, help='build every project found under this directory (instead of the project at --project), skipping any with inputs unchanged since their last recursive build')
+@click.option('--parallel', 'parallelism', default=None, type=click.IntRange(min=1), help='number of projects to build concurrently with --recursive, each in its own process (defaults to the number of CPUs)')
+def build(project_path, autocorrect, incremental, compression_level, recursive_root, parallelism):
     """Builds an Assembly/Resource project"""
+    if recursive_root is not None:
+        logger.debug('Building projects under: {0}'.format(recursive_root))
+        controller = lifecycle_cli.ExecutionController(BUILD_HEADER)
+        controller.start('Projects under {0}'.format(recursive_root))
+        exec_build_recursive(controller, recursive_root, allow_autocorrect=autocorrect, incremental=incremental, compression_level=compression_level, parallelism=parallelism)
+        controller.finalise()
+        return
     logger.debug('Building project at: {0}'.format(project_path))
     project = lifecycle_cli.open_project(project_path)
     controller = lifecycle_cli.ExecutionController(BUILD_HEADER)
     controller.start('{0} at {1}'.format(project.config.name, project_path))
-    exec_build(controller, project, allow_autocorrect=autocorrect)
+    exec_build(controller, project, allow_autocorrect=autocorrect, incremental=incremental, compression_level=compression_level)
     controller.finalise()
 
 
@@ -103,8 +133,10 @@ def build(project_path, autocorrect):
 @click.option('--armname', default='defaultrm', help='if using ansible-rm packaging the name of ARM to upload Resources must be provided')
 @click.option('--pwd', '--api-key', default=None, help='password/api_key used for authenticating with CP4NA orchestration. Only required if the environment is secure and a username has been included in your configuration file with no password (api_key when using auth_mode=zen)')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
+@click.option('--parallel', 'parallelism', default=1, type=click.IntRange(min=1), show_default=True, help='number of subprojects, and behaviour configurations or scenarios of each project, to push concurrently')
+@click.option('--changed-only', default=False, is_flag=True, help='skip descriptors, behaviour and Resource packages unchanged since they were last pushed to the environment from this machine')
 @object_group_options()
-def push(project_path, environment, config, armname, pwd, autocorrect, object_group_name = None, object_group_id = None):
+def push(project_path, environment, config, armname, pwd, autocorrect, parallelism, changed_only, object_group_name = None, object_group_id = None):
     """Push an Assembly/Resource project"""
     logger.debug('Pushing project at: {0}'.format(project_path))
     project = lifecycle_cli.open_project(project_path)
@@ -116,7 +148,7 @@ def push(project_path, environment, config, armname, pwd, autocorrect, object_gr
     controller = lifecycle_cli.ExecutionController(PUSH_HEADER)
     controller.start('{0} at {1}'.format(project.config.name, project_path))
     build_result = exec_build(controller, project, allow_autocorrect=autocorrect)
-    exec_push(controller, build_result.pkg, env_sessions, object_group_id=object_group_id)
+    exec_push(controller, build_result.pkg, env_sessions, object_group_id=object_group_id, parallelism=parallelism, changed_only=changed_only)
     controller.finalise()
 
 def __parse_tests_option(tests):
@@ -134,8 +166,9 @@ def __parse_tests_option(tests):
 @click.option('--tests', default=None, help='specify comma separated list of individual tests to execute')
 @click.option('--pwd', '--api-key', default=None, help='password/api_key used for authenticating with CP4NA orchestration. Only required if the environment is secure and a username has been included in your configuration file with no password (api_key when using auth_mode=zen)')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
+@click.option('--parallel', 'parallelism', default=1, type=click.IntRange(min=1), show_default=True, help='number of tests to execute concurrently')
 @object_group_options()
-def test(project_path, environment, config, armname, tests, pwd, autocorrect, object_group_name = None, object_group_id = None):
+def test(project_path, environment, config, armname, tests, pwd, autocorrect, parallelism, object_group_name = None, object_group_id = None):
     """Builds, pushes and runs the tests of an Assembly/Resource project on a target CP4NA orchestration (and ARM) environment"""
     logger.debug('Testing project at: {0}'.format(project_path))
     project = lifecycle_cli.open_project(project_path)
@@ -148,7 +181,7 @@ def test(project_path, environment, config, armname, tests, pwd, autocorrect, ob
     controller.start('{0} at {1}'.format(project.config.name, project_path))
     build_result = exec_build(controller, project, allow_autocorrect=autocorrect)
     pkg_content = exec_push(controller, build_result.pkg, env_sessions, object_group_id=object_group_id)
-    exec_test(controller, pkg_content, env_sessions, __parse_tests_option(tests))
+    exec_test(controller, pkg_content, env_sessions, __parse_tests_option(tests), parallelism=parallelism)
     controller.finalise()
 
 
@@ -157,14 +190,15 @@ def test(project_path, environment, config, armname, tests, pwd, autocorrect, ob
 @click.argument('environment', required=False, default=None)
 @click.option('--config', default=None, help='configuration file')
 @click.option('--pwd', '--api-key', default=None, help='password/api_key used for authenticating with CP4NA orchestration. Only required if the environment is secure and a username has been included in your configuration file with no password (api_key when using auth_mode=zen)')
-def pull(project_path, environment, config, pwd):
+@click.option('--parallel', 'parallelism', default=4, type=click.IntRange(min=1), show_default=True, help='number of subprojects to pull concurrently')
+def pull(project_path, environment, config, pwd, parallelism):
     """Pulls the content of a Assembly/Resource from a target CP4NA orchestration environment, overidding local content"""
     logger.debug('Pulling project at: {0}'.format(project_path))
     project = lifecycle_cli.open_project(project_path)
     env_sessions = lifecycle_cli.build_sessions_for_project(project.config, environment, pwd, None, config)
     controller = lifecycle_cli.ExecutionController(PULL_HEADER)
     controller.start('{0} at {1}'.format(project.config.name, project_path))
-    exec_pull(controller, project, env_sessions)
+    exec_pull(controller, project, env_sessions, parallelism=parallelism)
     controller.finalise()
 
 @project.command(help='List element(s) of a Project. Element options: tests')
@@ -0,0 +1,158 @@
+"""
+Registry of the commands of the CLI, so they can be registered lazily (see SuperGroup.add_lazy_command) without importing the modules defining them.
+
+The registry is generated into registry_data.py by importing every command module. Re-generate it after adding or changing a command:
+
+    python -m lmctl.cli.commands.registry
+
+Check it is up to date with:
+
+    python -m lmctl.cli.commands.registry --check
+"""
+import os
+import sys
+import runpy
+import importlib
+from lmctl.cli.tags import SETTINGS_TAG, PROJECT_TAG, DEPRECATED_TAG
+
+# Modules which add commands to the action groups on import, in the order they used to be imported.
+# A command is registered against the first module which adds it
+COMMAND_MODULES = [
+    'lmctl.cli.commands.assemblies',
+    'lmctl.cli.commands.assembly_components',
+    'lmctl.cli.commands.behaviour_assembly_configurations',
+    'lmctl.cli.commands.behaviour_projects',
+    'lmctl.cli.commands.behaviour_scenarios',
+    'lmctl.cli.commands.resource_cluster',
+    'lmctl.cli.commands.config',
+    'lmctl.cli.commands.deployment_location',
+    'lmctl.cli.commands.descriptors',
+    'lmctl.cli.commands.descriptor_templates',
+    'lmctl.cli.commands.env',
+    'lmctl.cli.commands.infrastructure_key',
+    'lmctl.cli.commands.intents',
+    'lmctl.cli.commands.processes',
+    'lmctl.cli.commands.permission_type',
+    'lmctl.cli.commands.resourcedriver',
+    'lmctl.cli.commands.resource_managers',
+    'lmctl.cli.commands.resource_packages',
+    'lmctl.cli.commands.object_groups',
+]
+
+# Commands added to the top level of the CLI, with the tags they are listed under
+TOP_LEVEL_COMMANDS = [
+    ('lmctl.cli.commands.deployment_location:deployment', [DEPRECATED_TAG]),
+    ('lmctl.cli.commands.env:env', [DEPRECATED_TAG]),
+    ('lmctl.cli.commands.resourcedriver:resourcedriver', [DEPRECATED_TAG]),
+    ('lmctl.cli.commands.pkg:pkg', [PROJECT_TAG]),
+    ('lmctl.cli.commands.project:project', [PROJECT_TAG]),
+    ('lmctl.cli.commands.infrastructure_key:key', [DEPRECATED_TAG]),
+    ('lmctl.cli.commands.lifecycledriver:lifecycledriver', [DEPRECATED_TAG]),
+    ('lmctl.cli.commands.vimdriver:vimdriver', [DEPRECATED_TAG]),
+    ('lmctl.cli.commands.login:login', [SETTINGS_TAG]),
+    ('lmctl.cli.commands.logdir:logdir', [SETTINGS_TAG]),
+    ('lmctl.cli.commands.whoami:whoami', [SETTINGS_TAG]),
+]
+
+DATA_HEADER = '''\
+# Generated by "python -m lmctl.cli.commands.registry" - do not edit
+'''
+
+
+def _describe(cmd, name, import_path, aliases, tags):
+    return {
+        'name': name,
+        'import_path': import_path,
+        'aliases': list(aliases),
+        'tags': list(tags),
+        'help': cmd.help,
+        'short_help': cmd.short_help,
+        'hidden': cmd.hidden,
+        'deprecated': cmd.deprecated
+    }
+
+
+def build_registry():
+    """
+    Build the registry by importing every command module. Must be called before any command module has been imported
+    (e.g. in a new interpreter), so the commands each module adds can be found
+    """
+    loaded = [m for m in COMMAND_MODULES if m in sys.modules]
+    if len(loaded) > 0:
+        raise ValueError('The registry can only be built before any command module is imported but found: {0}'.format(loaded))
+    from lmctl.cli.commands.actions import action_groups
+    groups = [definition['group'] for definition in action_groups]
+    action_commands = {group.name: [] for group in groups}
+    for module_name in COMMAND_MODULES:
+        existing = {group.name: set(group.commands) for group in groups}
+        importlib.import_module(module_name)
+        for group in groups:
+            for name, cmd in group.commands.items():
+                if name not in existing[group.name]:
+                    action_commands[group.name].append(
+                        _describe(cmd, name, module_name, group.cmd_aliases.get(cmd, []), group.cmd_tags.get(cmd, []))
+                    )
+    top_level_commands = []
+    for import_path, tags in TOP_LEVEL_COMMANDS:
+        module_name, _, attribute = import_path.partition(':')
+        cmd = getattr(importlib.import_module(module_name), attribute)
+        top_level_commands.append(_describe(cmd, cmd.name, import_path, [], tags))
+    return {
+        'TOP_LEVEL_COMMANDS': top_level_commands,
+        'ACTION_COMMANDS': action_commands
+    }
+
+
+def _format_value(value, indent=0):
+    """
+    Format a value of the registry as a Python literal. Written by hand (rather than with pprint), so the output is the same on every
+    supported version of Python
+    """
+    padding = ' ' * (indent + 4)
+    if isinstance(value, dict):
+        if len(value) == 0:
+            return '{}'
+        items = ['{0}{1}: {2}'.format(padding, repr(key), _format_value(item, indent + 4)) for key, item in value.items()]
+        return '{\n' + ',\n'.join(items) + '\n' + ' ' * indent + '}'
+    if isinstance(value, list):
+        if len(value) == 0:
+            return '[]'
+        if all(isinstance(item, str) for item in value):
+            return '[' + ', '.join(repr(item) for item in value) + ']'
+        items = [padding + _format_value(item, indent + 4) for item in value]
+        return '[\n' + ',\n'.join(items) + '\n' + ' ' * indent + ']'
+    if value is None or isinstance(value, (str, bool, int)):
+        return repr(value)
+    raise ValueError('Cannot add value of type {0} to the registry: {1}'.format(type(value), value))
+
+
+def render_registry(registry):
+    content = DATA_HEADER
+    for name, value in registry.items():
+        content += '\n{0} = {1}\n'.format(name, _format_value(value))
+    return content
+
+
+def load_registry(path):
+    """
+    Load the registry from a generated file
+    """
+    data = runpy.run_path(path)
+    return {name: data.get(name) for name in ['TOP_LEVEL_COMMANDS', 'ACTION_COMMANDS']}
+
+
+def main(args):
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'registry_data.py')
+    registry = build_registry()
+    if '--check' in args:
+        # Compares the data rather than the text, so formatting does not matter
+        if not os.path.exists(path) or load_registry(path) != registry:
+            print('{0} is out of date, re-generate it with "python -m lmctl.cli.commands.registry"'.format(path))
+            return 1
+        return 0
+    with open(path, 'w') as f:
+        f.write(render_registry(registry))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,881 @@
+# Generated by "python -m lmctl.cli.commands.registry" - do not edit
+
+TOP_LEVEL_COMMANDS = [
+    {
+        'name': 'deployment',
+        'import_path': 'lmctl.cli.commands.deployment_location:deployment',
+        'aliases': [],
+        'tags': ['Deprecated'],
+        'help': 'deprecated in v3.0: Commands for managing Deployment Locations',
+        'short_help': 'Use "lmctl create/get/update/delete deploymentlocation"',
+        'hidden': True,
+        'deprecated': False
+    },
+    {
+        'name': 'env',
+        'import_path': 'lmctl.cli.commands.env:env',
+        'aliases': [],
+        'tags': ['Deprecated'],
+        'help': 'deprecated in v3.0: Commands for inspecting available CP4NA orchestration environments',
+        'short_help': 'Use "get env"',
+        'hidden': True,
+        'deprecated': False
+    },
+    {
+        'name': 'resourcedriver',
+        'import_path': 'lmctl.cli.commands.resourcedriver:resourcedriver',
+        'aliases': [],
+        'tags': ['Deprecated'],
+        'help': 'deprecated in v3.0: Commands for managing Resource drivers (CP4NA orchestration 2.2+ only)',
+        'short_help': 'Use "lmctl create/get/delete resourcedriver"',
+        'hidden': True,
+        'deprecated': False
+    },
+    {
+        'name': 'pkg',
+        'import_path': 'lmctl.cli.commands.pkg:pkg',
+        'aliases': [],
+        'tags': ['Projects'],
+        'help': 'Onboard a package previously built from a Project, distributed as a ".tgz" or ".csar" file',
+        'short_help': 'Onboard a package built from a Project',
+        'hidden': False,
+        'deprecated': False
+    },
+    {
+        'name': 'project',
+        'import_path': 'lmctl.cli.commands.project:project',
+        'aliases': [],
+        'tags': ['Projects'],
+        'help': 'Commands for managing Assembly/Resource/NS/VNF Projects',
+        'short_help': 'Manage Assembly/Resource/NS/VNF Projects',
+        'hidden': False,
+        'deprecated': False
+    },
+    {
+        'name': 'key',
+        'import_path': 'lmctl.cli.commands.infrastructure_key:key',
+        'aliases': [],
+        'tags': ['Deprecated'],
+        'help': 'deprecated in v3.0: Commands for managing shared infrastructure keys',
+        'short_help': 'Use "lmctl create/get/update/delete infrastructurekey"',
+        'hidden': True,
+        'deprecated': False
+    },
+    {
+        'name': 'lifecycledriver',
+        'import_path': 'lmctl.cli.commands.lifecycledriver:lifecycledriver',
+        'aliases': [],
+        'tags': ['Deprecated'],
+        'help': 'deprecated in v3.0: Commands for managing Lifecycle drivers (CP4NA orchestration 2.1 only)',
+        'short_help': 'Use "lmctl create/get/delete resourcedriver"',
+        'hidden': True,
+        'deprecated': False
+    },
+    {
+        'name': 'vimdriver',
+        'import_path': 'lmctl.cli.commands.vimdriver:vimdriver',
+        'aliases': [],
+        'tags': ['Deprecated'],
+        'help': 'deprecated in v3.0: Commands for managing VIM drivers (CP4NA orchestration 2.1 only)',
+        'short_help': 'Use "lmctl create/get/delete resourcedriver"',
+        'hidden': True,
+        'deprecated': False
+    },
+    {
+        'name': 'login',
+        'import_path': 'lmctl.cli.commands.login:login',
+        'aliases': [],
+        'tags': ['Settings'],
+        'help': '    Authenticates with an environment and save the access token in your lmctl config file for subsequent use. \n    \n\nA single use token is obtained using the credentials and this token is persisted in the lmctl config file, instead of your credentials. Once the token has expired, you will no longer be able to access this environment and will need to call "login" again.\n    \n\nTo avoid leaking your credentials in your command history it is recommended that you exclude "--client-secret", "--password" and "--api-key" from your command. You will be prompted for these where appropriate.\n    \n\nUsing "--save-creds" will persist the credentials in the lmctl config file instead, which will allow lmctl to reauthenticate on your behalf when the current access token expires. This is discouraged as the config file is plain text and easily accessed on your environment.\n    \n\nYou can check the contents of your local lmctl config file at any time with "lmctl get config"\n    ',
+        'short_help': 'Authenticate and optionally save credentials',
+        'hidden': False,
+        'deprecated': False
+    },
+    {
+        'name': 'logdir',
+        'import_path': 'lmctl.cli.commands.logdir:logdir',
+        'aliases': [],
+        'tags': ['Settings'],
+        'help': 'Print log file location',
+        'short_help': 'Print log file location',
+        'hidden': False,
+        'deprecated': False
+    },
+    {
+        'name': 'whoami',
+        'import_path': 'lmctl.cli.commands.whoami:whoami',
+        'aliases': [],
+        'tags': ['Settings'],
+        'help': 'Show information about the active environment',
+        'short_help': 'Show information about the active environment',
+        'hidden': False,
+        'deprecated': False
+    }
+]
+
+ACTION_COMMANDS = {
+    'adopt': [
+        {
+            'name': 'assembly',
+            'import_path': 'lmctl.cli.commands.assemblies',
+            'aliases': ['assemblies'],
+            'tags': ['CP4NA Core'],
+            'help': 'Request an intent to adopt an Assembly. The request can include the following properties:\n\n\nassemblyName - A unique name by which this Assembly will be known externally. This cannot contain spaces, consecutive underscores or start with a numeric character.\n\ndescriptorName - The descriptor name from which this Assembly will be created\n\nintendedState - The final intended state that the Assembly should be brought into\n\n\nproperties - An optional map of name and string value properties that is supplied to the new Assembly\n\n\nclusters - An optional map of cluster sizes, if the descriptor includes clusters\n\nresources - Associated topology for each resource instance\n',
+            'short_help': 'Request an intent to adopt an Assembly',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'cancel': [
+        {
+            'name': 'process',
+            'import_path': 'lmctl.cli.commands.processes',
+            'aliases': ['processes'],
+            'tags': ['CP4NA Core'],
+            'help': 'Request an intent to cancel a Process\n\nIdentify the Process using the "id" parameter\n\nFor example:\n\n\nCancel process using Process ID: lmctl cancel process 6ad3327e-79df-464f-af48-3283f871584d\n',
+            'short_help': 'Request an intent to cancel a Process',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'changestate': [
+        {
+            'name': 'assembly',
+            'import_path': 'lmctl.cli.commands.assemblies',
+            'aliases': ['assemblies'],
+            'tags': ['CP4NA Core'],
+            'help': 'Request an intent to change state of an Assembly\n\nIdentify the Assembly using one paramter from ["name", "--id"] or by including one of the following attributes ["assemblyName", "assemblyId"] in the given object/file\n\nFor example:\n\n\nChange state using file: lmctl changestate assembly -f my-request.yaml\n\n\nChange state by name: lmctl changestate assembly my-assembly-name --intended-state Inactive\n\n\nChange state by ID: lmctl changestate assembly --id bd83f0df-1e82-48ac-8faa-1d772e0c49cd --intended-state Inactive\n',
+            'short_help': 'Request an intent to change state of an Assembly',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'create': [
+        {
+            'name': 'assembly',
+            'import_path': 'lmctl.cli.commands.assemblies',
+            'aliases': ['assemblies'],
+            'tags': ['CP4NA Core'],
+            'help': 'Create a Assembly\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.\n\nThe request can include the following parameters:\n\n\nassemblyName - A unique name by which this Assembly will be known externally. This cannot contain spaces, consecutive underscores or start with a numeric character.\n\ndescriptorName - The descriptor name from which this Assembly will be created\n\nintendedState - The final intended state that the Assembly should be brought into\n\n\nproperties - An optional map of name and value pairs supplied to the new Assembly\n',
+            'short_help': 'Create a Assembly',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'assemblyconfig',
+            'import_path': 'lmctl.cli.commands.behaviour_assembly_configurations',
+            'aliases': ['assemblyconfigs'],
+            'tags': ['CP4NA Core'],
+            'help': 'Create a Assembly Configuration\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.',
+            'short_help': 'Create a Assembly Configuration',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'behaviourproject',
+            'import_path': 'lmctl.cli.commands.behaviour_projects',
+            'aliases': ['behaviourprojects'],
+            'tags': ['CP4NA Core'],
+            'help': 'Create a Behaviour Project\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.',
+            'short_help': 'Create a Behaviour Project',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'scenario',
+            'import_path': 'lmctl.cli.commands.behaviour_scenarios',
+            'aliases': ['scenarios'],
+            'tags': ['CP4NA Core'],
+            'help': 'Create a Scenario\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.',
+            'short_help': 'Create a Scenario',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'config',
+            'import_path': 'lmctl.cli.commands.config',
+            'aliases': ['configs'],
+            'tags': ['Settings'],
+            'help': 'Create starter LMCTL Configuration file',
+            'short_help': None,
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'deploymentlocation',
+            'import_path': 'lmctl.cli.commands.deployment_location',
+            'aliases': ['deploymentlocations'],
+            'tags': ['CP4NA Core'],
+            'help': 'Create a Deployment Location\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.',
+            'short_help': 'Create a Deployment Location',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'descriptor',
+            'import_path': 'lmctl.cli.commands.descriptors',
+            'aliases': ['descriptors'],
+            'tags': ['CP4NA Core'],
+            'help': 'Create a Descriptor\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.',
+            'short_help': 'Create a Descriptor',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'descriptortemplate',
+            'import_path': 'lmctl.cli.commands.descriptor_templates',
+            'aliases': ['descriptortemplates'],
+            'tags': ['CP4NA Core'],
+            'help': 'Create a Descriptor Template\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.',
+            'short_help': 'Create a Descriptor Template',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'infrastructurekey',
+            'import_path': 'lmctl.cli.commands.infrastructure_key',
+            'aliases': ['infrastructurekeys'],
+            'tags': ['CP4NA Core'],
+            'help': 'Create a Infrastructure Key\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.',
+            'short_help': 'Create a Infrastructure Key',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'intent',
+            'import_path': 'lmctl.cli.commands.intents',
+            'aliases': ['intents'],
+            'tags': ['CP4NA Core'],
+            'help': '        Request an intent of any type on an Assembly.         \n\nYou must include the type of intent either as an "intentType" attribute in the content of "-f, file" or with the "--set intentType=<type>" option\n        \n\nThe properties of a request depend on the type of intent being performed.        \n\nKnown types: createAssembly, changeAssemblyState, upgradeAssembly, deleteAssembly, healAssembly, scaleOutAssembly, scaleInAssembly, adoptAssembly\n        \n\nNote: your chosen type is not validated against this list so if a new type of intent has been added in CP4NA, this command is still usable\n        \n\nTo request many intents at once, use "-f, --file" with a manifest including an "intents" list, each entry an intent request with an "intentType" attribute.         Up to "--concurrency" intents are submitted at once sharing one authenticated session with the environment, and the outcome of each is reported in one result (see "-o, --output")\n    ',
+            'short_help': 'Request an intent of any type on an Assembly',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcedriver',
+            'import_path': 'lmctl.cli.commands.resourcedriver',
+            'aliases': ['resourcedrivers'],
+            'tags': ['CP4NA Core'],
+            'help': 'Create a Resource Driver\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.',
+            'short_help': 'Create a Resource Driver',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcemanager',
+            'import_path': 'lmctl.cli.commands.resource_managers',
+            'aliases': ['resourcemanagers'],
+            'tags': ['CP4NA Core'],
+            'help': 'Create a Resource Manager\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.',
+            'short_help': 'Create a Resource Manager',
+            'hidden': True,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcepkg',
+            'import_path': 'lmctl.cli.commands.resource_packages',
+            'aliases': ['resourcepkgs'],
+            'tags': ['CP4NA Core'],
+            'help': 'Upload Resource Package            \n\nNOTE: Resource Packages are not synonymous with LMCTL project packages, even when the project contains a Resource.\n            The package for an LMCTL package can be extracted to find the Resource Package with zip/tar, depending on the chosen package format for your project',
+            'short_help': 'Upload a Resource Package',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'delete': [
+        {
+            'name': 'assembly',
+            'import_path': 'lmctl.cli.commands.assemblies',
+            'aliases': ['assemblies'],
+            'tags': ['CP4NA Core'],
+            'help': 'Delete a Assembly\n\nIdentify the Assembly to be deleted using one paramter from ["name", "--id"] or by including one of the following attributes ["assemblyName", "assemblyId"] in the given object/file',
+            'short_help': 'Delete a Assembly',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'assemblyconfig',
+            'import_path': 'lmctl.cli.commands.behaviour_assembly_configurations',
+            'aliases': ['assemblyconfigs'],
+            'tags': ['CP4NA Core'],
+            'help': 'Delete a Assembly Configuration\n\nIdentify the Assembly Configuration to be deleted using the "id" parameter or by including the "id" attribute in the given object/file',
+            'short_help': 'Delete a Assembly Configuration',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'behaviourproject',
+            'import_path': 'lmctl.cli.commands.behaviour_projects',
+            'aliases': ['behaviourprojects'],
+            'tags': ['CP4NA Core'],
+            'help': 'Delete a Behaviour Project\n\nIdentify the Behaviour Project to be deleted using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Delete a Behaviour Project',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'scenario',
+            'import_path': 'lmctl.cli.commands.behaviour_scenarios',
+            'aliases': ['scenarios'],
+            'tags': ['CP4NA Core'],
+            'help': 'Delete a Scenario\n\nIdentify the Scenario to be deleted using the "id" parameter or by including the "id" attribute in the given object/file',
+            'short_help': 'Delete a Scenario',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'deploymentlocation',
+            'import_path': 'lmctl.cli.commands.deployment_location',
+            'aliases': ['deploymentlocations'],
+            'tags': ['CP4NA Core'],
+            'help': 'Delete a Deployment Location\n\nIdentify the Deployment Location to be deleted using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Delete a Deployment Location',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'descriptor',
+            'import_path': 'lmctl.cli.commands.descriptors',
+            'aliases': ['descriptors'],
+            'tags': ['CP4NA Core'],
+            'help': 'Delete a Descriptor\n\nIdentify the Descriptor to be deleted using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Delete a Descriptor',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'descriptortemplate',
+            'import_path': 'lmctl.cli.commands.descriptor_templates',
+            'aliases': ['descriptortemplates'],
+            'tags': ['CP4NA Core'],
+            'help': 'Delete a Descriptor Template\n\nIdentify the Descriptor Template to be deleted using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Delete a Descriptor Template',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'infrastructurekey',
+            'import_path': 'lmctl.cli.commands.infrastructure_key',
+            'aliases': ['infrastructurekeys'],
+            'tags': ['CP4NA Core'],
+            'help': 'Delete a Infrastructure Key\n\nIdentify the Infrastructure Key to be deleted using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Delete a Infrastructure Key',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcedriver',
+            'import_path': 'lmctl.cli.commands.resourcedriver',
+            'aliases': ['resourcedrivers'],
+            'tags': ['CP4NA Core'],
+            'help': 'Delete a Resource Driver\n\nIdentify the Resource Driver to be deleted using one paramter from ["id", "--type"] or by including one of the following attributes ["id", "infrastructureType"] in the given object/file',
+            'short_help': 'Delete a Resource Driver',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcemanager',
+            'import_path': 'lmctl.cli.commands.resource_managers',
+            'aliases': ['resourcemanagers'],
+            'tags': ['CP4NA Core'],
+            'help': 'Delete a Resource Manager\n\nIdentify the Resource Manager to be deleted using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Delete a Resource Manager',
+            'hidden': True,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcepkg',
+            'import_path': 'lmctl.cli.commands.resource_packages',
+            'aliases': ['resourcepkgs'],
+            'tags': ['CP4NA Core'],
+            'help': 'Delete a Resource Package\n\nIdentify the Resource Package to be deleted using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Delete a Resource Package',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'execute': [
+        {
+            'name': 'scenario',
+            'import_path': 'lmctl.cli.commands.behaviour_scenarios',
+            'aliases': ['scenarios'],
+            'tags': ['CP4NA Core'],
+            'help': 'Execute a Scenario\n\nIdentify the Scenario using the "id" parameter or by including the "id" attribute in the given object/file',
+            'short_help': 'Execute a Scenario',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'generate': [
+        {
+            'name': 'assembly',
+            'import_path': 'lmctl.cli.commands.assemblies',
+            'aliases': ['assemblies'],
+            'tags': ['CP4NA Core'],
+            'help': 'Generate an example file for a Assembly',
+            'short_help': 'Generate an example file for a Assembly',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'assemblyconfig',
+            'import_path': 'lmctl.cli.commands.behaviour_assembly_configurations',
+            'aliases': ['assemblyconfigs'],
+            'tags': ['CP4NA Core'],
+            'help': 'Generate an example file for a Assembly Configuration',
+            'short_help': 'Generate an example file for a Assembly Configuration',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'behaviourproject',
+            'import_path': 'lmctl.cli.commands.behaviour_projects',
+            'aliases': ['behaviourprojects'],
+            'tags': ['CP4NA Core'],
+            'help': 'Generate an example file for a Behaviour Project',
+            'short_help': 'Generate an example file for a Behaviour Project',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'scenario',
+            'import_path': 'lmctl.cli.commands.behaviour_scenarios',
+            'aliases': ['scenarios'],
+            'tags': ['CP4NA Core'],
+            'help': 'Generate an example file for a Scenario',
+            'short_help': 'Generate an example file for a Scenario',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'deploymentlocation',
+            'import_path': 'lmctl.cli.commands.deployment_location',
+            'aliases': ['deploymentlocations'],
+            'tags': ['CP4NA Core'],
+            'help': 'Generate an example file for a Deployment Location',
+            'short_help': 'Generate an example file for a Deployment Location',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'descriptor',
+            'import_path': 'lmctl.cli.commands.descriptors',
+            'aliases': ['descriptors'],
+            'tags': ['CP4NA Core'],
+            'help': 'Generate an example file for a Descriptor',
+            'short_help': 'Generate an example file for a Descriptor',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'descriptortemplate',
+            'import_path': 'lmctl.cli.commands.descriptor_templates',
+            'aliases': ['descriptortemplates'],
+            'tags': ['CP4NA Core'],
+            'help': 'Generate an example file for a Descriptor Template',
+            'short_help': 'Generate an example file for a Descriptor Template',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'infrastructurekey',
+            'import_path': 'lmctl.cli.commands.infrastructure_key',
+            'aliases': ['infrastructurekeys'],
+            'tags': ['CP4NA Core'],
+            'help': 'Generate an example file for a Infrastructure Key',
+            'short_help': 'Generate an example file for a Infrastructure Key',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'intent',
+            'import_path': 'lmctl.cli.commands.intents',
+            'aliases': ['intents'],
+            'tags': ['CP4NA Core'],
+            'help': 'Generate an example file for a Intent',
+            'short_help': 'Generate an example file for a Intent',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcedriver',
+            'import_path': 'lmctl.cli.commands.resourcedriver',
+            'aliases': ['resourcedrivers'],
+            'tags': ['CP4NA Core'],
+            'help': 'Generate an example file for a Resource Driver',
+            'short_help': 'Generate an example file for a Resource Driver',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcemanager',
+            'import_path': 'lmctl.cli.commands.resource_managers',
+            'aliases': ['resourcemanagers'],
+            'tags': ['CP4NA Core'],
+            'help': 'Generate an example file for a Resource Manager',
+            'short_help': 'Generate an example file for a Resource Manager',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'get': [
+        {
+            'name': 'assembly',
+            'import_path': 'lmctl.cli.commands.assemblies',
+            'aliases': ['assemblies'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Assembly\n\nIdentify the Assembly to be retrieved using one parameter from ["name", "--id", "--name-contains", "--topN"] or by including one of the following attributes ["assemblyName", "assemblyId"] in the given object/file',
+            'short_help': 'Get a Assembly',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'assemblyconfig',
+            'import_path': 'lmctl.cli.commands.behaviour_assembly_configurations',
+            'aliases': ['assemblyconfigs'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Assembly Configuration\n\nIdentify the Assembly Configuration to be retrieved using one parameter from ["id", "--project"] or by including one of the following attributes ["id", "projectId"] in the given object/file',
+            'short_help': 'Get a Assembly Configuration',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'behaviourproject',
+            'import_path': 'lmctl.cli.commands.behaviour_projects',
+            'aliases': ['behaviourprojects'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Behaviour Project or get a list of instances\n\nIdentify the Behaviour Project to be retrieved using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Get a Behaviour Project',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'scenario',
+            'import_path': 'lmctl.cli.commands.behaviour_scenarios',
+            'aliases': ['scenarios'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Scenario\n\nIdentify the Scenario to be retrieved using one parameter from ["id", "--project"] or by including one of the following attributes ["id", "projectId"] in the given object/file',
+            'short_help': 'Get a Scenario',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'config',
+            'import_path': 'lmctl.cli.commands.config',
+            'aliases': ['configs'],
+            'tags': ['Settings'],
+            'help': 'Get the active LMCTL Configuration file',
+            'short_help': None,
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'deploymentlocation',
+            'import_path': 'lmctl.cli.commands.deployment_location',
+            'aliases': ['deploymentlocations'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Deployment Location or get a list of instances\n\nIdentify the Deployment Location to be retrieved using one parameter from ["name", "--name-contains"] or by including the "name" attribute in the given object/file',
+            'short_help': 'Get a Deployment Location',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'descriptor',
+            'import_path': 'lmctl.cli.commands.descriptors',
+            'aliases': ['descriptors'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Descriptor or get a list of instances\n\nIdentify the Descriptor to be retrieved using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Get a Descriptor',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'descriptortemplate',
+            'import_path': 'lmctl.cli.commands.descriptor_templates',
+            'aliases': ['descriptortemplates'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Descriptor Template or get a list of instances\n\nIdentify the Descriptor Template to be retrieved using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Get a Descriptor Template',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'env',
+            'import_path': 'lmctl.cli.commands.env',
+            'aliases': ['envs'],
+            'tags': ['Settings'],
+            'help': 'Get an Environment from active LMCTL config file',
+            'short_help': None,
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'infrastructurekey',
+            'import_path': 'lmctl.cli.commands.infrastructure_key',
+            'aliases': ['infrastructurekeys'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Infrastructure Key or get a list of instances\n\nIdentify the Infrastructure Key to be retrieved using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Get a Infrastructure Key',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'process',
+            'import_path': 'lmctl.cli.commands.processes',
+            'aliases': ['processes'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Process or get a list of instances\n\nIdentify the Process to be retrieved using the "id" parameter',
+            'short_help': 'Get a Process',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'permissiontype',
+            'import_path': 'lmctl.cli.commands.permission_type',
+            'aliases': ['permissiontypes'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Permission Type or get a list of instances\n\nIdentify the Permission Type to be retrieved using the "id" parameter',
+            'short_help': 'Get a Permission Type',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcedriver',
+            'import_path': 'lmctl.cli.commands.resourcedriver',
+            'aliases': ['resourcedrivers'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Resource Driver\n\nIdentify the Resource Driver to be retrieved using one parameter from ["id", "--type"] or by including one of the following attributes ["id", "infrastructureType"] in the given object/file',
+            'short_help': 'Get a Resource Driver',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcemanager',
+            'import_path': 'lmctl.cli.commands.resource_managers',
+            'aliases': ['resourcemanagers'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Resource Manager or get a list of instances\n\nIdentify the Resource Manager to be retrieved using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Get a Resource Manager',
+            'hidden': True,
+            'deprecated': False
+        },
+        {
+            'name': 'objectgroup',
+            'import_path': 'lmctl.cli.commands.object_groups',
+            'aliases': ['objectgroups'],
+            'tags': ['CP4NA Core'],
+            'help': 'Get a Object Groups or get a list of instances\n\nIdentify the Object Groups to be retrieved using one parameter from ["id", "-p, --permission", "-d, --default"] or by including one of the following attributes ["id", "permission"] in the given object/file',
+            'short_help': 'Get a Object Groups',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'heal': [
+        {
+            'name': 'assemblycomponent',
+            'import_path': 'lmctl.cli.commands.assembly_components',
+            'aliases': ['assemblycomponents'],
+            'tags': ['CP4NA Core'],
+            'help': 'Request an intent to heal an Assembly Component (e.g. Resource)\n\nIdentify the Assembly Component using one paramter from ["name", "--id", "--metric-key"] or by including one of the following attributes ["brokenComponentName", "brokenComponentId", "brokenComponentMetricKey"] in the given object/file\n\n    For example:\n    \n\nHeal using Assembly Component name: lmctl heal assemblycomponent my-component --assembly-name my-assembly-name \n    \n\nHeal using Assembly Component ID: lmctl heal assemblycomponent --id 6ad3327e-79df-464f-af48-3283f871584d --assembly-name my-assembly-name \n    \n\nHeal using Assembly Component metric key: lmctl heal assemblycomponent --metric-key 5fd27c1e-403c-402b-a033-fef0940974d5 --assembly-name my-assembly-name \n    \n\nHeal using Assembly Component name and Assembly ID: lmctl heal assemblycomponent my-component --assembly-id 7f528478-8180-442d-9a3f-c4e5869c9617\n    ',
+            'short_help': 'Request an intent to heal an Assembly Component (e.g. Resource)',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'resource',
+            'import_path': 'lmctl.cli.commands.assembly_components',
+            'aliases': ['resources'],
+            'tags': ['CP4NA Core'],
+            'help': 'Request an intent to heal a Resource \n\nIdentify the Resource using one paramter from ["name", "--id", "--metric-key"] or by including one of the following attributes ["brokenComponentName", "brokenComponentId", "brokenComponentMetricKey"] in the given object/file\n\n    For example:\n    \n\nHeal using Resource name: lmctl heal resource my-component --assembly-name my-assembly-name \n    \n\nHeal using Resource ID: lmctl heal resource --id 6ad3327e-79df-464f-af48-3283f871584d --assembly-name my-assembly-name \n    \n\nHeal using Resource metric key: lmctl heal resource --metric-key 5fd27c1e-403c-402b-a033-fef0940974d5 --assembly-name my-assembly-name \n    \n\nHeal using Resource name and Assembly ID: lmctl heal resource my-component --assembly-id 7f528478-8180-442d-9a3f-c4e5869c9617\n    ',
+            'short_help': 'Request an intent to heal a Resource ',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'retry': [
+        {
+            'name': 'process',
+            'import_path': 'lmctl.cli.commands.processes',
+            'aliases': ['processes'],
+            'tags': ['CP4NA Core'],
+            'help': 'Request an intent to retry a Process\n\nIdentify the Process using the "id" parameter\n\nFor example:\n\n\nRetry process using Process ID: lmctl retry process 6ad3327e-79df-464f-af48-3283f871584d\n',
+            'short_help': 'Request an intent to retry a Process',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'rollback': [
+        {
+            'name': 'process',
+            'import_path': 'lmctl.cli.commands.processes',
+            'aliases': ['processes'],
+            'tags': ['CP4NA Core'],
+            'help': 'Request an intent to rollback a Process\n\nIdentify the Process using the "id" parameter\n\nFor example:\n\n\nRollback process using Process ID: lmctl rollback process 6ad3327e-79df-464f-af48-3283f871584d\n',
+            'short_help': 'Request an intent to rollback a Process',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'ping': [
+        {
+            'name': 'env',
+            'import_path': 'lmctl.cli.commands.env',
+            'aliases': ['envs'],
+            'tags': ['Settings'],
+            'help': '            Test connection with an Environment from active LMCTL config file\n            \n\nConnection is tested by making requests to a few pre-selected APIs on the configured CP4NA orchestration',
+            'short_help': 'Test connection with an Environment from active LMCTL config file',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'render': [
+        {
+            'name': 'descriptortemplate',
+            'import_path': 'lmctl.cli.commands.descriptor_templates',
+            'aliases': ['descriptortemplates'],
+            'tags': ['CP4NA Core'],
+            'help': 'Render a Descriptor Template and view the output\n\nIdentify the Descriptor Template using the "name" parameter or by including the "name" attribute in the given object/file\n\nNote: the file passed to "-f, --file" only identifies the template, that should exist on the server, to be rendered. It does not represent the literal template to be rendered',
+            'short_help': 'Render a Descriptor Template and view the output',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'scale': [
+        {
+            'name': 'resourcecluster',
+            'import_path': 'lmctl.cli.commands.resource_cluster',
+            'aliases': ['resourceclusters'],
+            'tags': ['CP4NA Core'],
+            'help': 'Request an intent to scale out/in a Resource Cluster of an Assembly\n\nIdentify the Resource Cluster using the "name" parameter or by including the "clusterName" attribute in the given object/file\n\nRequest an intent to scale out/in a Resource Cluster of an Assembly.\n\n\nUse "--out" option to indicate a scale out request or "--in" to indicate a scale in\n\n\nThe target Assembly may be identified by the "--assembly-name" option or the "--assembly-id" option\n\n\nFor example:\n\n\nScale out using Assembly name: lmctl scale resourcecluster my-cluster-name --assembly-name my-assembly-name --out \n\n\nScale out using Assembly ID: lmctl scale resourcecluster my-cluster-name --id bd83f0df-1e82-48ac-8faa-1d772e0c49cd --out \n',
+            'short_help': 'Request an intent to scale out/in a Resource Cluster of an Assembly',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'update': [
+        {
+            'name': 'assembly',
+            'import_path': 'lmctl.cli.commands.assemblies',
+            'aliases': ['assemblies'],
+            'tags': ['CP4NA Core'],
+            'help': 'Update a Assembly\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.\n\nIdentify the Assembly to be updated using one paramter from ["--id", "name"] or by including one of the following attributes ["assemblyId", "assemblyName"] in the given object/file\n\nThe request can include the following parameters:\n\n\n\tdescriptorName - The descriptor name from which this Assembly will be updated to\n\n\tproperties - An optional map of name and string value properties that is supplied to the updated Assembly\n\n Examples:\n\n\nUpgrade Assembly using file: lmctl update assembly -f my-request.yaml\n\n\nUpgrade Assembly by name: lmctl update assembly my-assembly-name --set descriptorName=assembly::my-service::2.0\n\n\nUpgrade Assembly by ID: lmctl update assembly --id bd83f0df-1e82-48ac-8faa-1d772e0c49cd --set descriptorName=assembly::my-service::2.0\n',
+            'short_help': 'Update a Assembly',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'assemblyconfig',
+            'import_path': 'lmctl.cli.commands.behaviour_assembly_configurations',
+            'aliases': ['assemblyconfigs'],
+            'tags': ['CP4NA Core'],
+            'help': 'Update a Assembly Configuration\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.\n\nIdentify the Assembly Configuration to be updated using the "id" parameter or by including the "id" attribute in the given object/file',
+            'short_help': 'Update a Assembly Configuration',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'behaviourproject',
+            'import_path': 'lmctl.cli.commands.behaviour_projects',
+            'aliases': ['behaviourprojects'],
+            'tags': ['CP4NA Core'],
+            'help': 'Update a Behaviour Project\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.\n\nIdentify the Behaviour Project to be updated using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Update a Behaviour Project',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'scenario',
+            'import_path': 'lmctl.cli.commands.behaviour_scenarios',
+            'aliases': ['scenarios'],
+            'tags': ['CP4NA Core'],
+            'help': 'Update a Scenario\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.\n\nIdentify the Scenario to be updated using the "id" parameter or by including the "id" attribute in the given object/file',
+            'short_help': 'Update a Scenario',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'deploymentlocation',
+            'import_path': 'lmctl.cli.commands.deployment_location',
+            'aliases': ['deploymentlocations'],
+            'tags': ['CP4NA Core'],
+            'help': 'Update a Deployment Location\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.\n\nIdentify the Deployment Location to be updated using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Update a Deployment Location',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'descriptor',
+            'import_path': 'lmctl.cli.commands.descriptors',
+            'aliases': ['descriptors'],
+            'tags': ['CP4NA Core'],
+            'help': 'Update a Descriptor\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.\n\nIdentify the Descriptor to be updated using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Update a Descriptor',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'descriptortemplate',
+            'import_path': 'lmctl.cli.commands.descriptor_templates',
+            'aliases': ['descriptortemplates'],
+            'tags': ['CP4NA Core'],
+            'help': 'Update a Descriptor Template\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.\n\nIdentify the Descriptor Template to be updated using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Update a Descriptor Template',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'infrastructurekey',
+            'import_path': 'lmctl.cli.commands.infrastructure_key',
+            'aliases': ['infrastructurekeys'],
+            'tags': ['CP4NA Core'],
+            'help': 'Update a Infrastructure Key\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.\n\nIdentify the Infrastructure Key to be updated using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Update a Infrastructure Key',
+            'hidden': False,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcemanager',
+            'import_path': 'lmctl.cli.commands.resource_managers',
+            'aliases': ['resourcemanagers'],
+            'tags': ['CP4NA Core'],
+            'help': 'Update a Resource Manager\n\nUse the "-f, --file" option to parse input data as a file in a supported format.\nOtherwise, use "--set" option to set attributes as key=value pairs.\n\nIdentify the Resource Manager to be updated using the "name" parameter or by including the "name" attribute in the given object/file',
+            'short_help': 'Update a Resource Manager',
+            'hidden': True,
+            'deprecated': False
+        },
+        {
+            'name': 'resourcepkg',
+            'import_path': 'lmctl.cli.commands.resource_packages',
+            'aliases': ['resourcepkgs'],
+            'tags': ['CP4NA Core'],
+            'help': 'Upload an updated Resource Package            \n\nNOTE: Resource Packages are not synonymous with LMCTL project packages, even when the project contains a Resource.\n            The package for an LMCTL package can be extracted to find the Resource Package with zip/tar, depending on the chosen package format for your project',
+            'short_help': 'Upload an updated Resource Package',
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'use': [
+        {
+            'name': 'env',
+            'import_path': 'lmctl.cli.commands.env',
+            'aliases': ['envs'],
+            'tags': ['Settings'],
+            'help': 'Change the active environment (default environment used by commands)',
+            'short_help': None,
+            'hidden': False,
+            'deprecated': False
+        }
+    ],
+    'wait': [
+        {
+            'name': 'process',
+            'import_path': 'lmctl.cli.commands.processes',
+            'aliases': ['processes'],
+            'tags': ['CP4NA Core'],
+            'help': 'Wait for one or more Processes to finish\n\nStatus changes of each Process are printed as they are seen. Exits with an error if any Process does not reach the "Completed" status\nor the "--timeout" is reached before they all finish.\n\n\nWait for processes by ID: lmctl wait process 6ad3327e-79df-464f-af48-3283f871584d 9a8d7a05-4d19-4b2e-8b8b-d2b6e7c2d1b0 --timeout 600\n',
+            'short_help': 'Wait for one or more Processes to finish',
+            'hidden': False,
+            'deprecated': False
+        }
+    ]
+}
@@ -49,7 +49,8 @@ Request an intent to scale out/in a {tnco_builder.display_name} of an Assembly.
     additional_identifiers={
         'assembly_identity': (True, [assembly_name_opt, assembly_id_opt])
     },
-    pass_file_content=True
+    pass_file_content=True,
+    allow_wait=True
 )
 @click.argument(name_arg.param_name, required=False)
 @click.option(*assembly_name_opt.param_opts, help=f'Reference the owning Assembly by name')
@@ -77,3 +78,4 @@ def scale_resource_cluster(
     else:
         process_id = tnco_client.assemblies.intent_scale_out(obj)
     io.print(f'{accepted_process_prefix}{process_id}')
+    return process_id
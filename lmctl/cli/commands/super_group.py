@@ -1,9 +1,44 @@
 import click
-from typing import Iterable, Optional, Tuple
+import importlib
+from typing import Iterable, Optional, Tuple, Union
 from collections import OrderedDict
 
 DEFAULT_UNTAGGED_COMMAND_TITLE = 'Other'
 
+class LazyCommand:
+    """
+    A command registered by name, which is only imported when invoked (or otherwise resolved).
+
+    The help of the command is held, so it can be listed in the help of its group without importing it.
+
+    Args:
+        name: name of the command
+        import_path: module to import for the command, as "module" when the module adds the command to the group itself on import,
+            or "module:attribute" to add the command found on the module
+    """
+
+    def __init__(self, name: str, import_path: str, aliases: Optional[Iterable[str]] = None, tags: Optional[Iterable[str]] = None, 
+                    help: Optional[str] = None, short_help: Optional[str] = None, hidden: bool = False, deprecated: Union[bool, str] = False):
+        self.name = name
+        self.import_path = import_path
+        self.aliases = [] if aliases is None else [a for a in aliases]
+        self.tags = [] if tags is None else [t for t in tags]
+        self.help = help
+        self.short_help = short_help
+        self.hidden = hidden
+        self.deprecated = deprecated
+
+    def get_short_help_str(self, limit: int = 45) -> str:
+        # Let click shorten the help, so it is listed as it would be once imported
+        return click.Command(self.name, help=self.help, short_help=self.short_help, deprecated=self.deprecated).get_short_help_str(limit)
+
+    def load(self) -> Optional[click.Command]:
+        module_name, _, attribute = self.import_path.partition(':')
+        module = importlib.import_module(module_name)
+        if attribute:
+            return getattr(module, attribute)
+        return None
+
 class SuperGroup(click.Group):
     
     def __init__(self, *args, tag_order: Optional[Iterable[str]] = None, untagged_command_title: Optional[str] = DEFAULT_UNTAGGED_COMMAND_TITLE, **kwargs):
@@ -11,6 +46,8 @@ class SuperGroup(click.Group):
         self.cmds_by_alias = {}
         self.cmd_aliases = {}
         self.cmd_tags = {}
+        self.lazy_cmds = OrderedDict()
+        self.lazy_cmds_by_alias = {}
         self.untagged_command_title = untagged_command_title
 
         super().__init__(*args, **kwargs)
@@ -41,6 +78,24 @@ class SuperGroup(click.Group):
         if tags:
             self.associate_tags(cmd, tags)
 
+    def add_lazy_command(self, name: str, import_path: str, aliases: Optional[Iterable[str]] = None, tags: Optional[Iterable[str]] = None, **help_kwargs) -> LazyCommand:
+        """
+        Register a command by name, deferring the import of its module until it is invoked. See LazyCommand for the arguments
+        """
+        lazy_cmd = LazyCommand(name, import_path, aliases=aliases, tags=tags, **help_kwargs)
+        self.lazy_cmds[name] = lazy_cmd
+        for alias in lazy_cmd.aliases:
+            self.lazy_cmds_by_alias[alias] = lazy_cmd
+        return lazy_cmd
+
+    def _load_lazy_command(self, lazy_cmd: LazyCommand):
+        self.lazy_cmds.pop(lazy_cmd.name, None)
+        for alias in lazy_cmd.aliases:
+            self.lazy_cmds_by_alias.pop(alias, None)
+        cmd = lazy_cmd.load()
+        if cmd is not None and lazy_cmd.name not in self.commands:
+            self.add_command(cmd, name=lazy_cmd.name, aliases=lazy_cmd.aliases, tags=lazy_cmd.tags)
+
     def command(self, *args, aliases: Optional[Iterable[str]] = None, tags: Optional[Iterable[str]] = None, **kwargs):
         parent_decorator = super().command(*args, **kwargs)
         if not aliases and not tags:
@@ -68,6 +123,18 @@ class SuperGroup(click.Group):
         return decorator
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        cmd = self._get_loaded_command(ctx, cmd_name)
+        if cmd is not None:
+            return cmd
+
+        # Import the command, if registered lazily under this name or alias
+        lazy_cmd = self.lazy_cmds.get(cmd_name, self.lazy_cmds_by_alias.get(cmd_name, None))
+        if lazy_cmd is None:
+            return None
+        self._load_lazy_command(lazy_cmd)
+        return self._get_loaded_command(ctx, cmd_name)
+
+    def _get_loaded_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
         cmd = super().get_command(ctx, cmd_name)
         if cmd is not None:
             return cmd
@@ -76,6 +143,9 @@ class SuperGroup(click.Group):
         cmd = self.cmds_by_alias.get(cmd_name, None)
         return cmd
 
+    def list_commands(self, ctx: click.Context) -> Iterable[str]:
+        return sorted(set(self.commands).union(self.lazy_cmds))
+
     def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
         """
         Override format_commands to separate commands by tag
@@ -88,16 +158,20 @@ class SuperGroup(click.Group):
         cmds_by_tag = self._establish_tag_buckets()
         untagged_cmds = []
         for cmd_name in self.list_commands(ctx):
-            cmd = self.get_command(ctx, cmd_name)
+            # Commands not yet imported are listed from their registration
+            cmd = self._get_loaded_command(ctx, cmd_name)
+            if cmd is None:
+                cmd = self.lazy_cmds.get(cmd_name, None)
             if cmd is None:
                 continue
             if cmd.hidden:
                 continue
             
-            if cmd not in self.cmd_tags or len(self.cmd_tags[cmd]) == 0:
+            cmd_tags = cmd.tags if isinstance(cmd, LazyCommand) else self.cmd_tags.get(cmd, [])
+            if len(cmd_tags) == 0:
                 untagged_cmds.append((cmd_name, cmd))
             else:
-                for tag in self.cmd_tags[cmd]:
+                for tag in cmd_tags:
                     if tag not in cmds_by_tag:
                         cmds_by_tag[tag] = []
                     cmds_by_tag[tag].append((cmd_name, cmd))
@@ -0,0 +1,36 @@
+from typing import List, Sequence, Dict, Any, Tuple
+from lmctl.client import TNCOClient, ProcessWaitResult
+from lmctl.cli.controller import get_global_controller
+from lmctl.cli.arguments import WAIT_PARAM_NAME, WAIT_TIMEOUT_PARAM_NAME
+
+__all__ = (
+    'wait_for_processes',
+    'pop_wait_params',
+)
+
+def pop_wait_params(kwargs: Dict[str, Any]) -> Tuple[bool, float]:
+    """
+    Removes the values of the WaitOption and WaitTimeoutOption from the kwargs of a command callback, so they are not passed to its behaviour
+    """
+    return kwargs.pop(WAIT_PARAM_NAME, False), kwargs.pop(WAIT_TIMEOUT_PARAM_NAME, None)
+
+def wait_for_processes(tnco_client: TNCOClient, process_ids: Sequence[str], timeout: float = None) -> List[ProcessWaitResult]:
+    """
+    Wait for each process to finish, printing each change in status. Exits with an error if any process does not complete successfully 
+    (a timeout raises a ProcessWaitTimeoutError, which is reported by the CLI safety net)
+    """
+    io = get_global_controller().io
+
+    def print_change(result: ProcessWaitResult):
+        io.print(f'Process {result.process_id}: {result.status}')
+
+    results = tnco_client.processes.wait(process_ids, timeout=timeout, on_change=print_change)
+    unsuccessful = [r for r in results if not r.completed]
+    if len(unsuccessful) > 0:
+        for result in unsuccessful:
+            msg = f'Error: Process {result.process_id} did not complete successfully: {result.status}'
+            if result.status_reason:
+                msg += f' - {result.status_reason}'
+            io.print_error(msg)
+        exit(1)
+    return results
@@ -2,9 +2,10 @@ from typing import Dict, Any
 from .tnco_env_command import TNCOEnvironmentCommand
 from .obj_utils import shallow_merge_objs
 from .constraints import mutually_exclusive
+from .process_wait import wait_for_processes, pop_wait_params
 from lmctl.cli.controller import get_global_controller
 from lmctl.cli.arguments import (
-    FileInputOption, SetParamOption, ObjectGroupOption, ObjectGroupIDOption, 
+    FileInputOption, SetParamOption, ObjectGroupOption, ObjectGroupIDOption, WaitOption, WaitTimeoutOption,
     OBJECT_GROUP_PARAM_NAME, OBJECT_GROUP_ID_PARAM_NAME, OBJECT_GROUP_PARAM_OPTS_STR, OBJECT_GROUP_ID_PARAM_OPTS_STR
 )
 
@@ -21,6 +22,7 @@ class TNCOCreateCommand(TNCOEnvironmentCommand):
                  result_prefix: str = 'Created: ', 
                  additional_help: str = None, 
                  allow_object_group: bool = False, 
+                 allow_wait: bool = False,
                  **kwargs
             ):
         self.type_display_name = type_display_name
@@ -28,6 +30,7 @@ class TNCOCreateCommand(TNCOEnvironmentCommand):
         self.additional_help = additional_help
         self.print_result = print_result
         self.allow_object_group = allow_object_group
+        self.allow_wait = allow_wait
         if 'help' not in kwargs or kwargs['help'] is None:
             kwargs['help'] = self._build_help()
         if 'short_help' not in kwargs or kwargs['short_help'] is None:
@@ -38,6 +41,9 @@ class TNCOCreateCommand(TNCOEnvironmentCommand):
         if self.allow_object_group:
             self.params.append(ObjectGroupOption())
             self.params.append(ObjectGroupIDOption())
+        if self.allow_wait:
+            self.params.append(WaitOption())
+            self.params.append(WaitTimeoutOption())
 
         self.create_behaviour = self.callback
         self.callback = self._callback
@@ -56,6 +62,7 @@ class TNCOCreateCommand(TNCOEnvironmentCommand):
                     object_group_name: str = None,
                     object_group_id: str = None,
                     **kwargs):
+        wait, wait_timeout = pop_wait_params(kwargs) if self.allow_wait else (False, None)
         tnco_client = self._get_tnco_client(environment_name, pwd, client_secret, token)
         obj = shallow_merge_objs(file_content, set_values)
 
@@ -75,6 +82,10 @@ class TNCOCreateCommand(TNCOEnvironmentCommand):
             text += str(result)
             io.print(text)
 
+        if wait:
+            # Result of the create behaviour is the ID of the process started
+            wait_for_processes(tnco_client, [result], timeout=wait_timeout)
+
     def _build_help(self) -> str:
         help_msg = f'Create a {self.type_display_name}'
         help_msg += f'\n\nUse the "-f, --file" option to parse input data as a file in a supported format.'
@@ -4,8 +4,9 @@ from .identifier import Identifier, determine_identifier, strip_identifiers
 from .ignore_missing import IgnoreMissingSafetyNet, DisableIgnoreMissingSafetyNet, tnco_missing_detector
 from .tnco_env_command import TNCOEnvironmentCommand
 from .constraints import mutually_exclusive
+from .process_wait import wait_for_processes, pop_wait_params
 from lmctl.cli.controller import get_global_controller
-from lmctl.cli.arguments import FileInputOption, IgnoreMissingOption
+from lmctl.cli.arguments import FileInputOption, IgnoreMissingOption, WaitOption, WaitTimeoutOption
 
 __all__ = (
     'TNCODeleteCommand',
@@ -22,6 +23,7 @@ class TNCODeleteCommand(TNCOEnvironmentCommand):
                 additional_help: str = None,
                 missing_detector: Callable = tnco_missing_detector,
                 allow_file_input: bool = True,
+                allow_wait: bool = False,
                 **kwargs
             ):
         self.type_display_name = type_display_name
@@ -31,6 +33,7 @@ class TNCODeleteCommand(TNCOEnvironmentCommand):
         self.additional_help = additional_help
         self.missing_detector = missing_detector
         self.allow_file_input = allow_file_input
+        self.allow_wait = allow_wait
         if 'help' not in kwargs or kwargs['help'] is None:
             kwargs['help'] = self._build_help()
         if 'short_help' not in kwargs or kwargs['short_help'] is None:
@@ -40,6 +43,9 @@ class TNCODeleteCommand(TNCOEnvironmentCommand):
             file_input_option = FileInputOption()
             self.params.append(file_input_option)
         self.params.append(IgnoreMissingOption())
+        if self.allow_wait:
+            self.params.append(WaitOption())
+            self.params.append(WaitTimeoutOption())
 
         self.delete_behaviour = self.callback
         self.callback = self._callback
@@ -60,6 +66,7 @@ class TNCODeleteCommand(TNCOEnvironmentCommand):
                     file_content: Dict[str, Any] = None,
                     ignore_missing: bool = False,
                     **kwargs):
+        wait, wait_timeout = pop_wait_params(kwargs) if self.allow_wait else (False, None)
         identity = determine_identifier(self.identifiers, required=self.identifier_required, file_content=file_content, **kwargs)
         tnco_client = self._get_tnco_client(environment_name, pwd, client_secret, token)
 
@@ -81,6 +88,9 @@ class TNCODeleteCommand(TNCOEnvironmentCommand):
                 text += str(self.result_prefix)
             text += str(result)
             io.print(text)
+            if wait:
+                # Result of the delete behaviour is the ID of the process started
+                wait_for_processes(tnco_client, [result], timeout=wait_timeout)
 
     def _build_help(self) -> str:
         help_msg = f'Delete a {self.type_display_name}'
@@ -2,8 +2,9 @@ from typing import Dict, Any, Sequence, Tuple
 from .identifier import Identifier, determine_identifier, strip_identifiers
 from .tnco_env_command import TNCOEnvironmentCommand
 from .constraints import mutually_exclusive
+from .process_wait import wait_for_processes, pop_wait_params
 from lmctl.cli.arguments import (
-    FileInputOption, ObjectGroupOption, ObjectGroupIDOption, 
+    FileInputOption, ObjectGroupOption, ObjectGroupIDOption, WaitOption, WaitTimeoutOption,
     OBJECT_GROUP_PARAM_NAME, OBJECT_GROUP_ID_PARAM_NAME, OBJECT_GROUP_PARAM_OPTS_STR, OBJECT_GROUP_ID_PARAM_OPTS_STR
 )
 
@@ -25,6 +26,7 @@ class TNCOGeneralCommand(TNCOEnvironmentCommand):
                 file_mutually_exclusive_with_identifiers: bool = True,
                 pass_file_content: bool = False, 
                 allow_object_group: bool = False, 
+                allow_wait: bool = False,
                 **kwargs
             ):
         self.type_display_name = type_display_name
@@ -36,6 +38,7 @@ class TNCOGeneralCommand(TNCOEnvironmentCommand):
         self.allow_file_input = allow_file_input
         self.pass_file_content = pass_file_content
         self.allow_object_group = allow_object_group
+        self.allow_wait = allow_wait
         if 'help' not in kwargs or kwargs['help'] is None:
             kwargs['help'] = self._build_help()
         super().__init__(*args, **kwargs)
@@ -45,6 +48,9 @@ class TNCOGeneralCommand(TNCOEnvironmentCommand):
         if self.allow_object_group:
             self.params.append(ObjectGroupOption())
             self.params.append(ObjectGroupIDOption())
+        if self.allow_wait:
+            self.params.append(WaitOption())
+            self.params.append(WaitTimeoutOption())
 
         self.behaviour = self.callback
         self.callback = self._callback
@@ -77,6 +83,7 @@ class TNCOGeneralCommand(TNCOEnvironmentCommand):
                     object_group_name: str = None,
                     object_group_id: str = None,
                     **kwargs):
+        wait, wait_timeout = pop_wait_params(kwargs) if self.allow_wait else (False, None)
         if len(self.identifiers) > 0:
             identity = determine_identifier(self.identifiers, required=self.identifier_required, file_content=file_content, **kwargs)
         tnco_client = self._get_tnco_client(environment_name, pwd, client_secret, token)
@@ -105,6 +112,10 @@ class TNCOGeneralCommand(TNCOEnvironmentCommand):
 
         result = self.behaviour(*args, tnco_client=tnco_client, **stripped_kwargs)
 
+        if wait:
+            # Behaviours of commands allowing wait return the ID of the process started
+            wait_for_processes(tnco_client, [result], timeout=wait_timeout)
+
         return result
 
     def _build_help(self) -> str:
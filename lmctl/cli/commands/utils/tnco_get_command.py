@@ -1,4 +1,5 @@
 import click
+from collections.abc import Iterator
 from typing import Dict, Any, Sequence, Tuple
 from .identifier import Identifier, determine_identifier, strip_identifiers
 from .tnco_env_command import TNCOEnvironmentCommand
@@ -43,7 +44,7 @@ class TNCOGetCommand(TNCOEnvironmentCommand):
         if self.allow_file_input:
             file_input_option = FileInputOption()
             self.params.append(file_input_option)
-        self.params.append(OutputFormatOption(default_columns=default_columns))
+        self.params.append(OutputFormatOption(default_columns=default_columns, allow_ndjson=True))
         if self.allow_object_group:
             self.params.append(ObjectGroupOption())
             self.params.append(ObjectGroupIDOption())
@@ -92,6 +93,9 @@ class TNCOGetCommand(TNCOEnvironmentCommand):
         io = get_global_controller().io
         if isinstance(result, list):
             io.print(output_format.convert_list(result))
+        elif isinstance(result, Iterator):
+            # Results from a paged API are printed as each page arrives, rather than once all are held in memory
+            io.print_stream(output_format.convert_iter(result))
         else:
             io.print(output_format.convert_element(result))
 
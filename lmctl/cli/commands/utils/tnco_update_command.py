@@ -4,8 +4,9 @@ from .tnco_env_command import TNCOEnvironmentCommand
 from .obj_utils import shallow_merge_objs
 from .identifier import Identifier, determine_identifier, strip_identifiers
 from .constraints import mutually_exclusive
+from .process_wait import wait_for_processes, pop_wait_params
 from lmctl.cli.controller import get_global_controller
-from lmctl.cli.arguments import FileInputOption, SetParamOption
+from lmctl.cli.arguments import FileInputOption, SetParamOption, WaitOption, WaitTimeoutOption
 
 __all__ = (
     'TNCOUpdateCommand',
@@ -21,6 +22,7 @@ class TNCOUpdateCommand(TNCOEnvironmentCommand):
                 result_prefix: str = 'Updated: ', 
                 additional_help: str = None, 
                 allow_patch: bool = True,
+                allow_wait: bool = False,
                 **kwargs
             ):
         self.type_display_name = type_display_name
@@ -29,6 +31,7 @@ class TNCOUpdateCommand(TNCOEnvironmentCommand):
         self.result_prefix = result_prefix
         self.additional_help = additional_help
         self.allow_patch = allow_patch
+        self.allow_wait = allow_wait
         if 'help' not in kwargs or kwargs['help'] is None:
             kwargs['help'] = self._build_help()
         if 'short_help' not in kwargs or kwargs['short_help'] is None:
@@ -36,6 +39,9 @@ class TNCOUpdateCommand(TNCOEnvironmentCommand):
         super().__init__(*args, **kwargs)
         self.params.append(FileInputOption())
         self.params.append(SetParamOption())
+        if self.allow_wait:
+            self.params.append(WaitOption())
+            self.params.append(WaitTimeoutOption())
 
         self.update_behaviour = self.callback
         self.callback = self._callback
@@ -54,6 +60,7 @@ class TNCOUpdateCommand(TNCOEnvironmentCommand):
                     file_content: Dict[str, Any] = None,
                     set_values: Dict[str, Any] = None,
                     **kwargs):
+        wait, wait_timeout = pop_wait_params(kwargs) if self.allow_wait else (False, None)
         obj = shallow_merge_objs(file_content, set_values)
         identity = determine_identifier(self.identifiers, required=True, file_content=file_content, **kwargs)
         stripped_kwargs = strip_identifiers(self.identifiers, **kwargs)
@@ -73,6 +80,10 @@ class TNCOUpdateCommand(TNCOEnvironmentCommand):
             text += str(result)
             io.print(text)
 
+        if wait:
+            # Result of the update behaviour is the ID of the process started
+            wait_for_processes(tnco_client, [result], timeout=wait_timeout)
+
     def _build_help(self) -> str:
         help_msg = f'Update a {self.type_display_name}'
         help_msg += f'\n\nUse the "-f, --file" option to parse input data as a file in a supported format.'
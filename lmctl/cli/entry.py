@@ -1,17 +1,18 @@
 import click
 import os
 import logging
-import urllib3
-import lmctl.cli.commands as lmctl_commands
+import warnings
 import lmctl.utils.logging as lmctl_logging
 
 from lmctl.cli.commands import action_groups
+from lmctl.cli.commands import registry_data
 
 from .safety_net import safety_net
 from .commands.super_group import SuperGroup
 from .tags import SETTINGS_TAG, ACTIONS_TAG, PROJECT_TAG, DEPRECATED_TAG
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# Equivalent to urllib3.disable_warnings(InsecureRequestWarning), without importing urllib3 when the command invoked does not use it
+warnings.filterwarnings('ignore', message='Unverified HTTPS request')
 logging.captureWarnings(True)
 
 @click.group(cls=SuperGroup, tag_order=[SETTINGS_TAG, ACTIONS_TAG, PROJECT_TAG, DEPRECATED_TAG], help=f'CP4NA orchestration command line tools')
@@ -22,17 +23,9 @@ def cli():
 
 lmctl_logging.setup_logging()
 
-cli.add_command(lmctl_commands.deployment_group, tags=[DEPRECATED_TAG])
-cli.add_command(lmctl_commands.env_group, tags=[DEPRECATED_TAG])
-cli.add_command(lmctl_commands.resourcedriver_group, tags=[DEPRECATED_TAG])
-cli.add_command(lmctl_commands.pkg_group, tags=[PROJECT_TAG])
-cli.add_command(lmctl_commands.project_group, tags=[PROJECT_TAG])
-cli.add_command(lmctl_commands.key_group, tags=[DEPRECATED_TAG])
-cli.add_command(lmctl_commands.lifecycledriver_group, tags=[DEPRECATED_TAG]) 
-cli.add_command(lmctl_commands.vimdriver_group, tags=[DEPRECATED_TAG]) 
-cli.add_command(lmctl_commands.login_cmd, tags=[SETTINGS_TAG])
-cli.add_command(lmctl_commands.logdir_cmd, tags=[SETTINGS_TAG])
-cli.add_command(lmctl_commands.whoami_cmd, tags=[SETTINGS_TAG])
+# Commands are registered by name, so the module of a command is only imported when it is invoked
+for registered_command in registry_data.TOP_LEVEL_COMMANDS:
+    cli.add_lazy_command(**registered_command)
 
 ACTION_EXTRA_TAGS = {
     'use': [SETTINGS_TAG],
@@ -41,6 +34,8 @@ ACTION_EXTRA_TAGS = {
 
 for action_group_definition in action_groups:
     action_group = action_group_definition['group']
+    for registered_command in registry_data.ACTION_COMMANDS.get(action_group.name, []):
+        action_group.add_lazy_command(**registered_command)
     if action_group.name in ACTION_EXTRA_TAGS:
         tags = ACTION_EXTRA_TAGS[action_group.name]
     else:
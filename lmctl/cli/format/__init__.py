@@ -1,6 +1,7 @@
 from .output_format import OutputFormat
 from .input_format import InputFormat
 from .json import JsonFormat
+from .ndjson import NdjsonFormat
 from .yaml import YamlFormat
 from .table import TableFormat, Table, Column
 from .exceptions import BadFormatError
@@ -9,6 +10,7 @@ import warnings
 TABLE_FORMAT = 'table'
 YAML_FORMAT = 'yaml'
 JSON_FORMAT = 'json'
+NDJSON_FORMAT = 'ndjson'
 
 def determine_format_class(output_format):
     warnings.warn('determine_format_class is deprecated, use lmctl.cli.argument.format.FormatOptionBuilder instead', DeprecationWarning)
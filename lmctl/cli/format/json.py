@@ -1,7 +1,7 @@
 from .output_format import OutputFormat
 from .input_format import InputFormat
 from .exceptions import BadFormatError
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Iterable, Iterator
 from lmctl.utils.dcutils.dc_to_dict import asdict
 import dataclasses
 import json 
@@ -21,6 +21,21 @@ class JsonFormat(OutputFormat, InputFormat):
         except json.JSONDecodeError as e:
             raise BadFormatError(f'Failed to convert to JSON: {e}') from e
 
+    def convert_iter(self, elements: Iterable[Any]) -> Iterator[str]:
+        # Written in the layout of json.dumps with an indent of 2, so the output is the same as convert_list
+        empty = True
+        for e in elements:
+            item = self.convert_element(e).replace('\n', '\n    ')
+            if empty:
+                empty = False
+                yield '{\n  "items": [\n    ' + item
+            else:
+                yield ',\n    ' + item
+        if empty:
+            yield '{\n  "items": []\n}'
+        else:
+            yield '\n  ]\n}'
+
     def convert_element(self, element: Any) -> str:
         if dataclasses.is_dataclass(type(element)):
             element = asdict(element)
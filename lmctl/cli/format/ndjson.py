@@ -0,0 +1,27 @@
+from .output_format import OutputFormat
+from .exceptions import BadFormatError
+from typing import List, Any, Iterable, Iterator
+from lmctl.utils.dcutils.dc_to_dict import asdict
+import dataclasses
+import json
+
+class NdjsonFormat(OutputFormat):
+    """
+    Newline delimited JSON: each element as a compact JSON document on its own line, without the "items" wrapper of JsonFormat.
+    Suited to streaming, as each line can be written (and consumed by tools such as jq or grep) as soon as the element is converted
+    """
+
+    def convert_list(self, element_list: List[Any]) -> str:
+        return '\n'.join(self.convert_element(e) for e in element_list)
+
+    def convert_iter(self, elements: Iterable[Any]) -> Iterator[str]:
+        for e in elements:
+            yield self.convert_element(e) + '\n'
+
+    def convert_element(self, element: Any) -> str:
+        if dataclasses.is_dataclass(type(element)):
+            element = asdict(element)
+        try:
+            return json.dumps(element, separators=(',', ':'))
+        except (TypeError, ValueError) as e:
+            raise BadFormatError(f'Failed to convert to JSON: {e}') from e
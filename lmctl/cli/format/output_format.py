@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import List, Any, Iterable, Iterator
 
 class OutputFormat(ABC):
 
@@ -10,3 +10,10 @@ class OutputFormat(ABC):
     @abstractmethod
     def convert_element(self, element: Any) -> str:
         pass
+
+    def convert_iter(self, elements: Iterable[Any]) -> Iterator[str]:
+        """
+        Convert elements as they are produced, yielding chunks of output which, joined together, are equal to the output of convert_list
+        (plus a final newline, for formats which end each chunk with one). Formats which cannot produce output incrementally convert all of the elements at once
+        """
+        yield self.convert_list(list(elements))
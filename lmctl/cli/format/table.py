@@ -1,5 +1,6 @@
 from .output_format import OutputFormat
-from typing import Union, Callable, List, Any
+import itertools
+from typing import Union, Callable, List, Any, Iterable, Iterator
 from tabulate import tabulate
 from pydantic.dataclasses import dataclass, Field
 
@@ -13,6 +14,9 @@ class Column:
 class Table:
     columns: List[Column] = Field(default_factory=list)
 
+# Number of rows converted at a time by convert_iter
+STREAM_BATCH_SIZE = 100
+
 class TableFormat(OutputFormat):
 
     def __init__(self, headers: List[str] = None, row_processor: Callable = None, table: Table = None):
@@ -47,22 +51,58 @@ class TableFormat(OutputFormat):
                     raise TypeError(f'Found an instance of "{type(c)}" in table "{self.table}" columns when they must be an instance of "{Column.__name__}"')
         return columns
 
+    def _get_headers(self, columns: List[Column]):
+        if columns is None:
+            return self.headers
+        headers = []
+        for c in columns:
+            if c.header is not None:
+                headers.append(c.header)
+            else:
+                headers.append(c.name)
+        return headers
+
     def convert_list(self, element_list: List[Any]):
         columns = self._get_columns()
-        if columns is None:
-            headers = self.headers
-        else:
-            headers = []
-            for c in columns:
-                if c.header is not None:
-                    headers.append(c.header)
-                else:
-                    headers.append(c.name)
+        headers = self._get_headers(columns)
         rows = []
         for element in element_list:
             rows.append(self.__element_to_table_row(element, columns))
         return tabulate(rows, headers=headers, tablefmt='orgtbl')
 
+    def convert_iter(self, elements: Iterable[Any]) -> Iterator[str]:
+        """
+        Convert rows in batches as the elements are produced. The widths of the columns are set by the first batch, so a
+        longer value in a later batch widens only its own row. Anything which fits in one batch is output as convert_list does
+        """
+        elements = iter(elements)
+        first_batch = list(itertools.islice(elements, STREAM_BATCH_SIZE))
+        first_table = self.convert_list(first_batch)
+        yield first_table
+        if len(first_batch) < STREAM_BATCH_SIZE:
+            return
+        columns = self._get_columns()
+        # The separator below the headers gives the width of each column (plus the space either side of the value)
+        separator = first_table.split('\n')[1]
+        widths = [len(segment) - 2 for segment in separator.strip('|').split('+')]
+        while True:
+            batch = list(itertools.islice(elements, STREAM_BATCH_SIZE))
+            if len(batch) == 0:
+                return
+            lines = [self.__format_row(self.__element_to_table_row(element, columns), widths) for element in batch]
+            yield '\n' + '\n'.join(lines)
+
+    def __format_row(self, row: List[Any], widths: List[int]) -> str:
+        cells = []
+        for value, width in itertools.zip_longest(row, widths, fillvalue=0):
+            if value is None:
+                value = ''
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                cells.append(str(value).rjust(width))
+            else:
+                cells.append(str(value).ljust(width))
+        return '| ' + ' | '.join(cells) + ' |'
+
     def convert_element(self, element: Any):
         return self.convert_list([element])
 
@@ -1,7 +1,7 @@
 from .output_format import OutputFormat
 from .input_format import InputFormat
 from .exceptions import BadFormatError
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Iterable, Iterator
 from lmctl.utils.dcutils.dc_to_dict import asdict
 import dataclasses
 import yaml
@@ -21,6 +21,24 @@ class YamlFormat(OutputFormat):
         except yaml.YAMLError as e:
             raise BadFormatError(f'Failed to convert to YAML: {e}') from e
 
+    def convert_iter(self, elements: Iterable[Any]) -> Iterator[str]:
+        # Each element is dumped as a single item list, which is the same as its entry in the list dumped by convert_list
+        empty = True
+        for e in elements:
+            if dataclasses.is_dataclass(type(e)):
+                e = asdict(e)
+            try:
+                item = yaml.dump([e], sort_keys=False)
+            except yaml.YAMLError as ex:
+                raise BadFormatError(f'Failed to convert to YAML: {ex}') from ex
+            if empty:
+                empty = False
+                yield 'items:\n' + item
+            else:
+                yield item
+        if empty:
+            yield self.convert_list([])
+
     def convert_element(self, element: Any) -> str:
         if dataclasses.is_dataclass(type(element)):
             element = asdict(element)
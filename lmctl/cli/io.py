@@ -23,5 +23,16 @@ class IOController:
     def print(self, text):
         self.__print(text)
 
+    def print_stream(self, chunks):
+        """
+        Print each chunk of output as it is produced, ending with a newline if the last chunk does not
+        """
+        last_chunk = None
+        for chunk in chunks:
+            self.__print(chunk, nl=False)
+            last_chunk = chunk
+        if last_chunk is not None and not last_chunk.endswith('\n'):
+            self.__print('')
+
     def __print(self, text, **kwargs):
         click.echo(text, **kwargs)
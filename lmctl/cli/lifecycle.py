@@ -60,10 +60,11 @@ def open_project(project_path):
         logger.exception(str(e))
         exit(1)
 
-def get_pkg_and_open(pkg_path):
+def get_pkg_and_read_meta(pkg_path):
     try:
         pkg = pkgs.Pkg(pkg_path)
-        return pkg, pkg.open()
+        # Only the meta is read from the package, nothing is extracted
+        return pkg, pkg.read_meta()
     except pkgs.InvalidPackageError as e:
         printer.print_text('Error: {0}'.format(str(e)))
         logger.exception(str(e))
@@ -77,6 +78,14 @@ def open_pkg(pkg_path):
         logger.exception(str(e))
         exit(1)
 
+def inspect_pkg(pkg_path):
+    try:
+        return pkgs.Pkg(pkg_path).inspect()
+    except pkgs.InvalidPackageError as e:
+        printer.print_text('Error: {0}'.format(str(e)))
+        logger.exception(str(e))
+        exit(1)
+
 def resolve_object_group(tnco_client, object_group_id = None, object_group_name = None):
     if object_group_id is not None:
         return object_group_id
@@ -236,6 +245,24 @@ class TestReporter:
         return details
 
 
+class RecursiveBuildReporter:
+
+    def failed_report(self, build_result):
+        report = ['The following projects failed to build:']
+        for outcome in build_result.failed:
+            report.append('  {0}: {1}'.format(outcome.name, outcome.error))
+            for message in outcome.validation_errors:
+                report.append('    - {0}'.format(message))
+        return report
+
+    def warning_report(self, build_result):
+        report = ['Validation returned with the following warnings:']
+        for outcome in build_result.outcomes:
+            for message in outcome.validation_warnings:
+                report.append('\t- [{0}] {1}'.format(outcome.name, message))
+        return report
+
+
 class ExecutionController:
 
     def __init__(self, title):
@@ -291,6 +318,14 @@ class ExecutionController:
             validation_report = ValidationReporter().error_report(validation_result)
             self.end_with_failure(validation_report)
 
+    def process_recursive_build_result(self, build_result):
+        printer.print_section('Build Results')
+        printer.print_text('Built: {0}, Skipped: {1}, Failed: {2}'.format(len(build_result.built), len(build_result.skipped), len(build_result.failed)))
+        if any(len(outcome.validation_warnings) > 0 for outcome in build_result.outcomes):
+            self.include_warning(RecursiveBuildReporter().warning_report(build_result))
+        if build_result.has_failures():
+            self.end_with_failure(RecursiveBuildReporter().failed_report(build_result))
+
     def process_test_report(self, test_report):
         printer.print_section('Test Results')
         printer.print_text('Passed: {0}, Failed: {1}, Skipped: {2}'.format(test_report.passed_count(), test_report.failed_count(), test_report.skipped_count()))
@@ -2,9 +2,6 @@ import click
 import logging
 from typing import List
 from lmctl.cli.io import IOController
-from lmctl.client import TNCOClientError
-from lmctl.drivers.lm.base import LmDriverException
-from lmctl.drivers.arm import AnsibleRmDriverException
 
 logger = logging.getLogger(__name__)
 
@@ -32,10 +29,16 @@ def safety_net(*catchable_exceptions, error_prefix: str = 'Error: ', io_controll
         catchable_exceptions = [Exception]
     return ExceptionSafetyNet(catchable_exceptions, error_prefix=error_prefix, io_controller=io_controller)
 
+# The client and drivers are imported when needed, as the safety net wraps every command (including those which do not use them)
+
 def tnco_client_safety_net(*extra_exceptions, io_controller: IOController = None):
+    from lmctl.client import TNCOClientError
     exceptions = [TNCOClientError]
     exceptions.extend(extra_exceptions)
     return safety_net(*exceptions, error_prefix='TNCO error occurred: ', io_controller=io_controller)
 
 def lm_driver_safety_net(io_controller: IOController = None):
+    from lmctl.client import TNCOClientError
+    from lmctl.drivers.lm.base import LmDriverException
+    from lmctl.drivers.arm import AnsibleRmDriverException
     return safety_net(LmDriverException, AnsibleRmDriverException, TNCOClientError, error_prefix='TNCO error occurred: ', io_controller=io_controller)
\ No newline at end of file
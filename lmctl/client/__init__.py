@@ -10,6 +10,10 @@ from .token_auth import JwtTokenAuth
 from .error_capture import TNCOErrorCapture, tnco_error_capture
 from .client_test_result import TestResult, TestResults
 from .client_request import TNCOClientRequest
+from .transport import TNCOTransportOptions
+from .token_cache import TokenCache
+from .process_watcher import ProcessWatcher, ProcessWaitResult, ProcessWaitTimeoutError, PROCESS_END_STATUSES
+from .bulk_intents import BulkIntentSubmitter, BulkIntentResult, BulkIntentResults, RateLimiter
 from .constants import *
 
 def builder():
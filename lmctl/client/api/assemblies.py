@@ -1,5 +1,5 @@
 import urllib
-from typing import List, Dict, Union
+from typing import List, Dict, Union, Iterator, Iterable, Any, Callable
 from lmctl.client.exceptions import TNCOClientError
 from lmctl.client.models import (CreateAssemblyIntent, UpgradeAssemblyIntent, ChangeAssemblyStateIntent, 
                                     DeleteAssemblyIntent, ScaleAssemblyIntent, HealAssemblyIntent,
@@ -7,8 +7,9 @@ from lmctl.client.models import (CreateAssemblyIntent, UpgradeAssemblyIntent, Ch
                                     RollbackAssemblyIntent, CancelAssemblyIntent, RetryAssemblyIntent, Intent)
 
 from lmctl.client.client_request import TNCOClientRequest
-from .tnco_api_base import TNCOAPI
+from .tnco_api_base import TNCOAPI, DEFAULT_PAGE_SIZE
 from lmctl.client.utils import build_relative_endpoint
+from lmctl.client.bulk_intents import BulkIntentSubmitter, BulkIntentResult, BulkIntentResults, DEFAULT_INTENT_CONCURRENCY
 
 INTENTS_WITHOUT_LOCATION_HEADER = ["retry", "rollback", "cancel"]
 
@@ -23,6 +24,9 @@ class AssembliesAPI(TNCOAPI):
     def get_topN(self, object_group_id: str = None) -> List:
         return self._get_json(self.topology_endpoint, object_group_id=object_group_id)
 
+    def iter_topN(self, object_group_id: str = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict]:
+        return self._iter_all(endpoint=self.topology_endpoint, object_group_id=object_group_id, page_size=page_size)
+
     def get_by_name(self, name: str) -> Dict:
         result = self.all_with_name(name)
         if len(result) == 0:
@@ -50,6 +54,17 @@ class AssembliesAPI(TNCOAPI):
                      object_group_id: str = None) -> str:
         return self._intent_request_impl(intent_name, intent_obj, object_group_id=object_group_id)
 
+    def submit_intents(self, intents: Iterable[Dict[str, Any]], concurrency: int = DEFAULT_INTENT_CONCURRENCY, rate_limit: float = None,
+                        object_group_id: str = None, wait: bool = False, wait_timeout: float = None,
+                        on_result: Callable[[BulkIntentResult], None] = None) -> BulkIntentResults:
+        """
+        Submit many intents, each a dict including an "intentType" attribute, with up to "concurrency" requests in flight
+        and no more than "rate_limit" started each second (see BulkIntentSubmitter). Failures are recorded on the result of each intent, rather than raised.
+        Set wait to also wait for all of the resulting processes to finish
+        """
+        submitter = BulkIntentSubmitter(self, self.base_client.processes, concurrency=concurrency, rate_limit=rate_limit)
+        return submitter.submit(intents, object_group_id=object_group_id, wait=wait, wait_timeout=wait_timeout, on_result=on_result)
+
     def intent_create(self, intent_obj: Union[Dict, CreateAssemblyIntent], object_group_id: str = None) -> str:
         return self._intent_request_impl('createAssembly', intent_obj, object_group_id=object_group_id)
 
@@ -1,6 +1,7 @@
-from typing import List, Dict
-from .tnco_api_base import TNCOAPI
+from typing import List, Dict, Iterator, Iterable, Callable
+from .tnco_api_base import TNCOAPI, DEFAULT_PAGE_SIZE
 from lmctl.client.client_request import TNCOClientRequest
+from lmctl.client.process_watcher import ProcessWatcher, ProcessWaitResult
 
 class ProcessesAPI(TNCOAPI):
     endpoint = 'api/processes'
@@ -13,3 +14,20 @@ class ProcessesAPI(TNCOAPI):
 
     def query(self, object_group_id: str = None, **query_params) -> List:
         return self._get_json(self.endpoint, query_params=query_params, object_group_id=object_group_id)
+
+
+    def iter_query(self, object_group_id: str = None, page_size: int = DEFAULT_PAGE_SIZE, **query_params) -> Iterator[Dict]:
+        """
+        Query processes a page at a time, yielding each as it is received (see query for the supported query parameters)
+        """
+        limit = query_params.get('limit', None)
+        if limit is not None:
+            limit = int(limit)
+        return self._iter_all(query_params=query_params, object_group_id=object_group_id, page_size=page_size, limit=limit)
+
+    def wait(self, process_ids: Iterable[str], timeout: float = None, on_change: Callable[[ProcessWaitResult], None] = None, **watcher_kwargs) -> List[ProcessWaitResult]:
+        """
+        Wait for each process to finish (see ProcessWatcher.wait), polling all of them from a single loop.
+        Additional keyword arguments (min_interval, max_interval, backoff_factor) configure the polling of the ProcessWatcher
+        """
+        return ProcessWatcher(self, **watcher_kwargs).wait(process_ids, timeout=timeout, on_change=on_change)
@@ -1,15 +1,20 @@
-from typing import Dict, Callable, List
+from typing import Dict, Callable, List, Iterator
 from lmctl.client.client_request import TNCOClientRequest
+from lmctl.client.exceptions import TNCOClientError
 from lmctl.client.utils import (build_relative_endpoint, build_relative_endpoint_from_data, 
                         read_response_location_header, read_response_body_as_json, read_response_body_as_yaml, 
                         read_response_body_as_plaintext)
 
+DEFAULT_PAGE_SIZE = 100
 
 def default_create_response_handler_placeholder(response):
     pass
 
 class TNCOAPI:
     id_attr = 'id'
+    # Query parameters used to request a page of a collection (zero-based page number and number of items on each page)
+    page_param = 'page'
+    page_size_param = 'size'
 
     def __init__(self, base_client: 'TNCOClient'):
         self.base_client = base_client
@@ -46,6 +51,50 @@ class TNCOAPI:
             object_group_id=object_group_id
         )
 
+    def _iter_all(self, query_params: Dict[str,str] = None, endpoint: str = None, object_group_id: str = None, 
+                    page_size: int = DEFAULT_PAGE_SIZE, limit: int = None) -> Iterator[Dict]:
+        """
+        Iterate over a collection, requesting one page at a time as the previous is exhausted, so only a single page is held in memory.
+        Pages may be plain lists or page objects (with "content" and "last" attributes).
+
+        A server which ignores the paging parameters returns the whole collection (or the same page every time), which is detected and iterated once.
+        """
+        if endpoint is None:
+            endpoint = self.endpoint
+        if limit is not None:
+            page_size = min(page_size, limit)
+        page = 0
+        returned = 0
+        first_of_previous_page = None
+        while limit is None or returned < limit:
+            page_query_params = dict(query_params) if query_params is not None else {}
+            page_query_params[self.page_param] = page
+            page_query_params[self.page_size_param] = page_size
+            items, last = self.__read_page(self._get_json(endpoint=endpoint, query_params=page_query_params, object_group_id=object_group_id), page_size)
+            if len(items) == 0:
+                return
+            if page > 0 and items[0] == first_of_previous_page:
+                return
+            if len(items) > page_size:
+                last = True
+            for item in items:
+                if limit is not None and returned >= limit:
+                    return
+                returned += 1
+                yield item
+            if last:
+                return
+            first_of_previous_page = items[0]
+            page += 1
+
+    def __read_page(self, response, page_size: int):
+        if isinstance(response, list):
+            return response, len(response) < page_size
+        if isinstance(response, dict) and isinstance(response.get('content', None), list):
+            items = response['content']
+            return items, response.get('last', len(items) < page_size)
+        raise TNCOClientError(f'Expected a list or page of items in response but found: {type(response).__name__}')
+
     def _get(self, id_value: str, query_params: Dict[str,str] = None, endpoint: str = None) -> Dict:
         if endpoint is None:
             endpoint = self.endpoint
@@ -1,48 +1,158 @@
 from datetime import datetime, timedelta
+from typing import Callable, Dict
 from lmctl.utils.jwt import decode_jwt
 import logging
-import time
-import os
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Tokens are considered expired slightly early, so there is time to use them before the server rejects them
+EXPIRY_MARGIN_SECONDS = 0.75
+# Tokens are refreshed once they are within this many seconds of expiring
+DEFAULT_REFRESH_AHEAD_SECONDS = 10
+# Tokens read from the cache must be valid for at least this long (or the refresh_ahead_seconds, if longer), otherwise a new one is requested
+CACHED_TOKEN_MIN_TTL_SECONDS = 30
+
 class AuthTracker:
+    """
+    Tracks the current access token and when it expires.
+
+    Use get_access_token to obtain a token, providing a function to authenticate when a new one is needed.
+    The tracker is safe to share between threads: only one caller authenticates at a time and any others waiting on a token re-use the result.
+    Once a token is within the refresh_ahead_seconds window of expiring, it is refreshed by a single caller while others continue to use the current token.
+    """
 
-    def __init__(self):
+    def __init__(self, token_cache=None, cache_key: str = None, refresh_ahead_seconds: float = None):
         self.current_access_token = None
         self.time_of_auth = None # Datetime obj of when we're authenticated
         self._time_of_expiry = None # Datetime obj of when the current token expires
+        self.token_cache = token_cache
+        self.cache_key = cache_key
+        self.refresh_ahead_seconds = refresh_ahead_seconds if refresh_ahead_seconds is not None else DEFAULT_REFRESH_AHEAD_SECONDS
+        self._state_lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def _uses_cache(self):
+        return self.token_cache is not None and self.cache_key is not None
 
     @property
     def has_access_expired(self):
-        if self.current_access_token is None:
-            logger.debug('No current access token, must request one')
-            return True
-        logger.debug('Checking if CP4NA orchestration access token has expired')
-        now = datetime.now()
-        logger.debug(f'Authenticated at {self.time_of_auth.isoformat()}, the time is {now.isoformat()}, token has an expiration timestamp of {self._time_of_expiry.isoformat()}')
-        if now >= self._time_of_expiry:
-            logger.debug('Token expired, must request a new one')
-            return True
-        # If the token expires within 3/4 of a second, wait and get a new one
-        if now + timedelta(seconds = 0.75) >= self._time_of_expiry:
-            logger.debug('Expires in less than 1 second, must request a new one')
-            time.sleep(0.75)
-            return True
-        return False
-    
-    def accept_auth_response(self, auth_response):
+        """
+        True if there is no usable access token or the current one is due to be refreshed
+        """
+        with self._state_lock:
+            if self.current_access_token is None:
+                if not self._load_from_cache():
+                    logger.debug('No current access token, must request one')
+                    return True
+            if self._is_expired():
+                logger.debug('Token expired, must request a new one')
+                return True
+            if self._is_due_for_refresh():
+                logger.debug(f'Token expires within {self.refresh_ahead_seconds} second(s), should request a new one')
+                return True
+            return False
+
+    def get_access_token(self, authenticate: Callable[[], Dict]) -> str:
+        """
+        Returns a valid access token, calling authenticate to obtain a new one if there is no token or it is due to be refreshed
+
+        Args:
+            authenticate: function returning the response of an authentication request
+
+        Returns:
+            str: the access token
+        """
+        with self._state_lock:
+            if self.current_access_token is None:
+                self._load_from_cache()
+            token = self.current_access_token
+            usable = token is not None and not self._is_expired()
+            if usable and not self._is_due_for_refresh():
+                return token
+        if usable:
+            # Refresh ahead of expiry, unless another caller is already doing so, in which case carry on with the current token
+            if self._refresh_lock.acquire(blocking=False):
+                try:
+                    return self._refresh(authenticate, fallback_token=token)
+                finally:
+                    self._refresh_lock.release()
+            return token
+        with self._refresh_lock:
+            with self._state_lock:
+                # Another caller may have completed the refresh while we waited
+                if self.current_access_token is not None and not self._is_expired():
+                    return self.current_access_token
+            return self._refresh(authenticate)
+
+    def _refresh(self, authenticate: Callable[[], Dict], fallback_token: str = None) -> str:
+        logger.debug('Requesting new access token')
+        try:
+            auth_response = authenticate()
+        except Exception as e:
+            if fallback_token is None:
+                raise
+            logger.warning(f'Failed to refresh access token ahead of expiry, continuing with current token: {str(e)}')
+            return fallback_token
+        self.accept_auth_response(auth_response)
+        return self.current_access_token
+
+    def _is_expired(self) -> bool:
+        return datetime.now() + timedelta(seconds=EXPIRY_MARGIN_SECONDS) >= self._time_of_expiry
+
+    def _is_due_for_refresh(self) -> bool:
+        return datetime.now() + timedelta(seconds=self.refresh_ahead_seconds) >= self._time_of_expiry
+
+    def _load_from_cache(self) -> bool:
+        if not self._uses_cache:
+            return False
+        cached_token = self.token_cache.get(self.cache_key)
+        if cached_token is None:
+            return False
+        try:
+            time_of_expiry = self._get_expires_time_from_jwt(cached_token)
+        except ValueError as e:
+            logger.debug(f'Ignoring invalid cached access token: {str(e)}')
+            self.token_cache.remove(self.cache_key)
+            return False
+        min_ttl_seconds = max(CACHED_TOKEN_MIN_TTL_SECONDS, self.refresh_ahead_seconds)
+        if datetime.now() + timedelta(seconds=min_ttl_seconds) >= time_of_expiry:
+            logger.debug('Cached access token expires soon, must request a new one')
+            return False
+        logger.debug('Using cached access token')
+        self.current_access_token = cached_token
+        self._time_of_expiry = time_of_expiry
         self.time_of_auth = datetime.now()
+        return True
+
+    def accept_auth_response(self, auth_response):
         if 'token' in auth_response:
-            self.current_access_token = auth_response.get('token')
-            self._time_of_expiry = self._get_expires_time_from_jwt(self.current_access_token)
+            access_token = auth_response.get('token')
         else:
-            self.current_access_token = auth_response.get('access_token', auth_response.get('accessToken'))
-            self._time_of_expiry = self._get_expires_time_from_jwt(self.current_access_token)
+            access_token = auth_response.get('access_token', auth_response.get('accessToken'))
+        time_of_expiry = self._get_expires_time_from_jwt(access_token)
+        with self._state_lock:
+            self.time_of_auth = datetime.now()
+            self.current_access_token = access_token
+            self._time_of_expiry = time_of_expiry
+        if self._uses_cache:
+            self.token_cache.put(self.cache_key, access_token)
+
+    def clear(self):
+        """
+        Forget the current access token (and remove it from the cache), so a new one is requested on next use
+        """
+        with self._state_lock:
+            self.current_access_token = None
+            self.time_of_auth = None
+            self._time_of_expiry = None
+        if self._uses_cache:
+            self.token_cache.remove(self.cache_key)
 
     def _get_expires_time_from_jwt(self, token):
         jwt_content = decode_jwt(token)
         exp = jwt_content.get('exp')
         if exp is None:
             raise ValueError('Expected "exp" in token content')
-        return datetime.fromtimestamp(exp)
\ No newline at end of file
+        return datetime.fromtimestamp(exp)
@@ -0,0 +1,204 @@
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Callable, Optional
+from .exceptions import TNCOClientError
+from .process_watcher import ProcessWaitTimeoutError, PROCESS_COMPLETED_STATUS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTENT_CONCURRENCY = 8
+
+INTENT_TYPE_ATTR = 'intentType'
+
+
+class RateLimiter:
+    """
+    Spaces out calls to acquire so no more than "rate" callers proceed each second. Safe to share between threads
+    """
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError(f'Rate limit must be greater than 0 but was: {rate}')
+        self.interval = 1.0 / rate
+        self._next_start = None
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            start = now if self._next_start is None else max(now, self._next_start)
+            self._next_start = start + self.interval
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class BulkIntentResult:
+    """
+    Outcome of one intent submitted with AssembliesAPI.submit_intents
+    """
+
+    def __init__(self, index: int, intent: Dict[str, Any]):
+        self.index = index
+        self.intent = intent
+        self.process_id = None
+        self.error = None
+        self.process_status = None
+        self.process_status_reason = None
+        self.wait_error = None
+
+    def _intent_attr(self, name: str) -> Optional[Any]:
+        return self.intent.get(name) if isinstance(self.intent, dict) else None
+
+    @property
+    def intent_type(self) -> Optional[str]:
+        return self._intent_attr(INTENT_TYPE_ATTR)
+
+    @property
+    def assembly_name(self) -> Optional[str]:
+        return self._intent_attr('assemblyName')
+
+    @property
+    def accepted(self) -> bool:
+        return self.error is None
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        True if the intent was accepted and, when waited on, its process completed
+        """
+        return self.accepted and self.wait_error is None and self.process_status in (None, PROCESS_COMPLETED_STATUS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'index': self.index,
+            'intentType': self.intent_type,
+            'assemblyName': self.assembly_name,
+            'processId': self.process_id,
+            'processStatus': self.process_status,
+            'statusReason': self.process_status_reason,
+            'error': self.error,
+            'waitError': self.wait_error
+        }
+
+
+class BulkIntentResults:
+    """
+    Outcome of each intent submitted with AssembliesAPI.submit_intents, in the order the intents were given
+    """
+
+    def __init__(self, results: List[BulkIntentResult], timed_out: bool = False):
+        self.results = results
+        self.timed_out = timed_out
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    @property
+    def failed(self) -> List[BulkIntentResult]:
+        return [r for r in self.results if not r.succeeded]
+
+    @property
+    def succeeded(self) -> bool:
+        return len(self.failed) == 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total': len(self.results),
+            'failed': len(self.failed),
+            'timedOut': self.timed_out,
+            'intents': [r.to_dict() for r in self.results]
+        }
+
+
+class BulkIntentSubmitter:
+    """
+    Submits many intents through one client, so each shares its authentication and pooled connections.
+
+    Up to "concurrency" intents are in flight at once (keep this within the pool_maxsize of the client's transport, otherwise connections are
+    discarded rather than re-used) and, when a rate_limit is set, no more than that many are started each second.
+    A failure to submit one intent (including an entry which is not an intent request) is recorded on its result and does not stop the others.
+    A failure while waiting for the processes is recorded on the result of each intent not known to have finished.
+    """
+
+    def __init__(self, assemblies_api: 'AssembliesAPI', processes_api: 'ProcessesAPI', concurrency: int = DEFAULT_INTENT_CONCURRENCY, rate_limit: float = None):
+        if concurrency is None or concurrency < 1:
+            raise ValueError(f'Concurrency must be at least 1 but was: {concurrency}')
+        self.assemblies_api = assemblies_api
+        self.processes_api = processes_api
+        self.concurrency = concurrency
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit is not None else None
+
+    def submit(self, intents: Iterable[Dict[str, Any]], object_group_id: str = None, wait: bool = False, wait_timeout: float = None,
+                on_result: Callable[[BulkIntentResult], None] = None) -> BulkIntentResults:
+        """
+        Submit each intent, optionally waiting for all of the resulting processes to finish
+
+        Args:
+            intents: intent requests, each including an "intentType" attribute naming the type of intent (e.g. createAssembly)
+            object_group_id: ID of the Object Group to submit the intents in (only used by intent types which support it)
+            wait: wait for the processes of all accepted intents to finish (with a single ProcessWatcher)
+            wait_timeout: seconds to wait for the processes, after which the result is returned with "timed_out" set
+            on_result: called with the result of each intent once it has been submitted (from the thread which submitted it)
+
+        Returns:
+            BulkIntentResults: the result of each intent, in the order given
+        """
+        results = [BulkIntentResult(index, intent) for index, intent in enumerate(intents)]
+        if len(results) > 0:
+            if self.concurrency <= 1 or len(results) == 1:
+                for result in results:
+                    self._submit_one(result, object_group_id, on_result)
+            else:
+                with ThreadPoolExecutor(max_workers=min(self.concurrency, len(results))) as executor:
+                    for future in [executor.submit(self._submit_one, result, object_group_id, on_result) for result in results]:
+                        future.result()
+        bulk_results = BulkIntentResults(results)
+        if wait:
+            self._wait(bulk_results, wait_timeout)
+        return bulk_results
+
+    def _submit_one(self, result: BulkIntentResult, object_group_id: str, on_result: Callable):
+        if not isinstance(result.intent, dict):
+            result.error = f'Intent must be an object but was: {type(result.intent).__name__}'
+            if on_result is not None:
+                on_result(result)
+            return
+        intent_request = dict(result.intent)
+        intent_type = intent_request.pop(INTENT_TYPE_ATTR, None)
+        if intent_type is None:
+            result.error = f'Missing "{INTENT_TYPE_ATTR}"'
+        else:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                result.process_id = self.assemblies_api.intent(intent_type, intent_request, object_group_id=object_group_id)
+            except TNCOClientError as e:
+                logger.debug(f'Failed to submit intent {result.index} ({intent_type}): {str(e)}')
+                result.error = str(e)
+        if on_result is not None:
+            on_result(result)
+
+    def _wait(self, bulk_results: BulkIntentResults, wait_timeout: float):
+        to_wait_on = [r for r in bulk_results if r.accepted and r.process_id is not None]
+        if len(to_wait_on) == 0:
+            return
+        try:
+            wait_results = self.processes_api.wait([r.process_id for r in to_wait_on], timeout=wait_timeout)
+        except ProcessWaitTimeoutError as e:
+            wait_results = e.results
+            bulk_results.timed_out = True
+        except TNCOClientError as e:
+            # Keep the results (and process IDs) of every intent submitted, noting their processes could not be checked
+            logger.debug(f'Failed to wait for processes: {str(e)}')
+            for result in to_wait_on:
+                result.wait_error = str(e)
+            return
+        for result, wait_result in zip(to_wait_on, wait_results):
+            result.process_status = wait_result.status
+            result.process_status_reason = wait_result.status_reason
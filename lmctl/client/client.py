@@ -5,12 +5,16 @@ from .auth_tracker import AuthTracker
 from .error_capture import tnco_error_capture
 from .client_test_result import TestResult, TestResults
 from .client_request import TNCOClientRequest
+from .transport import TNCOTransportOptions
+from .token_cache import TokenCache
 from .utils import convert_dict_to_yaml, convert_dict_to_json
 
 from lmctl.utils.trace_ctx import trace_ctx
+from lmctl.utils.uploads import MultipartEncoder
 
 import requests
 import logging
+import threading
 from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -22,13 +26,16 @@ class TNCOClient:
     TNCO APIs are grouped by functional attributes.
     """
 
-    def __init__(self, address: str, auth_type: AuthType = None, kami_address: str = None, use_sessions: bool = False):
+    def __init__(self, address: str, auth_type: AuthType = None, kami_address: str = None, use_sessions: bool = True, transport_options: TNCOTransportOptions = None, 
+                    token_cache: TokenCache = None, token_cache_key: str = None, token_refresh_ahead: float = None):
         self.address = self._parse_address(address)
         self.auth_type = auth_type
         self.kami_address = kami_address
-        self.auth_tracker = AuthTracker() if self.auth_type is not None else None
+        self.auth_tracker = AuthTracker(token_cache=token_cache, cache_key=token_cache_key, refresh_ahead_seconds=token_refresh_ahead) if self.auth_type is not None else None
         self._session = None
+        self._session_lock = threading.Lock()
         self.use_sessions = use_sessions
+        self.transport_options = transport_options if transport_options is not None else TNCOTransportOptions()
 
     def _parse_address(self, address: str) -> str:
         if address is not None:
@@ -37,23 +44,24 @@ class TNCOClient:
         return address
 
     def close(self):
-        if self._session is not None:
-            self._session.close()
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
     
     def _curr_session(self):
         if self.use_sessions:
             if self._session is None:
-                self._session = requests.Session()
+                with self._session_lock:
+                    if self._session is None:
+                        self._session = self.transport_options.build_session()
             return self._session
         else:
             return requests
 
     def get_access_token(self) -> str:
         if self.auth_tracker is not None:
-            if self.auth_tracker.has_access_expired:
-                auth_response = self.auth_type.handle(self)
-                self.auth_tracker.accept_auth_response(auth_response)
-            return self.auth_tracker.current_access_token
+            return self.auth_tracker.get_access_token(lambda: self.auth_type.handle(self))
         else:
             return None
 
@@ -100,7 +108,13 @@ class TNCOClient:
         if request.body is not None:
             request_kwargs['data'] = self._convert_body(request.body, request_kwargs['headers'])
         if request.files is not None and len(request.files) > 0:
-            request_kwargs['files'] = request.files
+            if request.body is None:
+                # Stream the files, rather than building the whole multipart body in memory
+                multipart_body = MultipartEncoder({}, files=request.files)
+                request_kwargs['data'] = multipart_body
+                request_kwargs['headers']['Content-Type'] = multipart_body.content_type
+            else:
+                request_kwargs['files'] = request.files
 
         # Log before adding sensitive data
         logger.debug(f'CP4NA orchestration request: Method={request.method}, URL={url}, Request Kwargs={request_kwargs}')
@@ -117,6 +131,9 @@ class TNCOClient:
         try:
             response.raise_for_status()
         except requests.HTTPError as e:
+            if response.status_code == 401 and request.inject_current_auth and self.auth_tracker is not None:
+                # Token may have been revoked, make sure it is not re-used (including from the token cache)
+                self.auth_tracker.clear()
             raise TNCOClientHttpError(f'{request.method} request to {url} failed', e) from e
         return response
 
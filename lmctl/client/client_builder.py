@@ -5,6 +5,8 @@ from .zen_auth import ZenAPIKeyAuth
 from .token_auth import JwtTokenAuth
 from .client import TNCOClient
 from .auth_type import AuthType
+from .transport import TNCOTransportOptions
+from .token_cache import TokenCache
 
 class TNCOClientBuilder:
 
@@ -12,6 +14,14 @@ class TNCOClientBuilder:
         self._address = None
         self._kami_address = None
         self._auth = None
+        self._use_sessions = True
+        self._pool_connections = None
+        self._pool_maxsize = None
+        self._max_retries = None
+        self._retry_backoff_factor = None
+        self._token_cache = None
+        self._token_cache_key = None
+        self._token_refresh_ahead = None
     
     @property
     def address(self):
@@ -65,5 +75,41 @@ class TNCOClientBuilder:
         self._auth = LegacyUserPassAuth(username=username, password=password, legacy_auth_address=legacy_auth_address)
         return self
     
+    def use_sessions(self, use_sessions: bool) -> 'TNCOClientBuilder':
+        self._use_sessions = use_sessions
+        return self
+
+    def pool_connections(self, pool_connections: int) -> 'TNCOClientBuilder':
+        self._pool_connections = pool_connections
+        return self
+
+    def pool_maxsize(self, pool_maxsize: int) -> 'TNCOClientBuilder':
+        self._pool_maxsize = pool_maxsize
+        return self
+
+    def max_retries(self, max_retries: int) -> 'TNCOClientBuilder':
+        self._max_retries = max_retries
+        return self
+
+    def retry_backoff_factor(self, retry_backoff_factor: float) -> 'TNCOClientBuilder':
+        self._retry_backoff_factor = retry_backoff_factor
+        return self
+
+    def token_cache(self, token_cache: TokenCache, key: str) -> 'TNCOClientBuilder':
+        self._token_cache = token_cache
+        self._token_cache_key = key
+        return self
+
+    def token_refresh_ahead(self, seconds: float) -> 'TNCOClientBuilder':
+        self._token_refresh_ahead = seconds
+        return self
+
     def build(self):
-        return TNCOClient(self._address, auth_type=self._auth, kami_address=self._kami_address)
+        transport_options = TNCOTransportOptions(
+            pool_connections=self._pool_connections, 
+            pool_maxsize=self._pool_maxsize, 
+            max_retries=self._max_retries, 
+            retry_backoff_factor=self._retry_backoff_factor
+        )
+        return TNCOClient(self._address, auth_type=self._auth, kami_address=self._kami_address, use_sessions=self._use_sessions, transport_options=transport_options, 
+                            token_cache=self._token_cache, token_cache_key=self._token_cache_key, token_refresh_ahead=self._token_refresh_ahead)
@@ -0,0 +1,111 @@
+import time
+import logging
+from typing import List, Iterable, Callable, Optional
+from .exceptions import TNCOClientError
+
+logger = logging.getLogger(__name__)
+
+PROCESS_COMPLETED_STATUS = 'Completed'
+PROCESS_END_STATUSES = [PROCESS_COMPLETED_STATUS, 'Cancelled', 'Failed']
+
+DEFAULT_MIN_POLL_INTERVAL = 1.0
+DEFAULT_MAX_POLL_INTERVAL = 30.0
+DEFAULT_POLL_BACKOFF_FACTOR = 1.5
+
+
+class ProcessWaitTimeoutError(TNCOClientError):
+
+    def __init__(self, msg: str, results: List['ProcessWaitResult'], *args, **kwargs):
+        self.results = results
+        super().__init__(msg, *args, **kwargs)
+
+
+class ProcessWaitResult:
+    """
+    The last known state of a process being waited on
+    """
+
+    def __init__(self, process_id: str):
+        self.process_id = process_id
+        self.process = None
+
+    @property
+    def status(self) -> Optional[str]:
+        return self.process.get('status') if self.process is not None else None
+
+    @property
+    def status_reason(self) -> Optional[str]:
+        return self.process.get('statusReason') if self.process is not None else None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in PROCESS_END_STATUSES
+
+    @property
+    def completed(self) -> bool:
+        return self.status == PROCESS_COMPLETED_STATUS
+
+
+class ProcessWatcher:
+    """
+    Waits for processes (e.g. those started by Assembly intents) to finish, checking each with a shallow get.
+
+    A single poller checks every process still running on each tick, so waiting on many processes costs no more ticks than waiting on one.
+    The interval between ticks starts at min_interval, grows by backoff_factor (up to max_interval) while no process changes status
+    and returns to min_interval whenever one does.
+    """
+
+    def __init__(self, processes_api: 'ProcessesAPI',
+                    min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+                    max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+                    backoff_factor: float = DEFAULT_POLL_BACKOFF_FACTOR):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError(f'Poll intervals must be greater than 0, with max_interval no less than min_interval, but were: min_interval={min_interval}, max_interval={max_interval}')
+        if backoff_factor < 1:
+            raise ValueError(f'Poll backoff_factor must be at least 1 but was: {backoff_factor}')
+        self.processes_api = processes_api
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+
+    def wait(self, process_ids: Iterable[str], timeout: float = None, on_change: Callable[[ProcessWaitResult], None] = None) -> List[ProcessWaitResult]:
+        """
+        Wait for each process to reach an end status (Completed, Cancelled or Failed)
+
+        Args:
+            process_ids: IDs of the processes to wait on
+            timeout: seconds to wait before giving up (waits indefinitely if not set)
+            on_change: called with the result of a process each time its status changes
+
+        Returns:
+            the result of each process, in the order of the IDs given
+
+        Raises:
+            ProcessWaitTimeoutError: if a process has not finished before the timeout (the results so far are on the error)
+        """
+        results = [ProcessWaitResult(process_id) for process_id in process_ids]
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        interval = self.min_interval
+        running = list(results)
+        while True:
+            changed = False
+            for result in list(running):
+                previous_status = result.status
+                result.process = self.processes_api.get(result.process_id, shallow=True)
+                if result.status != previous_status:
+                    changed = True
+                    logger.debug(f'Process {result.process_id} status: {result.status}')
+                    if on_change is not None:
+                        on_change(result)
+                if result.finished:
+                    running.remove(result)
+            if len(running) == 0:
+                return results
+            interval = self.min_interval if changed else min(interval * self.backoff_factor, self.max_interval)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    unfinished = ', '.join(f'{r.process_id} ({r.status})' for r in running)
+                    raise ProcessWaitTimeoutError(f'Timed out after {timeout} seconds waiting for processes: {unfinished}', results)
+                interval = min(interval, remaining)
+            time.sleep(interval)
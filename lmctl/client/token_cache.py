@@ -0,0 +1,66 @@
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional
+import lmctl.files as files
+
+logger = logging.getLogger(__name__)
+
+TOKEN_CACHE_DIR_ENV_VAR = 'LMCTL_TOKEN_CACHE_DIR'
+
+def default_token_cache_dir() -> Path:
+    env_dir = os.environ.get(TOKEN_CACHE_DIR_ENV_VAR, None)
+    if env_dir is not None and len(env_dir.strip()) > 0:
+        return Path(env_dir)
+    return Path.home().joinpath('.lmctl').joinpath('tokens')
+
+class TokenCache:
+    """
+    Stores access tokens on disk so they may be re-used by later lmctl invocations, until they expire.
+
+    Each token is kept in its own file, readable only by the current user, named by a hash of the environment, auth mode and principal it was issued for.
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = Path(directory) if directory is not None else default_token_cache_dir()
+
+    @staticmethod
+    def build_key(environment: str, auth_mode: str, principal: str) -> str:
+        raw_key = json.dumps([environment, auth_mode, principal])
+        return hashlib.sha256(raw_key.encode('utf-8')).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.directory.joinpath(f'{key}.json')
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path_for(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            return entry.get('token', None)
+        except (OSError, ValueError) as e:
+            logger.debug(f'Ignoring unreadable token cache entry {path}: {str(e)}')
+            return None
+
+    def put(self, key: str, token: str):
+        try:
+            self._ensure_directory()
+            files.write_file_atomically(self._path_for(key), lambda f: json.dump({'token': token}, f), mode=0o600)
+        except OSError as e:
+            logger.debug(f'Failed to write token cache entry in {self.directory}: {str(e)}')
+
+    def remove(self, key: str):
+        try:
+            self._path_for(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f'Failed to remove token cache entry in {self.directory}: {str(e)}')
+
+    def _ensure_directory(self):
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(str(self.directory), 0o700)
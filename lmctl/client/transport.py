@@ -0,0 +1,62 @@
+import requests
+import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.5
+
+# Only statuses which indicate the server did not process the request are retried
+RETRY_STATUS_CODES = (429, 503)
+# POST/PATCH are not retried as they are not idempotent
+RETRY_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+class TNCOTransportOptions:
+    """
+    Options controlling the pooled HTTP transport used by a TNCOClient
+
+    Args:
+        pool_connections (int): number of per-host connection pools to cache
+        pool_maxsize (int): maximum number of connections kept alive in each per-host pool
+        max_retries (int): number of times a request is retried on connection errors or a retryable status (0 to disable)
+        retry_backoff_factor (float): backoff factor applied between retries (sleeps for backoff_factor * 2^(retry-1) seconds)
+    """
+
+    def __init__(self, pool_connections: int = None, pool_maxsize: int = None, max_retries: int = None, retry_backoff_factor: float = None):
+        self.pool_connections = pool_connections if pool_connections is not None else DEFAULT_POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize if pool_maxsize is not None else DEFAULT_POOL_MAXSIZE
+        self.max_retries = max_retries if max_retries is not None else DEFAULT_MAX_RETRIES
+        self.retry_backoff_factor = retry_backoff_factor if retry_backoff_factor is not None else DEFAULT_RETRY_BACKOFF_FACTOR
+
+    def build_retry(self) -> Retry:
+        retry_kwargs = {
+            'total': self.max_retries,
+            'connect': self.max_retries,
+            'read': self.max_retries,
+            'status': self.max_retries,
+            'backoff_factor': self.retry_backoff_factor,
+            'status_forcelist': RETRY_STATUS_CODES,
+            'respect_retry_after_header': True,
+            # Return the final response so the client can raise a TNCOClientHttpError with the details
+            'raise_on_status': False
+        }
+        try:
+            return Retry(allowed_methods=RETRY_METHODS, **retry_kwargs)
+        except TypeError:
+            # urllib3 < 1.26
+            return Retry(method_whitelist=RETRY_METHODS, **retry_kwargs)
+
+    def build_adapter(self) -> HTTPAdapter:
+        return HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, max_retries=self.build_retry())
+
+    def build_session(self) -> requests.Session:
+        logger.debug(f'Creating pooled HTTP session: pool_connections={self.pool_connections}, pool_maxsize={self.pool_maxsize}, max_retries={self.max_retries}, retry_backoff_factor={self.retry_backoff_factor}')
+        session = requests.Session()
+        adapter = self.build_adapter()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
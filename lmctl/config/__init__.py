@@ -7,6 +7,7 @@ from .rewriter import ConfigRewriter
 from .ctl import Ctl
 from .constants import CONFIG_ENV_VAR
 from .io import ConfigIO
+from .cache import ConfigCache, build_config_cache
 from typing import Tuple
 import warnings
 import os
@@ -29,7 +30,7 @@ def get_config(override_config_path: str = None) -> Config:
 
 def get_config_with_path(override_config_path: str = None) -> Tuple[Config, str]:
     logger.debug('Loading LMCTL config')
-    config, config_file_path = ConfigIO().read_discovered_file(override_path=override_config_path)
+    config, config_file_path = ConfigIO(cache=build_config_cache()).read_discovered_file(override_path=override_config_path)
     return config, config_file_path
 
 def get_global_config(override_config_path: str = None) -> Config:
@@ -46,7 +47,7 @@ def get_global_config_with_path(override_config_path: str = None) -> Config:
     return global_config, global_config_path
 
 def write_config(config: Config, override_config_path: str = None) -> str:
-    return ConfigIO().write_discovered_file(config, override_path=override_config_path, backup_existing=True)
+    return ConfigIO(cache=build_config_cache()).write_discovered_file(config, override_path=override_config_path, backup_existing=True)
 
 ### Deprecated
 global_ctl = None
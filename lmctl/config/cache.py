@@ -0,0 +1,148 @@
+import os
+import sys
+import copy
+import time
+import pickle
+import hashlib
+import logging
+from pathlib import Path
+from collections.abc import MutableMapping
+from typing import Optional
+from .config import Config
+import lmctl.files as files
+
+logger = logging.getLogger(__name__)
+
+CONFIG_CACHE_ENV_VAR = 'LMCTL_CONFIG_CACHE'
+CONFIG_CACHE_DIR_ENV_VAR = 'LMCTL_CONFIG_CACHE_DIR'
+
+# Changed whenever the content of a cache entry changes, so entries of older versions are ignored
+CACHE_FORMAT_VERSION = 1
+# A file modified this recently may be modified again without changing its mtime (on filesystems with coarse timestamps), so is not cached
+RACY_WINDOW_SECONDS = 2
+
+def default_config_cache_dir() -> Path:
+    env_dir = os.environ.get(CONFIG_CACHE_DIR_ENV_VAR, None)
+    if env_dir is not None and len(env_dir.strip()) > 0:
+        return Path(env_dir)
+    return Path.home().joinpath('.lmctl').joinpath('cache')
+
+def build_config_cache() -> Optional['ConfigCache']:
+    """
+    Returns the cache of config files used by the CLI, unless disabled with the LMCTL_CONFIG_CACHE environment variable
+    """
+    enabled = os.environ.get(CONFIG_CACHE_ENV_VAR, 'true')
+    if enabled.strip().lower() in ['false', 'no', 'off', '0']:
+        return None
+    return ConfigCache()
+
+
+class LazyEnvironmentGroups(MutableMapping):
+    """
+    Environment groups of a Config loaded from the cache. Each group is only unpickled when first accessed, so a command
+    using one environment does not build every group in the file
+    """
+
+    def __init__(self, pickled_groups):
+        self._groups = {name: _PickledGroup(data) for name, data in pickled_groups.items()}
+
+    def __getitem__(self, name):
+        group = self._groups[name]
+        if isinstance(group, _PickledGroup):
+            group = pickle.loads(group.data)
+            self._groups[name] = group
+        return group
+
+    def __setitem__(self, name, group):
+        self._groups[name] = group
+
+    def __delitem__(self, name):
+        del self._groups[name]
+
+    def __iter__(self):
+        return iter(self._groups)
+
+    def __len__(self):
+        return len(self._groups)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self._groups)})'
+
+    def __as_dict__(self):
+        # Used by lmctl.utils.dcutils.dc_to_dict.asdict, when the config is written
+        from lmctl.utils.dcutils.dc_to_dict import asdict
+        return {name: asdict(group) for name, group in self.items()}
+
+
+class _PickledGroup:
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+class ConfigCache:
+    """
+    Keeps validated copies of config files on disk, so later lmctl invocations skip parsing and validating a file which has not changed.
+
+    Each file is cached in its own entry, named by a hash of its path and keyed by the size and modification time of the file,
+    with each environment group pickled separately, so only those used are built when the entry is read.
+    The directory and entries are only readable by the current user, as the config may include credentials.
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = Path(directory) if directory is not None else default_config_cache_dir()
+
+    def _path_for(self, config_path: str) -> Path:
+        name = hashlib.sha256(os.path.abspath(config_path).encode('utf-8')).hexdigest()
+        return self.directory.joinpath(f'config-{name}.pickle')
+
+    def _key_for(self, config_path: str, stat: os.stat_result):
+        return (CACHE_FORMAT_VERSION, sys.version_info[:2], os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+
+    def get(self, config_path: str) -> Optional[Config]:
+        path = self._path_for(config_path)
+        try:
+            stat = os.stat(config_path)
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+            if entry.get('key') != self._key_for(config_path, stat):
+                return None
+            config = pickle.loads(entry['config'])
+            # Set directly, as setting the attribute would record it as changed since the config was loaded
+            config.__dict__['environments'] = LazyEnvironmentGroups(entry['environments'])
+            return config
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f'Ignoring unreadable config cache entry {path}: {str(e)}')
+            return None
+
+    def put(self, config_path: str, config: Config):
+        try:
+            stat = os.stat(config_path)
+            if time.time() - (stat.st_mtime_ns / 1e9) < RACY_WINDOW_SECONDS:
+                logger.debug(f'Not caching config {config_path} as it was modified in the last {RACY_WINDOW_SECONDS} seconds')
+                return
+            without_environments = copy.copy(config)
+            without_environments.__dict__['environments'] = {}
+            entry = {
+                'key': self._key_for(config_path, stat),
+                'config': pickle.dumps(without_environments, protocol=pickle.HIGHEST_PROTOCOL),
+                'environments': {name: pickle.dumps(group, protocol=pickle.HIGHEST_PROTOCOL) for name, group in config.environments.items()}
+            }
+            self._ensure_directory()
+            files.write_file_atomically(self._path_for(config_path), lambda f: pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL), binary=True, mode=0o600)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug(f'Failed to write config cache entry for {config_path} in {self.directory}: {str(e)}')
+
+    def remove(self, config_path: str):
+        try:
+            self._path_for(config_path).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f'Failed to remove config cache entry for {config_path} in {self.directory}: {str(e)}')
+
+    def _ensure_directory(self):
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(str(self.directory), 0o700)
@@ -2,7 +2,8 @@ from .config import Config
 from .finder import ConfigFinder
 from .exceptions import ConfigError
 from .env_pre_parser import EnvironmentGroupPreParser
-from typing import Dict, Tuple
+from .cache import ConfigCache
+from typing import Dict, Tuple, Optional
 from lmctl.utils.dcutils.dc_to_dict import asdict
 from pydantic import parse_obj_as, ValidationError
 import yaml
@@ -11,8 +12,9 @@ import shutil
 
 class ConfigIO:
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ConfigCache] = None):
         self.finder = ConfigFinder()
+        self.cache = cache
 
     def read_discovered_file(self, override_path: str = None) -> Tuple[Config, str]:
         if override_path is None:
@@ -28,8 +30,15 @@ class ConfigIO:
             return self.config_to_file(config, override_path, backup_existing=backup_existing)
 
     def file_to_config(self, path: str) -> Config:
+        if self.cache is not None:
+            config = self.cache.get(path)
+            if config is not None:
+                return config
         config_dict = self.file_to_dict(path)
-        return self.dict_to_config(config_dict)
+        config = self.dict_to_config(config_dict)
+        if self.cache is not None:
+            self.cache.put(path, config)
+        return config
 
     def file_to_dict(self, path: str) -> Dict:
         config_dict = self.__read_yaml_file(path)
@@ -52,6 +61,8 @@ class ConfigIO:
             shutil.copyfile(path, backup_path)
         with open(path, 'w') as f:
             f.write(yaml.safe_dump(config_dict))
+        if self.cache is not None:
+            self.cache.remove(path)
         return path
 
     def dict_to_config(self, config_dict: Dict) -> Config:
@@ -1,5 +1,6 @@
 import json
 import requests
+from lmctl.utils.uploads import MultipartEncoder
 
 
 class AnsibleRmDriver:
@@ -10,15 +11,20 @@ class AnsibleRmDriver:
     def __init__(self, ansible_rm_base):
         self.ansible_rm_base = ansible_rm_base
 
-    def onboard_type(self, resource_name, resource_version, resource_csar):
-        """Push a Resource to the target Ansible RM"""
+    def onboard_type(self, resource_name, resource_version, resource_csar, progress_callback=None):
+        """Push a Resource to the target Ansible RM, given the path to its CSAR or an open (binary, seekable) file"""
         url = '{0}/api/v1.0/resource-manager/types'.format(self.ansible_rm_base)
-        files = {'upfile': open(resource_csar, 'rb')}
         data = {
             'resource_name': resource_name,
             'resource_version': resource_version
         }
-        response = requests.post(url, files=files, data=data, verify=False)
+        if hasattr(resource_csar, 'read'):
+            body = MultipartEncoder(data, files={'upfile': resource_csar}, progress_callback=progress_callback)
+            response = requests.post(url, data=body, headers={'Content-Type': body.content_type}, verify=False)
+        else:
+            with open(resource_csar, 'rb') as csar:
+                body = MultipartEncoder(data, files={'upfile': csar}, progress_callback=progress_callback)
+                response = requests.post(url, data=body, headers={'Content-Type': body.content_type}, verify=False)
         if response.status_code == 200:
             return True
         else:
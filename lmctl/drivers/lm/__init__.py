@@ -2,6 +2,7 @@ from .behaviour import LmBehaviourDriver
 from .descriptor import LmDescriptorDriver
 from .deployment_locations import LmDeploymentLocationDriver
 from .base import LmDriverException, NotFoundException
+from .session import LmHttpSession, LmRequestStats
 from .onboarding import LmOnboardRmDriver
 from .security import LmSecurityCtrl, LmSecurityDriver
 from .topology import LmTopologyDriver
@@ -1,10 +1,15 @@
 import yaml
+from .session import LmHttpSession
 
 class LmDriver:
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
+    def __init__(self, lm_base, lm_security_ctrl=None, http_session=None):
         self.lm_base = lm_base
         self.lm_security_ctrl = lm_security_ctrl
+        if http_session is None:
+            http_session = LmHttpSession()
+        self.http_session = http_session
+        self._http = http_session.for_driver(self.__class__.__name__)
 
     def _configure_access_headers(self, headers=None):
         if headers is None:
@@ -1,5 +1,4 @@
 import json
-import requests
 from .base import LmDriver, NotFoundException
 
 
@@ -8,8 +7,8 @@ class LmBehaviourDriver(LmDriver):
     Client for the CP4NA orchestration Behaviour APIs
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, http_session=None):
+        super().__init__(lm_base, lm_security_ctrl, http_session=http_session)
 
     def __projects_api(self):
         return '{0}/api/behaviour/projects'.format(self.lm_base)
@@ -44,10 +43,18 @@ class LmBehaviourDriver(LmDriver):
     def __scenario_execution_api(self):
         return '{0}/api/behaviour/executions'.format(self.lm_base)
 
+    def __with_created_id(self, obj, response):
+        # Returns a copy of the created object, including the ID from the location header (when present) so callers need not fetch it again
+        created_obj = obj.copy()
+        location = response.headers.get('location', None)
+        if location:
+            created_obj['id'] = location.rstrip('/').split('/')[-1]
+        return created_obj
+
     def create_project(self, project):
         url = self.__projects_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, json=project, headers=headers, verify=False)
+        response = self._http.post(url, json=project, headers=headers, verify=False)
         if response.status_code == 201:
             return True
         else:
@@ -56,7 +63,7 @@ class LmBehaviourDriver(LmDriver):
     def update_project(self, project):
         url = self.__project_api(project['id'])
         headers = self._configure_access_headers()
-        response = requests.put(url, json=project, headers=headers, verify=False)
+        response = self._http.put(url, json=project, headers=headers, verify=False)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -67,7 +74,7 @@ class LmBehaviourDriver(LmDriver):
     def get_project(self, project_id):
         url = self.__project_api(project_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 200:
             project = response.json()
             return project
@@ -79,16 +86,16 @@ class LmBehaviourDriver(LmDriver):
     def create_assembly_configuration(self, assembly_configuration):
         url = self.__assembly_configurations_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, json=assembly_configuration, headers=headers, verify=False)
+        response = self._http.post(url, json=assembly_configuration, headers=headers, verify=False)
         if response.status_code == 201:
-            return True
+            return self.__with_created_id(assembly_configuration, response)
         else:
             self._raise_unexpected_status_exception(response)
 
     def update_assembly_configuration(self, assembly_configuration):
         url = self.__assembly_configuration_api(assembly_configuration['id'])
         headers = self._configure_access_headers()
-        response = requests.put(url, json=assembly_configuration, headers=headers, verify=False)
+        response = self._http.put(url, json=assembly_configuration, headers=headers, verify=False)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -99,7 +106,7 @@ class LmBehaviourDriver(LmDriver):
     def get_assembly_configuration(self, assembly_configuration_id):
         url = self.__assembly_configuration_api(assembly_configuration_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 200:
             template = response.json()
             return template
@@ -111,7 +118,7 @@ class LmBehaviourDriver(LmDriver):
     def get_assembly_configurations(self, project_id):
         url = self.__assembly_configurations_in_project_api(project_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 200:
             templates = response.json()
             return templates
@@ -123,16 +130,16 @@ class LmBehaviourDriver(LmDriver):
     def create_scenario(self, scenario):
         url = self.__scenarios_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, json=scenario, headers=headers, verify=False)
+        response = self._http.post(url, json=scenario, headers=headers, verify=False)
         if response.status_code == 201:
-            return True
+            return self.__with_created_id(scenario, response)
         else:
             self._raise_unexpected_status_exception(response)
 
     def update_scenario(self, scenario):
         url = self.__scenario_api(scenario['id'])
         headers = self._configure_access_headers()
-        response = requests.put(url, json=scenario, headers=headers, verify=False)
+        response = self._http.put(url, json=scenario, headers=headers, verify=False)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -143,7 +150,7 @@ class LmBehaviourDriver(LmDriver):
     def get_scenario(self, scenario_id):
         url = self.__scenario_api(scenario_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 200:
             scenario = response.json()
             return scenario
@@ -162,7 +169,7 @@ class LmBehaviourDriver(LmDriver):
     def get_scenarios(self, project_id):
         url = self.__scenarios_in_project_api(project_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 200:
             scenarios = response.json()
             return scenarios
@@ -178,7 +185,7 @@ class LmBehaviourDriver(LmDriver):
         body = {}
         body['scenarioId'] = '{0}'.format(scenario_id)
 
-        response = requests.post(url, json=body, headers=headers, verify=False)
+        response = self._http.post(url, json=body, headers=headers, verify=False)
         if response.status_code == 201:
             return response.headers['location']
         elif response.status_code == 404:
@@ -189,7 +196,7 @@ class LmBehaviourDriver(LmDriver):
     def get_execution(self, exec_id):
         url = self.__scenario_exec_api(exec_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 200:
             execution = response.json()
             return execution
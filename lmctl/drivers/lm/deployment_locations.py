@@ -1,5 +1,4 @@
 import logging
-import requests
 from .base import LmDriver
 
 logger = logging.getLogger(__name__)
@@ -10,8 +9,8 @@ class LmDeploymentLocationDriver(LmDriver):
     Client for CP4NA orchestration Deployment Location APIs
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, http_session=None):
+        super().__init__(lm_base, lm_security_ctrl, http_session=http_session)
 
     def __locations_api(self):
         return '{0}/api/deploymentLocations'.format(self.lm_base)
@@ -25,7 +24,7 @@ class LmDeploymentLocationDriver(LmDriver):
     def get_locations(self):
         url = self.__locations_api()
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 200:
             locations = response.json()
             return locations
@@ -35,7 +34,7 @@ class LmDeploymentLocationDriver(LmDriver):
     def get_locations_by_name(self, deployment_location_name):
         url = self.__location_by_name_api(deployment_location_name)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 200:
             locations = response.json()
             return locations
@@ -45,7 +44,7 @@ class LmDeploymentLocationDriver(LmDriver):
     def add_location(self, deployment_location):
         url = self.__locations_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, headers=headers, json=deployment_location, verify=False)
+        response = self._http.post(url, headers=headers, json=deployment_location, verify=False)
         if response.status_code == 201:
             location_header = response.headers['location']
             location_parts = location_header.split('/')
@@ -58,7 +57,7 @@ class LmDeploymentLocationDriver(LmDriver):
     def delete_location(self, deployment_location_id):
         url = self.__location_by_id_api(deployment_location_id)
         headers = self._configure_access_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._http.delete(url, headers=headers, verify=False)
         if response.status_code == 204:
             return True
         elif response.status_code == 404:
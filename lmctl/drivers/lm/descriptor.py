@@ -1,5 +1,4 @@
 import json
-import requests
 import logging
 from .base import LmDriver, NotFoundException
 
@@ -11,13 +10,13 @@ class LmDescriptorDriver(LmDriver):
     Client for CP4NA orchestration Descriptor APIs
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, http_session=None):
+        super().__init__(lm_base, lm_security_ctrl, http_session=http_session)
 
     def delete_descriptor(self, descriptor_name):
         url = '{0}/api/catalog/descriptors/{1}'.format(self.lm_base, descriptor_name)
         headers = self._configure_access_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._http.delete(url, headers=headers, verify=False)
         if response.status_code == 404:
             raise NotFoundException('No descriptor with name {0}'.format(descriptor_name))
         elif response.status_code == 204:
@@ -31,7 +30,7 @@ class LmDescriptorDriver(LmDriver):
             'Accept': 'application/yaml'
         }
         headers = self._configure_access_headers(headers)
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 404:
             raise NotFoundException('No descriptor with name {0}'.format(descriptor_name))
         elif response.status_code == 200:
@@ -48,7 +47,7 @@ class LmDescriptorDriver(LmDriver):
         params = {}
         if object_group_id is not None:
             params['objectGroupId'] = object_group_id
-        response = requests.post(url, headers=headers, data=descriptor_content, params=params, verify=False)
+        response = self._http.post(url, headers=headers, data=descriptor_content, params=params, verify=False)
         if response.status_code == 201:
             return True
         else:
@@ -60,7 +59,7 @@ class LmDescriptorDriver(LmDriver):
             'Content-Type': 'application/yaml'
         }
         headers = self._configure_access_headers(headers)
-        response = requests.put(url, headers=headers, data=descriptor_content, verify=False)
+        response = self._http.put(url, headers=headers, data=descriptor_content, verify=False)
         if response.status_code == 200:
             return True
         else:
@@ -1,7 +1,7 @@
 import logging
-import requests
 import json
 from .base import LmDriver, NotFoundException
+from lmctl.utils.uploads import UploadStream
 
 logger = logging.getLogger(__name__)
 
@@ -10,8 +10,8 @@ class EtsiPackageMgmtDriver(LmDriver):
     Client for managing packages
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, http_session=None):
+        super().__init__(lm_base, lm_security_ctrl, http_session=http_session)
 
     def __packages_api(self):
         return '{0}/api/etsi/vnfpkgm/v2/vnf_packages'.format(self.lm_base)
@@ -37,23 +37,25 @@ class EtsiPackageMgmtDriver(LmDriver):
         headers['Content-Type'] = content_type
         return headers
 
-    def onboard_package(self, package_id, resource_pkg_path, object_group_id = None):
+    def onboard_package(self, package_id, resource_pkg_path, object_group_id = None, progress_callback = None):
         self.__create_package(package_id, object_group_id=object_group_id)
         url = self.__packages_api_package_content(package_id)
         headers = self.__configure_headers('application/zip')
         with open(resource_pkg_path, 'rb') as resource_pkg:
-            response = requests.put(url, headers=headers, data=resource_pkg, verify=False)
+            body = UploadStream.for_file(resource_pkg, progress_callback=progress_callback)
+            response = self._http.put(url, headers=headers, data=body, verify=False)
             if response.status_code == 202:
                 return True
             else:
                 self._raise_unexpected_status_exception(response)
 
-    def onboard_nsd_package(self, package_id, resource_pkg_path, object_group_id = None):
+    def onboard_nsd_package(self, package_id, resource_pkg_path, object_group_id = None, progress_callback = None):
         self.__create_nsd_package_entry(package_id, object_group_id=object_group_id)
         url = self.__nsd_api_package_content(package_id)
         headers = self.__configure_headers('application/zip')
         with open(resource_pkg_path, 'rb') as resource_pkg:
-            response = requests.put(url, headers=headers, data=resource_pkg, verify=False)
+            body = UploadStream.for_file(resource_pkg, progress_callback=progress_callback)
+            response = self._http.put(url, headers=headers, data=body, verify=False)
             if response.status_code == 202:
                 return True
             else:
@@ -66,7 +68,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__packages_api()
         headers = self.__configure_headers()
         params = self.__build_base_params(object_group_id)
-        response = requests.post(url, headers=headers, json=package_user_data_json, params=params, verify=False)
+        response = self._http.post(url, headers=headers, json=package_user_data_json, params=params, verify=False)
         if response.status_code == 201:
             return response.json()
         else:
@@ -78,7 +80,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__nsd_api()
         headers = self.__configure_headers()
         params = self.__build_base_params(object_group_id)
-        response = requests.post(url, headers=headers, json=package_user_data_json, params=params, verify=False)
+        response = self._http.post(url, headers=headers, json=package_user_data_json, params=params, verify=False)
         if response.status_code == 201:
             return response.json()
         else:
@@ -88,7 +90,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         self.__disable_package(package_id)    
         url = self.__packages_api_by_id_api(package_id)
         headers = self.__configure_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._http.delete(url, headers=headers, verify=False)
         if response.status_code == 204:
             return True
         elif response.status_code == 404:
@@ -101,7 +103,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         self.__disable_nsd_package(package_id)    
         url = self.__nsd_api_by_id(package_id)
         headers = self.__configure_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._http.delete(url, headers=headers, verify=False)
         if response.status_code == 204:
             return True
         elif response.status_code == 404:
@@ -113,7 +115,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__packages_api_by_id_api(package_id)
         headers = self.__configure_headers()
         data='{"operationalState": "DISABLED"}'
-        response = requests.patch(url, data, headers=headers, verify=False)
+        response = self._http.patch(url, data, headers=headers, verify=False)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -125,7 +127,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__nsd_api_by_id(package_id)
         headers = self.__configure_headers()
         data='{"nsdOperationalState": "DISABLED"}'
-        response = requests.patch(url, data, headers=headers, verify=False)
+        response = self._http.patch(url, data, headers=headers, verify=False)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -136,7 +138,7 @@ class EtsiPackageMgmtDriver(LmDriver):
     def get_package_details(self, package_id):
         url = self.__packages_api_by_id_api(package_id)
         headers = self.__configure_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
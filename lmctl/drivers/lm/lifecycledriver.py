@@ -1,5 +1,4 @@
 import logging
-import requests
 from .base import LmDriver, NotFoundException
 
 logger = logging.getLogger(__name__)
@@ -9,8 +8,8 @@ class LmLifecycleDriverMgmtDriver(LmDriver):
     Client for managing lifecycle drivers
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, http_session=None):
+        super().__init__(lm_base, lm_security_ctrl, http_session=http_session)
 
     def __lifecycle_drivers_api(self):
         return '{0}/api/resource-manager/lifecycle-drivers'.format(self.lm_base)
@@ -24,7 +23,7 @@ class LmLifecycleDriverMgmtDriver(LmDriver):
     def add_lifecycle_driver(self, lifecycle_driver):
         url = self.__lifecycle_drivers_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, headers=headers, json=lifecycle_driver, verify=False)
+        response = self._http.post(url, headers=headers, json=lifecycle_driver, verify=False)
         if response.status_code == 201:
             location_header = response.headers['location']
             location_parts = location_header.split('/')
@@ -37,7 +36,7 @@ class LmLifecycleDriverMgmtDriver(LmDriver):
     def delete_lifecycle_driver(self, driver_id):
         url = self.__lifecycle_driver_by_id_api(driver_id)
         headers = self._configure_access_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._http.delete(url, headers=headers, verify=False)
         if response.status_code == 204:
             return True
         elif response.status_code == 404:
@@ -48,7 +47,7 @@ class LmLifecycleDriverMgmtDriver(LmDriver):
     def get_lifecycle_driver(self, driver_id):
         url = self.__lifecycle_driver_by_id_api(driver_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
@@ -59,7 +58,7 @@ class LmLifecycleDriverMgmtDriver(LmDriver):
     def get_lifecycle_driver_by_type(self, lifecycle_type):
         url = self.__lifecycle_drivers_by_type_api(lifecycle_type)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
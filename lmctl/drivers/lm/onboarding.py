@@ -1,5 +1,4 @@
 import json
-import requests
 from .base import LmDriver, NotFoundException
 
 
@@ -8,14 +7,14 @@ class LmOnboardRmDriver(LmDriver):
     Client for CP4NA orchestration Resource Manager Onboarding APIs
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, http_session=None):
+        super().__init__(lm_base, lm_security_ctrl, http_session=http_session)
 
     def update_rm(self, rm_data):
         rm_name = rm_data['name']
         url = '{0}/api/resource-managers/{1}'.format(self.lm_base, rm_name)
         headers = self._configure_access_headers()
-        response = requests.put(url, json=rm_data, headers=headers, verify=False)
+        response = self._http.put(url, json=rm_data, headers=headers, verify=False)
         if response.status_code == 404:
             raise NotFoundException('No resource manager with name {0}'.format(rm_name))
         elif response.status_code == 200:
@@ -26,7 +25,7 @@ class LmOnboardRmDriver(LmDriver):
     def get_rm_by_name(self, rm_name):
         url = '{0}/api/resource-managers/{1}'.format(self.lm_base, rm_name)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._http.get(url, headers=headers, verify=False)
         if response.status_code == 404:
             raise NotFoundException('No resource manager with name {0}'.format(rm_name))
         elif response.status_code == 200:
@@ -1,13 +1,13 @@
-import requests
 from .base import LmDriver, NotFoundException
+from lmctl.utils.uploads import MultipartEncoder
 
 class LmResourcePkgDriver(LmDriver):
     """
     Client for CP4NA orchestration Resource Pkg APIs
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, http_session=None):
+        super().__init__(lm_base, lm_security_ctrl, http_session=http_session)
 
     def __packages_api(self):
         return '{0}/api/resource-manager/resource-packages'.format(self.lm_base)
@@ -15,24 +15,34 @@ class LmResourcePkgDriver(LmDriver):
     def __package_api(self, resource_type_name):
         return '{0}/{1}'.format(self.__packages_api(), resource_type_name)
 
-    def onboard_package(self, resource_pkg_path, object_group_id = None):
+    def onboard_package(self, resource_pkg_path, object_group_id = None, progress_callback = None):
+        """
+        Upload a Resource package, given the path to it or an open (binary, seekable) file
+        """
+        if hasattr(resource_pkg_path, 'read'):
+            return self.__onboard_package(resource_pkg_path, object_group_id, progress_callback)
+        with open(resource_pkg_path, 'rb') as resource_pkg:
+            return self.__onboard_package(resource_pkg, object_group_id, progress_callback)
+
+    def __onboard_package(self, resource_pkg, object_group_id, progress_callback):
         url = self.__packages_api()
         headers = self._configure_access_headers()
         params = {}
         if object_group_id is not None:
             params['objectGroupId'] = object_group_id
-        with open(resource_pkg_path, 'rb') as resource_pkg:
-            files = {'file': resource_pkg}
-            response = requests.post(url, headers=headers, files=files, params=params, verify=False)
-            if response.status_code == 201:
-                return True
-            else:
-                self._raise_unexpected_status_exception(response)
+        # Stream the package, rather than building the whole multipart body in memory
+        body = MultipartEncoder({}, files={'file': resource_pkg}, progress_callback=progress_callback)
+        headers['Content-Type'] = body.content_type
+        response = self._http.post(url, headers=headers, data=body, params=params, verify=False)
+        if response.status_code == 201:
+            return True
+        else:
+            self._raise_unexpected_status_exception(response)
 
     def delete_package(self, resource_type_name):
         url = self.__package_api(resource_type_name)
         headers = self._configure_access_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._http.delete(url, headers=headers, verify=False)
         if response.status_code == 404:
             raise NotFoundException('Package does not exist: {0}'.format(resource_type_name))
         elif response.status_code == 204:
@@ -1,5 +1,4 @@
 import datetime
-import requests
 import logging
 import time
 from .base import LmDriver
@@ -16,8 +15,8 @@ class LmSecurityDriver(LmDriver):
     Client for CP4NA orchestration Security APIs
     """
 
-    def __init__(self, lm_base):
-        super().__init__(lm_base)
+    def __init__(self, lm_base, http_session=None):
+        super().__init__(lm_base, http_session=http_session)
 
     def login(self, username, password):
         url = '{0}/ui/api/login'.format(self.lm_base)
@@ -25,11 +24,11 @@ class LmSecurityDriver(LmDriver):
             'username': username,
             'password': password
         }
-        response = requests.post(url, json=data, verify=False)
+        response = self._http.post(url, json=data, verify=False)
         if response.status_code == 404 or response.status_code == 405:
             old_url = '{0}/api/login'.format(self.lm_base)
             logger.info('Failed to access login at {0} with {1} repsonse code...may be an older LM environment, trying {2}'.format(url, response.status_code, old_url))
-            response = requests.post(old_url, json=data, verify=False)
+            response = self._http.post(old_url, json=data, verify=False)
         if response.status_code == 200:
             login_result = response.json()
             return login_result
@@ -41,7 +40,7 @@ class LmSecurityCtrl:
     Manages authentication with a target CP4NA orchestration environment 
     """
 
-    def __init__(self, auth_address, username=None, password=None, client_id=None, client_secret=None, token=None, api_key=None, auth_mode=None, scope=None, auth_server_id=None):
+    def __init__(self, auth_address, username=None, password=None, client_id=None, client_secret=None, token=None, api_key=None, auth_mode=None, scope=None, auth_server_id=None, token_cache=None, token_cache_key=None, token_refresh_ahead=None):
         """
         Constructs a new instance of controller for a target CP4NA orchestration environment and target user
 
@@ -54,6 +53,9 @@ class LmSecurityCtrl:
             api_key (str): API key used for Zen based auth
             token (str): Token used for authentication
             auth_mode (str): Determines if we're using Zen or Oauth
+            token_cache (TokenCache): optional cache used to share access tokens between lmctl invocations
+            token_cache_key (str): key of this user's access token in the token_cache
+            token_refresh_ahead (float): number of seconds before expiry at which the access token is refreshed
         """
         self.__auth_address = auth_address
         self.__username = username
@@ -63,7 +65,7 @@ class LmSecurityCtrl:
         self.__api_key = api_key
         self.__token = token
         self.__auth_mode = auth_mode
-        self.__auth_tracker = AuthTracker()
+        self.__auth_tracker = AuthTracker(token_cache=token_cache, cache_key=token_cache_key, refresh_ahead_seconds=token_refresh_ahead)
         self.__scope = scope
         self.__auth_server_id = auth_server_id
         # Using the new client authentication methods in the "legacy" driver so we only need to maintain one impl
@@ -105,28 +107,13 @@ class LmSecurityCtrl:
     def get_access_token(self):
         """
         Retrieves the current Access Token for the user. If there is no current Access Token then a request is made to authenticate the user and, if a valid attempt, a new Access Token is returned.
-        If the Access Token has expired (or will within an unreasonable amount of time to make use of the Token) then a request is made to re-authenticate the user. 
+        If the Access Token has expired (or is due to be refreshed) then a request is made to re-authenticate the user. This method is safe to call from multiple threads, only one will re-authenticate at a time.
         Any client making use of this Token should call this function for EACH request, rather than caching the Token, therefore making use of this functions handling of requesting new Tokens on behalf of the client.
 
         Returns:
             str: the current Access Token for the user
         """
-        if self.__need_new_token():
-            logger.debug('Requesting new access token')
-            auth_response = self.__client.auth_type.handle(self.__client)
-            self.__auth_tracker.accept_auth_response(auth_response)
-        return self.__auth_tracker.current_access_token
-
-    def __need_new_token(self):
-        """
-        Determines if we need an Access Token by checking if there is one already, if there is then check it hasn't expired (using local knowledge of when the token would expire).
-        This method adds a "wait period" of 1 second to any previous Access Token expiration time, meaning if the Token is going to expire within 
-        1 second it waits till the Token expires before returning True to indicate a new one is needed. This gives clients a reasonable time to use the Token after checking it.
-
-        Returns:
-            bool: True if there is no Access Token for the user or it is believed to be expired based on time of last authentication
-        """
-        return self.__auth_tracker.has_access_expired
+        return self.__auth_tracker.get_access_token(lambda: self.__client.auth_type.handle(self.__client))
 
     def add_access_headers(self, headers=None):
         """
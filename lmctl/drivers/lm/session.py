@@ -0,0 +1,129 @@
+import threading
+import time
+import logging
+from lmctl.client import TNCOTransportOptions
+
+logger = logging.getLogger(__name__)
+
+
+class LmRequestStats:
+    """
+    Number of requests made by a driver and the total time spent waiting on them
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.request_count = 0
+        self.total_time = 0.0
+
+    def record(self, duration):
+        self.request_count += 1
+        self.total_time += duration
+
+    def copy(self):
+        stats = LmRequestStats(self.name)
+        stats.request_count = self.request_count
+        stats.total_time = self.total_time
+        return stats
+
+
+class LmHttpSession:
+    """
+    Pooled HTTP transport shared by the CP4NA orchestration drivers of an LmSession.
+    Connections are re-used between requests from any driver, and the number of requests and the time spent on them is recorded per driver
+    """
+
+    def __init__(self, transport_options=None):
+        self.transport_options = transport_options if transport_options is not None else TNCOTransportOptions()
+        self.__session = None
+        self.__lock = threading.Lock()
+        self.__stats = {}
+
+    def __curr_session(self):
+        if self.__session is None:
+            with self.__lock:
+                if self.__session is None:
+                    self.__session = self.transport_options.build_session()
+        return self.__session
+
+    def request(self, driver_name, method, url, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.__curr_session().request(method, url, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            with self.__lock:
+                if driver_name not in self.__stats:
+                    self.__stats[driver_name] = LmRequestStats(driver_name)
+                self.__stats[driver_name].record(duration)
+            logger.debug('{0} {1} request to {2} took {3:.3f}s'.format(driver_name, method, url, duration))
+
+    def for_driver(self, driver_name):
+        return LmDriverHttp(self, driver_name)
+
+    @property
+    def stats(self):
+        with self.__lock:
+            return [s.copy() for s in self.__stats.values()]
+
+    def stats_since(self, previous_stats):
+        """
+        Calculate the requests made by each driver since a previous snapshot of the stats was taken
+
+        Args:
+            previous_stats (list): LmRequestStats previously obtained from the "stats" property
+
+        Returns:
+            list: LmRequestStats for each driver which made a request since the snapshot
+        """
+        previous = {s.name: s for s in previous_stats}
+        result = []
+        for current in self.stats:
+            if current.name in previous:
+                current.request_count -= previous[current.name].request_count
+                current.total_time -= previous[current.name].total_time
+            if current.request_count > 0:
+                result.append(current)
+        return result
+
+    @property
+    def request_count(self):
+        return sum(s.request_count for s in self.stats)
+
+    @property
+    def total_time(self):
+        return sum(s.total_time for s in self.stats)
+
+    def close(self):
+        with self.__lock:
+            if self.__session is not None:
+                self.__session.close()
+                self.__session = None
+
+
+class LmDriverHttp:
+    """
+    Requests style API (get, post, put, patch, delete) for a single driver, routed through a shared LmHttpSession
+    """
+
+    def __init__(self, http_session, driver_name):
+        self.http_session = http_session
+        self.driver_name = driver_name
+
+    def request(self, method, url, **kwargs):
+        return self.http_session.request(self.driver_name, method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('PUT', url, data=data, **kwargs)
+
+    def patch(self, url, data=None, **kwargs):
+        return self.request('PATCH', url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
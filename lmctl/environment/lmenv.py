@@ -1,6 +1,7 @@
 import lmctl.drivers.lm as lm_drivers
 import logging
 import os
+import threading
 
 from typing import Union, Optional
 from .common import build_address
@@ -10,7 +11,7 @@ from pydantic import constr, root_validator
 
 from lmctl.utils.jwt import decode_jwt
 from lmctl.utils.dcutils.dc_capture import recordattrs
-from lmctl.client import TNCOClientBuilder, TOKEN_AUTH_MODE, ZEN_AUTH_MODE, OAUTH_MODE, OKTA_MODE
+from lmctl.client import TNCOClientBuilder, TNCOTransportOptions, TokenCache, TOKEN_AUTH_MODE, ZEN_AUTH_MODE, OAUTH_MODE, OKTA_MODE
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,15 @@ class TNCOEnvironment:
     kami_port: Optional[Union[str,int]] = DEFAULT_KAMI_PORT 
     kami_protocol: Optional[str] = DEFAULT_KAMI_PROTOCOL
 
+    use_sessions: Optional[bool] = True
+    pool_connections: Optional[int] = None
+    pool_maxsize: Optional[int] = None
+    max_retries: Optional[int] = None
+    retry_backoff_factor: Optional[float] = None
+
+    token_cache: Optional[bool] = False
+    token_refresh_ahead: Optional[float] = None
+
     @root_validator(pre=True)
     @classmethod
     def check_security(cls, values):
@@ -202,10 +212,52 @@ class TNCOEnvironment:
                                 scope=self.scope,
                                 auth_server_id=self.auth_server_id
                             )
+
+    def build_transport_options(self):
+        return TNCOTransportOptions(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+            retry_backoff_factor=self.retry_backoff_factor
+        )
+
+    @property
+    def uses_token_cache(self):
+        return self.secure and self.token_cache is True and not self.is_using_token_auth
+
+    def build_token_cache(self):
+        if self.uses_token_cache:
+            return TokenCache()
+        return None
+
+    def token_cache_key(self):
+        return self.token_cache_key_for(self.auth_mode, username=self.username, client_id=self.client_id)
+
+    def token_cache_key_for(self, auth_mode, username=None, client_id=None):
+        """
+        Key of the access token cached for the credentials actually used to authenticate with this environment
+        (which, for a session, may differ from those configured), so tokens issued to different users or clients are never shared
+        """
+        environment = self.address if self.name is None else f'{self.name}@{self.address}'
+        if username is not None and client_id is not None:
+            # Password grant through a client
+            principal = f'{username}@{client_id}'
+        else:
+            principal = username if username is not None else client_id
+        return TokenCache.build_key(environment, auth_mode, principal)
+
     def build_client(self):
         builder = TNCOClientBuilder()
         builder.address(self.address)
         builder.kami_address(self.kami_address)
+        builder.use_sessions(self.use_sessions)
+        builder.pool_connections(self.pool_connections)
+        builder.pool_maxsize(self.pool_maxsize)
+        builder.max_retries(self.max_retries)
+        builder.retry_backoff_factor(self.retry_backoff_factor)
+        builder.token_refresh_ahead(self.token_refresh_ahead)
+        if self.uses_token_cache:
+            builder.token_cache(self.build_token_cache(), self.token_cache_key())
         if self.secure:
             if self.auth_mode == ZEN_AUTH_MODE:
                 builder.zen_api_key_auth(username=self.username, api_key=self.api_key, zen_auth_address=self.auth_address)
@@ -341,21 +393,45 @@ class LmSession:
         self.__pkg_mgmt_driver = None
         self.__infrastructure_keys_driver = None
         self.__descriptor_template_driver = None
+        self.__http_session = None
+        self.__lock = threading.RLock()
+
+    @property
+    def http_session(self):
+        """
+        Obtain the LmHttpSession shared by all drivers of this session, so connections to CP4NA orchestration are re-used between them
+
+        Returns:
+            LmHttpSession: the pooled HTTP session, which also records the number of requests and time spent on them per driver
+        """
+        with self.__lock:
+            if not self.__http_session:
+                self.__http_session = lm_drivers.LmHttpSession(self.env.build_transport_options())
+            return self.__http_session
+
+    def close(self):
+        if self.__http_session:
+            self.__http_session.close()
 
     def __get_lm_security_ctrl(self):
         if self.env.secure:
-            if not self.__lm_security_ctrl:
-                self.__lm_security_ctrl = lm_drivers.LmSecurityCtrl(self.env.auth_address, 
-                                                                    username=self.username, 
-                                                                    password=self.password,
-                                                                    client_id=self.client_id, 
-                                                                    client_secret=self.client_secret,
-                                                                    api_key=self.api_key,
-                                                                    token=self.token,
-                                                                    auth_mode=self.auth_mode,
-                                                                    scope=self.scope,
-                                                                    auth_server_id=self.auth_server_id
-                                                                )
+            with self.__lock:
+                if not self.__lm_security_ctrl:
+                    token_cache = self.env.build_token_cache()
+                    self.__lm_security_ctrl = lm_drivers.LmSecurityCtrl(self.env.auth_address, 
+                                                                        username=self.username, 
+                                                                        password=self.password,
+                                                                        client_id=self.client_id, 
+                                                                        client_secret=self.client_secret,
+                                                                        api_key=self.api_key,
+                                                                        token=self.token,
+                                                                        auth_mode=self.auth_mode,
+                                                                        scope=self.scope,
+                                                                        auth_server_id=self.auth_server_id,
+                                                                        token_cache=token_cache,
+                                                                        token_cache_key=self.env.token_cache_key_for(self.auth_mode, username=self.username, client_id=self.client_id) if token_cache is not None else None,
+                                                                        token_refresh_ahead=self.env.token_refresh_ahead
+                                                                    )
             return self.__lm_security_ctrl
         return None
 
@@ -369,7 +445,7 @@ class LmSession:
             LmDescriptorDriver: a configured DescriptorDriver for this CP4NA orchestration environment
         """
         if not self.__descriptor_driver:
-            self.__descriptor_driver = lm_drivers.LmDescriptorDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__descriptor_driver = lm_drivers.LmDescriptorDriver(self.env.api_address, self.__get_lm_security_ctrl(), http_session=self.http_session)
         return self.__descriptor_driver
 
     @property
@@ -381,7 +457,7 @@ class LmSession:
             LmOnboardRmDriver: a configured LmOnboardRmDriver for this CP4NA orchestration environment
         """
         if not self.__onboard_rm_driver:
-            self.__onboard_rm_driver = lm_drivers.LmOnboardRmDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__onboard_rm_driver = lm_drivers.LmOnboardRmDriver(self.env.api_address, self.__get_lm_security_ctrl(), http_session=self.http_session)
         return self.__onboard_rm_driver
 
     @property
@@ -393,7 +469,7 @@ class LmSession:
             LmTopologyDriver: a configured LmTopologyDriver for this CP4NA orchestration environment
         """
         if not self.__topology_driver:
-            self.__topology_driver = lm_drivers.LmTopologyDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__topology_driver = lm_drivers.LmTopologyDriver(self.env.api_address, self.__get_lm_security_ctrl(), http_session=self.http_session)
         return self.__topology_driver
 
     @property
@@ -405,7 +481,7 @@ class LmSession:
             LmBehaviourDriver: a configured LmBehaviourDriver for this CP4NA orchestration environment
         """
         if not self.__behaviour_driver:
-            self.__behaviour_driver = lm_drivers.LmBehaviourDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__behaviour_driver = lm_drivers.LmBehaviourDriver(self.env.api_address, self.__get_lm_security_ctrl(), http_session=self.http_session)
         return self.__behaviour_driver
 
     @property
@@ -417,7 +493,7 @@ class LmSession:
             LmDeploymentLocationDriver: a configured LmDeploymentLocationDriver for this CP4NA orchestration environment
         """
         if not self.__deployment_location_driver:
-            self.__deployment_location_driver = lm_drivers.LmDeploymentLocationDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__deployment_location_driver = lm_drivers.LmDeploymentLocationDriver(self.env.api_address, self.__get_lm_security_ctrl(), http_session=self.http_session)
         return self.__deployment_location_driver
 
     @property
@@ -429,7 +505,7 @@ class LmSession:
             LmResourcePkgDriver: a configured LmResourcePkgDriver for this CP4NA orchestration environment
         """
         if not self.__resource_pkg_driver:
-            self.__resource_pkg_driver = lm_drivers.LmResourcePkgDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__resource_pkg_driver = lm_drivers.LmResourcePkgDriver(self.env.api_address, self.__get_lm_security_ctrl(), http_session=self.http_session)
         return self.__resource_pkg_driver
 
     @property
@@ -441,7 +517,7 @@ class LmSession:
             EtsiPackageMgmtDriver: a configured EtsiPackageMgmtDriver for this CP4NA orchestration environment
         """
         if not self.__pkg_mgmt_driver:
-            self.__pkg_mgmt_driver = lm_drivers.EtsiPackageMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__pkg_mgmt_driver = lm_drivers.EtsiPackageMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), http_session=self.http_session)
         return self.__pkg_mgmt_driver        
 
     @property
@@ -453,7 +529,7 @@ class LmSession:
             LmResourceDriverMgmtDriver: a configured LmResourceDriverMgmtDriver for this CP4NA orchestration environment
         """
         if not self.__resource_driver_mgmt_driver:
-            self.__resource_driver_mgmt_driver = lm_drivers.LmResourceDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__resource_driver_mgmt_driver = lm_drivers.LmResourceDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), http_session=self.http_session)
         return self.__resource_driver_mgmt_driver
 
     @property
@@ -465,7 +541,7 @@ class LmSession:
             LmVimDriverMgmtDriver: a configured LmVimDriverMgmtDriver for this CP4NA orchestration environment
         """
         if not self.__vim_driver_mgmt_driver:
-            self.__vim_driver_mgmt_driver = lm_drivers.LmVimDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__vim_driver_mgmt_driver = lm_drivers.LmVimDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), http_session=self.http_session)
         return self.__vim_driver_mgmt_driver
 
     @property
@@ -477,7 +553,7 @@ class LmSession:
             LmLifecycleDriverMgmtDriver: a configured LmLifecycleDriverMgmtDriver for this CP4NA orchestration environment
         """
         if not self.__lifecycle_driver_mgmt_driver:
-            self.__lifecycle_driver_mgmt_driver = lm_drivers.LmLifecycleDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__lifecycle_driver_mgmt_driver = lm_drivers.LmLifecycleDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), http_session=self.http_session)
         return self.__lifecycle_driver_mgmt_driver
 
     @property
@@ -489,7 +565,7 @@ class LmSession:
             LmInfrastructureKeysDriver: a configured LmInfrastructureKeysDriver for this CP4NA orchestration environment
         """
         if not self.__infrastructure_keys_driver:
-            self.__infrastructure_keys_driver = lm_drivers.LmInfrastructureKeysDriver(self.env.api_address, self.__get_lm_security_ctrl())
+            self.__infrastructure_keys_driver = lm_drivers.LmInfrastructureKeysDriver(self.env.api_address, self.__get_lm_security_ctrl(), http_session=self.http_session)
         return self.__infrastructure_keys_driver
 
     @property
@@ -501,7 +577,7 @@ class LmSession:
             LmDescriptorTemplatesDriver: a configured LmDescriptorTemplatesDriver for this CP4NA orchestration environment
         """
         if not self.__descriptor_template_driver:
-            self.__descriptor_template_driver = lm_drivers.LmDescriptorTemplatesDriver(self.env.kami_address)
+            self.__descriptor_template_driver = lm_drivers.LmDescriptorTemplatesDriver(self.env.kami_address, http_session=self.http_session)
         return self.__descriptor_template_driver
 
 LmEnvironment = TNCOEnvironment
\ No newline at end of file
@@ -1,9 +1,14 @@
 import os
+import errno
 import shutil
-import distutils.dir_util
 import string
 import unicodedata
 import logging
+import tempfile
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +26,39 @@ class Tree:
         return os.path.join(self.root_path, *relative_paths)
 
 
+class ContentFiles:
+    """
+    Access to the files of expanded content by the path they have (or would have) on disk.
+
+    This default reads every file from disk. Alternatives may leave some files in their original location (e.g. the archive of a package being pushed)
+    until they are read, so content handlers should use this, rather than the os module, to check for and read any files they upload as they are.
+    """
+
+    def exists(self, path):
+        return os.path.exists(path)
+
+    def open(self, path):
+        """
+        Open a file for reading in binary mode. The "name" of the returned file object is always the path requested
+        """
+        return open(path, 'rb')
+
+    def local_path(self, path):
+        """
+        Ensure a file is on disk at the given path (so it may be modified) and return the path
+        """
+        return path
+
+    def moved(self, src, dest):
+        """
+        Notify that a directory of content has been moved on disk
+        """
+        pass
+
+    def close(self):
+        pass
+
+
 def clean_directory(directory_path):
     if os.path.exists(directory_path):
         shutil.rmtree(directory_path)
@@ -41,10 +79,140 @@ def copy_file(src, dest):
     shutil.copy2(src, dest)
 
 
+def write_file_atomically(path, write, binary=False, mode=None):
+    """
+    Write a file by passing a temporary file, in the same directory, to "write" then renaming it to the path. Readers never see a partially
+    written file and a failed (or interrupted) write leaves any existing file as it was. The directory must already exist
+
+    Args:
+        path (str): path of the file to write
+        write (callable): function writing the content to the open file object it is given
+        binary (bool): open the file in binary mode
+        mode (int): permissions of the file (e.g. 0o600 for content only the current user may read), set before any content is written
+    """
+    path = str(path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-', suffix=os.path.splitext(path)[1])
+    try:
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        with os.fdopen(fd, 'wb' if binary else 'w') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def copy_tree(src, dest):
+    # Imported when first used, as importing distutils (through setuptools) slows the start of every command
+    import distutils.dir_util
+    # distutils remembers the directories it has created and would not re-create one removed since (e.g. by an incremental build)
+    path_cache = getattr(distutils.dir_util, '_path_created', None)
+    if path_cache is not None:
+        path_cache.clear()
     distutils.dir_util.copy_tree(src, dest, 0)
 
 
+COPY_STRATEGY = 'copy'
+HARDLINK_STRATEGY = 'hardlink'
+REFLINK_STRATEGY = 'reflink'
+AUTO_STRATEGY = 'auto'
+COPY_STRATEGIES = [AUTO_STRATEGY, REFLINK_STRATEGY, HARDLINK_STRATEGY, COPY_STRATEGY]
+
+# Linux ioctl which clones the extents of one file into another (supported by btrfs, XFS and others)
+FICLONE = 0x40049409
+
+
+def _reflink(src, dest):
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, 'Reflinks are not supported on this platform')
+    with open(src, 'rb') as src_file:
+        with open(dest, 'wb') as dest_file:
+            try:
+                fcntl.ioctl(dest_file.fileno(), FICLONE, src_file.fileno())
+            except OSError:
+                dest_file.close()
+                os.remove(dest)
+                raise
+    shutil.copystat(src, dest)
+
+
+class FileCopier:
+    """
+    Copies files and trees which are only read once copied (e.g. the staged and compiled content of a build), sharing their content with the original where possible.
+
+    Strategies:
+        auto: reflink, falling back to a hardlink, then a copy
+        reflink: copy-on-write clone (btrfs, XFS etc.), falling back to a copy
+        hardlink: hardlink, falling back to a copy (e.g. across devices)
+        copy: always copy
+
+    A hardlinked file shares its content with the original, so must never be written in place (see unshare_file).
+    Once a strategy fails with a filesystem it is not attempted again by the same copier.
+    """
+
+    def __init__(self, strategy=COPY_STRATEGY):
+        if strategy not in COPY_STRATEGIES:
+            raise ValueError('Copy strategy must be one of {0} but was: {1}'.format(COPY_STRATEGIES, strategy))
+        self.strategy = strategy
+        self._reflink = strategy in [AUTO_STRATEGY, REFLINK_STRATEGY]
+        self._hardlink = strategy in [AUTO_STRATEGY, HARDLINK_STRATEGY]
+        self.bytes_copied = 0
+        self.bytes_linked = 0
+
+    def copy_file(self, src, dest):
+        if self.strategy == COPY_STRATEGY:
+            copy_file(src, dest)
+            self.bytes_copied += os.path.getsize(dest)
+            return
+        if os.path.isdir(dest):
+            dest = os.path.join(dest, os.path.basename(src))
+        if os.path.lexists(dest):
+            os.remove(dest)
+        if self._reflink:
+            try:
+                _reflink(src, dest)
+                self.bytes_linked += os.path.getsize(dest)
+                return
+            except OSError as e:
+                logger.debug('Reflink from {0} to {1} not possible, not attempting again: {2}'.format(src, dest, str(e)))
+                self._reflink = False
+        if self._hardlink:
+            try:
+                os.link(src, dest)
+                self.bytes_linked += os.path.getsize(dest)
+                return
+            except OSError as e:
+                logger.debug('Hardlink from {0} to {1} not possible, not attempting again: {2}'.format(src, dest, str(e)))
+                self._hardlink = False
+        shutil.copy2(src, dest)
+        self.bytes_copied += os.path.getsize(dest)
+
+    def copy_tree(self, src, dest):
+        if self.strategy == COPY_STRATEGY:
+            copy_tree(src, dest)
+            self.bytes_copied += sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(dest) for name in names)
+            return
+        os.makedirs(dest, exist_ok=True)
+        for name in os.listdir(src):
+            src_path = os.path.join(src, name)
+            dest_path = os.path.join(dest, name)
+            # Symlinks are followed, as copy_tree does
+            if os.path.isdir(src_path):
+                self.copy_tree(src_path, dest_path)
+            else:
+                self.copy_file(src_path, dest_path)
+
+
+def unshare_file(path):
+    """
+    Remove a file which shares its content with another through a hardlink, so it may be re-written without changing the other
+    """
+    if os.path.exists(path) and os.stat(path).st_nlink > 1:
+        os.remove(path)
+
+
 def immediate_sub_directories(parent_directory):
     sub_directory_paths = []
     for sub_name in os.listdir(parent_directory):
@@ -0,0 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+import lmctl.project.journal as project_journal
+
+
+def run_concurrently(journal, items, action, parallelism=1):
+    """
+    Calls action(item, journal) for each item, with up to "parallelism" calls in progress at once.
+
+    When run concurrently, each call is given its own BufferedProjectJournal, which is replayed into the journal in the order of the items once complete,
+    so the output of each call is never interleaved. The first error cancels any calls not yet started and is raised once those in progress have finished.
+
+    Args:
+        journal (ProjectJournal): journal to record the output of each call in
+        items (list): the items to act on
+        action (callable): function accepting an item and the journal to use
+        parallelism (int): maximum number of calls in progress at once (1 to act on each item in turn, on the calling thread)
+
+    Returns:
+        list: the result of each call, in the order of the items
+    """
+    if parallelism is None or parallelism <= 1 or len(items) <= 1:
+        return [action(item, journal) for item in items]
+    results = []
+    first_error = None
+    with ThreadPoolExecutor(max_workers=min(parallelism, len(items))) as executor:
+        tasks = []
+        for item in items:
+            buffered_journal = project_journal.BufferedProjectJournal()
+            tasks.append((executor.submit(action, item, buffered_journal), buffered_journal))
+        for future, buffered_journal in tasks:
+            if first_error is not None and future.cancel():
+                continue
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if first_error is None:
+                    first_error = e
+                    for remaining_future, _ in tasks:
+                        remaining_future.cancel()
+            buffered_journal.replay(journal)
+    if first_error is not None:
+        raise first_error
+    return results
@@ -2,6 +2,7 @@ import os
 import lmctl.files as files
 import lmctl.utils.descriptors as descriptors
 import lmctl.drivers.lm.base as lm_drivers
+import lmctl.utils.uploads as uploads
 import lmctl.project.validation as validation 
 import lmctl.project.handlers.interface as handlers_api
 
@@ -63,7 +64,7 @@ class AnsibleRmContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegat
         errors = []
         warnings = []
         self.__validate_descriptor(journal, errors, warnings)
-        self.__validate_csar(journal, errors, warnings)
+        self.__validate_csar(journal, validation_options, errors, warnings)
         return validation.ValidationResult(errors, warnings)
 
     def __validate_descriptor(self, journal, errors, warnings):
@@ -73,10 +74,10 @@ class AnsibleRmContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegat
             journal.error_event(msg)
             errors.append(validation.ValidationViolation(msg))
 
-    def __validate_csar(self, journal, errors, warnings):
+    def __validate_csar(self, journal, validation_options, errors, warnings):
         journal.stage('Checking CSAR exists for {0}'.format(self.meta.name))
         csar_path = self.tree.gen_csar_file_path(self.meta.full_name)
-        if not os.path.exists(csar_path):
+        if not validation_options.content_files.exists(csar_path):
             msg = 'No CSAR found at: {0}'.format(csar_path)
             journal.error_event(msg)
             errors.append(validation.ValidationViolation(msg))
@@ -84,7 +85,7 @@ class AnsibleRmContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegat
     def __clear_existing_descriptor(self, journal, env_sessions):
         lm_session = env_sessions.lm
         descriptor_path = self.tree.gen_root_descriptor_file_path(self.meta.full_name)
-        descriptor = descriptors.DescriptorParser().read_from_file(descriptor_path)
+        descriptor = descriptors.DescriptorParser(read_only=True).read_from_file(descriptor_path)
         descriptor_name = descriptor.get_name()
         descriptor_version = descriptor.get_version()
         journal.event('Removing descriptor {0} from CP4NA orchestration ({1})'.format(descriptor_name, lm_session.env.address))
@@ -98,14 +99,15 @@ class AnsibleRmContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegat
 
     def push_content(self, journal, env_sessions, push_options):
         descriptor_name, descriptor_version = self.__clear_existing_descriptor(journal, env_sessions)
-        self.__push_csar(journal, env_sessions, descriptor_version)
+        self.__push_csar(journal, env_sessions, descriptor_version, push_options)
 
-    def __push_csar(self, journal, env_sessions, descriptor_version):
+    def __push_csar(self, journal, env_sessions, descriptor_version, push_options):
         lm_session = env_sessions.lm
         arm_session = env_sessions.arm
         csar_path = self.tree.gen_csar_file_path(self.meta.full_name)
         journal.event('Pushing {0} (version: {1}) CSAR to ansible-rm: {2} ({3})'.format(self.meta.full_name, descriptor_version, arm_session.env.name, arm_session.env.address))
         driver = arm_session.arm_driver
-        driver.onboard_type(self.meta.full_name, descriptor_version, csar_path)
+        with push_options.content_files.open(csar_path) as csar:
+            driver.onboard_type(self.meta.full_name, descriptor_version, csar, progress_callback=uploads.UploadProgressReporter(journal.event, os.path.basename(csar_path)))
         env_sessions.mark_arm_updated()
 
@@ -1,5 +1,4 @@
 import os
-import zipfile
 import yaml
 import lmctl.files as files
 import lmctl.project.validation as project_validation
@@ -138,7 +137,7 @@ class AnsibleRmStagedSourceHandlerDelegate(handlers_api.ResourceStagedSourceHand
         relative_csar_path = pkg_tree.gen_csar_file_path(self.source_config.full_name)
         full_csar_path = source_compiler.make_file_path(relative_csar_path)
         journal.event('Creating CSAR for Resource {0}: {1}'.format(self.source_config.name, relative_csar_path))
-        with zipfile.ZipFile(full_csar_path, "w") as csar:
+        with source_compiler.create_zip(full_csar_path) as csar:
             included_items = [
                 {'path': self.tree.descriptor_path, 'alias': csar_content_tree.descriptor_path, 'required': True},
                 {'path': self.tree.lifecycle_path, 'alias': csar_content_tree.lifecycle_path, 'required': True},
@@ -1,16 +1,24 @@
 import time
 import os
 import json
+import threading
+import functools
 import lmctl.files as files
 import lmctl.utils.descriptors as descriptors
 import lmctl.drivers.lm.base as lm_drivers
 import lmctl.project.mutate.behaviour as behaviour_mutations
 import lmctl.project.handlers.interface as handlers_api
 import lmctl.project.testing as project_testing
+import lmctl.project.journal as project_journal
+import lmctl.project.concurrency as concurrency
+import lmctl.project.ledger as push_ledger
+import lmctl.project.package.meta as pkg_metas
 from lmctl.project.validation import ValidationResult, ValidationViolation
 
 DEFAULT_POLLING_PERIOD = 2
 POLLING_PERIOD = DEFAULT_POLLING_PERIOD
+# While no test execution makes progress, the time between polls is doubled, up to this multiple of the polling period
+MAX_POLLING_BACKOFF = 4
 
 def set_polling_period(new_period):
     global POLLING_PERIOD
@@ -102,14 +110,25 @@ class AssemblyContentHandler(handlers_api.PkgContentHandler):
 
     def push_content(self, journal, env_sessions, push_options):
         project_id = self.__push_descriptor(journal, env_sessions, push_options)
-        self.__push_descriptor_template(journal, env_sessions)
+        self.__push_descriptor_template(journal, env_sessions, push_options)
         self.__push_service_behaviour(journal, env_sessions, project_id, push_options)
 
+    def __content_hash(self, file_path):
+        content_hash = self.meta.content_hash(os.path.relpath(file_path, self.root_path))
+        if content_hash is None:
+            content_hash = pkg_metas.calculate_file_hash(file_path)
+        return content_hash
+
     def __push_descriptor(self, journal, env_sessions, push_options):
         lm_session = env_sessions.lm
         descriptor_path = self.tree.descriptor_file_path
-        descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path)
+        descriptor, descriptor_yml_str = descriptors.DescriptorParser(read_only=True).read_from_file_with_raw(descriptor_path)
         descriptor_name = descriptor.get_name()
+        descriptor_hash = self.__content_hash(descriptor_path)
+        ledger_key = 'descriptor:{0}'.format(descriptor_name)
+        if push_options.skip_unchanged(ledger_key, descriptor_hash):
+            journal.event('Descriptor {0} unchanged since last push, skipping'.format(descriptor_name))
+            return descriptor_name
         descriptor_driver = lm_session.descriptor_driver
         journal.event('Checking for Descriptor {0} in CP4NA orchestration ({1})'.format(descriptor_name, lm_session.env.address))
         found = True
@@ -124,14 +143,20 @@ class AssemblyContentHandler(handlers_api.PkgContentHandler):
             journal.event('Not found, creating Descriptor {0}'.format(descriptor_name))
             descriptor_driver.create_descriptor(descriptor_yml_str, object_group_id=push_options.object_group_id)
         env_sessions.mark_lm_updated()
+        push_options.pushed(ledger_key, descriptor_hash)
         return descriptor_name
 
-    def __push_descriptor_template(self, journal, env_sessions):
+    def __push_descriptor_template(self, journal, env_sessions, push_options):
         lm_session = env_sessions.lm
         descriptor_template_path = self.tree.descriptor_template_file_path
         if os.path.exists(descriptor_template_path):
-            descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_template_path)
+            descriptor, descriptor_yml_str = descriptors.DescriptorParser(read_only=True).read_from_file_with_raw(descriptor_template_path)
             descriptor_name = descriptor.get_name()
+            descriptor_template_hash = self.__content_hash(descriptor_template_path)
+            ledger_key = 'descriptor-template:{0}'.format(descriptor_name)
+            if push_options.skip_unchanged(ledger_key, descriptor_template_hash):
+                journal.event('Descriptor Template {0} unchanged since last push, skipping'.format(descriptor_name))
+                return
             descriptor_template_driver = lm_session.descriptor_template_driver
             journal.event('Checking for Descriptor Template {0} in CP4NA orchestration ({1})'.format(descriptor_name, descriptor_template_driver.lm_base))
             found = True
@@ -145,6 +170,7 @@ class AssemblyContentHandler(handlers_api.PkgContentHandler):
             else:
                 journal.event('Not found, creating Descriptor Template {0}'.format(descriptor_name))
                 descriptor_template_driver.create_descriptor_template(descriptor_yml_str)
+            push_options.pushed(ledger_key, descriptor_template_hash)
 
     def __push_service_behaviour(self, journal, env_sessions, project_id, push_options):
         lm_session = env_sessions.lm
@@ -153,67 +179,130 @@ class AssemblyContentHandler(handlers_api.PkgContentHandler):
             journal.event('Skipping Service Behaviour - nothing to push at {0}'.format(behaviour_path))
             return
         journal.stage('Pushing Service Behaviour for {0} at {1}'.format(self.meta.name, behaviour_path))
-        existing_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        self.__push_configurations(journal, env_sessions, project_id, existing_configurations)
-        existing_scenarios = lm_session.behaviour_driver.get_scenarios(project_id)
-        all_available_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        self.__push_runtime_scenarios(journal, env_sessions, project_id, existing_scenarios, all_available_configurations)
-        self.__push_test_scenarios(journal, env_sessions, project_id, existing_scenarios, all_available_configurations)
-
-    def __push_configurations(self, journal, env_sessions, project_id, existing_configurations):
-        lm_session = env_sessions.lm
-        existing_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        configurations_path = self.tree.service_behaviour_configurations_path
-        if os.path.exists(configurations_path):
-            walk_and_find_json(configurations_path, 'Assembly Configuration', self.__push_configuration, journal, env_sessions, project_id, existing_configurations)
-
-    def __push_configuration(self, file_path, configuration, journal, env_sessions, project_id, existing_configurations):
+        behaviour_index = BehaviourIndex(lm_session.behaviour_driver, project_id)
+        # Configurations are independent of each other, as are scenarios, but scenarios reference configurations so must be pushed after them
+        configurations = find_json(self.tree.service_behaviour_configurations_path)
+        push_configuration = functools.partial(self.__push_configuration, env_sessions=env_sessions, project_id=project_id, behaviour_index=behaviour_index, push_options=push_options)
+        concurrency.run_concurrently(journal, configurations, push_configuration, parallelism=push_options.parallelism)
+        scenarios = find_json(self.tree.service_behaviour_runtime_path) + find_json(self.tree.service_behaviour_tests_path)
+        if len(scenarios) > 0:
+            available_configurations = behaviour_index.configurations
+            push_scenario = functools.partial(self.__push_scenario, env_sessions=env_sessions, project_id=project_id, behaviour_index=behaviour_index,
+                                              available_configurations=available_configurations, push_options=push_options)
+            concurrency.run_concurrently(journal, scenarios, push_scenario, parallelism=push_options.parallelism)
+
+    def __push_configuration(self, configuration_file, journal, env_sessions, project_id, behaviour_index, push_options):
+        file_path, configuration = configuration_file
         lm_session = env_sessions.lm
         configuration['projectId'] = project_id
-        project_descriptor_name = project_id
         behaviour_driver = lm_session.behaviour_driver
         journal.event('Checking for assembly configuration {0} in CP4NA orchestration ({1}) project {2}'.format(configuration['name'], lm_session.env.address, project_id))
-        matching_configuration = self.__find_assembly_configuration_by_name(existing_configurations, configuration['name'])
+        matching_configuration = behaviour_index.find_configuration(configuration['name'])
+        configuration_hash = push_ledger.calculate_data_hash(configuration)
+        ledger_key = 'assembly-configuration:{0}:{1}'.format(project_id, configuration['name'])
+        if matching_configuration and push_options.skip_unchanged(ledger_key, configuration_hash):
+            journal.event('Assembly Configuration {0} unchanged since last push, skipping'.format(configuration['name']))
+            return
         if matching_configuration:
             journal.event('Assembly Configuration {0} already exists, updating'.format(configuration['name']))
             configuration['id'] = matching_configuration['id']
             behaviour_driver.update_assembly_configuration(configuration)
+            behaviour_index.put_configuration(configuration)
         else:
             journal.event('Not found, creating assembly configuration {0}'.format(configuration['name']))
-            behaviour_driver.create_assembly_configuration(configuration)
+            created_configuration = behaviour_driver.create_assembly_configuration(configuration)
+            behaviour_index.put_configuration(created_configuration if isinstance(created_configuration, dict) else configuration)
         env_sessions.mark_lm_updated()
+        push_options.pushed(ledger_key, configuration_hash)
 
-    def __push_runtime_scenarios(self, journal, env_sessions, project_id, existing_scenarios, available_configurations):
-        runtimes_path = self.tree.service_behaviour_runtime_path
-        if os.path.exists(runtimes_path):
-            walk_and_find_json(runtimes_path, 'Runtime', self.__push_scenario, journal, env_sessions, project_id, existing_scenarios, available_configurations)
-
-    def __push_test_scenarios(self, journal, env_sessions, project_id, existing_scenarios, available_configurations):
-        tests_path = self.tree.service_behaviour_tests_path
-        if os.path.exists(tests_path):
-            walk_and_find_json(tests_path, 'Test', self.__push_scenario, journal, env_sessions, project_id, existing_scenarios, available_configurations)
-
-    def __push_scenario(self, file_path, scenario, journal, env_sessions, project_id, existing_scenarios, available_configurations):
+    def __push_scenario(self, scenario_file, journal, env_sessions, project_id, behaviour_index, available_configurations, push_options):
+        file_path, scenario = scenario_file
         lm_session = env_sessions.lm
         scenario['projectId'] = project_id
         behaviour_driver = lm_session.behaviour_driver
         scenario = behaviour_mutations.ScenarioPushMutator(available_configurations).apply(scenario)
         journal.event('Checking for Scenario {0} in CP4NA orchestration ({1}) project {2}'.format(scenario['name'], lm_session.env.address, project_id))
-        matching_scenario = next((x for x in existing_scenarios if x["name"] == scenario['name']), None)
+        matching_scenario = behaviour_index.find_scenario(scenario['name'])
+        # Hashed after mutation, so the scenario is pushed again if the configurations it references have been re-created
+        scenario_hash = push_ledger.calculate_data_hash(scenario)
+        ledger_key = 'scenario:{0}:{1}'.format(project_id, scenario['name'])
+        if matching_scenario and push_options.skip_unchanged(ledger_key, scenario_hash):
+            journal.event('Scenario {0} unchanged since last push, skipping'.format(scenario['name']))
+            return
         if matching_scenario:
             journal.event('Scenario {0} already exists, updating'.format(scenario['name']))
             scenario['id'] = matching_scenario['id']
             behaviour_driver.update_scenario(scenario)
+            behaviour_index.put_scenario(scenario)
         else:
             journal.event('Not found, creating Scenario {0}'.format(scenario['name']))
-            behaviour_driver.create_scenario(scenario)
+            created_scenario = behaviour_driver.create_scenario(scenario)
+            behaviour_index.put_scenario(created_scenario if isinstance(created_scenario, dict) else scenario)
         env_sessions.mark_lm_updated()
+        push_options.pushed(ledger_key, scenario_hash)
+
+    def execute_tests(self, journal, env_sessions, selected_tests, parallelism=1):
+        return AssemblyTestManager(self.root_path, self.meta).execute_tests(journal, env_sessions, selected_tests, parallelism=parallelism)
+
+
+class BehaviourIndex:
+    """
+    The assembly configurations and scenarios of a behaviour project, fetched once and indexed by name.
+    Kept up to date as objects are created and updated during a push, so the project does not need to be fetched again
+    """
+
+    def __init__(self, behaviour_driver, project_id):
+        self.behaviour_driver = behaviour_driver
+        self.project_id = project_id
+        self.__lock = threading.Lock()
+        self.__configurations = self.__index_by_name(behaviour_driver.get_assembly_configurations(project_id))
+        self.__scenarios = self.__index_by_name(behaviour_driver.get_scenarios(project_id))
+        self.__configurations_incomplete = False
+
+    def __index_by_name(self, behaviour_objs):
+        index = {}
+        for behaviour_obj in behaviour_objs:
+            index.setdefault(behaviour_obj['name'], behaviour_obj)
+        return index
+
+    def find_configuration(self, name):
+        with self.__lock:
+            return self.__configurations.get(name, None)
+
+    def find_scenario(self, name):
+        with self.__lock:
+            return self.__scenarios.get(name, None)
+
+    def put_configuration(self, configuration):
+        with self.__lock:
+            if configuration.get('id', None) is None:
+                # Created without learning the ID, which scenarios need to reference it
+                self.__configurations_incomplete = True
+            else:
+                self.__configurations[configuration['name']] = configuration
+
+    def put_scenario(self, scenario):
+        with self.__lock:
+            if scenario.get('id', None) is not None:
+                self.__scenarios[scenario['name']] = scenario
+
+    @property
+    def configurations(self):
+        with self.__lock:
+            if self.__configurations_incomplete:
+                self.__configurations = self.__index_by_name(self.behaviour_driver.get_assembly_configurations(self.project_id))
+                self.__configurations_incomplete = False
+            return list(self.__configurations.values())
 
-    def __find_assembly_configuration_by_name(self, all_available_configurations, assembly_name):
-        return next((x for x in all_available_configurations if x["name"] == assembly_name), None)
 
-    def execute_tests(self, journal, env_sessions, selected_tests):
-        return AssemblyTestManager(self.root_path, self.meta).execute_tests(journal, env_sessions, selected_tests)
+def find_json(path):
+    """
+    Returns the path and parsed content of each JSON file found under path
+    """
+    found = []
+    if os.path.exists(path):
+        walk_and_find_json(path, None, lambda file_path, content: found.append((file_path, content)))
+    return found
 
 
 def walk_and_find_json(path, type_name, action, *action_args):
@@ -240,7 +329,7 @@ class AssemblyTestManager:
 
     def __determine_project_id(self):
         descriptor_path = self.tree.descriptor_file_path
-        descriptor = descriptors.DescriptorParser().read_from_file(descriptor_path)
+        descriptor = descriptors.DescriptorParser(read_only=True).read_from_file(descriptor_path)
         descriptor_name = descriptor.get_name()
         return descriptor_name
 
@@ -253,17 +342,53 @@ class AssemblyTestManager:
             test_scenarios.extend(test_capture.captives)
         return test_scenarios
 
-    def execute_tests(self, journal, env_sessions, selected_tests):
+    def execute_tests(self, journal, env_sessions, selected_tests, parallelism=1):
         test_scenarios = self.__filter_scenarios_to_execute(self.get_tests(), selected_tests)
         if len(test_scenarios) == 0:
             journal.event('No matching tests found to execute at {0}'.format(self.tree.service_behaviour_tests_path))
             return project_testing.TestSuiteExecutionReport([])
         lm_session = env_sessions.lm
         project_id = self.__determine_project_id()
-        report_entries = []
-        for test_scenario in test_scenarios:
-            report_entries.append(self.__execute_test(journal, lm_session, project_id, test_scenario))
-        return project_testing.TestSuiteExecutionReport(report_entries)
+        concurrent = parallelism is not None and parallelism > 1 and len(test_scenarios) > 1
+        # When running concurrently, the output of each test is held back until all earlier tests have completed, so it is never interleaved
+        test_runs = [AssemblyTestRun(test_scenario['name'], project_journal.BufferedProjectJournal() if concurrent else journal) for test_scenario in test_scenarios]
+        try:
+            self.__poll_test_runs(lm_session.behaviour_driver, project_id, test_runs, parallelism if concurrent else 1, journal)
+        finally:
+            if concurrent:
+                for test_run in test_runs:
+                    test_run.journal.replay(journal)
+        return project_testing.TestSuiteExecutionReport([test_run.report_entry for test_run in test_runs])
+
+    def __poll_test_runs(self, behaviour_driver, project_id, test_runs, parallelism, journal):
+        # A single poller checks on every test in progress each tick, starting more as others complete
+        waiting = list(test_runs)
+        in_progress = []
+        next_to_replay = 0
+        polling_period = POLLING_PERIOD
+        while len(waiting) > 0 or len(in_progress) > 0:
+            while len(waiting) > 0 and len(in_progress) < parallelism:
+                test_run = waiting.pop(0)
+                test_run.start(behaviour_driver, project_id)
+                in_progress.append(test_run)
+            progressed = False
+            for test_run in list(in_progress):
+                if test_run.poll(behaviour_driver):
+                    progressed = True
+                if test_run.finished:
+                    in_progress.remove(test_run)
+            if parallelism > 1:
+                while next_to_replay < len(test_runs) and test_runs[next_to_replay].finished:
+                    test_runs[next_to_replay].journal.replay(journal)
+                    next_to_replay += 1
+            if len(in_progress) == 0 or (len(waiting) > 0 and len(in_progress) < parallelism):
+                # Start the next tests without waiting
+                continue
+            if progressed:
+                polling_period = POLLING_PERIOD
+            else:
+                polling_period = min(polling_period * 2, POLLING_PERIOD * MAX_POLLING_BACKOFF)
+            time.sleep(polling_period)
 
     def __filter_scenarios_to_execute(self, test_scenarios, selected_test_names):
         scenarios_to_execute = []
@@ -272,39 +397,59 @@ class AssemblyTestManager:
                 scenarios_to_execute.append(test_scenario)
         return scenarios_to_execute
 
-    def __execute_test(self, journal, lm_session, project_id, test_scenario):
-        scenario_name = test_scenario['name']
-        journal.event('Executing test: {0}'.format(scenario_name))
-        behaviour_driver = lm_session.behaviour_driver
-        remote_scenario = behaviour_driver.get_scenario_by_name(project_id, scenario_name)
+
+class AssemblyTestRun:
+    """
+    Tracks the execution of a single test scenario, recording its progress on a journal
+    """
+
+    def __init__(self, scenario_name, journal):
+        self.scenario_name = scenario_name
+        self.journal = journal
+        self.execution_id = None
+        self.current_step = 0
+        self.last_status = None
+        self.report_entry = None
+
+    @property
+    def finished(self):
+        return self.report_entry is not None
+
+    def start(self, behaviour_driver, project_id):
+        self.journal.event('Executing test: {0}'.format(self.scenario_name))
+        remote_scenario = behaviour_driver.get_scenario_by_name(project_id, self.scenario_name)
         execution_location = behaviour_driver.execute_scenario(remote_scenario['id'])
         location_parts = execution_location.split('/')
-        execution_id = location_parts[len(location_parts) - 1]
-        finished = False
-        report_entries = []
-        current_step = 0
-        while not finished:
-            execution = behaviour_driver.get_execution(execution_id)
-            finished = self.__is_exec_finished(execution)
-            if finished:
-                journal.event('Test {0} completed with result: {1}'.format(scenario_name, execution['status']))
-                if execution['status'] == 'FAIL':
-                    journal.error_event('Execution failed with reason: {0}'.format(execution['error']))
-                exec_report = self.__build_execution_report(scenario_name, execution)
-                return exec_report
-            else:
-                stage_results = execution['stageReports']
-                total_steps = self.__calc_total_steps(stage_results)
-                prev_step = current_step
-                current_step = self.__calc_current_step(stage_results)
-                steps_difference = current_step - prev_step
-                if steps_difference > 1:
-                    for i in range(prev_step+1, current_step):
-                        step_str = 'step {0}/{1}'.format(i, total_steps)
-                        journal.event('Test \'{0}\' in progress: {1}'.format(scenario_name, step_str))
-                step_str = 'step {0}/{1}'.format(current_step, total_steps) if current_step > 0 else 'pending...'
-                journal.event('Test \'{0}\' in progress: {1}'.format(scenario_name, step_str))
-                time.sleep(POLLING_PERIOD)
+        self.execution_id = location_parts[len(location_parts) - 1]
+
+    def poll(self, behaviour_driver):
+        """
+        Check the status of the execution
+
+        Returns:
+            bool: True if the execution has made progress since it was last checked
+        """
+        execution = behaviour_driver.get_execution(self.execution_id)
+        progressed = execution['status'] != self.last_status
+        self.last_status = execution['status']
+        if self.__is_exec_finished(execution):
+            self.journal.event('Test {0} completed with result: {1}'.format(self.scenario_name, execution['status']))
+            if execution['status'] == 'FAIL':
+                self.journal.error_event('Execution failed with reason: {0}'.format(execution['error']))
+            self.report_entry = self.__build_execution_report(execution)
+            return True
+        stage_results = execution['stageReports']
+        total_steps = self.__calc_total_steps(stage_results)
+        prev_step = self.current_step
+        self.current_step = self.__calc_current_step(stage_results)
+        steps_difference = self.current_step - prev_step
+        if steps_difference > 1:
+            for i in range(prev_step+1, self.current_step):
+                step_str = 'step {0}/{1}'.format(i, total_steps)
+                self.journal.event('Test \'{0}\' in progress: {1}'.format(self.scenario_name, step_str))
+        step_str = 'step {0}/{1}'.format(self.current_step, total_steps) if self.current_step > 0 else 'pending...'
+        self.journal.event('Test \'{0}\' in progress: {1}'.format(self.scenario_name, step_str))
+        return progressed or steps_difference != 0
 
     def __calc_current_step(self, stage_results):
         current_step = 0
@@ -330,19 +475,19 @@ class AssemblyTestManager:
             return True
         return False
 
-    def __build_execution_report(self, scenario_name, execution):
+    def __build_execution_report(self, execution):
         status = execution['status']
         detail = None
         if status == 'PASS':
             result = project_testing.TEST_STATUS_PASSED
         else:
             result = project_testing.TEST_STATUS_FAILED
-            detail = '{0} failed:'.format(scenario_name)
+            detail = '{0} failed:'.format(self.scenario_name)
             if 'error' in execution:
                 detail += ' {0}'.format(execution['error'])
             else:
                 detail += ' no reason given'
-        entry = project_testing.TestExecutionReportEntry(scenario_name, result, detail)
+        entry = project_testing.TestExecutionReportEntry(self.scenario_name, result, detail)
         return entry
 
 
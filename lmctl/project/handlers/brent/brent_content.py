@@ -6,6 +6,8 @@ import lmctl.project.handlers.interface as handlers_api
 import lmctl.project.validation as project_validation
 import lmctl.utils.descriptors as descriptor_utils
 import lmctl.drivers.lm.base as lm_drivers
+import lmctl.utils.uploads as uploads
+import lmctl.project.package.meta as pkg_metas
 from .brent_autocorrect import BrentCorrectableValidation
 
 class BrentPkgContentTree(files.Tree):
@@ -85,20 +87,27 @@ class BrentContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegate):
     def __validate_res_pkg(self, journal, validation_options, errors, warnings):
         journal.stage('Checking Resource package exists for {0}'.format(self.meta.name))
         res_pkg_path = self.tree.gen_resource_package_file_path(self.meta.full_name)
-        if not os.path.exists(res_pkg_path):
+        if not validation_options.content_files.exists(res_pkg_path):
             msg = 'No Resource package found at: {0}'.format(res_pkg_path)
             journal.error_event(msg)
             errors.append(project_validation.ValidationViolation(msg))
         else:
             extraction_path = os.path.join(os.path.dirname(res_pkg_path), 'tmp-extract')
             os.makedirs(extraction_path)
-            with zipfile.ZipFile(res_pkg_path, "r") as res_pkg:
-                res_pkg.extractall(extraction_path)
+            # Read from wherever the Resource package is (it may still be in the package archive being pushed)
+            with validation_options.content_files.open(res_pkg_path) as res_pkg_file:
+                with zipfile.ZipFile(res_pkg_file, "r") as res_pkg:
+                    res_pkg.extractall(extraction_path)
             try:
+                original_hashes = pkg_metas.calculate_content_hashes(extraction_path) if validation_options.allow_autocorrect else None
                 tree = BrentResourcePackageContentTree(extraction_path)
                 BrentCorrectableValidation().validate_and_autocorrect(journal, validation_options, errors, warnings, tree.descriptor_file_path, \
                 tree.infrastructure_definitions_path, tree.infrastructure_manifest_file_path, tree.lifecycle_path, \
                     tree.lifecycle_manifest_file_path)
+                if original_hashes is None or pkg_metas.calculate_content_hashes(extraction_path) == original_hashes:
+                    return
+                # Re-written with the autocorrections, so must be on disk
+                res_pkg_path = validation_options.content_files.local_path(res_pkg_path)
                 with zipfile.ZipFile(res_pkg_path, "w") as res_pkg:
                     res_pkg_content_tree = BrentResourcePackageContentTree()
                     included_items = [
@@ -126,7 +135,7 @@ class BrentContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegate):
     def __clear_existing_descriptor(self, journal, env_sessions):
         lm_session = env_sessions.lm
         descriptor_path = self.tree.root_descriptor_file_path
-        descriptor = descriptor_utils.DescriptorParser().read_from_file(descriptor_path)
+        descriptor = descriptor_utils.DescriptorParser(read_only=True).read_from_file(descriptor_path)
         descriptor_name = descriptor.get_name()
         descriptor_version = descriptor.get_version()
         journal.event('Removing descriptor {0} from CP4NA orchestration ({1})'.format(descriptor_name, lm_session.env.address))
@@ -138,9 +147,23 @@ class BrentContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegate):
             journal.event('Descriptor {0} not found'.format(descriptor_name))
         return descriptor_name, descriptor_version
 
+    def __res_pkg_hash(self, content_files):
+        res_pkg_path = self.tree.gen_resource_package_file_path(self.meta.full_name)
+        content_hash = self.meta.content_hash(os.path.relpath(res_pkg_path, self.root_path))
+        if content_hash is None:
+            with content_files.open(res_pkg_path) as res_pkg:
+                content_hash = pkg_metas.calculate_stream_hash(res_pkg)
+        return content_hash
+
     def push_content(self, journal, env_sessions, push_options):
+        res_pkg_hash = self.__res_pkg_hash(push_options.content_files)
+        ledger_key = 'resource-package:{0}'.format(self.meta.descriptor_name)
+        if push_options.skip_unchanged(ledger_key, res_pkg_hash):
+            journal.event('Resource package {0} (version: {1}) unchanged since last push, skipping'.format(self.meta.full_name, self.meta.version))
+            return
         descriptor_name, descriptor_version = self.__clear_existing_descriptor(journal, env_sessions)
         self.__push_res_pkg(journal, env_sessions, descriptor_name, push_options)
+        push_options.pushed(ledger_key, res_pkg_hash)
 
     def __push_res_pkg(self, journal, env_sessions, descriptor_name, push_options):
         lm_session = env_sessions.lm
@@ -152,5 +175,6 @@ class BrentContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegate):
             journal.event('No package named {0} found'.format(descriptor_name))
         res_pkg_path = self.tree.gen_resource_package_file_path(self.meta.full_name)
         journal.event('Pushing {0} (version: {1}) Resource package to Brent: {2} ({3})'.format(self.meta.full_name, self.meta.version, lm_session.env.name, lm_session.env.address))
-        pkg_driver.onboard_package(res_pkg_path, object_group_id=push_options.object_group_id)
+        with push_options.content_files.open(res_pkg_path) as res_pkg:
+            pkg_driver.onboard_package(res_pkg, object_group_id=push_options.object_group_id, progress_callback=uploads.UploadProgressReporter(journal.event, os.path.basename(res_pkg_path)))
         env_sessions.mark_brent_updated()
@@ -4,6 +4,8 @@ import lmctl.project.handlers.interface as handlers_api
 import lmctl.project.validation as project_validation
 import lmctl.utils.descriptors as descriptor_utils
 import lmctl.drivers.lm.base as lm_drivers
+import lmctl.utils.uploads as uploads
+import lmctl.project.package.meta as pkg_metas
 
 class BrentPkgContentTree(files.Tree):
 
@@ -56,7 +58,7 @@ class BrentContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegate):
         errors = []
         warnings = []
         self.__validate_descriptor(journal, errors, warnings)
-        self.__validate_res_pkg(journal, errors, warnings)
+        self.__validate_res_pkg(journal, validation_options, errors, warnings)
         return project_validation.ValidationResult(errors, warnings)
 
     def __validate_descriptor(self, journal, errors, warnings):
@@ -66,10 +68,10 @@ class BrentContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegate):
             journal.error_event(msg)
             errors.append(project_validation.ValidationViolation(msg))
 
-    def __validate_res_pkg(self, journal, errors, warnings):
+    def __validate_res_pkg(self, journal, validation_options, errors, warnings):
         journal.stage('Checking Resource package exists for {0}'.format(self.meta.name))
         res_pkg_path = self.tree.gen_resource_package_file_path(self.meta.full_name)
-        if not os.path.exists(res_pkg_path):
+        if not validation_options.content_files.exists(res_pkg_path):
             msg = 'No Resource package found at: {0}'.format(res_pkg_path)
             journal.error_event(msg)
             errors.append(project_validation.ValidationViolation(msg))
@@ -77,7 +79,7 @@ class BrentContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegate):
     def __clear_existing_descriptor(self, journal, env_sessions):
         lm_session = env_sessions.lm
         descriptor_path = self.tree.root_descriptor_file_path
-        descriptor = descriptor_utils.DescriptorParser().read_from_file(descriptor_path)
+        descriptor = descriptor_utils.DescriptorParser(read_only=True).read_from_file(descriptor_path)
         descriptor_name = descriptor.get_name()
         descriptor_version = descriptor.get_version()
         journal.event('Removing descriptor {0} from CP4NA orchestration ({1})'.format(descriptor_name, lm_session.env.address))
@@ -89,11 +91,25 @@ class BrentContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegate):
             journal.event('Descriptor {0} not found'.format(descriptor_name))
         return descriptor_name, descriptor_version
 
+    def __res_pkg_hash(self, content_files):
+        res_pkg_path = self.tree.gen_resource_package_file_path(self.meta.full_name)
+        content_hash = self.meta.content_hash(os.path.relpath(res_pkg_path, self.root_path))
+        if content_hash is None:
+            with content_files.open(res_pkg_path) as res_pkg:
+                content_hash = pkg_metas.calculate_stream_hash(res_pkg)
+        return content_hash
+
     def push_content(self, journal, env_sessions, push_options):
+        res_pkg_hash = self.__res_pkg_hash(push_options.content_files)
+        ledger_key = 'resource-package:{0}'.format(self.meta.descriptor_name)
+        if push_options.skip_unchanged(ledger_key, res_pkg_hash):
+            journal.event('Resource package {0} (version: {1}) unchanged since last push, skipping'.format(self.meta.full_name, self.meta.version))
+            return
         descriptor_name, descriptor_version = self.__clear_existing_descriptor(journal, env_sessions)
-        self.__push_res_pkg(journal, env_sessions, descriptor_name)
+        self.__push_res_pkg(journal, env_sessions, descriptor_name, push_options)
+        push_options.pushed(ledger_key, res_pkg_hash)
 
-    def __push_res_pkg(self, journal, env_sessions, descriptor_name):
+    def __push_res_pkg(self, journal, env_sessions, descriptor_name, push_options):
         lm_session = env_sessions.lm
         pkg_driver = lm_session.resource_pkg_driver
         journal.event('Removing any existing Resource package named {0} (version: {1}) from Brent: {2} ({3})'.format(descriptor_name, self.meta.version, lm_session.env.name, lm_session.env.address))
@@ -103,5 +119,6 @@ class BrentContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegate):
             journal.event('No package named {0} found'.format(descriptor_name))
         res_pkg_path = self.tree.gen_resource_package_file_path(self.meta.full_name)
         journal.event('Pushing {0} (version: {1}) Resource package to Brent: {2} ({3})'.format(self.meta.full_name, self.meta.version, lm_session.env.name, lm_session.env.address))
-        pkg_driver.onboard_package(res_pkg_path)
+        with push_options.content_files.open(res_pkg_path) as res_pkg:
+            pkg_driver.onboard_package(res_pkg, progress_callback=uploads.UploadProgressReporter(journal.event, os.path.basename(res_pkg_path)))
         env_sessions.mark_brent_updated()
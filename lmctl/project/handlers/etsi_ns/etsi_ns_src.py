@@ -4,6 +4,7 @@ import lmctl.project.handlers.interface as handlers_api
 import lmctl.project.mutate.behaviour as behaviour_mutations
 import lmctl.utils.descriptors as descriptors
 import lmctl.files as files
+from lmctl.project.source.index import SourceIndex
 from .etsi_ns_content import EtsiNsPkgContentTree
 
 class EtsiNsSourceTree(assembly_api.AssemblySourceTree):
@@ -82,7 +83,7 @@ class EtsiNsSourceHandler(assembly_api.AssemblySourceHandler):
         descriptor_path = self.tree.descriptor_file_path
         journal.stage('Staging assembly descriptor for {0} at {1}'.format(self.source_config.name, descriptor_path))
         staged_descriptor_path = source_stager.stage_descriptor(descriptor_path, staging_tree.descriptor_definitions_file_path)
-        descriptor = descriptors.DescriptorParser().read_from_file(staged_descriptor_path)
+        descriptor = source_stager.source_index.read_descriptor(staged_descriptor_path)
         return descriptor.get_name()
 
     def __stage_etsi_files(self, journal, source_stager, staging_tree):
@@ -107,51 +108,50 @@ class EtsiNsSourceHandler(assembly_api.AssemblySourceHandler):
         configurations_path = self.tree.service_behaviour_configurations_path
         if os.path.exists(configurations_path):
             journal.event('Staging configurations at: {0}'.format(configurations_path))
-            walk_and_find_json(configurations_path, self.__stage_behaviour_configuration, staging_tree, source_stager, journal)
+            walk_and_find_json(configurations_path, self.__stage_behaviour_configuration, staging_tree, source_stager, journal, source_index=source_stager.source_index)
         else:
             journal.event('Skipping - no configurations found at: {0}'.format(configurations_path))
         runtimes_path = self.tree.service_behaviour_runtime_path
         if os.path.exists(runtimes_path):
             journal.event('Staging runtime tests at: {0}'.format(runtimes_path))
-            walk_and_find_json(runtimes_path, self.__stage_behaviour_runtime, staging_tree, source_stager)
+            walk_and_find_json(runtimes_path, self.__stage_behaviour_runtime, staging_tree, source_stager, source_index=source_stager.source_index)
         else:
             journal.event('Skipping - no runtime tests found at: {0}'.format(runtimes_path))
         tests_path = self.tree.service_behaviour_tests_path
         if os.path.exists(tests_path):
             journal.event('Staging tests at: {0}'.format(tests_path))
-            walk_and_find_json(tests_path, self.__stage_behaviour_test, staging_tree, source_stager)
+            walk_and_find_json(tests_path, self.__stage_behaviour_test, staging_tree, source_stager, source_index=source_stager.source_index)
         else:
             journal.event('Skipping - no tests found at: {0}'.format(tests_path))
 
     def __stage_behaviour_configuration(self, configuration_path, configuration, staging_tree, source_stager, journal):
         relative_staging_path = os.path.join(staging_tree.etsi_test_config_dir_path, os.path.basename(configuration_path))
-        source_stager.stage_file(configuration_path, relative_staging_path, behaviour_mutations.AssemblyConfigurationStagingMutator(self.source_config, source_stager.references, journal))
+        source_stager.stage_json(configuration_path, relative_staging_path, behaviour_mutations.AssemblyConfigurationStagingMutator(self.source_config, source_stager.references, journal))
 
     def __stage_behaviour_runtime(self, runtime_path, runtime, staging_tree, source_stager):
         relative_staging_path = os.path.join(staging_tree.etsi_test_runtime_scenarios_dir_path, os.path.basename(runtime_path))
-        source_stager.stage_file(runtime_path, relative_staging_path, behaviour_mutations.ScenarioStagingMutator(self.source_config))
+        source_stager.stage_json(runtime_path, relative_staging_path, behaviour_mutations.ScenarioStagingMutator(self.source_config))
 
     def __stage_behaviour_test(self, test_path, test, staging_tree, source_stager):
         relative_staging_path = os.path.join(staging_tree.etsi_test_scenarios_dir_path, os.path.basename(test_path))
-        source_stager.stage_file(test_path, relative_staging_path, behaviour_mutations.ScenarioStagingMutator(self.source_config))
+        source_stager.stage_json(test_path, relative_staging_path, behaviour_mutations.ScenarioStagingMutator(self.source_config))
 
 
     def build_staged_source_handler(self, staging_path):
         return EtsiStagedSourceHandler(staging_path, self.source_config)
 
-def walk_and_find_json(path, action, *action_args):
-    for root, dirs, files in os.walk(path):
-        for file_name in files:
-            if file_name.endswith(".json"):
-                file_path = os.path.join(root, file_name)
-                with open(file_path, 'rt') as f:
-                    try:
-                        content = json.loads(f.read())
-                    except IOError as e:
-                        raise handlers_api.InvalidSourceError(str(e)) from e
-                    except json.JSONDecodeError as e:
-                        raise handlers_api.InvalidSourceError(str(e)) from e
-                    action(file_path, content, *action_args)
+def walk_and_find_json(path, action, *action_args, source_index=None):
+    if source_index is None:
+        source_index = SourceIndex()
+    for file_path in source_index.files_under(path):
+        if file_path.endswith(".json"):
+            try:
+                content = source_index.read_json(file_path)
+            except IOError as e:
+                raise handlers_api.InvalidSourceError(str(e)) from e
+            except json.JSONDecodeError as e:
+                raise handlers_api.InvalidSourceError(str(e)) from e
+            action(file_path, content, *action_args)
 
 
 class EtsiNsSourceCreator(assembly_api.AssemblySourceCreator):
@@ -9,6 +9,7 @@ from lmctl.project.handlers.brent.brent_autocorrect import BrentCorrectableValid
 from lmctl.project.handlers.brent.brent_content import BrentResourcePackageContentTree
 import lmctl.utils.descriptors as descriptor_utils
 import lmctl.drivers.lm.base as lm_drivers
+import lmctl.project.package.meta as pkg_metas
 class EtsiVnfPkgContentTree(brent_api.BrentPkgContentTree):
     def __int__(self, root_path=None):
         super().__init__(root_path)
@@ -67,20 +68,27 @@ class EtsiVnfContentHandler(resource_api.ResourceContentHandler):
     def __validate_res_pkg(self, journal, validation_options, errors, warnings):
         journal.stage('Checking Resource package exists for {0}'.format(self.meta.name))
         res_pkg_path = self.tree.gen_resource_package_file_path(self.meta.full_name)
-        if not os.path.exists(res_pkg_path):
+        if not validation_options.content_files.exists(res_pkg_path):
             msg = 'No Resource package found at: {0}'.format(res_pkg_path)
             journal.error_event(msg)
             errors.append(project_validation.ValidationViolation(msg))
         else:
             extraction_path = os.path.join(os.path.dirname(res_pkg_path), 'tmp-extract')
             os.makedirs(extraction_path)
-            with zipfile.ZipFile(res_pkg_path, "r") as res_pkg:
-                res_pkg.extractall(extraction_path)
+            # Read from wherever the Resource package is (it may still be in the package archive being pushed)
+            with validation_options.content_files.open(res_pkg_path) as res_pkg_file:
+                with zipfile.ZipFile(res_pkg_file, "r") as res_pkg:
+                    res_pkg.extractall(extraction_path)
             try:
+                original_hashes = pkg_metas.calculate_content_hashes(extraction_path) if validation_options.allow_autocorrect else None
                 tree = BrentResourcePackageContentTree(extraction_path)
                 BrentCorrectableValidation().validate_and_autocorrect(journal, validation_options, errors, warnings, tree.descriptor_file_path, \
                 tree.infrastructure_definitions_path, tree.infrastructure_manifest_file_path, tree.lifecycle_path, \
                     tree.lifecycle_manifest_file_path)
+                if original_hashes is None or pkg_metas.calculate_content_hashes(extraction_path) == original_hashes:
+                    return
+                # Re-written with the autocorrections, so must be on disk
+                res_pkg_path = validation_options.content_files.local_path(res_pkg_path)
                 with zipfile.ZipFile(res_pkg_path, "w") as res_pkg:
                     res_pkg_content_tree = BrentResourcePackageContentTree()
                     included_items = [
@@ -1,6 +1,7 @@
 import abc
 import os
 import shutil
+import lmctl.files as files
 from lmctl.project.source.config import RootProjectConfig
 import lmctl.project.types as project_types
 from datetime import datetime, timezone
@@ -387,12 +388,37 @@ class InvalidContentTypeError(ContentHandlerError):
 ############################
 
 class ContentValidationOptions:
-    def __init__(self, allow_autocorrect=False):
+    def __init__(self, allow_autocorrect=False, content_files=None):
         self.allow_autocorrect = allow_autocorrect
+        # Access to any files of the content which have not been extracted to disk (e.g. Resource packages left in the archive of a package being pushed)
+        self.content_files = content_files if content_files is not None else files.ContentFiles()
 
 class ContentPushOptions:
-    def __init__(self, object_group_id=None):
+    def __init__(self, object_group_id=None, push_ledger=None, changed_only=False, parallelism=1, content_files=None):
         self.object_group_id = object_group_id
+        self.push_ledger = push_ledger
+        self.changed_only = changed_only
+        # Number of independent artifacts (e.g. behaviour scenarios) a handler may push concurrently
+        self.parallelism = parallelism
+        # Access to any files of the content which have not been extracted to disk (e.g. Resource packages left in the archive of a package being pushed)
+        self.content_files = content_files if content_files is not None else files.ContentFiles()
+
+    def skip_unchanged(self, key, content_hash):
+        """
+        Returns True if the artifact should be skipped, as only changed artifacts are being pushed and it has not changed since it was last pushed.
+        Otherwise the artifact is removed from the push ledger until pushed() is called, as its state in the environment is about to change
+        """
+        if self.push_ledger is None:
+            return False
+        if self.changed_only and self.push_ledger.is_unchanged(key, content_hash, object_group_id=self.object_group_id):
+            self.push_ledger.mark_skipped(key)
+            return True
+        self.push_ledger.forget(key)
+        return False
+
+    def pushed(self, key, content_hash):
+        if self.push_ledger is not None:
+            self.push_ledger.record(key, content_hash, object_group_id=self.object_group_id)
 
 ############################
 # Content Handlers
@@ -413,7 +439,7 @@ class PkgContentHandler(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def execute_tests(self, journal, env_sessions, selected_tests):
+    def execute_tests(self, journal, env_sessions, selected_tests, parallelism=1):
         pass
 
 
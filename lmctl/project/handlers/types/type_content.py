@@ -91,7 +91,7 @@ class TypeContentHandler(handlers_api.PkgContentHandler):
     def __push_descriptor(self, journal, env_sessions, push_options):
         lm_session = env_sessions.lm
         descriptor_path = self.tree.descriptor_file_path
-        descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path)
+        descriptor, descriptor_yml_str = descriptors.DescriptorParser(read_only=True).read_from_file_with_raw(descriptor_path)
         descriptor_name = descriptor.get_name()
         descriptor_driver = lm_session.descriptor_driver
         journal.event('Checking for Descriptor {0} in CP4NA orchestration ({1})'.format(descriptor_name, lm_session.env.address))
@@ -169,7 +169,7 @@ class TypeContentHandler(handlers_api.PkgContentHandler):
     def __find_assembly_configuration_by_name(self, all_available_configurations, assembly_name):
         return next((x for x in all_available_configurations if x["name"] == assembly_name), None)
 
-    def execute_tests(self, journal, env_sessions, selected_tests):
+    def execute_tests(self, journal, env_sessions, selected_tests, parallelism=1):
         journal.event('No tests to execute')
         return project_testing.TestSuiteExecutionReport([])
 
@@ -6,6 +6,7 @@ import lmctl.utils.descriptors as descriptors
 import lmctl.drivers.lm.base as lm_drivers
 import lmctl.project.mutate.behaviour as behaviour_mutations
 import lmctl.project.mutate.descriptor as descriptor_mutations
+from lmctl.project.source.index import SourceIndex
 from lmctl.project.validation import ValidationResult, ValidationViolation
 from .type_content import TypePkgContentTree
 
@@ -137,36 +138,33 @@ class TypeSourceHandler(handlers_api.SourceHandler):
             configurations_path = self.tree.service_behaviour_configurations_path
             if os.path.exists(configurations_path):
                 journal.event('Checking configurations at: {0}'.format(configurations_path))
-                self.__walk_and_check_json_files(configurations_path, 'Configuration', journal, errors, warnings)
+                self.__walk_and_check_json_files(configurations_path, 'Configuration', journal, errors, warnings, source_validator.source_index)
             else:
                 journal.event('No configurations found at: {0}'.format(configurations_path))
             tests_path = self.tree.service_behaviour_tests_path
             if os.path.exists(tests_path):
                 journal.event('Checking tests at: {0}'.format(tests_path))
-                self.__walk_and_check_json_files(tests_path, 'Test', journal, errors, warnings)
+                self.__walk_and_check_json_files(tests_path, 'Test', journal, errors, warnings, source_validator.source_index)
             else:
                 journal.event('No tests found at: {0}'.format(configurations_path))
 
-    def __walk_and_check_json_files(self, path, type_name, journal, errors, warnings):
-        for root, dirs, files in os.walk(path):
-            for file_name in files:
-                file_path = os.path.join(root, file_name)
-                if not file_name.endswith(".json"):
-                    msg = '{0} [{1}]: is not a json file (with a .json extension)'.format(type_name, file_path)
+    def __walk_and_check_json_files(self, path, type_name, journal, errors, warnings, source_index):
+        for file_path in source_index.files_under(path):
+            if not file_path.endswith(".json"):
+                msg = '{0} [{1}]: is not a json file (with a .json extension)'.format(type_name, file_path)
+                journal.error_event(msg)
+                errors.append(ValidationViolation(msg))
+            else:
+                try:
+                    source_index.read_json(file_path)
+                except IOError as e:
+                    msg = '{0} [{1}]: does not contain valid JSON: {2}'.format(type_name, file_path, str(e))
+                    journal.error_event(msg)
+                    errors.append(ValidationViolation(msg))
+                except json.JSONDecodeError as e:
+                    msg = '{0} [{1}]: does not contain valid JSON: {2}'.format(type_name, file_path, str(e))
                     journal.error_event(msg)
                     errors.append(ValidationViolation(msg))
-                else:
-                    with open(file_path, 'rt') as f:
-                        try:
-                            json.loads(f.read())
-                        except IOError as e:
-                            msg = '{0} [{1}]: does not contain valid JSON: {2}'.format(type_name, file_path, str(e))
-                            journal.error_event(msg)
-                            errors.append(ValidationViolation(msg))
-                        except json.JSONDecodeError as e:
-                            msg = '{0} [{1}]: does not contain valid JSON: {2}'.format(type_name, file_path, str(e))
-                            journal.error_event(msg)
-                            errors.append(ValidationViolation(msg))
 
     def stage_sources(self, journal, source_stager):
         staging_tree = TypePkgContentTree()
@@ -177,7 +175,7 @@ class TypeSourceHandler(handlers_api.SourceHandler):
         descriptor_path = self.tree.descriptor_file_path
         journal.stage('Staging type descriptor for {0} at {1}'.format(self.source_config.name, descriptor_path))
         staged_descriptor_path = source_stager.stage_descriptor(descriptor_path, staging_tree.descriptor_file_path)
-        descriptor = descriptors.DescriptorParser().read_from_file(staged_descriptor_path)
+        descriptor = source_stager.source_index.read_descriptor(staged_descriptor_path)
         return descriptor.get_name()
 
     def __stage_service_behaviour(self, journal, source_stager, staging_tree, project_descriptor_name):
@@ -189,27 +187,27 @@ class TypeSourceHandler(handlers_api.SourceHandler):
         configurations_path = self.tree.service_behaviour_configurations_path
         if os.path.exists(configurations_path):
             journal.event('Staging configurations at: {0}'.format(configurations_path))
-            walk_and_find_json(configurations_path, self.__stage_behaviour_configuration, staging_tree, source_stager, journal)
+            walk_and_find_json(configurations_path, self.__stage_behaviour_configuration, staging_tree, source_stager, journal, source_index=source_stager.source_index)
         else:
             journal.event('Skipping - no configurations found at: {0}'.format(configurations_path))
         tests_path = self.tree.service_behaviour_tests_path
         if os.path.exists(tests_path):
             journal.event('Staging tests at: {0}'.format(tests_path))
-            walk_and_find_json(tests_path, self.__stage_behaviour_test, staging_tree, source_stager)
+            walk_and_find_json(tests_path, self.__stage_behaviour_test, staging_tree, source_stager, source_index=source_stager.source_index)
         else:
             journal.event('Skipping - no tests found at: {0}'.format(tests_path))
 
     def __stage_behaviour_configuration(self, configuration_path, configuration, staging_tree, source_stager, journal):
         relative_staging_path = os.path.join(staging_tree.service_behaviour_configurations_path, os.path.basename(configuration_path))
-        source_stager.stage_file(configuration_path, relative_staging_path, behaviour_mutations.AssemblyConfigurationStagingMutator(self.source_config, source_stager.references, journal))
+        source_stager.stage_json(configuration_path, relative_staging_path, behaviour_mutations.AssemblyConfigurationStagingMutator(self.source_config, source_stager.references, journal))
 
     def __stage_behaviour_runtime(self, runtime_path, runtime, staging_tree, source_stager):
         relative_staging_path = os.path.join(staging_tree.service_behaviour_runtime_path, os.path.basename(runtime_path))
-        source_stager.stage_file(runtime_path, relative_staging_path, behaviour_mutations.ScenarioStagingMutator(self.source_config))
+        source_stager.stage_json(runtime_path, relative_staging_path, behaviour_mutations.ScenarioStagingMutator(self.source_config))
 
     def __stage_behaviour_test(self, test_path, test, staging_tree, source_stager):
         relative_staging_path = os.path.join(staging_tree.service_behaviour_tests_path, os.path.basename(test_path))
-        source_stager.stage_file(test_path, relative_staging_path, behaviour_mutations.ScenarioStagingMutator(self.source_config))
+        source_stager.stage_json(test_path, relative_staging_path, behaviour_mutations.ScenarioStagingMutator(self.source_config))
 
     def pull_sources(self, journal, backup_tool, env_sessions, references):
         lm_session = env_sessions.lm
@@ -229,16 +227,8 @@ class TypeSourceHandler(handlers_api.SourceHandler):
             msg = 'Descriptor {0} not found'.format(descriptor_name)
             journal.error_event(msg)
             return
-        descriptor_path = self.tree.descriptor_file_path
-        if os.path.exists(descriptor_path):
-            self.__backup_descriptor(journal, backup_tool, backup_tree, descriptor_path)
-        journal.event('Saving pulled descriptor to {0}'.format(descriptor_path))
         descriptor = descriptor_mutations.DescriptorPullMutator(references, journal).apply(descriptor)
-        descriptors.DescriptorParser().write_to_file(descriptor, descriptor_path)
-
-    def __backup_descriptor(self, journal, backup_tool, backup_tree, descriptor_path):
-        journal.event('Creating backup of descriptor {0}'.format(descriptor_path))
-        backup_tool.backup_file(descriptor_path, backup_tree.descriptor_file_path)
+        backup_tool.save_pulled_descriptor(descriptor, self.tree.descriptor_file_path, backup_tree.descriptor_file_path)
 
     def __pull_behaviour(self, journal, backup_tool, backup_tree, lm_session, references):
         journal.stage('Pulling service behaviour for {0}'.format(self.source_config.name))
@@ -262,14 +252,9 @@ class TypeSourceHandler(handlers_api.SourceHandler):
             config_id = assembly_configuration['id']
             discovered_configurations_by_id[config_id] = assembly_configuration
             file_path = self.tree.gen_service_behaviour_configuration_path(config_name)
-            if os.path.exists(file_path):
-                backup_file_path = backup_tree.gen_service_behaviour_configuration_path(config_name)
-                journal.event('Creating backup of assembly configuration {0}'.format(file_path))
-                backup_tool.backup_file(file_path, backup_file_path)
-            journal.event('Saving assembly configuration {0} to {1}'.format(config_name, file_path))
+            backup_file_path = backup_tree.gen_service_behaviour_configuration_path(config_name)
             assembly_configuration = behaviour_mutations.AssemblyConfigurationPullMutator(self.source_config, references, journal).apply(assembly_configuration)
-            with open(file_path, 'w') as out:
-                json.dump(assembly_configuration, out, indent=2)
+            backup_tool.save_pulled_json(assembly_configuration, file_path, backup_file_path, 'assembly configuration {0}'.format(config_name))
         return discovered_configurations_by_id
 
     def __pull_scenarios(self, journal, backup_tool, backup_tree, lm_session, behaviour_project_id, discovered_configurations_by_id, references):
@@ -279,29 +264,23 @@ class TypeSourceHandler(handlers_api.SourceHandler):
         for scenario in scenarios:
             scenario_name = scenario['name']
             file_path = self.tree.gen_service_behaviour_tests_path(scenario_name)
-            if os.path.exists(file_path):
-                backup_file_path = backup_tree.gen_service_behaviour_tests_path(scenario_name)
-                journal.event('Creating backup of test {0}'.format(file_path))
-                backup_tool.backup_file(file_path, backup_file_path)
+            backup_file_path = backup_tree.gen_service_behaviour_tests_path(scenario_name)
             scenario = behaviour_mutations.ScenarioPullMutator(self.source_config, references, discovered_configurations_by_id).apply(scenario)
-            journal.event('Saving scenario {0} to {1}'.format(scenario_name, file_path))
-            with open(file_path, 'w') as out:
-                json.dump(scenario, out, indent=2)
-
-
-def walk_and_find_json(path, action, *action_args):
-    for root, dirs, files in os.walk(path):
-        for file_name in files:
-            if file_name.endswith(".json"):
-                file_path = os.path.join(root, file_name)
-                with open(file_path, 'rt') as f:
-                    try:
-                        content = json.loads(f.read())
-                    except IOError as e:
-                        raise handlers_api.InvalidSourceError(str(e)) from e
-                    except json.JSONDecodeError as e:
-                        raise handlers_api.InvalidSourceError(str(e)) from e
-                    action(file_path, content, *action_args)
+            backup_tool.save_pulled_json(scenario, file_path, backup_file_path, 'test {0}'.format(scenario_name))
+
+
+def walk_and_find_json(path, action, *action_args, source_index=None):
+    if source_index is None:
+        source_index = SourceIndex()
+    for file_path in source_index.files_under(path):
+        if file_path.endswith(".json"):
+            try:
+                content = source_index.read_json(file_path)
+            except IOError as e:
+                raise handlers_api.InvalidSourceError(str(e)) from e
+            except json.JSONDecodeError as e:
+                raise handlers_api.InvalidSourceError(str(e)) from e
+            action(file_path, content, *action_args)
 
 
 class TypeStagedSourceHandler(handlers_api.StagedSourceHandler):
@@ -80,3 +80,33 @@ class Event(ProjectEvent):
 
     def to_readable(self):
         return self.message
+
+
+class BufferedProjectJournal(ProjectJournal):
+    """
+    Holds entries in memory so they can be added to another ProjectJournal later, as one uninterrupted group.
+    Used when work is carried out concurrently, to prevent the output of each piece of work being interleaved
+    """
+
+    def __init__(self):
+        self.entries = []
+        super().__init__(EntryCollector(self.entries))
+
+    def replay(self, target_journal):
+        for entry in self.entries:
+            if not isinstance(entry, (journal.OpenChapterEntry, journal.CloseChapterEntry)):
+                target_journal.journal.add_entry(entry)
+        self.entries.clear()
+
+
+class EntryCollector(journal.Consumer):
+
+    def __init__(self, entries):
+        super().__init__()
+        self.entries = entries
+
+    def is_interested(self, entry):
+        return True
+
+    def consume(self, entry):
+        self.entries.append(entry)
@@ -0,0 +1,117 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+import lmctl.files as files
+
+logger = logging.getLogger(__name__)
+
+PUSH_LEDGER_DIR_ENV_VAR = 'LMCTL_PUSH_LEDGER_DIR'
+
+def default_push_ledger_dir() -> Path:
+    env_dir = os.environ.get(PUSH_LEDGER_DIR_ENV_VAR, None)
+    if env_dir is not None and len(env_dir.strip()) > 0:
+        return Path(env_dir)
+    return Path.home().joinpath('.lmctl').joinpath('push-ledger')
+
+def calculate_data_hash(data):
+    """
+    Calculate the sha256 hash of a JSON serializable object, independent of the order of any dictionary keys
+    """
+    raw_data = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(raw_data.encode('utf-8')).hexdigest()
+
+
+class PushLedger:
+    """
+    Records the hash of each artifact (descriptor, behaviour or resource package) last pushed to an environment, so unchanged artifacts may be skipped on the next push.
+
+    The ledger is local to this machine, so it does not know about changes made to the environment by other means (e.g. the UI or another user).
+    """
+
+    def __init__(self, path: str = None):
+        self.path = Path(path) if path is not None else None
+        self.__lock = threading.Lock()
+        self.__entries = self.__load()
+        self.__skipped = []
+
+    @staticmethod
+    def for_environment(env, directory: str = None, existing_only: bool = False):
+        """
+        Open the ledger of an environment, named by a hash of its name and address
+
+        Args:
+            env: the environment (with "name" and "address" attributes)
+            directory (str): the directory holding ledgers (default: ~/.lmctl/push-ledger)
+            existing_only (bool): only open the ledger if one has already been saved for the environment. Used by pushes of all content,
+                which must still update an existing ledger (otherwise it would record hashes the environment no longer has) but need not start one
+
+        Returns:
+            PushLedger: the ledger, or None if existing_only is set and there is no ledger for the environment
+        """
+        directory = Path(directory) if directory is not None else default_push_ledger_dir()
+        raw_key = json.dumps([getattr(env, 'name', None), getattr(env, 'address', None)])
+        key = hashlib.sha256(raw_key.encode('utf-8')).hexdigest()
+        path = directory.joinpath(f'{key}.json')
+        if existing_only and not path.exists():
+            return None
+        return PushLedger(path)
+
+    def __load(self):
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+            if type(entries) is not dict:
+                raise ValueError('Expected a dictionary')
+            return entries
+        except (OSError, ValueError) as e:
+            logger.debug(f'Ignoring unreadable push ledger {self.path}: {str(e)}')
+            return {}
+
+    def is_unchanged(self, key: str, content_hash: str, object_group_id: str = None) -> bool:
+        """
+        True if the artifact was last pushed with the same hash, to the same Object Group. An artifact is only created in the Object Group it is
+        first pushed to (later pushes update it wherever it is), so a push to a different Object Group is treated as a change
+        """
+        if content_hash is None:
+            return False
+        with self.__lock:
+            entry = self.__entries.get(key, None)
+        if isinstance(entry, dict):
+            return entry.get('hash') == content_hash and entry.get('objectGroupId') == object_group_id
+        # Entries saved before Object Groups were recorded hold only the hash
+        return entry is not None and entry == content_hash and object_group_id is None
+
+    def record(self, key: str, content_hash: str, object_group_id: str = None):
+        with self.__lock:
+            if content_hash is None:
+                self.__entries.pop(key, None)
+            else:
+                self.__entries[key] = {'hash': content_hash, 'objectGroupId': object_group_id}
+
+    def forget(self, key: str):
+        self.record(key, None)
+
+    def mark_skipped(self, key: str):
+        with self.__lock:
+            self.__skipped.append(key)
+
+    @property
+    def skipped(self):
+        with self.__lock:
+            return list(self.__skipped)
+
+    def save(self):
+        if self.path is None:
+            return
+        with self.__lock:
+            entries = dict(self.__entries)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            files.write_file_atomically(self.path, lambda f: json.dump(entries, f, indent=2, sort_keys=True))
+        except OSError as e:
+            logger.warning(f'Failed to save push ledger {self.path}: {str(e)}')
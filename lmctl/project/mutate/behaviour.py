@@ -25,10 +25,13 @@ class AssemblyConfigurationStagingMutator(BehaviourMutator):
         self.journal = journal
 
     def apply(self, original_content):
-        orig_configuration = json.loads(original_content)
-        new_configuration = self._set_project_id(orig_configuration, self.project_config.descriptor_name)
+        return json.dumps(self.apply_to_document(json.loads(original_content)), indent=2)
+
+    def apply_to_document(self, orig_configuration):
+        # Only top level attributes are changed, so a shallow copy leaves the original untouched
+        new_configuration = self._set_project_id(dict(orig_configuration), self.project_config.descriptor_name)
         new_configuration = self.__replace_descriptor_refs_with_name(new_configuration)
-        return json.dumps(new_configuration, indent=2)
+        return new_configuration
 
     def __replace_descriptor_refs_with_name(self, assembly_configuration):
         assembly_configuration = self.__replace_deprecated_descriptor_refs_with_name(assembly_configuration)
@@ -84,15 +87,19 @@ class ScenarioStagingMutator(BehaviourMutator):
         self.project_config = project_config
 
     def apply(self, original_scenario_content):
-        orig_scenario = json.loads(original_scenario_content)
-        new_scenario = self._set_project_id(orig_scenario, self.project_config.descriptor_name)
-        return json.dumps(new_scenario, indent=2)
+        return json.dumps(self.apply_to_document(json.loads(original_scenario_content)), indent=2)
+
+    def apply_to_document(self, orig_scenario):
+        return self._set_project_id(dict(orig_scenario), self.project_config.descriptor_name)
 
 
 class ScenarioPushMutator(BehaviourMutator):
 
     def __init__(self, available_configurations):
         self.available_configurations = available_configurations
+        self.__configurations_by_name = {}
+        for configuration in available_configurations:
+            self.__configurations_by_name.setdefault(configuration['name'], configuration)
 
     def apply(self, original_scenario):
         return self.__replace_actor_refs_with_ids(original_scenario)
@@ -123,7 +130,7 @@ class ScenarioPushMutator(BehaviourMutator):
         return scenario
 
     def __find_assembly_configuration_by_name(self, assembly_name):
-        return next((x for x in self.available_configurations if x["name"] == assembly_name), None)
+        return self.__configurations_by_name.get(assembly_name, None)
 
 
 class ScenarioPullMutator(BehaviourMutator):
@@ -1,4 +1,5 @@
 import os
+import time
 import yaml
 import tarfile
 import zipfile
@@ -9,6 +10,8 @@ import lmctl.files as files
 import lmctl.journal as journal
 import lmctl.project.journal as project_journal
 import lmctl.project.package.meta as pkg_metas
+import lmctl.project.package.reader as pkg_reader
+import lmctl.project.package.workspace as pkg_workspace
 import lmctl.project.processes.push as push_exec
 import lmctl.project.processes.etsi_push as etsi_push_exec
 import lmctl.project.processes.pkg_validation as pkg_validation_exec
@@ -18,6 +21,8 @@ import lmctl.drivers.lm.base as lm_drivers
 
 from typing import List
 
+# Directory of the artifacts included in ETSI packages, which are uploaded within the whole package so are not needed in the push workspace
+ETSI_FILES_DIR = 'Files'
 
 ########################
 # Exceptions
@@ -63,29 +68,38 @@ class ValidateOptions(Options):
 
 class PushOptions(ValidateOptions):
 
-    def __init__(self, object_group_id: str = None):
+    def __init__(self, object_group_id: str = None, parallelism: int = 1, changed_only: bool = False, push_ledger=None):
         super().__init__()
         self.object_group_id = object_group_id
+        # Number of sibling subprojects pushed concurrently
+        self.parallelism = parallelism
+        # Skip artifacts recorded in the push_ledger as unchanged since they were last pushed to the environment
+        self.changed_only = changed_only
+        self.push_ledger = push_ledger
 
 class TestOptions(Options):
 
-    def __init__(self, tests: List[str] = None):
+    def __init__(self, tests: List[str] = None, parallelism: int = 1):
         super().__init__()
         if tests is not None:
             self.selected_tests = tests
         else:
             self.selected_tests = ['*']
+        # Number of tests to execute at once
+        self.parallelism = parallelism
 
 
 class PkgContentBase():
 
-    def __init__(self, tree, meta):
+    def __init__(self, tree, meta, content_files=None):
         if tree is None:
             raise ValueError('tree must be provided')
         self.tree = tree
         if meta is None:
             raise ValueError('meta must be provided')
         self.meta = meta
+        # Access to the files of the content, which may not all have been extracted
+        self.content_files = content_files if content_files is not None else files.ContentFiles()
         self.handler = handler_manager.content_handler_for(self.meta)(self.tree.root_path, self.meta)
         self.subcontents = self.__init_subcontents()
 
@@ -109,7 +123,7 @@ class SubPkgContent(PkgContentBase):
             raise ValueError('parent_pkg must be provided for Subproject')
         self.parent_pkg = parent_pkg
         tree = ExpandedPkgTree(root_path)
-        super().__init__(tree, meta)
+        super().__init__(tree, meta, content_files=parent_pkg.content_files)
 
 class PkgInspectionReport:
 
@@ -120,6 +134,18 @@ class PkgInspectionReport:
             includes = []
         self.includes = includes
 
+    @staticmethod
+    def from_meta(meta):
+        return PkgInspectionReport(meta.full_name, meta.version, PkgInspectionReport.__includes(meta))
+
+    @staticmethod
+    def __includes(meta_entry):
+        includes = []
+        includes.append(PkgIncludeEntry(meta_entry))
+        for subpkg in meta_entry.subpkgs:
+            includes.extend(PkgInspectionReport.__includes(subpkg))
+        return includes
+
     def to_dict(self):
         tpl = {}
         tpl['name'] = self.name
@@ -161,13 +187,26 @@ class Pkg:
         self.path = path
 
     def inspect(self):
-        tempdir = tempfile.mkdtemp()
+        return PkgInspectionReport.from_meta(self.read_meta())
+
+    def read_meta(self):
+        """
+        Read the meta of the package straight from the archive, without extracting any other content
+        """
         try:
-            pkg_content = self.open(tempdir)
-            return pkg_content.inspect()
-        finally:
-            if os.path.exists(tempdir):
-                shutil.rmtree(tempdir)
+            meta_dict, deprecated = pkg_reader.PkgArchiveReader(self.path).read_meta_dict()
+        except (pkg_reader.PkgArchiveError, tarfile.TarError, zipfile.BadZipFile, OSError) as e:
+            raise InvalidPackageError(str(e)) from e
+        except yaml.YAMLError as e:
+            raise InvalidPackageError('Could not parse meta file in pkg {0}: {1}'.format(self.path, str(e))) from e
+        if meta_dict is None:
+            raise InvalidPackageError('Could not find meta file in pkg: {0}'.format(self.path))
+        if deprecated:
+            meta_dict = pkg_metas.PkgMetaRewriter(None, None, meta_dict).convert()
+        try:
+            return pkg_metas.PkgMetaParser.from_dict(meta_dict)
+        except pkg_metas.PkgMetaError as e:
+            raise InvalidPackageError(str(e)) from e
 
     def extract(self, target_directory):
         if tarfile.is_tarfile(self.path):
@@ -184,10 +223,30 @@ class Pkg:
         if target_directory is None:
             target_directory = tempfile.mkdtemp()
         self.extract(target_directory)
+        return self.__open_extracted(target_directory)
+
+    def __open_extracted(self, target_directory, content_files=None):
         pkg_tree = ExpandedPkgTree(target_directory)
         pkg_tree = self.__refactor_deprecated_pkg_structure(pkg_tree)
         meta = self.__read_meta_file(pkg_tree)
-        return PkgContent(pkg_tree.root_path, meta)
+        return PkgContent(pkg_tree.root_path, meta, content_files=content_files)
+
+    def __open_for_push(self):
+        """
+        Expand the package into an auto-cleaned, bounded workspace, leaving the Resource packages and CSARs it includes (and the artifacts of ETSI packages,
+        as the whole package is uploaded) in the archive until they are uploaded
+        """
+        deferred_dirs = []
+        if self.__is_etsi_pkg(self.read_meta()):
+            deferred_dirs.append(ETSI_FILES_DIR)
+        workspace = pkg_workspace.PushWorkspace.create()
+        try:
+            content_files = pkg_workspace.ArchiveContentFiles(self.path, workspace, deferred_dirs=deferred_dirs)
+            content_files.expand()
+            return self.__open_extracted(workspace.path, content_files=content_files)
+        except BaseException:
+            workspace.close()
+            raise
 
     def __refactor_deprecated_pkg_structure(self, pkg_tree):
         # Expand content.tgz if found (deprecated)
@@ -228,7 +287,7 @@ class Pkg:
         try:
             potential_descriptor = os.path.join(self.path, 'Descriptor', 'assembly.yml')
             if os.path.exists(potential_descriptor):
-                descriptor = descriptor_utils.DescriptorParser().read_from_file(potential_descriptor)
+                descriptor = descriptor_utils.DescriptorParser(read_only=True).read_from_file(potential_descriptor)
                 return descriptor.get_version()
         except Exception:
             return None
@@ -244,27 +303,62 @@ class Pkg:
         journal.section('Processing Package')
         journal.event('Processing {0}'.format(self.path))
 
-        push_workspace = self.__create_push_workspace()
-        files.clean_directory(push_workspace)
-        pkg_content = self.open(push_workspace)
+        start_time = time.perf_counter()
+        http_session = env_sessions.lm.http_session
+        start_stats = http_session.stats
 
-        if self.__is_etsi_pkg(pkg_content.meta):
-            etsi_push_exec.EtsiPushProcess(self, pkg_content.meta, options, journal, env_sessions, push_workspace).execute()
-        else:
-            pkg_content.push(env_sessions, options)
+        try:
+            pkg_content = self.__open_for_push()
+        except (pkg_reader.PkgArchiveError, tarfile.TarError, zipfile.BadZipFile) as e:
+            raise InvalidPackageError(str(e)) from e
+        except pkg_workspace.PushWorkspaceError as e:
+            raise PushError(str(e)) from e
+        try:
+            if self.__is_etsi_pkg(pkg_content.meta):
+                etsi_push_exec.EtsiPushProcess(self, pkg_content.meta, options, journal, env_sessions, pkg_content.tree.root_path).execute()
+            else:
+                try:
+                    pkg_content.push(env_sessions, options)
+                finally:
+                    # Keep a record of anything pushed, even if a later artifact failed
+                    if options.push_ledger is not None:
+                        options.push_ledger.save()
+                self.__report_skipped(journal, options)
+        except pkg_workspace.PushWorkspaceError as e:
+            pkg_content.close()
+            raise PushError(str(e)) from e
+        except BaseException:
+            pkg_content.close()
+            raise
+        self.__report_network_usage(journal, http_session, start_stats, time.perf_counter() - start_time)
+        # The workspace is removed once the content is closed or no longer referenced (it is kept for now, so the content may also be tested)
         return pkg_content
 
-    def __create_push_workspace(self):
-        tempdir = tempfile.mkdtemp()
-        return tempdir
+    def __report_skipped(self, journal, options):
+        if not options.changed_only or options.push_ledger is None:
+            return
+        skipped = options.push_ledger.skipped
+        journal.section('Unchanged Content')
+        journal.event('Skipped {0} artifact(s) unchanged since last push'.format(len(skipped)))
+        for key in skipped:
+            journal.event(key)
+
+    def __report_network_usage(self, journal, http_session, start_stats, total_time):
+        push_stats = http_session.stats_since(start_stats)
+        request_count = sum(s.request_count for s in push_stats)
+        network_time = sum(s.total_time for s in push_stats)
+        journal.section('Network Usage')
+        journal.event('{0} request(s) to CP4NA orchestration took {1:.2f}s of the {2:.2f}s push ({3:.2f}s on local work)'.format(request_count, network_time, total_time, max(total_time - network_time, 0)))
+        for stats in push_stats:
+            journal.event('{0}: {1} request(s), {2:.2f}s'.format(stats.name, stats.request_count, stats.total_time))
 
 class PkgContent(PkgContentBase):
 
-    def __init__(self, root_path, meta):
+    def __init__(self, root_path, meta, content_files=None):
         if root_path is None:
             raise ValueError('root_path must be provided for PkgContent')
         tree = ExpandedPkgTree(root_path)
-        super().__init__(tree, meta)
+        super().__init__(tree, meta, content_files=content_files)
         self.__rename_old_directories(tree)
 
     def __rename_old_directories(self, pkg_tree):
@@ -272,20 +366,19 @@ class PkgContent(PkgContentBase):
         contains_path = pkg_tree.child_content_path
         if os.path.exists(vnfcs_path) and not os.path.exists(contains_path):
             os.rename(vnfcs_path, contains_path)
+            self.content_files.moved(vnfcs_path, contains_path)
+
+    def close(self):
+        """
+        Release the files of the content, removing the workspace it was expanded into by Pkg.push
+        """
+        self.content_files.close()
 
     def __init_journal(self, journal_consumer=None):
         return project_journal.ProjectJournal(journal_consumer)
 
     def inspect(self):
-        includes = self.__inspect_meta(self.meta)
-        return PkgInspectionReport(self.meta.full_name, self.meta.version, includes)
-
-    def __inspect_meta(self, meta_entry):
-        includes = []
-        includes.append(PkgIncludeEntry(meta_entry))
-        for subpkg in meta_entry.subpkgs:
-            includes.extend(self.__inspect_meta(subpkg))
-        return includes
+        return PkgInspectionReport.from_meta(self.meta)
 
     def validate(self, env_sessions, options):
         journal = self.__init_journal(options.journal_consumer)
@@ -2,12 +2,52 @@ import lmctl.project.types as types
 import os
 import yaml 
 import shutil
+import hashlib
 import lmctl.utils.descriptors as descriptor_utils
 
 # Any Packages without a Schema are deemed to be using Schema 1.0, as the idea of a Schema was only introduced in v2.1 of lmctl
 SCHEMA_1_0 = '1.0'
 SCHEMA_2_0 = '2.0'
 
+HASH_READ_SIZE = 1024 * 1024
+
+
+def calculate_file_hash(path):
+    with open(path, 'rb') as f:
+        return calculate_stream_hash(f)
+
+
+def calculate_stream_hash(stream):
+    file_hash = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(HASH_READ_SIZE), b''):
+        file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def calculate_content_hashes(root_path, excluded_dirs=None, hash_file=calculate_file_hash):
+    """
+    Calculate the sha256 hash of each file in a directory, keyed by the path of the file relative to the directory (always using '/' as the separator)
+
+    Args:
+        root_path (str): the directory to search
+        excluded_dirs (list): names of top level directories to exclude (e.g. the directory holding subcontent)
+        hash_file (callable): function calculating the hash of a file from its path
+
+    Returns:
+        dict: hash of each file
+    """
+    if excluded_dirs is None:
+        excluded_dirs = []
+    content_hashes = {}
+    for root, dirs, filelist in os.walk(root_path):
+        if root == root_path:
+            dirs[:] = [d for d in dirs if d not in excluded_dirs]
+        for file_name in filelist:
+            full_path = os.path.join(root, file_name)
+            relative_path = os.path.relpath(full_path, root_path).replace(os.sep, '/')
+            content_hashes[relative_path] = hash_file(full_path)
+    return dict(sorted(content_hashes.items()))
+
 
 class PkgMetaError(Exception):
     pass
@@ -49,6 +89,19 @@ class PkgMeta:
     def descriptor_name(self):
         pass
 
+    @property
+    def content_hashes(self):
+        pass
+
+    def content_hash(self, relative_path):
+        """
+        Returns the hash of a file in this content recorded when the package was built, or None if it was not recorded (packages built with older versions of lmctl)
+        """
+        content_hashes = self.content_hashes
+        if not content_hashes:
+            return None
+        return content_hashes.get(relative_path.replace(os.sep, '/'), None)
+
     def is_subpkg(self):
         return False
 
@@ -72,7 +125,7 @@ class PkgMeta:
 
 class PkgMetaBase(PkgMeta):
 
-    def __init__(self, name, content_type, resource_manager=None, subpkg_entries=None):
+    def __init__(self, name, content_type, resource_manager=None, subpkg_entries=None, content_hashes=None):
         if not name:
             raise PkgMetaError('name must be defined')
         self._name = name
@@ -89,6 +142,9 @@ class PkgMetaBase(PkgMeta):
             if resource_manager not in types.SUPPORTED_RM_TYPES:
                 raise PkgMetaError('resource_manager type not supported, must be one of: {0}'.format(types.SUPPORTED_RM_TYPES_GROUPED))
         self._resource_manager = resource_manager
+        if not content_hashes:
+            content_hashes = {}
+        self._content_hashes = content_hashes
 
     @property
     def name(self):
@@ -126,6 +182,10 @@ class PkgMetaBase(PkgMeta):
     def subpkg_entries(self):
         return self._subpkg_entries
 
+    @property
+    def content_hashes(self):
+        return self._content_hashes
+
     def to_dict(self):
         data = {
             'name': self.name,
@@ -137,13 +197,15 @@ class PkgMetaBase(PkgMeta):
             data['contains'] = []
             for entry in self.subpkg_entries:
                 data['contains'].append(entry.to_dict())
+        if len(self.content_hashes) > 0:
+            data['content-hashes'] = dict(self.content_hashes)
         return data
 
 
 class RootPkgMeta(PkgMetaBase):
 
-    def __init__(self, schema, name, version, content_type, resource_manager=None, subpkg_entries=None):
-        super().__init__(name, content_type, resource_manager, subpkg_entries)
+    def __init__(self, schema, name, version, content_type, resource_manager=None, subpkg_entries=None, content_hashes=None):
+        super().__init__(name, content_type, resource_manager, subpkg_entries, content_hashes)
         if not schema:
             raise ValueError('schema must be defined')
         self._schema = schema
@@ -174,7 +236,7 @@ class RootPkgMeta(PkgMetaBase):
 class SubPkgMeta(PkgMetaBase):
 
     def __init__(self, parent_meta, entry):
-        super().__init__(entry.name, entry.content_type, entry.resource_manager, entry.subpkg_entries)
+        super().__init__(entry.name, entry.content_type, entry.resource_manager, entry.subpkg_entries, entry.content_hashes)
         self.parent_meta = parent_meta
         self.entry = entry
 
@@ -202,8 +264,8 @@ class SubPkgMeta(PkgMetaBase):
 
 class SubPkgEntry(PkgMetaBase):
 
-    def __init__(self, name, directory, content_type, resource_manager=None, subpkg_entries=None, full_name_override=None):
-        super().__init__(name, content_type, resource_manager, subpkg_entries)
+    def __init__(self, name, directory, content_type, resource_manager=None, subpkg_entries=None, full_name_override=None, content_hashes=None):
+        super().__init__(name, content_type, resource_manager, subpkg_entries, content_hashes)
         if not directory:
             raise ValueError('directory must be defined')
         self.directory = directory
@@ -222,6 +284,7 @@ class PkgMetaBaseBuilder:
         self._content_type = None
         self._subpkg_entries = []
         self._resource_manager = None
+        self._content_hashes = None
 
     def name(self, name):
         self._name = name
@@ -240,6 +303,10 @@ class PkgMetaBaseBuilder:
         self._resource_manager = resource_manager
         return self
 
+    def content_hashes(self, content_hashes):
+        self._content_hashes = content_hashes
+        return self
+
     def _build_subpkg_entries(self):
         entries = []
         for builder in self._subpkg_entries:
@@ -267,7 +334,7 @@ class RootPkgMetaBuilder(PkgMetaBaseBuilder):
         content_type = self._content_type
         resource_manager = self._resource_manager
         subpkg_entries = self._build_subpkg_entries()
-        return RootPkgMeta(self._schema, name, self._version, content_type, resource_manager, subpkg_entries)
+        return RootPkgMeta(self._schema, name, self._version, content_type, resource_manager, subpkg_entries, self._content_hashes)
 
 
 class SubPkgEntryBuilder(PkgMetaBaseBuilder):
@@ -285,7 +352,7 @@ class SubPkgEntryBuilder(PkgMetaBaseBuilder):
         content_type = self._content_type
         resource_manager = self._resource_manager
         subpkg_entries = self._build_subpkg_entries()
-        return SubPkgEntry(name, self._directory, content_type, resource_manager, subpkg_entries)
+        return SubPkgEntry(name, self._directory, content_type, resource_manager, subpkg_entries, content_hashes=self._content_hashes)
 
 
 class PkgMetaParser:
@@ -314,7 +381,8 @@ class PkgMetaParserWorker:
         subcontent = self.__read_subcontents(self.meta_dict)
         if self.content_type in [types.RESOURCE_PROJECT_TYPE, types.ETSI_VNF_PROJECT_TYPE]:
             resource_manager = self.__read_resource_manager(self.meta_dict)
-        return RootPkgMeta(self.schema, self.content_name, self.content_version, self.content_type, resource_manager, subcontent)
+        content_hashes = self.__read_content_hashes(self.meta_dict)
+        return RootPkgMeta(self.schema, self.content_name, self.content_version, self.content_type, resource_manager, subcontent, content_hashes)
 
     def __read_schema(self):
         return self.meta_dict.get('schema', None)
@@ -328,6 +396,12 @@ class PkgMetaParserWorker:
     def __read_resource_manager(self, meta_dict):
         return meta_dict.get('resource-manager', None)
 
+    def __read_content_hashes(self, meta_dict):
+        content_hashes = meta_dict.get('content-hashes', None)
+        if content_hashes is not None and type(content_hashes) is not dict:
+            raise PkgMetaParsingException('content-hashes should be a dictionary')
+        return content_hashes
+
     def __read_content_type(self, meta_dict):
         if 'type' not in meta_dict:
             return types.ASSEMBLY_PROJECT_TYPE
@@ -351,7 +425,8 @@ class PkgMetaParserWorker:
         full_name_override = raw_subcontent_entry.get('full-name-override', None)
         resource_manager = self.__read_resource_manager(raw_subcontent_entry)
         subcontent = self.__read_subcontents(raw_subcontent_entry)
-        return SubPkgEntry(sub_name, directory, content_type, resource_manager, subcontent, full_name_override)
+        content_hashes = self.__read_content_hashes(raw_subcontent_entry)
+        return SubPkgEntry(sub_name, directory, content_type, resource_manager, subcontent, full_name_override, content_hashes)
 
 
 class PkgMetaParsingException(Exception):
@@ -368,13 +443,19 @@ class PkgMetaRewriter:
             version = '1.0'
         self.version = version
 
-    def rewrite(self):
-        new_meta = {}
+    def convert(self):
+        """
+        Returns the meta converted to the current schema, without writing it to a file
+        """
         if type(self.meta) is not dict:
             raise ValueError('Meta should be a dictionary')
         new_meta = self.meta.copy()
         new_meta = self.__add_schema_and_version(new_meta)
         new_meta = self.__rewrite_vnfcs_as_subprojects(new_meta)
+        return new_meta
+
+    def rewrite(self):
+        new_meta = self.convert()
         if os.path.exists(self.path):
             backup_file_name = '{0}.bak'.format(os.path.basename(self.path))
             backup_path = os.path.join(os.path.dirname(self.path), backup_file_name)
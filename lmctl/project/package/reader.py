@@ -0,0 +1,111 @@
+import tarfile
+import zipfile
+import yaml
+
+# Members read to determine the meta of a package, including those of deprecated package structures
+PKG_META_FILE = 'lmpkg.yml'
+DEPRECATED_PKG_META_FILE = 'lmproject.yml'
+DEPRECATED_CONTENT_TGZ = 'content.tgz'
+DEPRECATED_CONTENT_DIR = 'content'
+
+
+class PkgArchiveError(Exception):
+    pass
+
+
+def normalize_member_name(name):
+    while name.startswith('./'):
+        name = name[2:]
+    return name.rstrip('/')
+
+
+class PkgArchiveReader:
+    """
+    Reads the meta of a package (".tgz" or ".csar") straight from the archive, without extracting it.
+
+    CSARs (zip) are read from their central directory, so only the meta members are decompressed.
+    Gzipped tars have no index, so members are streamed in order and skipped until the meta is found; packages built by lmctl
+    add the meta as the first member, so reading stops there. Otherwise (e.g. older packages) the rest of the archive is streamed through,
+    to check for the deprecated structures which take precedence, but is never written to disk.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def read_meta_dict(self):
+        """
+        Returns:
+            tuple: the meta of the package (dict) and True if it was read from a deprecated meta file (so must be rewritten before use), or (None, False) if there is none
+        """
+        if tarfile.is_tarfile(self.path):
+            with open(self.path, 'rb') as pkg_file:
+                members = self.__scan_tar(pkg_file, stop_at_leading_meta=True)
+        elif zipfile.is_zipfile(self.path):
+            members = self.__scan_zip()
+        else:
+            raise PkgArchiveError('Could not determine if pkg {0} was a tgz or csar'.format(self.path))
+        return self.__resolve_meta(members)
+
+    def __scan_tar(self, fileobj, stop_at_leading_meta=False):
+        found = {'names': set(), 'content_dir': False, 'content_tgz': None}
+        with tarfile.open(fileobj=fileobj, mode='r|gz') as pkg_tar:
+            first_member = True
+            for member in pkg_tar:
+                name = normalize_member_name(member.name)
+                if member.isfile():
+                    self.__record_member(found, name, lambda: pkg_tar.extractfile(member))
+                elif name == DEPRECATED_CONTENT_DIR:
+                    found['content_dir'] = True
+                if first_member and stop_at_leading_meta and name == PKG_META_FILE:
+                    # Packages built by lmctl lead with the meta file and never include the deprecated structures
+                    break
+                first_member = False
+        return found
+
+    def __scan_zip(self):
+        found = {'names': set(), 'content_dir': False, 'content_tgz': None}
+        with zipfile.ZipFile(self.path, mode='r') as pkg_zip:
+            for info in pkg_zip.infolist():
+                name = normalize_member_name(info.filename)
+                if info.is_dir():
+                    if name == DEPRECATED_CONTENT_DIR:
+                        found['content_dir'] = True
+                    continue
+                self.__record_member(found, name, lambda: pkg_zip.open(info))
+        return found
+
+    def __record_member(self, found, name, open_member):
+        if name.startswith(DEPRECATED_CONTENT_DIR + '/'):
+            found['content_dir'] = True
+        if name in [PKG_META_FILE, DEPRECATED_PKG_META_FILE, DEPRECATED_CONTENT_DIR + '/' + PKG_META_FILE, DEPRECATED_CONTENT_DIR + '/' + DEPRECATED_PKG_META_FILE]:
+            with open_member() as member_file:
+                found[name] = member_file.read()
+        elif name == DEPRECATED_CONTENT_TGZ:
+            with open_member() as member_file:
+                found['content_tgz'] = self.__scan_tar(member_file)
+
+    def __resolve_meta(self, found):
+        # Mirrors the way the content of an extracted package is re-arranged by Pkg.open
+        if found['content_tgz'] is not None:
+            # content.tgz is extracted over the root of the package
+            nested = found['content_tgz']
+            meta = nested.get(PKG_META_FILE, found.get(PKG_META_FILE))
+            deprecated_meta = nested.get(DEPRECATED_PKG_META_FILE, found.get(DEPRECATED_PKG_META_FILE))
+        elif found['content_dir']:
+            # The package is opened from the content directory, with the meta at the root copied into it
+            meta = found.get(PKG_META_FILE, found.get(DEPRECATED_CONTENT_DIR + '/' + PKG_META_FILE))
+            deprecated_meta = found.get(DEPRECATED_CONTENT_DIR + '/' + DEPRECATED_PKG_META_FILE)
+        else:
+            meta = found.get(PKG_META_FILE)
+            deprecated_meta = found.get(DEPRECATED_PKG_META_FILE)
+        if meta is not None:
+            return self.__load_yaml(meta), False
+        if deprecated_meta is not None:
+            return self.__load_yaml(deprecated_meta), True
+        return None, False
+
+    def __load_yaml(self, raw_content):
+        meta_dict = yaml.safe_load(raw_content.decode('utf-8'))
+        if not meta_dict:
+            meta_dict = {}
+        return meta_dict
@@ -0,0 +1,274 @@
+import io
+import os
+import shutil
+import tarfile
+import zipfile
+import logging
+import tempfile
+import threading
+import weakref
+import lmctl.files as files
+from .reader import PkgArchiveError, normalize_member_name
+
+logger = logging.getLogger(__name__)
+
+PUSH_WORKSPACE_DIR_ENV_VAR = 'LMCTL_PUSH_WORKSPACE_DIR'
+PUSH_WORKSPACE_LIMIT_ENV_VAR = 'LMCTL_PUSH_WORKSPACE_LIMIT_MB'
+DEFAULT_PUSH_WORKSPACE_LIMIT_MB = 1024
+# Members uploaded exactly as they are in the package (Resource packages and CSARs), so they are read from the archive rather than written to disk
+DEFERRED_MEMBER_EXTENSIONS = ('.zip', '.csar')
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class PushWorkspaceError(Exception):
+    pass
+
+
+def default_push_workspace_dir():
+    env_dir = os.environ.get(PUSH_WORKSPACE_DIR_ENV_VAR, None)
+    if env_dir is not None and len(env_dir.strip()) > 0:
+        return env_dir
+    # The system temp directory (which also honours TMPDIR)
+    return None
+
+
+def default_push_workspace_limit():
+    """
+    Returns:
+        int: the maximum number of bytes written to a push workspace, or None if unbounded (the limit is set to 0)
+    """
+    env_limit = os.environ.get(PUSH_WORKSPACE_LIMIT_ENV_VAR, None)
+    if env_limit is None or len(env_limit.strip()) == 0:
+        limit_mb = DEFAULT_PUSH_WORKSPACE_LIMIT_MB
+    else:
+        try:
+            limit_mb = int(env_limit)
+        except ValueError as e:
+            raise PushWorkspaceError('{0} must be a whole number of megabytes but was: {1}'.format(PUSH_WORKSPACE_LIMIT_ENV_VAR, env_limit)) from e
+    if limit_mb <= 0:
+        return None
+    return limit_mb * 1024 * 1024
+
+
+class PushWorkspace:
+    """
+    Temporary directory holding the content of a package being pushed.
+
+    The directory is removed when the workspace is closed, when it is no longer referenced or, at the latest, when the interpreter exits.
+    The total size of the files written to it is bounded by limit_bytes, so a push fails early with a clear error, rather than filling the volume.
+    """
+
+    def __init__(self, parent_dir=None, limit_bytes=None):
+        self.path = tempfile.mkdtemp(prefix='lmctl-push-', dir=parent_dir)
+        self.limit_bytes = limit_bytes
+        self.used_bytes = 0
+        self.__lock = threading.Lock()
+        self.__finalizer = weakref.finalize(self, shutil.rmtree, self.path, ignore_errors=True)
+
+    @staticmethod
+    def create():
+        return PushWorkspace(parent_dir=default_push_workspace_dir(), limit_bytes=default_push_workspace_limit())
+
+    @property
+    def closed(self):
+        return not self.__finalizer.alive
+
+    def reserve(self, num_bytes, name):
+        """
+        Account for a file about to be written to the workspace
+
+        Raises:
+            PushWorkspaceError: if writing the file would exceed the limit of the workspace
+        """
+        with self.__lock:
+            if self.limit_bytes is not None and self.used_bytes + num_bytes > self.limit_bytes:
+                raise PushWorkspaceError('Writing {0} ({1} bytes) would exceed the {2} byte limit of the push workspace at {3} (set {4} to change the limit, in megabytes)'.format(
+                    name, num_bytes, self.limit_bytes, self.path, PUSH_WORKSPACE_LIMIT_ENV_VAR))
+            self.used_bytes += num_bytes
+
+    def write(self, path, stream, size):
+        """
+        Write the content of a stream (of the given size) to a file in the workspace
+        """
+        self.reserve(size, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            shutil.copyfileobj(stream, f, COPY_CHUNK_SIZE)
+
+    def close(self):
+        self.__finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class _DeferredMember:
+
+    def __init__(self, name, size, tarinfo=None):
+        self.name = name
+        self.size = size
+        self.tarinfo = tarinfo
+
+
+class ArchiveContentFiles(files.ContentFiles):
+    """
+    Content of a package expanded into a PushWorkspace, except for the Resource packages and CSARs it includes (and any other deferred members),
+    which are only read from the package archive as they are uploaded, so they are never written to disk.
+
+    CSARs (zip) are indexed, so a deferred member is read from its own offset. Gzipped tars are not, so each deferred member is decompressed
+    from the start of the archive each time it is opened, trading CPU for disk space and writes.
+    """
+
+    def __init__(self, pkg_path, workspace, deferred_dirs=None):
+        self.pkg_path = pkg_path
+        self.workspace = workspace
+        self.deferred_dirs = deferred_dirs or []
+        self.__deferred = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def root_path(self):
+        return self.workspace.path
+
+    @property
+    def deferred_paths(self):
+        return sorted(self.__deferred.keys())
+
+    def expand(self):
+        """
+        Write every member of the package to the workspace, except those deferred
+        """
+        if tarfile.is_tarfile(self.pkg_path):
+            self.__expand_tar()
+        elif zipfile.is_zipfile(self.pkg_path):
+            self.__expand_zip()
+        else:
+            raise PkgArchiveError('Could not determine if pkg {0} was a tgz or csar'.format(self.pkg_path))
+
+    def __is_deferred(self, name):
+        if name.lower().endswith(DEFERRED_MEMBER_EXTENSIONS):
+            return True
+        return any(name.startswith(deferred_dir + '/') for deferred_dir in self.deferred_dirs)
+
+    def __member_path(self, name):
+        member_path = os.path.join(self.root_path, name)
+        if not files.is_in_directory(member_path, self.root_path):
+            raise PkgArchiveError('Package contains a file which attempts to traverse to a path outside of the target extraction path: {0}'.format(name))
+        return self.__key(member_path)
+
+    def __key(self, path):
+        return os.path.normpath(os.path.abspath(path))
+
+    def __expand_tar(self):
+        with tarfile.open(self.pkg_path, mode='r|gz') as pkg_tar:
+            for member in pkg_tar:
+                name = normalize_member_name(member.name)
+                member_path = self.__member_path(name)
+                if member.isfile() and self.__is_deferred(name):
+                    self.__deferred[member_path] = _DeferredMember(name, member.size, tarinfo=member)
+                    # Keep the directory, so the layout of the content is unchanged
+                    os.makedirs(os.path.dirname(member_path), exist_ok=True)
+                    continue
+                if member.isfile():
+                    self.workspace.reserve(member.size, name)
+                pkg_tar.extract(member, self.root_path)
+
+    def __expand_zip(self):
+        with zipfile.ZipFile(self.pkg_path, mode='r') as pkg_zip:
+            for info in pkg_zip.infolist():
+                name = normalize_member_name(info.filename)
+                member_path = self.__member_path(name)
+                if not info.is_dir() and self.__is_deferred(name):
+                    self.__deferred[member_path] = _DeferredMember(info.filename, info.file_size)
+                    # Keep the directory, so the layout of the content is unchanged
+                    os.makedirs(os.path.dirname(member_path), exist_ok=True)
+                    continue
+                if not info.is_dir():
+                    self.workspace.reserve(info.file_size, name)
+                pkg_zip.extract(info, self.root_path)
+
+    def __deferred_member(self, path):
+        with self.__lock:
+            return self.__deferred.get(self.__key(path), None)
+
+    def exists(self, path):
+        return self.__deferred_member(path) is not None or super().exists(path)
+
+    def open(self, path):
+        member = self.__deferred_member(path)
+        if member is None:
+            return super().open(path)
+        return ArchiveMemberFile(self.pkg_path, member, path)
+
+    def local_path(self, path):
+        key = self.__key(path)
+        with self.__lock:
+            member = self.__deferred.get(key, None)
+            if member is not None:
+                logger.debug('Writing {0} from {1} to the push workspace'.format(member.name, self.pkg_path))
+                with ArchiveMemberFile(self.pkg_path, member, path) as member_file:
+                    self.workspace.write(path, member_file, member.size)
+                self.__deferred.pop(key)
+        return path
+
+    def moved(self, src, dest):
+        src_prefix = self.__key(src) + os.sep
+        dest_key = self.__key(dest)
+        with self.__lock:
+            for key in [key for key in self.__deferred if key.startswith(src_prefix)]:
+                self.__deferred[os.path.join(dest_key, key[len(src_prefix):])] = self.__deferred.pop(key)
+
+    def close(self):
+        self.workspace.close()
+
+
+class ArchiveMemberFile(io.IOBase):
+    """
+    Read-only, seekable file object for a member of a package archive, which opens its own handle on the archive (so members may be read concurrently).
+    The "name" of the file is the path the member would have been extracted to
+    """
+
+    def __init__(self, pkg_path, member, name):
+        super().__init__()
+        self.name = name
+        self.size = member.size
+        self._archive = None
+        self._stream = None
+        try:
+            if member.tarinfo is not None:
+                self._archive = tarfile.open(pkg_path, mode='r:gz')
+                self._stream = self._archive.extractfile(member.tarinfo)
+            else:
+                self._archive = zipfile.ZipFile(pkg_path, mode='r')
+                self._stream = self._archive.open(member.name)
+        except BaseException:
+            self.close()
+            raise
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self._stream.seek(offset, whence)
+
+    def tell(self):
+        return self._stream.tell()
+
+    def close(self):
+        if not self.closed:
+            try:
+                if self._stream is not None:
+                    self._stream.close()
+            finally:
+                if self._archive is not None:
+                    self._archive.close()
+        super().close()
@@ -0,0 +1,292 @@
+import os
+import json
+import hashlib
+import logging
+import lmctl
+import lmctl.files as files
+import lmctl.project.package.meta as pkg_metas
+from .common import LIFECYCLE_WORKSPACE
+
+logger = logging.getLogger(__name__)
+
+BUILD_INDEX_FILE = 'build-index.json'
+BUILD_RECORD_FILE = 'build-record.json'
+# Increment when the content of the index changes in a way older versions cannot use
+BUILD_INDEX_FORMAT = 1
+
+
+def _lmctl_version():
+    try:
+        with open(os.path.join(os.path.dirname(lmctl.__file__), 'pkg_info.json'), 'r') as f:
+            return json.load(f).get('version', None)
+    except (OSError, ValueError):
+        return None
+
+
+class BuildCache:
+    """
+    Index of the (sub)projects staged and compiled by the last incremental build, used to skip staging and compiling any which are unchanged.
+
+    Each (sub)project is fingerprinted from the content of its own source files (excluding any subprojects), the project file of the root project and the version of lmctl.
+    The hash of each file is kept with its modification time and size, so files are only read again when either changes.
+
+    A project is only recorded once the whole build has completed, so a failed build never leaves partially staged or compiled content marked as reusable.
+    When given the SourceIndex of the build, files are listed from it (instead of walking each project again) and hashed from the content it has already read.
+    """
+
+    def __init__(self, project, settings=None, source_index=None):
+        self.project = project
+        # Build settings which change the compiled content, so are included in each fingerprint
+        self.settings = settings or {}
+        self.source_index = source_index
+        self.index_path = BuildCache.index_path_for(project)
+        self.__index = self.__load()
+        self.__file_hashes = {}
+        self.__fingerprints = {}
+        self.__unchanged = set()
+        self.__root_config_hash = self.__calculate_root_config_hash()
+
+    @staticmethod
+    def index_path_for(project):
+        return os.path.join(project.tree.root_path, LIFECYCLE_WORKSPACE, BUILD_INDEX_FILE)
+
+    @staticmethod
+    def clear(project):
+        """
+        Remove the index of a project, so the next incremental build starts from scratch (used whenever a full build replaces the staged content)
+        """
+        index_path = BuildCache.index_path_for(project)
+        if os.path.exists(index_path):
+            os.remove(index_path)
+
+    def __load(self):
+        empty_index = {'format': BUILD_INDEX_FORMAT, 'lmctl': _lmctl_version(), 'files': {}, 'projects': {}}
+        if not os.path.exists(self.index_path):
+            return empty_index
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug('Ignoring unreadable build index {0}: {1}'.format(self.index_path, str(e)))
+            return empty_index
+        if type(index) is not dict or index.get('format') != BUILD_INDEX_FORMAT or index.get('lmctl') != _lmctl_version():
+            return empty_index
+        index.setdefault('files', {})
+        index.setdefault('projects', {})
+        return index
+
+    def __calculate_root_config_hash(self):
+        root_project = self.project
+        while getattr(root_project, 'parent_project', None) is not None:
+            root_project = root_project.parent_project
+        project_file_path = getattr(root_project.tree, 'project_file_path', None)
+        if project_file_path is None or not os.path.exists(project_file_path):
+            return None
+        return self.file_hash(project_file_path)
+
+    def key_for(self, project):
+        directories = []
+        while getattr(project, 'parent_project', None) is not None:
+            directories.insert(0, project.config.directory)
+            project = project.parent_project
+        return '/'.join(directories) if len(directories) > 0 else '.'
+
+    def file_hash(self, path):
+        """
+        Returns the sha256 hash of a file, re-using the hash from the index if the modification time and size of the file are unchanged
+        """
+        abs_path = os.path.abspath(path)
+        stat = os.stat(abs_path)
+        fingerprint = [stat.st_mtime_ns, stat.st_size]
+        cached = self.__index['files'].get(abs_path, None)
+        if cached is not None and cached[:2] == fingerprint:
+            file_hash = cached[2]
+        elif self.source_index is not None:
+            file_hash = self.source_index.file_hash(abs_path)
+        else:
+            file_hash = pkg_metas.calculate_file_hash(abs_path)
+        self.__file_hashes[abs_path] = fingerprint + [file_hash]
+        return file_hash
+
+    def __fingerprint(self, project):
+        # Subprojects are fingerprinted on their own
+        excluded_dirs = [LIFECYCLE_WORKSPACE, os.path.basename(project.tree.vnfcs_path), os.path.basename(project.tree.contains_path)]
+        if self.source_index is not None:
+            source_hashes = self.source_index.content_hashes(project.tree.root_path, excluded_dirs=excluded_dirs, hash_file=self.file_hash)
+        else:
+            source_hashes = pkg_metas.calculate_content_hashes(project.tree.root_path, excluded_dirs=excluded_dirs, hash_file=self.file_hash)
+        fingerprint_content = {'config': self.__root_config_hash, 'sources': source_hashes}
+        if len(self.settings) > 0:
+            fingerprint_content['settings'] = self.settings
+        raw_content = json.dumps(fingerprint_content, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(raw_content.encode('utf-8')).hexdigest()
+
+    def check_project(self, project, staging_path):
+        """
+        Determine if the sources of a (sub)project are unchanged since the last incremental build (and it's staged content still exists).
+        Any record of a changed project is removed from the index straight away, as its staged and compiled content is about to be replaced.
+
+        Returns:
+            bool: True if the staged and compiled content of the project may be re-used
+        """
+        key = self.key_for(project)
+        fingerprint = self.__fingerprint(project)
+        self.__fingerprints[key] = fingerprint
+        if self.__index['projects'].get(key, None) == fingerprint and os.path.isdir(staging_path):
+            self.__unchanged.add(key)
+            return True
+        if key in self.__index['projects']:
+            self.__index['projects'].pop(key)
+            self.__save(self.__index)
+        return False
+
+    def is_unchanged(self, project):
+        return self.key_for(project) in self.__unchanged
+
+    def commit(self):
+        """
+        Record the fingerprint of each project built, once the build has completed
+        """
+        index = {
+            'format': BUILD_INDEX_FORMAT,
+            'lmctl': _lmctl_version(),
+            'files': dict(sorted(self.__file_hashes.items())),
+            'projects': dict(sorted(self.__fingerprints.items()))
+        }
+        self.__save(index)
+        self.__index = index
+
+    def __save(self, index):
+        try:
+            _write_json(self.index_path, index)
+        except OSError as e:
+            logger.warning('Failed to save build index {0}: {1}'.format(self.index_path, str(e)))
+
+
+class BuildRecord:
+    """
+    Record of the package last built from a project by a recursive build, used to skip projects with inputs unchanged since.
+
+    The inputs are fingerprinted from every source file of the project (including those of its subprojects), the settings of the build and the version of lmctl.
+    The hash of each file is kept with its modification time and size, so files are only read again when either changes.
+    """
+
+    def __init__(self, project, settings=None):
+        self.project = project
+        # Build settings which change the package, so are included in the fingerprint
+        self.settings = settings or {}
+        self.record_path = BuildRecord.record_path_for(project)
+        self.__record = self.__load()
+        self.__file_hashes = {}
+
+    @staticmethod
+    def record_path_for(project):
+        return os.path.join(project.tree.root_path, LIFECYCLE_WORKSPACE, BUILD_RECORD_FILE)
+
+    @staticmethod
+    def clear(project):
+        """
+        Remove the record of a project, so it is built by the next recursive build (used whenever the package is built by any other means)
+        """
+        record_path = BuildRecord.record_path_for(project)
+        if os.path.exists(record_path):
+            os.remove(record_path)
+
+    def __load(self):
+        if not os.path.exists(self.record_path):
+            return None
+        try:
+            with open(self.record_path, 'r') as f:
+                record = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug('Ignoring unreadable build record {0}: {1}'.format(self.record_path, str(e)))
+            return None
+        if type(record) is not dict or record.get('format') != BUILD_INDEX_FORMAT or record.get('lmctl') != _lmctl_version():
+            return None
+        return record
+
+    def __file_hash(self, path):
+        abs_path = os.path.abspath(path)
+        stat = os.stat(abs_path)
+        fingerprint = [stat.st_mtime_ns, stat.st_size]
+        cached = self.__record.get('files', {}).get(abs_path, None) if self.__record is not None else None
+        if cached is not None and cached[:2] == fingerprint:
+            file_hash = cached[2]
+        else:
+            file_hash = pkg_metas.calculate_file_hash(abs_path)
+        self.__file_hashes[abs_path] = fingerprint + [file_hash]
+        return file_hash
+
+    def __fingerprint(self):
+        self.__file_hashes = {}
+        source_hashes = pkg_metas.calculate_content_hashes(self.project.tree.root_path, excluded_dirs=[LIFECYCLE_WORKSPACE], hash_file=self.__file_hash)
+        raw_content = json.dumps({'sources': source_hashes, 'settings': self.settings}, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(raw_content.encode('utf-8')).hexdigest()
+
+    def unchanged_pkg_path(self):
+        """
+        Determine if the inputs of the project are unchanged since the package in the record was built (and the package still exists)
+
+        Returns:
+            str: path of the package which may be re-used, or None if the project must be built
+        """
+        if self.__record is None:
+            return None
+        pkg_path = os.path.join(self.project.tree.root_path, self.__record.get('pkg', ''))
+        if not os.path.isfile(pkg_path):
+            return None
+        if self.__fingerprint() != self.__record.get('fingerprint', None):
+            return None
+        return pkg_path
+
+    def save(self, pkg_path):
+        """
+        Record the package built from the current inputs of the project, once the build has completed
+        """
+        # Fingerprinted after the build, as autocorrection may have changed the sources
+        record = {
+            'format': BUILD_INDEX_FORMAT,
+            'lmctl': _lmctl_version(),
+            'fingerprint': self.__fingerprint(),
+            'pkg': os.path.relpath(pkg_path, self.project.tree.root_path).replace(os.sep, '/'),
+            'files': dict(sorted(self.__file_hashes.items()))
+        }
+        try:
+            _write_json(self.record_path, record)
+        except OSError as e:
+            logger.warning('Failed to save build record {0}: {1}'.format(self.record_path, str(e)))
+        self.__record = record
+
+
+def _write_json(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    files.write_file_atomically(path, lambda f: json.dump(content, f, indent=2))
+
+
+def clean_own_content(directory_path, child_directory_name, kept_child_names):
+    """
+    Remove the content of a directory belonging to a (sub)project, keeping the content of any of it's subprojects still included in the build
+
+    Args:
+        directory_path (str): the directory to clean (created if it does not exist)
+        child_directory_name (str): name of the directory holding the content of subprojects
+        kept_child_names (list): names of the subproject directories to keep
+    """
+    if not os.path.exists(directory_path):
+        os.makedirs(directory_path)
+        return
+    for entry in os.listdir(directory_path):
+        entry_path = os.path.join(directory_path, entry)
+        if entry == child_directory_name and os.path.isdir(entry_path):
+            for child_entry in os.listdir(entry_path):
+                if child_entry not in kept_child_names:
+                    _remove(os.path.join(entry_path, child_entry))
+        else:
+            _remove(entry_path)
+
+
+def _remove(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        files.remove_directory(path)
+    else:
+        os.remove(path)
@@ -1,3 +1,15 @@
+import os
+import lmctl.files as files
+from lmctl.utils.compression import ArchiveCompression
 
+LIFECYCLE_WORKSPACE = '_lmctl'
 
-LIFECYCLE_WORKSPACE = '_lmctl'
\ No newline at end of file
+# Strategy used to copy sources into the staging and compile directories of a build (see lmctl.files.FileCopier)
+BUILD_COPY_STRATEGY_ENV_VAR = 'LMCTL_BUILD_COPY_STRATEGY'
+
+def archive_compression(options):
+    return ArchiveCompression(level=getattr(options, 'compression_level', None), workers=getattr(options, 'compression_workers', None))
+
+def build_file_copier():
+    strategy = os.environ.get(BUILD_COPY_STRATEGY_ENV_VAR, '').strip() or files.AUTO_STRATEGY
+    return files.FileCopier(strategy)
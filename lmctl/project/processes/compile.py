@@ -1,19 +1,24 @@
 import os
 import lmctl.files as files
 import lmctl.project.handlers.interface as handlers_api
+from lmctl.utils.compression import ArchiveCompression
 from lmctl.project.package.core import ExpandedPkgTree
-from .common import LIFECYCLE_WORKSPACE
+from lmctl.project.source.index import SourceIndex
+from .common import LIFECYCLE_WORKSPACE, archive_compression, build_file_copier
+from .build_cache import clean_own_content
 
 class CompileProcessError(Exception):
     pass
 
 class CompileProcess:
 
-    def __init__(self, project, options, staging_tree, journal):
+    def __init__(self, project, options, staging_tree, journal, build_cache=None, source_index=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.staging_tree = staging_tree
+        self.build_cache = build_cache
+        self.source_index = source_index if source_index is not None else SourceIndex()
 
     def __create_content_tree(self):
         compile_workspace = os.path.join(self.project.tree.root_path, LIFECYCLE_WORKSPACE, 'compile')
@@ -21,32 +26,47 @@ class CompileProcess:
 
     def execute(self):
         content_tree = self.__create_content_tree()
-        CompileWorker(self.project, self.options, self.staging_tree, content_tree, self.journal).work()
+        CompileWorker(self.project, self.options, self.staging_tree, content_tree, self.journal, build_cache=self.build_cache, source_index=self.source_index).work()
         return content_tree
 
 
 class CompileWorker:
 
-    def __init__(self, project, options, staging_tree, content_tree, journal):
+    def __init__(self, project, options, staging_tree, content_tree, journal, build_cache=None, source_index=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.staging_tree = staging_tree
         self.content_tree = content_tree
+        self.build_cache = build_cache
+        self.source_index = source_index if source_index is not None else SourceIndex()
 
     def work(self):
-        self.__prepare_compile_directories()
-        self.__compile_sources()
+        if self.build_cache is not None and self.build_cache.is_unchanged(self.project) and os.path.isdir(self.content_tree.root_path):
+            self.journal.event('Sources of {0} unchanged since last build, re-using compiled content'.format(self.project.config.name))
+        else:
+            self.__prepare_compile_directories()
+            self.__compile_sources()
         self.__compile_child_projects()
 
     def __prepare_compile_directories(self):
-        files.clean_directory(self.content_tree.root_path)
+        if self.build_cache is None:
+            files.clean_directory(self.content_tree.root_path)
+        else:
+            # Compiled content of subprojects is kept, as each decides whether to re-use it
+            kept_children = [subproject.config.directory for subproject in self.project.subprojects]
+            clean_own_content(self.content_tree.root_path, ExpandedPkgTree.CONTAINS_DIR, kept_children)
 
     def __compile_sources(self):
         self.journal.section('Compile Package')
+        try:
+            copier = build_file_copier()
+        except ValueError as e:
+            raise CompileProcessError(str(e)) from e
         try:
             staged_source_handler = self.project.source_handler.build_staged_source_handler(self.staging_tree.root_path)
-            source_compiler = SourceCompiler(self.journal, self.project.config, self.content_tree.root_path)
+            source_compiler = SourceCompiler(self.journal, self.project.config, self.content_tree.root_path, compression=archive_compression(self.options), copier=copier,
+                                             source_index=self.source_index)
             staged_source_handler.compile_sources(self.journal, source_compiler)
         except handlers_api.SourceHandlerError as e:
             raise CompileProcessError(str(e)) from e
@@ -65,15 +85,19 @@ class CompileWorker:
             self.journal.subproject(subproject.config.name)
             child_staging_tree = self.staging_tree.gen_subproject_staging_tree(subproject.config.directory)
             child_content_tree = self.content_tree.gen_child_content_tree(subproject.config.directory)
-            CompileWorker(subproject, self.options, child_staging_tree, child_content_tree, self.journal).work()
+            CompileWorker(subproject, self.options, child_staging_tree, child_content_tree, self.journal, build_cache=self.build_cache, source_index=self.source_index).work()
             self.journal.subproject_end(subproject.config.name)
 
 class SourceCompiler:
 
-    def __init__(self, journal, source_config, compile_path):
+    def __init__(self, journal, source_config, compile_path, compression=None, copier=None, source_index=None):
         self.journal = journal
         self.source_config = source_config
         self.compile_path = compile_path
+        self.compression = compression if compression is not None else ArchiveCompression()
+        self.copier = copier if copier is not None else files.FileCopier()
+        # Holds the files written by staging, so staged handlers can read them without parsing them again
+        self.source_index = source_index if source_index is not None else SourceIndex()
 
     def _join_path(self, base_path, relative_path):
         return os.path.join(base_path, relative_path)
@@ -90,12 +114,18 @@ class SourceCompiler:
             compile_path = self.compile_path
         else:
             compile_path = self._make_path(self.compile_path, relative_compile_path)
-        files.copy_tree(orig_path, compile_path)
+        self.copier.copy_tree(orig_path, compile_path)
 
     def make_file_path(self, relative_compile_path):
         return self._make_path(self.compile_path, relative_compile_path)
 
     def compile_file(self, orig_path, relative_compile_path):
         target_path = self._make_path(self.compile_path, relative_compile_path)
-        files.copy_file(orig_path, target_path)
+        self.copier.copy_file(orig_path, target_path)
+
+    def create_zip(self, full_path):
+        """
+        Open a zip (e.g. a Resource package or CSAR) for writing, which compresses each file added with the compression of the build
+        """
+        return self.compression.open_zip(full_path)
 
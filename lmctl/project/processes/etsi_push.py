@@ -1,8 +1,10 @@
+import os
 import lmctl.project.handlers.interface as handlers_api
 import lmctl.project.handlers.etsi_ns as etsi_ns_handler_api
 import lmctl.project.handlers.etsi_vnf as etsi_vnf_handler_api
 import lmctl.utils.descriptors as descriptors
 import lmctl.drivers.lm.base as lm_drivers
+import lmctl.utils.uploads as uploads
 
 class EtsiPushProcessError(Exception):
     pass
@@ -24,7 +26,7 @@ class EtsiPushProcess:
         if (self.pkg_meta.is_etsi_ns_content()):
             # Need to get the descriptor to determin the full ID (descriptor_name) as namein the pkg_meta is not full
             descriptor_path = etsi_ns_handler_api.EtsiNsPkgContentTree(self.push_workspace).descriptor_definitions_file_path
-            descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path)
+            descriptor, descriptor_yml_str = descriptors.DescriptorParser(read_only=True).read_from_file_with_raw(descriptor_path)
             descriptor_name = descriptor.get_name()            
             self.journal.event('Removing any existing ETSI_NS assembly package named {0} (version: {1}) from TNC-O: {2} ({3})'
                 .format(descriptor_name, self.pkg_meta.version, lm_session.env.name, lm_session.env.address))
@@ -32,10 +34,10 @@ class EtsiPushProcess:
                 pkg_driver.delete_nsd_package(descriptor_name)
             except lm_drivers.NotFoundException:
                 self.journal.event('No package named {0} found'.format(descriptor_name))            
-            pkg_driver.onboard_nsd_package(descriptor_name, self.pkg.path, object_group_id=self.options.object_group_id)
+            pkg_driver.onboard_nsd_package(descriptor_name, self.pkg.path, object_group_id=self.options.object_group_id, progress_callback=self.__progress_reporter())
         elif (self.pkg_meta.is_etsi_vnf_content()):
             descriptor_path = etsi_vnf_handler_api.EtsiVnfPkgContentTree(self.push_workspace).definitions_descriptor_file_path
-            descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path)
+            descriptor, descriptor_yml_str = descriptors.DescriptorParser(read_only=True).read_from_file_with_raw(descriptor_path)
             descriptor_name = descriptor.get_name()
             self.journal.event('Removing any existing ETSI_NS assembly package named {0} (version: {1}) from TNC-O: {2} ({3})'
                 .format(descriptor_name, self.pkg_meta.version, lm_session.env.name, lm_session.env.address))
@@ -43,6 +45,9 @@ class EtsiPushProcess:
                 pkg_driver.delete_package(descriptor_name)
             except lm_drivers.NotFoundException:
                 self.journal.event('No package named {0} found'.format(descriptor_name))
-            pkg_driver.onboard_package(descriptor_name, self.pkg.path, object_group_id=self.options.object_group_id)
+            pkg_driver.onboard_package(descriptor_name, self.pkg.path, object_group_id=self.options.object_group_id, progress_callback=self.__progress_reporter())
         else:
             raise EtsiPushProcessError('Not an ETSI package, Not pushing.')
+
+    def __progress_reporter(self):
+        return uploads.UploadProgressReporter(self.journal.event, os.path.basename(self.pkg.path))
@@ -1,11 +1,9 @@
 import os
-import tarfile
-import zipfile
 import yaml
 import lmctl.files as files
 import lmctl.project.package.core as pkgs
 import lmctl.project.package.meta as pkg_metas
-from .common import LIFECYCLE_WORKSPACE
+from .common import LIFECYCLE_WORKSPACE, archive_compression
 from lmctl.project.handlers.interface import CSAR_PACKAGING, TGZ_PACKAGING
 
 class PkgBuildTree(files.Tree):
@@ -28,11 +26,12 @@ class PkgProcessError(Exception):
 
 class PkgProcess:
 
-    def __init__(self, project, options, content_tree, journal):
+    def __init__(self, project, options, content_tree, journal, build_cache=None):
         self.project = project
         self.options = options
         self.content_tree = content_tree
         self.journal = journal
+        self.build_cache = build_cache
 
     def __create_pkg_build_tree(self):
         return PkgBuildTree(os.path.join(self.project.tree.root_path, LIFECYCLE_WORKSPACE, 'build'))
@@ -47,19 +46,28 @@ class PkgProcess:
         self.journal.event('Creating package at: {0}'.format(pkg_path))
         pkg_tree = pkgs.ExpandedPkgTree()
         compiled_content_path = self.content_tree.root_path
+        compression = archive_compression(self.options)
         if self.project.config.packaging == CSAR_PACKAGING:
-            with zipfile.ZipFile(pkg_path, mode='w') as pkg_zip:
+            with compression.open_zip(pkg_path) as pkg_zip:
                 self.__build_package(pkg_zip.write, pkg_tree, compiled_content_path, pkg_meta_file_path)
         else:
-            with tarfile.open(pkg_path, mode='w:gz') as pkg_tar:
+            # Compressed on multiple cores, with any already compressed files stored as they are
+            with compression.open_tgz(pkg_path) as pkg_tar:
                 self.__build_package(pkg_tar.add, pkg_tree, compiled_content_path, pkg_meta_file_path)
-        self.__clear_compile_directory()
+        if self.build_cache is None:
+            self.__clear_compile_directory()
         try:
-            return pkgs.Pkg(pkg_path)
+            pkg = pkgs.Pkg(pkg_path)
         except pkgs.InvalidPackageError as e:
             raise PkgProcessError(str(e)) from e
+        if self.build_cache is not None:
+            # Compiled content is kept for the next incremental build
+            self.build_cache.commit()
+        return pkg
 
     def __build_package(self, add_method, pkg_tree, compiled_content_path, pkg_meta_file_path):
+        # The meta leads the package, so it can be read without streaming through the rest of a tgz
+        add_method(pkg_meta_file_path, arcname=pkg_tree.pkg_meta_file_name)
         rootlen = len(compiled_content_path) + 1
         for root, dirs, filelist in os.walk(compiled_content_path):
             for file_name in filelist:
@@ -70,7 +78,6 @@ class PkgProcess:
                     # For big files let people know. TODO: make this more generic, so we can report long running tasks as events
                     self.journal.event('Processing large file {0} ({1:.2f} mb), this may take some time...'.format(os.path.basename(full_path), (file_size/1000000)))
                 add_method(full_path, arcname=arcname)
-        add_method(pkg_meta_file_path, arcname=pkg_tree.pkg_meta_file_name)
 
     def __clear_compile_directory(self):
         files.remove_directory(self.content_tree.root_path)
@@ -82,7 +89,9 @@ class PkgProcess:
         builder.content_type(self.project.config.project_type)
         builder.version(self.project.config.version)
         builder.resource_manager(self.project.config.resource_manager)
-        self.__add_child_projects_to_pkg_meta(self.project.config, builder)
+        content_tree = pkgs.ExpandedPkgTree(self.content_tree.root_path)
+        builder.content_hashes(self.__calculate_content_hashes(content_tree))
+        self.__add_child_projects_to_pkg_meta(self.project.config, builder, content_tree)
         try:
             pkg_meta = builder.build()
         except pkg_metas.PkgMetaError as e:
@@ -91,7 +100,7 @@ class PkgProcess:
             yaml.dump(pkg_meta.to_dict(), pkg_meta_file, default_flow_style=False, sort_keys=False)
         return pkg_meta_file_path
 
-    def __add_child_projects_to_pkg_meta(self, config, meta_builder):
+    def __add_child_projects_to_pkg_meta(self, config, meta_builder, content_tree):
         subprojects = config.subprojects
         for subproject_config in subprojects:
             subpkg_builder = meta_builder.subpkg_entry_builder()
@@ -99,4 +108,13 @@ class PkgProcess:
             subpkg_builder.content_type(subproject_config.project_type)
             subpkg_builder.directory(subproject_config.directory)
             subpkg_builder.resource_manager(subproject_config.resource_manager)
-            self.__add_child_projects_to_pkg_meta(subproject_config, subpkg_builder)
+            child_content_tree = content_tree.gen_child_content_tree(subproject_config.directory)
+            subpkg_builder.content_hashes(self.__calculate_content_hashes(child_content_tree))
+            self.__add_child_projects_to_pkg_meta(subproject_config, subpkg_builder, child_content_tree)
+
+    def __calculate_content_hashes(self, content_tree):
+        # Recorded in the meta so a push can tell which artifacts have changed since they were last pushed to an environment
+        if not os.path.exists(content_tree.root_path):
+            return None
+        hash_file = self.build_cache.file_hash if self.build_cache is not None else pkg_metas.calculate_file_hash
+        return pkg_metas.calculate_content_hashes(content_tree.root_path, excluded_dirs=[pkgs.ExpandedPkgTree.CONTAINS_DIR], hash_file=hash_file)
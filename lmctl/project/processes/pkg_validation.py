@@ -24,7 +24,8 @@ class PackageValidationWorker:
         self.env_sessions = env_sessions
 
     def __build_content_options(self, cmd_options):
-        self.options = handlers_api.ContentValidationOptions(allow_autocorrect=cmd_options.allow_autocorrect)
+        self.options = handlers_api.ContentValidationOptions(allow_autocorrect=cmd_options.allow_autocorrect,
+                                                             content_files=getattr(self.pkg_content, 'content_files', None))
 
     def work(self):
         self.journal.section('Validate Content')
@@ -1,9 +1,25 @@
 import os
+import json
+import hashlib
+import threading
 import lmctl.files as files
+import lmctl.utils.descriptors as descriptors
 import lmctl.project.handlers.interface as handlers_api
+import lmctl.project.concurrency as concurrency
 from .common import LIFECYCLE_WORKSPACE
 import lmctl.project.source.config_references as refs
 
+PULL_UNCHANGED = 'unchanged'
+PULL_UPDATED = 'updated'
+PULL_NEW = 'new'
+
+def calculate_pulled_content_hash(data):
+    """
+    Calculate the sha256 hash of parsed file content (JSON or YAML), independent of formatting and the order of any dictionary keys
+    """
+    raw_data = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(raw_data.encode('utf-8')).hexdigest()
+
 class BackupTree(files.Tree):
     CONTAINS_DIR = 'Contains'
 
@@ -26,6 +42,29 @@ class BackupTree(files.Tree):
 class PullProcessError(Exception):
     pass
 
+class PullSummary:
+    """
+    Records the files left unchanged, updated or created by a pull (of a project and all of its subprojects). Safe to share between threads
+    """
+
+    def __init__(self):
+        self.unchanged = []
+        self.updated = []
+        self.new = []
+        self._lock = threading.Lock()
+
+    def record(self, status, file_path):
+        with self._lock:
+            getattr(self, status).append(file_path)
+
+    def report(self, journal, root_path):
+        journal.section('Pull Summary')
+        journal.event('{0} unchanged, {1} updated, {2} new file(s)'.format(len(self.unchanged), len(self.updated), len(self.new)))
+        for file_path in sorted(self.updated):
+            journal.event('Updated: {0}'.format(os.path.relpath(file_path, root_path)))
+        for file_path in sorted(self.new):
+            journal.event('New: {0}'.format(os.path.relpath(file_path, root_path)))
+
 class PullProcess:
 
     def __init__(self, project, options, journal, env_sessions):
@@ -41,17 +80,23 @@ class PullProcess:
 
     def execute(self):
         backup_tree = self.__create_backup_tree()
-        return PullWorker(self.project, self.options, backup_tree, self.journal, self.env_sessions, self.references).work()
+        summary = PullSummary()
+        PullWorker(self.project, self.options, backup_tree, self.journal, self.env_sessions, self.references, summary).work()
+        summary.report(self.journal, self.project.tree.root_path)
+        return summary
 
 class PullWorker:
 
-    def __init__(self, project, options, backup_tree, journal, env_sessions, references):
+    def __init__(self, project, options, backup_tree, journal, env_sessions, references, summary, concurrent=True):
         self.project = project
         self.options = options
         self.journal = journal
         self.backup_tree = backup_tree
         self.env_sessions = env_sessions
         self.references = references
+        self.summary = summary
+        # Subprojects pulled on a pool thread pull their own children serially, so pools are never nested
+        self.concurrent = concurrent
 
     def work(self):
         self.__pull_sources()
@@ -59,7 +104,7 @@ class PullWorker:
 
     def __pull_sources(self):
         self.journal.section('Pull Sources')
-        backup_tool = SourceBackupTool(self.journal, self.project.config, self.backup_tree.root_path)
+        backup_tool = SourceBackupTool(self.journal, self.project.config, self.backup_tree.root_path, summary=self.summary)
         try:
             self.project.source_handler.pull_sources(self.journal, backup_tool, self.env_sessions, self.references)
         except handlers_api.SourceHandlerError as e:
@@ -69,18 +114,38 @@ class PullWorker:
         subprojects = self.project.subprojects
         if len(subprojects) == 0:
             return
-        for subproject in subprojects:
-            self.journal.subproject(subproject.config.name)
-            child_backup_tree = self.backup_tree.gen_subproject_backup_tree(subproject.config.directory)
-            PullWorker(subproject, self.options, child_backup_tree, self.journal, self.env_sessions, self.references).work()
-            self.journal.subproject_end(subproject.config.name)
+        if self.concurrent and self.__parallelism() > 1 and len(subprojects) > 1:
+            # Each subproject writes to its own directory, so siblings are pulled on a pool
+            concurrency.run_concurrently(self.journal, subprojects, self.__pull_concurrent_child_project, parallelism=self.__parallelism())
+        else:
+            for subproject in subprojects:
+                self.__pull_child_project(subproject, self.journal, concurrent=self.concurrent)
+
+    def __parallelism(self):
+        return getattr(self.options, 'parallelism', None) or 1
+
+    def __pull_concurrent_child_project(self, subproject, journal):
+        self.__pull_child_project(subproject, journal, concurrent=False)
+
+    def __pull_child_project(self, subproject, journal, concurrent):
+        journal.subproject(subproject.config.name)
+        child_backup_tree = self.backup_tree.gen_subproject_backup_tree(subproject.config.directory)
+        PullWorker(subproject, self.options, child_backup_tree, journal, self.env_sessions, self.references, self.summary, concurrent=concurrent).work()
+        journal.subproject_end(subproject.config.name)
 
 class SourceBackupTool:
+    """
+    Backs up, and saves, the files of a project replaced by a pull.
+
+    The save_pulled_ functions compare pulled content with the local file by a hash of their parsed content, so a file is only backed up and
+    re-written when the content has changed (formatting, comments and key order of the local file are kept otherwise).
+    """
 
-    def __init__(self, journal, source_config, backup_path):
+    def __init__(self, journal, source_config, backup_path, summary=None):
         self.journal = journal
         self.source_config = source_config
         self.backup_path = backup_path
+        self.summary = summary if summary is not None else PullSummary()
 
     def _join_path(self, base_path, relative_path):
         return os.path.join(base_path, relative_path)
@@ -103,4 +168,52 @@ class SourceBackupTool:
             backup_path = self._make_path(self.backup_path, relative_backup_path)
         files.copy_tree(orig_path, backup_path)
 
-        
\ No newline at end of file
+        
+
+    def save_pulled_file(self, file_path, relative_backup_path, display_name, pulled_data, read_local_data, write):
+        """
+        Saves pulled content to file_path, unless the parsed content of the existing file is the same (backing up the existing file when it is not)
+
+        Args:
+            file_path (str): path of the local file
+            relative_backup_path (str): path, relative to the backup directory, to backup the existing file to
+            display_name (str): name of the file content used in journal events
+            pulled_data: the parsed content pulled
+            read_local_data (callable): function returning the parsed content of the local file at the path given
+            write (callable): function writing the pulled content to the path given
+
+        Returns:
+            str: one of PULL_UNCHANGED, PULL_UPDATED or PULL_NEW
+        """
+        status = PULL_NEW
+        if os.path.exists(file_path):
+            try:
+                local_hash = calculate_pulled_content_hash(read_local_data(file_path))
+            except Exception:
+                # Unreadable local content is replaced
+                local_hash = None
+            if local_hash == calculate_pulled_content_hash(pulled_data):
+                self.journal.event('No changes to {0} at {1}'.format(display_name, file_path))
+                self.summary.record(PULL_UNCHANGED, file_path)
+                return PULL_UNCHANGED
+            self.journal.event('Creating backup of {0} {1}'.format(display_name, file_path))
+            self.backup_file(file_path, relative_backup_path)
+            status = PULL_UPDATED
+        self.journal.event('Saving {0} to {1}'.format(display_name, file_path))
+        write(file_path)
+        self.summary.record(status, file_path)
+        return status
+
+    def save_pulled_json(self, data, file_path, relative_backup_path, display_name):
+        def read_local_data(path):
+            with open(path, 'r') as f:
+                return json.load(f)
+        def write(path):
+            with open(path, 'w') as out:
+                json.dump(data, out, indent=2)
+        return self.save_pulled_file(file_path, relative_backup_path, display_name, data, read_local_data, write)
+
+    def save_pulled_descriptor(self, descriptor, file_path, relative_backup_path, display_name='descriptor'):
+        parser = descriptors.DescriptorParser()
+        return self.save_pulled_file(file_path, relative_backup_path, display_name, descriptor.raw, 
+                                     lambda path: parser.read_from_file(path).raw, lambda path: parser.write_to_file(descriptor, path))
@@ -1,4 +1,5 @@
 import lmctl.project.handlers.interface as handlers_api
+import lmctl.project.concurrency as concurrency
 
 class PushProcessError(Exception):
     pass
@@ -16,18 +17,24 @@ class PushProcess:
 
 class PushWorker:
 
-    def __init__(self, pkg_content, options, journal, env_sessions):
+    def __init__(self, pkg_content, options, journal, env_sessions, concurrent=True):
         self.pkg_content = pkg_content
         self.journal = journal
         self.options = options
         self.env_sessions = env_sessions
+        # Subcontent pushed on a pool thread pushes its own children and artifacts serially, so pools are never nested
+        self.concurrent = concurrent
 
     def work(self):
         self.__push_child_content()
         self.__push_content()
 
     def __build_push_options(self):
-        return handlers_api.ContentPushOptions(object_group_id=self.options.object_group_id)
+        # Content pushed on a pool thread pushes its own artifacts serially too
+        parallelism = self.__parallelism() if self.concurrent else 1
+        return handlers_api.ContentPushOptions(object_group_id=self.options.object_group_id, push_ledger=getattr(self.options, 'push_ledger', None),
+                                               changed_only=getattr(self.options, 'changed_only', False), parallelism=parallelism,
+                                               content_files=getattr(self.pkg_content, 'content_files', None))
 
     def __push_content(self):
         self.journal.section('Push Content')
@@ -36,10 +43,22 @@ class PushWorker:
         except handlers_api.ContentHandlerError as e:
             raise PushProcessError(str(e)) from e
 
+    def __parallelism(self):
+        return getattr(self.options, 'parallelism', None) or 1
+
     def __push_child_content(self):
         subcontents = self.pkg_content.subcontents
-        for subcontent in subcontents:
-            self.journal.subproject(subcontent.meta.name)
-            PushWorker(subcontent, self.options, self.journal, self.env_sessions).work()
-            self.journal.subproject_end(subcontent.meta.name)
+        if self.concurrent and self.__parallelism() > 1 and len(subcontents) > 1:
+            # Sibling subcontents are independent, so push them on a pool
+            concurrency.run_concurrently(self.journal, subcontents, self.__push_concurrent_subcontent, parallelism=self.__parallelism())
+        else:
+            for subcontent in subcontents:
+                self.__push_subcontent(subcontent, self.journal, concurrent=self.concurrent)
+
+    def __push_concurrent_subcontent(self, subcontent, journal):
+        self.__push_subcontent(subcontent, journal, concurrent=False)
 
+    def __push_subcontent(self, subcontent, journal, concurrent):
+        journal.subproject(subcontent.meta.name)
+        PushWorker(subcontent, self.options, journal, self.env_sessions, concurrent=concurrent).work()
+        journal.subproject_end(subcontent.meta.name)
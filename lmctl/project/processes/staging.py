@@ -1,10 +1,11 @@
 import os
 import lmctl.files as files
-import lmctl.utils.descriptors as descriptor_utils
 import lmctl.project.mutate.descriptor as descriptor_mutations
 import lmctl.project.source.config_references as refs
 import lmctl.project.handlers.interface as handlers_api
-from .common import LIFECYCLE_WORKSPACE
+from lmctl.project.source.index import SourceIndex
+from .common import LIFECYCLE_WORKSPACE, build_file_copier
+from .build_cache import clean_own_content
 from lmctl.project.source.config import RootProjectConfig
 
 class StagingTree(files.Tree):
@@ -31,11 +32,13 @@ class StageProcessError(Exception):
 
 class StageProcess:
 
-    def __init__(self, project, options, journal):
+    def __init__(self, project, options, journal, build_cache=None, source_index=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.references = refs.ConfigReferences(self.project.config)
+        self.build_cache = build_cache
+        self.source_index = source_index if source_index is not None else SourceIndex()
 
     def __create_staging_tree(self):
         staging_workspace = os.path.join(self.project.tree.root_path, LIFECYCLE_WORKSPACE, 'staging')
@@ -43,29 +46,43 @@ class StageProcess:
 
     def execute(self):
         staging_tree = self.__create_staging_tree()
-        StageWorker(self.project, self.options, staging_tree, self.journal, self.references).work()
+        StageWorker(self.project, self.options, staging_tree, self.journal, self.references, build_cache=self.build_cache, source_index=self.source_index).work()
         return staging_tree
 
 class StageWorker:
 
-    def __init__(self, project, options, staging_tree, journal, references):
+    def __init__(self, project, options, staging_tree, journal, references, build_cache=None, source_index=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.staging_tree = staging_tree
         self.references = references
+        self.build_cache = build_cache
+        self.source_index = source_index if source_index is not None else SourceIndex()
 
     def work(self):
-        self.__prepare_stage_directories()
-        self.__stage_sources()
+        if self.build_cache is not None and self.build_cache.check_project(self.project, self.staging_tree.root_path):
+            self.journal.event('Sources of {0} unchanged since last build, re-using staged content'.format(self.project.config.name))
+        else:
+            self.__prepare_stage_directories()
+            self.__stage_sources()
         self.__stage_child_projects()
 
     def __prepare_stage_directories(self):
-        files.clean_directory(self.staging_tree.root_path)
+        if self.build_cache is None:
+            files.clean_directory(self.staging_tree.root_path)
+        else:
+            # Staged content of subprojects is kept, as each decides whether to re-use it
+            kept_children = [subproject.config.directory for subproject in self.project.subprojects]
+            clean_own_content(self.staging_tree.root_path, StagingTree.CONTAINS_DIR, kept_children)
 
     def __stage_sources(self):
         self.journal.section('Stage Sources')
-        source_stager = SourceStager(self.journal, self.project.config, self.staging_tree.root_path, self.references)
+        try:
+            copier = build_file_copier()
+        except ValueError as e:
+            raise StageProcessError(str(e)) from e
+        source_stager = SourceStager(self.journal, self.project.config, self.staging_tree.root_path, self.references, copier=copier, source_index=self.source_index)
         try:
             self.project.source_handler.stage_sources(self.journal, source_stager)
         except handlers_api.SourceHandlerError as e:
@@ -86,16 +103,20 @@ class StageWorker:
         for subproject in subprojects:
             self.journal.subproject(subproject.config.name)
             child_staging_tree = self.staging_tree.gen_subproject_staging_tree(subproject.config.directory)
-            StageWorker(subproject, self.options, child_staging_tree, self.journal, self.references).work()
+            StageWorker(subproject, self.options, child_staging_tree, self.journal, self.references, build_cache=self.build_cache, source_index=self.source_index).work()
             self.journal.subproject_end(subproject.config.name)
 
 class SourceStager:
 
-    def __init__(self, journal, source_config, staging_path, references):
+    def __init__(self, journal, source_config, staging_path, references, copier=None, source_index=None):
         self.journal = journal
         self.source_config = source_config
         self.staging_path = staging_path
         self.references = references
+        # Staged files may share their content with the sources (through hardlinks), so are unshared before being re-written
+        self.copier = copier if copier is not None else files.FileCopier()
+        # Sources already parsed by validation are taken from the index, and files written here are added to it
+        self.source_index = source_index if source_index is not None else SourceIndex()
 
     def _join_path(self, base_path, relative_path):
         return os.path.join(base_path, relative_path)
@@ -110,29 +131,39 @@ class SourceStager:
     def stage_file(self, orig_path, relative_staging_path, mutator=None):
         target_path = self._make_path(self.staging_path, relative_staging_path)
         if mutator is None:
-            files.copy_file(orig_path, target_path)
+            self.copier.copy_file(orig_path, target_path)
         else:
             with open(orig_path, 'r') as file:
                 old_contents = file.read()
             new_contents = mutator.apply(old_contents)
+            files.unshare_file(target_path)
             with open(target_path, 'w') as file:
                 file.write(new_contents)
         return target_path
 
     def stage_tree(self, orig_path, relative_staging_path):
         target_path = self._make_path(self.staging_path, relative_staging_path)
-        files.copy_tree(orig_path, target_path)
+        self.copier.copy_tree(orig_path, target_path)
         return target_path
 
     def copy_staged_file(self, orig_path, relative_staging_path):
         src_path = self._make_path(self.staging_path, orig_path)
         target_path = self._make_path(self.staging_path, relative_staging_path)
-        files.copy_file(src_path, target_path)
+        self.copier.copy_file(src_path, target_path)
         return target_path
 
+    def stage_json(self, orig_path, relative_staging_path, mutator):
+        """
+        Stage a JSON file, changed by a mutator with an apply_to_document function (such as those in lmctl.project.mutate.behaviour)
+        """
+        target_path = self._make_path(self.staging_path, relative_staging_path)
+        new_document = mutator.apply_to_document(self.source_index.read_json(orig_path))
+        files.unshare_file(target_path)
+        return self.source_index.write_json(new_document, target_path)
+
     def stage_descriptor(self, orig_path, relative_staging_path, is_template=False):
-        staged_path = self.stage_file(orig_path, relative_staging_path)
-        descriptor = descriptor_utils.DescriptorParser().read_from_file(staged_path)
+        staged_path = self._make_path(self.staging_path, relative_staging_path)
+        descriptor = self.source_index.read_descriptor(orig_path)
         descriptor = descriptor_mutations.DescriptorStageMutator(self.source_config, self.references, self.journal).apply(descriptor, is_template=is_template)
-        descriptor_utils.DescriptorParser().write_to_file(descriptor, staged_path)
-        return staged_path
\ No newline at end of file
+        files.unshare_file(staged_path)
+        return self.source_index.write_descriptor(descriptor, staged_path)
\ No newline at end of file
@@ -34,7 +34,7 @@ class TestWorker:
     def __test_content(self):
         self.journal.section('Execute Tests')
         try:
-            test_report = self.pkg_content.handler.execute_tests(self.journal, self.env_sessions, self.__filter_selected_tests())
+            test_report = self.pkg_content.handler.execute_tests(self.journal, self.env_sessions, self.__filter_selected_tests(), parallelism=getattr(self.options, 'parallelism', None) or 1)
             return test_report
         except handlers_api.ContentHandlerError as e:
             raise TestProcessError(str(e)) from e
@@ -2,15 +2,19 @@ import os
 import lmctl.utils.descriptors as descriptor_utils
 import lmctl.project.validation as validation
 import lmctl.project.handlers.interface as handlers_api
+from lmctl.project.source.index import SourceIndex
+from .common import LIFECYCLE_WORKSPACE
 
 class ValidationProcessError(Exception):
     pass
 
 class SourceValidator:
 
-    def __init__(self, journal, source_config):
+    def __init__(self, journal, source_config, source_index=None):
         self.journal = journal
         self.source_config = source_config
+        # Shared with the later phases of a build, so the sources checked here are not read and parsed again
+        self.source_index = source_index if source_index is not None else SourceIndex()
 
     def validate_descriptor(self, descriptor_path, errors, warnings, allow_autocorrect=False, is_template=False):
         if not os.path.exists(descriptor_path):
@@ -21,7 +25,7 @@ class SourceValidator:
         self.journal.event('Checking descriptor found at: {0}'.format(descriptor_path))
         descriptor = None
         try:
-            descriptor = descriptor_utils.DescriptorParser().read_from_file(descriptor_path)
+            descriptor = self.source_index.read_descriptor(descriptor_path)
         except descriptor_utils.DescriptorParsingError as e:
             errors.append(validation.ValidationViolation('Descriptor [{0}]: could not be parsed: {1}'.format(descriptor_path, str(e))))
         else:
@@ -55,24 +59,34 @@ class SourceValidator:
                     new_lifecycle[lifecycle] = {}
                 descriptor.lifecycle = new_lifecycle
                 try:
-                    descriptor_utils.DescriptorParser().write_to_file(descriptor, descriptor_path)
+                    self.source_index.write_descriptor(descriptor, descriptor_path)
                 except Exception as e:
                     self.journal.error_event('Failed to update lifecycle list structure in Resource descriptor [{0}]: {1}'.format(descriptor_path, str(e)))
 
 class ValidationProcess:
-    def __init__(self, project, options, journal):
+    def __init__(self, project, options, journal, source_index=None):
         self.project = project
         self.journal = journal
         self.options = options
+        self.source_index = source_index if source_index is not None else build_source_index(project)
 
     def execute(self):
-        return ValidationWorker(self.project, self.options, self.journal).work()
+        return ValidationWorker(self.project, self.options, self.journal, self.source_index).work()
+
+def build_source_index(project):
+    """
+    Create an index of the sources of a project (and all of its subprojects), walking the project directory once
+    """
+    source_index = SourceIndex()
+    source_index.walk(project.tree.root_path, excluded_dirs=[LIFECYCLE_WORKSPACE])
+    return source_index
 
 class ValidationWorker:
 
-    def __init__(self, project, options, journal):
+    def __init__(self, project, options, journal, source_index):
         self.project = project
         self.journal = journal
+        self.source_index = source_index
         self.__build_source_options(options)
 
     def __build_source_options(self, cmd_options):
@@ -82,7 +96,7 @@ class ValidationWorker:
         self.journal.section('Validate Sources')
         all_errors = []
         all_warnings = []
-        source_validator = SourceValidator(self.journal, self.project.config)
+        source_validator = SourceValidator(self.journal, self.project.config, source_index=self.source_index)
         try:
             validate_sources_result = self.project.source_handler.validate_sources(self.journal, source_validator, self.options)
         except handlers_api.SourceHandlerError as e:
@@ -95,7 +109,7 @@ class ValidationWorker:
     def __validate_child_projects(self, errors, warnings):
         for subproject in self.project.subprojects:
             self.journal.subproject(subproject.config.name)
-            validation_result = ValidationWorker(subproject, self.options, self.journal).work()
+            validation_result = ValidationWorker(subproject, self.options, self.journal, self.source_index).work()
             errors.extend(validation_result.errors)
             warnings.extend(validation_result.warnings)
             self.journal.subproject_end(subproject.config.name)
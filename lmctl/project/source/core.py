@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 import lmctl.files as files
 import yaml
 import lmctl.utils.descriptors as descriptor_utils
@@ -9,10 +10,12 @@ import lmctl.project.processes.staging as stage_exec
 import lmctl.project.processes.compile as compile_exec
 import lmctl.project.processes.pull as pull_exec
 import lmctl.project.processes.package as package_exec
+import lmctl.project.processes.build_cache as build_cache_exec
 import lmctl.project.processes.listelement as list_exec
 import lmctl.project.handlers.interface as handlers_api
 import lmctl.project.handlers.manager as handler_manager
 import lmctl.project.package.core as pkgs
+from lmctl.project.processes.common import LIFECYCLE_WORKSPACE
 
 ########################
 # Exceptions
@@ -62,12 +65,30 @@ class BuildOptions(ValidateOptions):
 
     def __init__(self):
         super().__init__()
+        # Re-use the staged and compiled content of (sub)projects unchanged since the last incremental build
+        self.incremental = False
+        # Compression level (0-9) of the package and the Resource packages/CSARs within it (None keeps the defaults: gzip level 9 and zips stored uncompressed)
+        self.compression_level = None
+        # Number of threads compressing a tgz package (defaults to the number of cores)
+        self.compression_workers = None
+
+
+class RecursiveBuildOptions(BuildOptions):
+
+    def __init__(self):
+        super().__init__()
+        # Number of projects built concurrently, each in its own process (defaults to the number of CPUs)
+        self.parallelism = None
+        # Re-use the package of each project with inputs unchanged since it was last built by a recursive build
+        self.skip_unchanged = True
 
 
 class PullOptions(Options):
 
     def __init__(self):
         super().__init__()
+        # Number of subprojects pulled concurrently
+        self.parallelism = 1
 
 ########################
 # Results
@@ -79,6 +100,51 @@ class BuildResult:
         self.pkg = pkg
         self.validation_result = validation_result
 
+PROJECT_BUILT = 'Built'
+PROJECT_SKIPPED = 'Skipped'
+PROJECT_FAILED = 'Failed'
+
+class ProjectBuildOutcome:
+    """
+    Outcome of building one of the projects found by a recursive build (passed back from the process which built it)
+    """
+
+    def __init__(self, project_path, name, status, pkg_path=None, error=None, validation_errors=None, validation_warnings=None, entries=None):
+        self.project_path = project_path
+        self.name = name
+        self.status = status
+        self.pkg_path = pkg_path
+        self.error = error
+        self.validation_errors = validation_errors or []
+        self.validation_warnings = validation_warnings or []
+        # Journal entries added while building the project
+        self.entries = entries or []
+
+
+class RecursiveBuildResult:
+
+    def __init__(self, root_path, outcomes):
+        self.root_path = root_path
+        self.outcomes = outcomes
+
+    def __with_status(self, status):
+        return [outcome for outcome in self.outcomes if outcome.status == status]
+
+    @property
+    def built(self):
+        return self.__with_status(PROJECT_BUILT)
+
+    @property
+    def skipped(self):
+        return self.__with_status(PROJECT_SKIPPED)
+
+    @property
+    def failed(self):
+        return self.__with_status(PROJECT_FAILED)
+
+    def has_failures(self):
+        return len(self.failed) > 0
+
 ########################
 # Projects
 ########################
@@ -147,7 +213,7 @@ class Project(ProjectBase):
         try:
             potential_descriptor = os.path.join(self.root_path, 'Descriptor', 'assembly.yml')
             if os.path.exists(potential_descriptor):
-                descriptor = descriptor_utils.DescriptorParser().read_from_file(potential_descriptor)
+                descriptor = descriptor_utils.DescriptorParser(read_only=True).read_from_file(potential_descriptor)
                 return descriptor.get_version()
         except Exception as e:
             return None
@@ -155,13 +221,80 @@ class Project(ProjectBase):
     def __init_journal(self, journal_consumer=None):
         return project_journal.ProjectJournal(journal_consumer)
 
+    @staticmethod
+    def discover(root_path):
+        """
+        Find the projects under a directory (including the directory itself), each identified by its project file.
+        Directories of a project found are not searched further, nor are hidden directories or lmctl workspaces
+
+        Returns:
+            list: the root path of each project, sorted
+        """
+        project_paths = []
+        for root, dirs, filelist in os.walk(root_path):
+            if ProjectTree.PROJECT_FILE_YML in filelist or ProjectTree.PROJECT_FILE_YAML in filelist:
+                project_paths.append(root)
+                dirs[:] = []
+            else:
+                dirs[:] = [d for d in dirs if not d.startswith('.') and d != LIFECYCLE_WORKSPACE]
+        return sorted(project_paths)
+
+    @staticmethod
+    def build_recursive(root_path, options):
+        """
+        Build every project found under a directory, each in its own process with up to options.parallelism running at once.
+        The journal of each project is added to the journal of this build, in the order the projects were found, once it has been built.
+        A project which fails to build does not stop the others.
+
+        Returns:
+            RecursiveBuildResult: the outcome of building each project
+        """
+        journal = project_journal.ProjectJournal(options.journal_consumer)
+        project_paths = Project.discover(root_path)
+        journal.section('Build Projects')
+        journal.event('Found {0} project(s) under: {1}'.format(len(project_paths), root_path))
+        settings = {
+            'allow_autocorrect': options.allow_autocorrect,
+            'incremental': getattr(options, 'incremental', False),
+            'compression_level': getattr(options, 'compression_level', None),
+            'compression_workers': getattr(options, 'compression_workers', None),
+            'skip_unchanged': getattr(options, 'skip_unchanged', True)
+        }
+        parallelism = getattr(options, 'parallelism', None) or os.cpu_count() or 1
+        outcomes = []
+        if parallelism <= 1 or len(project_paths) <= 1:
+            for project_path in project_paths:
+                outcomes.append(Project.__add_outcome_to_journal(_build_project(project_path, root_path, settings), journal))
+        else:
+            if settings['compression_workers'] is None:
+                # The projects are already built in parallel, so each package is compressed on a single thread
+                settings['compression_workers'] = 1
+            with ProcessPoolExecutor(max_workers=min(parallelism, len(project_paths))) as executor:
+                futures = [executor.submit(_build_project, project_path, root_path, settings) for project_path in project_paths]
+                for future in futures:
+                    outcomes.append(Project.__add_outcome_to_journal(future.result(), journal))
+        return RecursiveBuildResult(root_path, outcomes)
+
+    @staticmethod
+    def __add_outcome_to_journal(outcome, journal):
+        journal.subproject(outcome.name)
+        buffered_journal = project_journal.BufferedProjectJournal()
+        buffered_journal.entries.extend(outcome.entries)
+        buffered_journal.replay(journal)
+        if outcome.status == PROJECT_SKIPPED:
+            journal.event('Skipped, inputs unchanged since the last build of: {0}'.format(outcome.pkg_path))
+        elif outcome.status == PROJECT_FAILED:
+            journal.error_event('Build failed: {0}'.format(outcome.error))
+        journal.subproject_end(outcome.name)
+        return outcome
+
     def validate(self, options):
         journal = self.__init_journal(options.journal_consumer)
         return self.__do_validate(options, journal)
 
-    def __do_validate(self, options, journal):
+    def __do_validate(self, options, journal, source_index=None):
         try:
-            return validation_exec.ValidationProcess(self, options, journal).execute()
+            return validation_exec.ValidationProcess(self, options, journal, source_index=source_index).execute()
         except validation_exec.ValidationProcessError as e:
             raise ValidateError(str(e)) from e
 
@@ -170,13 +303,24 @@ class Project(ProjectBase):
         return self.__do_build(options, journal)
 
     def __do_build(self, options, journal):
-        validate_result = self.__do_validate(options, journal)
+        # Each source file is listed, read and parsed once, then shared by every phase of the build
+        source_index = validation_exec.build_source_index(self)
+        validate_result = self.__do_validate(options, journal, source_index=source_index)
         if validate_result.has_errors():
             raise BuildValidationError(validate_result)
+        if getattr(options, 'incremental', False):
+            # Compiled Resource packages are only re-used if built with the same compression
+            build_cache = build_cache_exec.BuildCache(self, settings={'compression_level': getattr(options, 'compression_level', None)}, source_index=source_index)
+        else:
+            # A full build replaces all staged content, so the index of the last incremental build no longer applies
+            build_cache_exec.BuildCache.clear(self)
+            build_cache = None
+        # The package is about to be replaced, so may no longer match the inputs recorded by the last recursive build
+        build_cache_exec.BuildRecord.clear(self)
         try:
-            staging_tree = stage_exec.StageProcess(self, options, journal).execute()
-            content_tree = compile_exec.CompileProcess(self, options, staging_tree, journal).execute()
-            final_pkg = package_exec.PkgProcess(self, options, content_tree, journal).execute()
+            staging_tree = stage_exec.StageProcess(self, options, journal, build_cache=build_cache, source_index=source_index).execute()
+            content_tree = compile_exec.CompileProcess(self, options, staging_tree, journal, build_cache=build_cache, source_index=source_index).execute()
+            final_pkg = package_exec.PkgProcess(self, options, content_tree, journal, build_cache=build_cache).execute()
         except (stage_exec.StageProcessError, compile_exec.CompileProcessError, package_exec.PkgProcessError) as e:
             raise BuildError(str(e)) from e
         return BuildResult(final_pkg, validate_result)
@@ -187,7 +331,7 @@ class Project(ProjectBase):
 
     def __do_pull(self, env_sessions, options, journal):
         try:
-            pull_exec.PullProcess(self, options, journal, env_sessions).execute()
+            return pull_exec.PullProcess(self, options, journal, env_sessions).execute()
         except pull_exec.PullProcessError as e:
             raise PullError(str(e)) from e
 
@@ -198,6 +342,42 @@ class Project(ProjectBase):
         except list_exec.ListElementProcessError as e:
             raise ListError(str(e)) from e
 
+def _build_project(project_path, root_path, settings):
+    """
+    Build one of the projects found by Project.build_recursive (run in a worker process, so takes and returns only picklable values)
+    """
+    name = os.path.relpath(project_path, root_path).replace(os.sep, '/')
+    entries = []
+    outcome = ProjectBuildOutcome(project_path, name, PROJECT_FAILED)
+    try:
+        project = Project(project_path)
+        build_record = build_cache_exec.BuildRecord(project, settings={'incremental': settings['incremental'], 'compression_level': settings['compression_level']})
+        unchanged_pkg_path = build_record.unchanged_pkg_path() if settings['skip_unchanged'] else None
+        if unchanged_pkg_path is not None:
+            outcome.status = PROJECT_SKIPPED
+            outcome.pkg_path = unchanged_pkg_path
+        else:
+            options = BuildOptions()
+            options.allow_autocorrect = settings['allow_autocorrect']
+            options.incremental = settings['incremental']
+            options.compression_level = settings['compression_level']
+            options.compression_workers = settings['compression_workers']
+            options.journal_consumer = project_journal.EntryCollector(entries)
+            build_result = project.build(options)
+            build_record.save(build_result.pkg.path)
+            outcome.status = PROJECT_BUILT
+            outcome.pkg_path = build_result.pkg.path
+            outcome.validation_warnings = [violation.message for violation in build_result.validation_result.warnings]
+    except BuildValidationError as e:
+        outcome.error = str(e)
+        outcome.validation_errors = [violation.message for violation in e.validation_result.errors]
+        outcome.validation_warnings = [violation.message for violation in e.validation_result.warnings]
+    except Exception as e:
+        # Reported with the outcome, so one project failing to build does not stop the others
+        outcome.error = str(e)
+    outcome.entries = [entry for entry in entries if isinstance(entry, project_journal.ProjectEvent)]
+    return outcome
+
 ########################
 # Trees
 ########################
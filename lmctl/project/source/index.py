@@ -0,0 +1,184 @@
+import os
+import copy
+import json
+import hashlib
+import lmctl.utils.descriptors as descriptor_utils
+
+_NOT_PARSED = object()
+
+
+class _IndexedFile:
+
+    def __init__(self, key):
+        # Modification time and size of the file when it was read
+        self.key = key
+        self.data = None
+        self.hash = None
+        self.document = _NOT_PARSED
+        self.descriptor = _NOT_PARSED
+
+
+class SourceIndex:
+    """
+    Index of the files of a project, shared by the validate, stage and compile phases of a build so each file is listed, read and parsed once.
+
+    Each directory is walked once (on the first request for a file under it) and each JSON document or descriptor is parsed on first use,
+    keeping the parsed content with the sha256 hash of the file. Entries are keyed by the modification time and size of their file, so a file
+    changed during the run (e.g. autocorrected by validation) is read again.
+
+    JSON documents are shared between callers, so must be copied before being changed. Descriptors are returned as copies, as the
+    mutators of a build change them in place.
+    """
+
+    def __init__(self):
+        self.__walked = {}
+        self.__dirs = {}
+        self.__files = {}
+
+    def walk(self, root_path, excluded_dirs=None):
+        """
+        List the files under a directory, so later requests for any file under it are answered without walking the directory again
+
+        Args:
+            root_path (str): the directory to walk
+            excluded_dirs (list): names of top level directories to skip (e.g. the lmctl workspace, holding the output of a build)
+        """
+        root_path = os.path.abspath(root_path)
+        excluded_dirs = list(excluded_dirs) if excluded_dirs is not None else []
+        for root, dirs, filelist in os.walk(root_path):
+            if root == root_path:
+                dirs[:] = [d for d in dirs if d not in excluded_dirs]
+            self.__dirs[root] = list(filelist)
+        self.__walked[root_path] = [os.path.join(root_path, d) for d in excluded_dirs]
+
+    def __is_walked(self, path):
+        for root_path, excluded_paths in self.__walked.items():
+            if _is_within(path, root_path):
+                return not any(_is_within(path, excluded_path) for excluded_path in excluded_paths)
+        return False
+
+    def files_under(self, path):
+        """
+        Returns the path of each file under a directory, in the order found by os.walk
+        """
+        path = os.path.abspath(path)
+        if not self.__is_walked(path):
+            self.walk(path)
+        found = []
+        for dir_path, filelist in self.__dirs.items():
+            if _is_within(dir_path, path):
+                found.extend(os.path.join(dir_path, file_name) for file_name in filelist)
+        return found
+
+    def content_hashes(self, root_path, excluded_dirs=None, hash_file=None):
+        """
+        Calculate the hash of each file in a directory from the index, keyed as lmctl.project.package.meta.calculate_content_hashes
+
+        Args:
+            root_path (str): the directory to search
+            excluded_dirs (list): names of top level directories to exclude (e.g. the directory holding subcontent)
+            hash_file (callable): function calculating the hash of a file from its path (defaults to file_hash)
+
+        Returns:
+            dict: hash of each file
+        """
+        root_path = os.path.abspath(root_path)
+        excluded_paths = [os.path.join(root_path, d) for d in (excluded_dirs or [])]
+        hash_file = hash_file if hash_file is not None else self.file_hash
+        content_hashes = {}
+        for file_path in self.files_under(root_path):
+            if any(_is_within(file_path, excluded_path) for excluded_path in excluded_paths):
+                continue
+            relative_path = os.path.relpath(file_path, root_path).replace(os.sep, '/')
+            content_hashes[relative_path] = hash_file(file_path)
+        return dict(sorted(content_hashes.items()))
+
+    def __entry(self, path, load=True):
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        entry = self.__files.get(path, None)
+        if entry is None or entry.key != key:
+            entry = _IndexedFile(key)
+            self.__files[path] = entry
+        if load and entry.data is None:
+            with open(path, 'rb') as f:
+                entry.data = f.read()
+            entry.hash = hashlib.sha256(entry.data).hexdigest()
+        return entry
+
+    def __record(self, path, data):
+        path = os.path.abspath(path)
+        with open(path, 'wb') as f:
+            f.write(data)
+        stat = os.stat(path)
+        entry = _IndexedFile((stat.st_mtime_ns, stat.st_size))
+        entry.data = data
+        entry.hash = hashlib.sha256(data).hexdigest()
+        self.__files[path] = entry
+        return entry
+
+    def file_hash(self, path):
+        """
+        Returns the sha256 hash of a file (the same as lmctl.project.package.meta.calculate_file_hash)
+        """
+        entry = self.__entry(path, load=False)
+        if entry.hash is None:
+            with open(path, 'rb') as f:
+                file_hash = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    file_hash.update(chunk)
+            entry.hash = file_hash.hexdigest()
+        return entry.hash
+
+    def read_text(self, path):
+        return self.__entry(path).data.decode('utf-8')
+
+    def read_json(self, path):
+        """
+        Returns the parsed content of a JSON file, shared with every other caller (copy it before making changes)
+
+        Raises:
+            IOError: if the file cannot be read
+            json.JSONDecodeError: if the file does not contain valid JSON
+        """
+        entry = self.__entry(path)
+        if entry.document is _NOT_PARSED:
+            entry.document = json.loads(entry.data.decode('utf-8'))
+        return entry.document
+
+    def write_json(self, document, path, indent=2):
+        """
+        Write a JSON document to a file, keeping it in the index so it is not parsed again if read later in the run
+        """
+        entry = self.__record(path, json.dumps(document, indent=indent).encode('utf-8'))
+        entry.document = document
+        return path
+
+    def read_descriptor(self, path):
+        """
+        Returns a copy of the descriptor in a file
+
+        Raises:
+            lmctl.utils.descriptors.DescriptorReaderException: if the file does not exist
+            lmctl.utils.descriptors.DescriptorParsingError: if the file does not contain valid YAML
+        """
+        if not os.path.exists(path):
+            raise descriptor_utils.DescriptorReaderException('Could not find descriptor at path: {0}'.format(path))
+        entry = self.__entry(path)
+        if entry.descriptor is _NOT_PARSED:
+            entry.descriptor = descriptor_utils.DescriptorParser().read_from_str(entry.data.decode('utf-8')).raw
+        return descriptor_utils.Descriptor(copy.deepcopy(entry.descriptor))
+
+    def write_descriptor(self, descriptor, path):
+        """
+        Write a descriptor to a file (as lmctl.utils.descriptors.DescriptorParser.write_to_file), keeping it in the index so it is not parsed again if read later in the run
+        """
+        yml_str = descriptor_utils.DescriptorParser().write_to_str(descriptor)
+        entry = self.__record(path, yml_str.encode('utf-8'))
+        entry.descriptor = copy.deepcopy(descriptor.raw)
+        return path
+
+
+def _is_within(path, parent_path):
+    return path == parent_path or path.startswith(parent_path.rstrip(os.sep) + os.sep)
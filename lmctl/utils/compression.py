@@ -0,0 +1,232 @@
+import os
+import zlib
+import struct
+import tarfile
+import zipfile
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+# Level used for gzipped tars when none is set (the default of tarfile)
+DEFAULT_GZIP_LEVEL = 9
+# Size of each block of a gzip stream compressed independently
+GZIP_BLOCK_SIZE = 1024 * 1024
+# Size of the deflate window, primed with the end of the previous block, so compression across blocks is as good as with one stream
+DEFLATE_WINDOW_SIZE = 32 * 1024
+# Files smaller than this are always compressed, as sampling them is not worth it
+MIN_SAMPLED_FILE_SIZE = 1024 * 1024
+SAMPLE_SIZE = 64 * 1024
+# Files which do not compress below this ratio of their size (when sampled) are assumed to already be compressed
+INCOMPRESSIBLE_RATIO = 0.95
+
+GZIP_HEADER = b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff'
+
+
+def is_compressible(path: str) -> bool:
+    """
+    Determine if a file is worth compressing, by compressing samples from the start and middle of it.
+    Already compressed content (e.g. images, Helm charts, nested zips) does not compress, so is better stored as it is
+    """
+    size = os.path.getsize(path)
+    if size < MIN_SAMPLED_FILE_SIZE:
+        return True
+    with open(path, 'rb') as f:
+        sample = f.read(SAMPLE_SIZE)
+        f.seek(size // 2)
+        sample += f.read(SAMPLE_SIZE)
+    compressed = zlib.compress(sample, 1)
+    return len(compressed) < len(sample) * INCOMPRESSIBLE_RATIO
+
+
+def _compress_block(data: bytes, level: int, dictionary: bytes, last: bool) -> bytes:
+    if len(dictionary) > 0:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, zlib.Z_DEFAULT_STRATEGY, dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    # A sync flush ends the block on a byte boundary, so the raw deflate output of each block can be concatenated into one stream
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class ParallelGzipWriter:
+    """
+    Writes a gzip stream, compressing blocks of the content on a pool of threads (zlib releases the GIL), so compression scales with the number of cores.
+
+    The result is a single standard gzip member, readable by any gzip implementation (including tarfile "r:gz" and "r|gz").
+    The level may be changed between writes (e.g. to store already compressed content), as each block is compressed on its own.
+    """
+
+    def __init__(self, fileobj, level: int = DEFAULT_GZIP_LEVEL, workers: int = None, block_size: int = GZIP_BLOCK_SIZE):
+        self.fileobj = fileobj
+        self.level = level
+        self.block_size = block_size
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        self._pending = collections.deque()
+        self._buffer = bytearray()
+        self._block_level = level
+        self._dictionary = b''
+        self._crc = 0
+        self._size = 0
+        self._closed = False
+        self.fileobj.write(GZIP_HEADER)
+
+    def set_level(self, level: int):
+        """
+        Compress content written from now on at a different level, ending the current block
+        """
+        if level == self._block_level:
+            return
+        if len(self._buffer) > 0:
+            self._submit(bytes(self._buffer))
+            self._buffer = bytearray()
+        self._block_level = level
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        self._buffer += data
+        while len(self._buffer) >= self.block_size:
+            self._submit(bytes(self._buffer[:self.block_size]))
+            del self._buffer[:self.block_size]
+        return len(data)
+
+    def tell(self) -> int:
+        # Position in the uncompressed content, as expected by tarfile
+        return self._size
+
+    def _submit(self, block: bytes, last: bool = False):
+        dictionary = self._dictionary
+        self._dictionary = (dictionary + block)[-DEFLATE_WINDOW_SIZE:]
+        if self._executor is None:
+            self.fileobj.write(_compress_block(block, self._block_level, dictionary, last))
+            return
+        self._pending.append(self._executor.submit(_compress_block, block, self._block_level, dictionary, last))
+        # Bound the number of blocks held in memory
+        while len(self._pending) > self.workers * 2:
+            self.fileobj.write(self._pending.popleft().result())
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._submit(bytes(self._buffer), last=True)
+            self._buffer = bytearray()
+            while len(self._pending) > 0:
+                self.fileobj.write(self._pending.popleft().result())
+            self.fileobj.write(struct.pack('<II', self._crc & 0xffffffff, self._size & 0xffffffff))
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._executor is not None:
+            # Blocks not yet started are abandoned, leaving the error raised by the caller to propagate
+            while len(self._pending) > 0:
+                self._pending.popleft().cancel()
+            self._executor.shutdown(wait=False)
+
+
+class ArchiveCompression:
+    """
+    Compression settings for the archives created by a build (packages and the Resource packages/CSARs within them)
+
+    Args:
+        level: compression level (0-9), where 0 stores all content uncompressed. When not set, the previous defaults are kept:
+            gzipped tars at level 9 and zips stored uncompressed
+        workers: number of threads compressing a gzipped tar (defaults to the number of cores)
+        store_incompressible: store files which are already compressed (e.g. images, Helm charts and nested zips) uncompressed, rather than compress them again.
+            When not set, this is only done when a level is set, so the default output is unchanged
+    """
+
+    def __init__(self, level: int = None, workers: int = None, store_incompressible: bool = None):
+        if level is not None and (level < 0 or level > 9):
+            raise ValueError('Compression level must be between 0 and 9 but was: {0}'.format(level))
+        self.level = level
+        self.workers = workers
+        self.store_incompressible = store_incompressible if store_incompressible is not None else level is not None
+
+    @property
+    def gzip_level(self) -> int:
+        return self.level if self.level is not None else DEFAULT_GZIP_LEVEL
+
+    def gzip_level_for(self, path: str) -> int:
+        if self.gzip_level > 0 and self.store_incompressible and not is_compressible(path):
+            return 0
+        return self.gzip_level
+
+    def zip_compression_for(self, path: str):
+        """
+        Returns:
+            tuple: the compress_type and compresslevel to add a file to a zip with
+        """
+        if self.level is None or self.level == 0:
+            return zipfile.ZIP_STORED, None
+        if self.store_incompressible and not is_compressible(path):
+            return zipfile.ZIP_STORED, None
+        return zipfile.ZIP_DEFLATED, self.level
+
+    def open_tgz(self, path: str) -> 'GzipTarWriter':
+        return GzipTarWriter(path, self)
+
+    def open_zip(self, path: str) -> 'CompressingZipFile':
+        return CompressingZipFile(path, self)
+
+
+class GzipTarWriter:
+    """
+    Creates a gzipped tar, compressing each file at the level chosen by an ArchiveCompression, on multiple cores
+    """
+
+    def __init__(self, path: str, compression: ArchiveCompression):
+        self.compression = compression
+        self._file = open(path, 'wb')
+        try:
+            self._gzip = ParallelGzipWriter(self._file, level=compression.gzip_level, workers=compression.workers)
+            # Compiled content may be hardlinked (see lmctl.files.FileCopier), which must still be added as regular files
+            self._tar = tarfile.TarFile(fileobj=self._gzip, mode='w', dereference=True)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def add(self, name: str, arcname: str = None):
+        if os.path.isfile(name):
+            self._gzip.set_level(self.compression.gzip_level_for(name))
+        self._tar.add(name, arcname=arcname)
+
+    def close(self):
+        try:
+            self._tar.close()
+            self._gzip.close()
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._gzip.__exit__(exc_type, exc_value, traceback)
+            self._file.close()
+
+
+class CompressingZipFile(zipfile.ZipFile):
+    """
+    Zip file (opened for writing) which compresses each file written at the level chosen by an ArchiveCompression
+    """
+
+    def __init__(self, path: str, compression: ArchiveCompression):
+        super().__init__(path, mode='w')
+        self.compression = compression
+
+    def write(self, filename, arcname=None, compress_type=None, compresslevel=None):
+        if compress_type is None and os.path.isfile(filename):
+            compress_type, compresslevel = self.compression.zip_compression_for(filename)
+        return super().write(filename, arcname=arcname, compress_type=compress_type, compresslevel=compresslevel)
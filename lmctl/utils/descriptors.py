@@ -1,5 +1,7 @@
 import ruamel.yaml as ryaml
+import yaml as pyyaml
 import os
+import threading
 from collections import OrderedDict
 
 ASSEMBLY_DESCRIPTOR_TYPE = 'assembly'
@@ -9,6 +11,14 @@ TYPE_DESCRIPTOR_TYPE = 'type'
 
 yaml = ryaml.YAML()
 yaml.default_flow_style = False
+# The shared YAML instance keeps state while loading/dumping, so is used by one thread at a time (e.g. when subprojects are pulled concurrently)
+_yaml_lock = threading.Lock()
+
+# The libyaml backed loader of PyYAML, when PyYAML was built with it, used to read descriptors which are only inspected
+try:
+    FastSafeLoader = pyyaml.CSafeLoader
+except AttributeError:
+    FastSafeLoader = pyyaml.SafeLoader
 
 class DescriptorParsingError(Exception):
     pass
@@ -16,8 +26,13 @@ class DescriptorParsingError(Exception):
 
 class DescriptorParser:
 
-    def __init__(self):
-        pass
+    def __init__(self, read_only=False):
+        """
+        Args:
+            read_only (bool): load descriptors with the (C accelerated) safe loader of PyYAML rather than the ruamel round-trip loader. This is many times faster
+                but keeps no comments, ordering or formatting (and follows YAML 1.1 rather than 1.2), so is only for descriptors which are inspected (e.g. to find their name) and never re-written
+        """
+        self.read_only = read_only
 
     def read_from_file(self, descriptor_path):
         yml_str = self.__read_yml_str_from_file(descriptor_path)
@@ -34,8 +49,14 @@ class DescriptorParser:
         return Descriptor(yml_dict)
 
     def __convert_str_to_dict(self, descriptor_yml_str):
+        if self.read_only:
+            try:
+                return pyyaml.load(descriptor_yml_str, Loader=FastSafeLoader)
+            except pyyaml.YAMLError as e:
+                raise DescriptorParsingError(str(e)) from e
         try:
-            yml_dict = yaml.load(descriptor_yml_str)
+            with _yaml_lock:
+                yml_dict = yaml.load(descriptor_yml_str)
         except ryaml.YAMLError as e:
             raise DescriptorParsingError(str(e)) from e
         return yml_dict
@@ -49,13 +70,14 @@ class DescriptorParser:
 
     def write_to_file(self, descriptor, descriptor_path):
         descriptor.sort()
-        with open(descriptor_path, 'w') as descriptor_file:
+        with open(descriptor_path, 'w') as descriptor_file, _yaml_lock:
             yaml.dump(descriptor.raw, descriptor_file)
 
     def write_to_str(self, descriptor):
         descriptor.sort()
         stringio = ryaml.compat.StringIO()
-        yaml.dump(descriptor.raw, stringio)
+        with _yaml_lock:
+            yaml.dump(descriptor.raw, stringio)
         return stringio.getvalue()
 
 
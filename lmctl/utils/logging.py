@@ -1,7 +1,7 @@
 import logging.config
+import pkgutil
 import yaml
 import shutil
-from pkg_resources import resource_string
 from pathlib import Path
 from datetime import datetime
 
@@ -10,7 +10,7 @@ def log_dir() -> Path:
 
 def setup_logging(default_level=logging.INFO):
 
-  logging_config = resource_string("lmctl.utils", 'logging.yaml')
+  logging_config = pkgutil.get_data("lmctl.utils", 'logging.yaml')
 
   if logging_config is not None:
     config = yaml.safe_load(logging_config)
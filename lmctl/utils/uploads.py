@@ -0,0 +1,199 @@
+import os
+import uuid
+from typing import Callable, Dict, Any
+
+# Size of each chunk read from a file while it is being uploaded
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+def format_size(num_bytes: int) -> str:
+    size = float(num_bytes)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024 or unit == 'GB':
+            return '{0:.1f} {1}'.format(size, unit) if unit != 'B' else '{0} B'.format(int(size))
+        size /= 1024
+
+
+class UploadStream:
+    """
+    A file-like request body made up of in-memory segments and segments read from files on demand,
+    so the whole body is never held in memory at once, regardless of the size of the files.
+
+    Instances can be passed as "data" to requests, which sends them with a Content-Length header, reading one chunk at a time.
+    seek/tell are supported so the body can be rewound if the request is retried.
+    """
+
+    def __init__(self, segments, progress_callback: Callable[[int, int], None] = None):
+        """
+        Args:
+            segments (list): bytes, or tuples of (file object, length) to read "length" bytes from the current position of the file
+            progress_callback: called with the number of bytes read so far and the total length, after each read
+        """
+        self._segments = []
+        offset = 0
+        for segment in segments:
+            if isinstance(segment, bytes):
+                length = len(segment)
+                self._segments.append((offset, length, segment, None))
+            else:
+                file_obj, length = segment
+                self._segments.append((offset, length, file_obj, file_obj.tell()))
+            offset += length
+        self.len = offset
+        self._position = 0
+        self.progress_callback = progress_callback
+
+    @staticmethod
+    def for_file(file_obj, progress_callback: Callable[[int, int], None] = None) -> 'UploadStream':
+        """
+        Stream the remaining content of an open (binary) file
+        """
+        return UploadStream([(file_obj, _remaining_length(file_obj))], progress_callback=progress_callback)
+
+    def __len__(self):
+        return self.len
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = self.len + offset
+        else:
+            raise ValueError('Invalid whence: {0}'.format(whence))
+        if position < 0:
+            raise ValueError('Negative seek position {0}'.format(position))
+        self._position = position
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.len - self._position
+        chunks = []
+        remaining = min(size, max(self.len - self._position, 0))
+        while remaining > 0:
+            chunk = self._read_from_segment(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+            self._position += len(chunk)
+        data = b''.join(chunks)
+        if self.progress_callback is not None and len(data) > 0:
+            self.progress_callback(self._position, self.len)
+        return data
+
+    def _read_from_segment(self, size: int) -> bytes:
+        for offset, length, source, file_start in self._segments:
+            if offset <= self._position < offset + length:
+                segment_position = self._position - offset
+                read_size = min(size, length - segment_position)
+                if file_start is None:
+                    return source[segment_position:segment_position + read_size]
+                source.seek(file_start + segment_position)
+                return source.read(read_size)
+        return b''
+
+
+class MultipartEncoder(UploadStream):
+    """
+    Streams a multipart/form-data body, in the same format requests produces for "data" and "files", without reading the files into memory.
+
+    Send with the "content_type" of the encoder as the Content-Type header of the request.
+    """
+
+    def __init__(self, fields: Dict[str, Any], files: Dict[str, Any] = None, boundary: str = None, progress_callback: Callable[[int, int], None] = None):
+        """
+        Args:
+            fields: plain form fields (name to str/bytes value), sent before any files
+            files: file fields, as in requests "files": name to file object, or a tuple of (filename, file object or bytes[, content type])
+            boundary: the multipart boundary (a random one is generated by default)
+            progress_callback: called with the number of bytes read so far and the total length, after each read
+        """
+        self.boundary = boundary if boundary is not None else uuid.uuid4().hex
+        segments = []
+        for name, value in (fields or {}).items():
+            segments.append(self._part_header(name))
+            segments.append(value if isinstance(value, bytes) else str(value).encode('utf-8'))
+            segments.append(b'\r\n')
+        for name, value in (files or {}).items():
+            filename, content, content_type = self._unpack_file(name, value)
+            segments.append(self._part_header(name, filename=filename, content_type=content_type))
+            if isinstance(content, (bytes, str)):
+                segments.append(content if isinstance(content, bytes) else content.encode('utf-8'))
+            else:
+                segments.append((content, _remaining_length(content)))
+            segments.append(b'\r\n')
+        segments.append('--{0}--\r\n'.format(self.boundary).encode('utf-8'))
+        super().__init__(segments, progress_callback=progress_callback)
+
+    @property
+    def content_type(self) -> str:
+        return 'multipart/form-data; boundary={0}'.format(self.boundary)
+
+    def _unpack_file(self, name, value):
+        content_type = None
+        if isinstance(value, (tuple, list)):
+            if len(value) == 2:
+                filename, content = value
+            else:
+                filename, content, content_type = value[0], value[1], value[2]
+        else:
+            content = value
+            filename = os.path.basename(getattr(value, 'name', None) or name)
+        return filename, content, content_type
+
+    def _part_header(self, name, filename=None, content_type=None) -> bytes:
+        header = '--{0}\r\nContent-Disposition: form-data; name="{1}"'.format(self.boundary, name)
+        if filename is not None:
+            header += '; filename="{0}"'.format(filename)
+        header += '\r\n'
+        if content_type is not None:
+            header += 'Content-Type: {0}\r\n'.format(content_type)
+        header += '\r\n'
+        return header.encode('utf-8')
+
+
+class UploadProgressReporter:
+    """
+    Progress callback for an UploadStream which reports a message each time another "step" percent of the upload has been sent
+    """
+
+    def __init__(self, report: Callable[[str], None], label: str, step: int = 10):
+        self.report = report
+        self.label = label
+        self.step = step
+        self._next_percent = step
+        self._finished = False
+
+    def __call__(self, bytes_sent: int, total: int):
+        # Once complete, stop reporting, even if the body is read again on a retry
+        if self._finished:
+            return
+        percent = 100 if total <= 0 else int(bytes_sent * 100 / total)
+        if percent < self._next_percent and bytes_sent < total:
+            return
+        while self._next_percent <= percent:
+            self._next_percent += self.step
+        self._finished = bytes_sent >= total
+        self.report('Uploading {0}: {1}% ({2} of {3})'.format(self.label, percent, format_size(bytes_sent), format_size(total)))
+
+
+def _remaining_length(file_obj) -> int:
+    position = file_obj.tell()
+    try:
+        return os.fstat(file_obj.fileno()).st_size - position
+    except (AttributeError, OSError, ValueError):
+        end = file_obj.seek(0, os.SEEK_END)
+        file_obj.seek(position)
+        return end - position
@@ -7,6 +7,7 @@ import shutil
 import tarfile
 import zipfile
 import tempfile
+import hashlib
 
 WORKSPACE = '_lmctl'
 
@@ -204,7 +205,29 @@ class PkgAssertions:
         self.tc.assertTrue(os.path.exists(meta_path))
         with open(meta_path, 'r') as meta_file:
             meta_content = yaml.safe_load(meta_file.read())
-        self.tc.assertEqual(meta_content, expected_meta_dict)
+        # Hashes vary with the content of each test project, so are checked separately with assert_has_content_hashes
+        self.tc.assertEqual(self.__without_content_hashes(meta_content), expected_meta_dict)
+
+    def __without_content_hashes(self, meta_dict):
+        stripped = {key: value for key, value in meta_dict.items() if key != 'content-hashes'}
+        if 'contains' in stripped:
+            stripped['contains'] = [self.__without_content_hashes(entry) for entry in stripped['contains']]
+        return stripped
+
+    def assert_has_content_hashes(self, expected_paths, subpkg_path=None):
+        meta_path = os.path.join(self.temp_dir, PKG_META_YML_FILE)
+        with open(meta_path, 'r') as meta_file:
+            meta_dict = yaml.safe_load(meta_file.read())
+        content_root = self.temp_dir
+        if subpkg_path is not None:
+            for name in subpkg_path:
+                meta_dict = next(entry for entry in meta_dict['contains'] if entry['name'] == name)
+                content_root = os.path.join(content_root, 'Contains', meta_dict.get('directory', name))
+        content_hashes = meta_dict.get('content-hashes', {})
+        self.tc.assertEqual(sorted(content_hashes.keys()), sorted(expected_paths))
+        for relative_path, content_hash in content_hashes.items():
+            with open(os.path.join(content_root, relative_path), 'rb') as f:
+                self.tc.assertEqual(content_hash, hashlib.sha256(f.read()).hexdigest())
 
     def assert_has_directory(self, rel_directory_path):
         full_path = self.__full_content_path(rel_directory_path)
@@ -16,7 +16,7 @@ class SimulatedArm:
         self.onboarded_types = {}
         self.mock = MagicMock()
 
-    def onboard_type(self, resource_name, resource_version, resource_csar):
+    def onboard_type(self, resource_name, resource_version, resource_csar, progress_callback=None):
         self.onboarded_types[resource_name] = {'resource_version': resource_version, 'resource_csar': resource_csar}
 
     def as_mocked_session(self):
@@ -44,7 +44,7 @@ class MockAnsibleRmDriver:
     def __init__(self, sim_arm):
         self.sim_arm = sim_arm
 
-    def onboard_type(self, resource_name, resource_version, resource_csar):
+    def onboard_type(self, resource_name, resource_version, resource_csar, progress_callback=None):
         try:
             self.sim_arm.onboard_type(resource_name, resource_version, resource_csar)
         except Exception as e:
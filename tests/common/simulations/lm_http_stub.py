@@ -0,0 +1,471 @@
+import base64
+import io
+import re
+import json
+import time
+import uuid
+import zipfile
+import threading
+import jwt
+import yaml
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, unquote
+from .lm_simulator import SimulatedLm, NotFoundError, DuplicateError
+
+STUB_USERNAME = 'stub-user'
+STUB_PASSWORD = 'stub-password'
+STUB_CLIENT_ID = 'StubClient'
+STUB_CLIENT_SECRET = 'stub-secret'
+STUB_API_KEY = 'stub-api-key'
+# Resource manager every CP4NA orchestration environment includes, onboarded after pushing Resources
+BRENT_RM_NAME = 'brent'
+
+ZEN_AUTH_PATH = '/icp4d-api/v1/authorize'
+# Tokens are signed with a fixed key, as lmctl only reads their expiry
+TOKEN_SIGNING_KEY = 'lmctl-http-stub-token-signing-key'
+
+RESOURCE_DESCRIPTOR_PATHS = ['Definitions/lm/resource.yaml', 'Definitions/lm/resource.yml']
+
+
+class StubResponse:
+
+    def __init__(self, status, body=None, content_type='application/json', headers=None):
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+        self.headers = headers or {}
+
+    @staticmethod
+    def json(status, obj, headers=None):
+        return StubResponse(status, json.dumps(obj).encode('utf-8'), headers=headers)
+
+    @staticmethod
+    def yaml(status, yaml_str):
+        return StubResponse(status, yaml_str.encode('utf-8'), content_type='application/yaml')
+
+    @staticmethod
+    def created(location):
+        return StubResponse(201, headers={'Location': location})
+
+    @staticmethod
+    def error(status, message):
+        return StubResponse.json(status, {'localizedMessage': message, 'details': {}})
+
+
+class StubRequest:
+
+    def __init__(self, method, path, query, headers, body):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+        self.params = {}
+
+    def query_param(self, name):
+        values = self.query.get(name, None)
+        return values[0] if values else None
+
+    def json(self):
+        return json.loads(self.body.decode('utf-8'))
+
+    def text(self):
+        return self.body.decode('utf-8')
+
+
+class LmHttpStub:
+    """
+    Serves a SimulatedLm over HTTP, standing in for the CP4NA orchestration APIs used by lmctl, so the whole of an lmctl command
+    (authentication, HTTP transport and serialization) can be exercised locally.
+
+    Covers the auth token endpoints (legacy login, OAuth, Zen), catalog descriptors, behaviour projects, assembly configurations,
+    scenarios and executions, Resource packages, resource managers (a "brent" resource manager is always included), intents and
+    processes. Any of the STUB_* credentials are accepted and each token issued is a JWT, valid for token_lifetime seconds. When
+    secure, every other request must include a current token.
+
+    Serves HTTP, unless given an ssl.SSLContext (with a certificate loaded) to serve HTTPS. lmctl only accepts an "http" address
+    when the LMCTL_ALLOW_ALL_SCHEMES environment variable is set to "true".
+
+    Each response is delayed by "latency" seconds. Descriptors and the items of each listing are padded with "payload_padding"
+    bytes (in a YAML comment or a "stubPadding" attribute), to simulate larger payloads.
+
+    Usage:
+        with LmHttpStub(latency=0.01) as stub:
+            client = TNCOClient(stub.address)
+    """
+
+    def __init__(self, lm_sim=None, latency=0.0, payload_padding=0, secure=True, token_lifetime=3600, host='127.0.0.1', port=0, ssl_context=None):
+        self.sim = lm_sim if lm_sim is not None else SimulatedLm()
+        if BRENT_RM_NAME not in self.sim.rms:
+            self.sim.add_rm({'name': BRENT_RM_NAME, 'url': 'https://brent:8443', 'type': 'brent'})
+        self.latency = latency
+        self.payload_padding = payload_padding
+        self.secure = secure
+        self.token_lifetime = token_lifetime
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.tokens_issued = 0
+        # Number of requests received for each route, keyed by "<method> <route pattern>"
+        self.request_counts = {}
+        self._lock = threading.Lock()
+        self._sim_lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._routes = self.__build_routes()
+
+    @property
+    def address(self):
+        scheme = 'https' if self.ssl_context is not None else 'http'
+        return '{0}://{1}:{2}'.format(scheme, self.host, self._server.server_port)
+
+    @property
+    def zen_auth_address(self):
+        return self.address + ZEN_AUTH_PATH
+
+    def start(self):
+        stub = self
+
+        class Handler(_StubRequestHandler):
+            pass
+        Handler.stub = stub
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        if self.ssl_context is not None:
+            self._server.socket = self.ssl_context.wrap_socket(self._server.socket, server_side=True)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def add_descriptors(self, count, descriptor_type='assembly', name_prefix='stub'):
+        """
+        Add generated descriptors, e.g. to fill the listing returned by "lmctl get descriptors"
+        """
+        for index in range(count):
+            self.sim.add_descriptor('name: {0}::{1}-{2}::1.0\ndescription: generated by the stub\n'.format(descriptor_type, name_prefix, index))
+
+    def request_count(self, method, route):
+        return self.request_counts.get('{0} {1}'.format(method, route), 0)
+
+    def __build_routes(self):
+        routes = [
+            ('POST', '/ui/api/login', self.__legacy_login),
+            ('POST', '/api/login', self.__legacy_login),
+            ('POST', '/oauth/token', self.__oauth_token),
+            ('POST', ZEN_AUTH_PATH, self.__zen_authorize),
+            ('GET', '/api/catalog/descriptors', self.__get_descriptors),
+            ('POST', '/api/catalog/descriptors', self.__create_descriptor),
+            ('GET', '/api/catalog/descriptors/{id}', self.__get_descriptor),
+            ('PUT', '/api/catalog/descriptors/{id}', self.__update_descriptor),
+            ('DELETE', '/api/catalog/descriptors/{id}', self.__delete_descriptor),
+            ('POST', '/api/behaviour/projects', self.__create_project),
+            ('GET', '/api/behaviour/projects/{id}', self.__get_project),
+            ('PUT', '/api/behaviour/projects/{id}', self.__update_project),
+            ('GET', '/api/behaviour/assemblyConfigurations', self.__get_assembly_configurations),
+            ('POST', '/api/behaviour/assemblyConfigurations', self.__create_assembly_configuration),
+            ('GET', '/api/behaviour/assemblyConfigurations/{id}', self.__get_assembly_configuration),
+            ('PUT', '/api/behaviour/assemblyConfigurations/{id}', self.__update_assembly_configuration),
+            ('GET', '/api/behaviour/scenarios', self.__get_scenarios),
+            ('POST', '/api/behaviour/scenarios', self.__create_scenario),
+            ('GET', '/api/behaviour/scenarios/{id}', self.__get_scenario),
+            ('PUT', '/api/behaviour/scenarios/{id}', self.__update_scenario),
+            ('GET', '/api/behaviour/executions', self.__get_executions),
+            ('POST', '/api/behaviour/executions', self.__execute_scenario),
+            ('GET', '/api/behaviour/executions/{id}', self.__get_execution),
+            ('POST', '/api/resource-manager/resource-packages', self.__onboard_resource_package),
+            ('DELETE', '/api/resource-manager/resource-packages/{id}', self.__delete_resource_package),
+            ('GET', '/api/resource-managers/{id}', self.__get_rm),
+            ('PUT', '/api/resource-managers/{id}', self.__update_rm),
+            ('POST', '/api/intent/{id}', self.__submit_intent),
+            ('GET', '/api/processes', self.__get_processes),
+            ('GET', '/api/processes/{id}', self.__get_process),
+        ]
+        compiled = []
+        for method, route, handler in routes:
+            pattern = re.compile('^' + re.escape(route).replace(re.escape('{id}'), '(?P<id>[^/]+)') + '/?$')
+            compiled.append((method, route, pattern, handler))
+        return compiled
+
+    def handle(self, request):
+        if self.latency > 0:
+            time.sleep(self.latency)
+        path_matched = False
+        for method, route, pattern, handler in self._routes:
+            match = pattern.match(request.path)
+            if match is None:
+                continue
+            path_matched = True
+            if method != request.method:
+                continue
+            with self._lock:
+                key = '{0} {1}'.format(method, route)
+                self.request_counts[key] = self.request_counts.get(key, 0) + 1
+            if 'id' in match.groupdict():
+                request.params['id'] = unquote(match.group('id'))
+            if self.secure and not route.startswith(('/ui/api/login', '/api/login', '/oauth/token', ZEN_AUTH_PATH)) and not self.__is_authorized(request):
+                return StubResponse.error(401, 'Full authentication is required to access this resource')
+            try:
+                # The simulator is not thread safe, so requests are handled one at a time (once any latency has elapsed)
+                with self._sim_lock:
+                    return handler(request)
+            except NotFoundError as e:
+                return StubResponse.error(404, str(e))
+            except DuplicateError as e:
+                return StubResponse.error(409, str(e))
+        if path_matched:
+            return StubResponse.error(405, 'Method {0} not supported on {1}'.format(request.method, request.path))
+        return StubResponse.error(404, 'No API at {0}'.format(request.path))
+
+    ########################
+    # Auth
+    ########################
+
+    def __issue_token(self):
+        with self._lock:
+            self.tokens_issued += 1
+        claims = {'sub': STUB_USERNAME, 'jti': str(uuid.uuid4()), 'exp': int(time.time()) + self.token_lifetime}
+        token = jwt.encode(claims, TOKEN_SIGNING_KEY, algorithm='HS256')
+        # Older versions of pyjwt return bytes
+        return token.decode('utf-8') if isinstance(token, bytes) else token
+
+    def __is_authorized(self, request):
+        authorization = request.headers.get('Authorization', '')
+        if not authorization.startswith('Bearer '):
+            return False
+        try:
+            jwt.decode(authorization[len('Bearer '):], TOKEN_SIGNING_KEY, algorithms=['HS256'])
+        except jwt.InvalidTokenError:
+            return False
+        return True
+
+    def __legacy_login(self, request):
+        body = request.json()
+        if body.get('username') != STUB_USERNAME or body.get('password') != STUB_PASSWORD:
+            return StubResponse.error(401, 'Bad credentials')
+        return StubResponse.json(200, {'accessToken': self.__issue_token(), 'expiresIn': self.token_lifetime})
+
+    def __oauth_token(self, request):
+        form = parse_qs(request.text())
+        grant_type = form.get('grant_type', [None])[0]
+        if self.__client_credentials(request, form) != (STUB_CLIENT_ID, STUB_CLIENT_SECRET):
+            return StubResponse.error(401, 'Bad client credentials')
+        if grant_type == 'password' and (form.get('username', [None])[0] != STUB_USERNAME or form.get('password', [None])[0] != STUB_PASSWORD):
+            return StubResponse.error(401, 'Bad credentials')
+        return StubResponse.json(200, {'access_token': self.__issue_token(), 'token_type': 'bearer', 'expires_in': self.token_lifetime})
+
+    def __client_credentials(self, request, form):
+        authorization = request.headers.get('Authorization', '')
+        if authorization.startswith('Basic '):
+            client_id, _, client_secret = base64.b64decode(authorization[len('Basic '):]).decode('utf-8').partition(':')
+            return client_id, client_secret
+        return form.get('client_id', [None])[0], form.get('client_secret', [None])[0]
+
+    def __zen_authorize(self, request):
+        body = request.json()
+        if body.get('username') != STUB_USERNAME or body.get('api_key') != STUB_API_KEY:
+            return StubResponse.error(401, 'Bad credentials')
+        return StubResponse.json(200, {'token': self.__issue_token(), '_messageCode_': 'success', 'message': 'success'})
+
+    ########################
+    # Payloads
+    ########################
+
+    def __padded_yaml(self, yaml_str):
+        if self.payload_padding <= 0:
+            return yaml_str
+        return '{0}\n# {1}\n'.format(yaml_str.rstrip('\n'), 'x' * self.payload_padding)
+
+    def __padded_list(self, items):
+        if self.payload_padding <= 0:
+            return items
+        padding = 'x' * self.payload_padding
+        return [dict(item, stubPadding=padding) for item in items]
+
+    ########################
+    # Descriptors
+    ########################
+
+    def __get_descriptors(self, request):
+        descriptors = [yaml.safe_load(descriptor) for descriptor in self.sim.get_descriptors()]
+        return StubResponse.json(200, self.__padded_list(descriptors))
+
+    def __create_descriptor(self, request):
+        self.sim.add_descriptor(request.text())
+        name = yaml.safe_load(request.text())['name']
+        return StubResponse.created('/api/catalog/descriptors/{0}'.format(name))
+
+    def __get_descriptor(self, request):
+        return StubResponse.yaml(200, self.__padded_yaml(self.sim.get_descriptor(request.params['id'])))
+
+    def __update_descriptor(self, request):
+        self.sim.update_descriptor(request.text())
+        return StubResponse(200)
+
+    def __delete_descriptor(self, request):
+        self.sim.delete_descriptor(request.params['id'])
+        return StubResponse(204)
+
+    ########################
+    # Behaviour
+    ########################
+
+    def __create_project(self, request):
+        project = request.json()
+        self.sim.add_project(project)
+        return StubResponse.created('/api/behaviour/projects/{0}'.format(project['id']))
+
+    def __get_project(self, request):
+        return StubResponse.json(200, self.sim.get_project(request.params['id']))
+
+    def __update_project(self, request):
+        self.sim.update_project(request.json())
+        return StubResponse(200)
+
+    def __get_assembly_configurations(self, request):
+        return StubResponse.json(200, self.__padded_list(self.sim.get_assembly_configurations_on_project(request.query_param('projectId'))))
+
+    def __create_assembly_configuration(self, request):
+        assembly_configuration = self.sim.add_assembly_configuration(request.json())
+        return StubResponse.created('/api/behaviour/assemblyConfigurations/{0}'.format(assembly_configuration['id']))
+
+    def __get_assembly_configuration(self, request):
+        return StubResponse.json(200, self.sim.get_assembly_configuration(request.params['id']))
+
+    def __update_assembly_configuration(self, request):
+        self.sim.update_assembly_configuration(request.json())
+        return StubResponse(200)
+
+    def __get_scenarios(self, request):
+        return StubResponse.json(200, self.__padded_list(self.sim.get_scenarios_on_project(request.query_param('projectId'))))
+
+    def __create_scenario(self, request):
+        scenario = self.sim.add_scenario(request.json())
+        return StubResponse.created('/api/behaviour/scenarios/{0}'.format(scenario['id']))
+
+    def __get_scenario(self, request):
+        return StubResponse.json(200, self.sim.get_scenario(request.params['id']))
+
+    def __update_scenario(self, request):
+        self.sim.update_scenario(request.json())
+        return StubResponse(200)
+
+    def __get_executions(self, request):
+        return StubResponse.json(200, self.__padded_list(self.sim.get_executions_on_scenario(request.query_param('scenarioId'))))
+
+    def __execute_scenario(self, request):
+        execution = self.sim.execute_scenario(request.json()['scenarioId'])
+        return StubResponse.created('/api/behaviour/executions/{0}'.format(execution['id']))
+
+    def __get_execution(self, request):
+        return StubResponse.json(200, self.sim.get_execution(request.params['id']))
+
+    ########################
+    # Resource packages
+    ########################
+
+    def __onboard_resource_package(self, request):
+        content_type = request.headers.get('Content-Type', '')
+        message = BytesParser().parsebytes(b'Content-Type: ' + content_type.encode('utf-8') + b'\r\n\r\n' + request.body)
+        package_content = None
+        for part in message.get_payload():
+            if part.get_param('name', header='content-disposition') == 'file':
+                package_content = part.get_payload(decode=True)
+        if package_content is None:
+            return StubResponse.error(400, 'Missing "file" part')
+        try:
+            with zipfile.ZipFile(io.BytesIO(package_content)) as package_zip:
+                descriptor_path = next(path for path in RESOURCE_DESCRIPTOR_PATHS if path in package_zip.namelist())
+                descriptor = yaml.safe_load(package_zip.read(descriptor_path))
+        except (zipfile.BadZipFile, StopIteration):
+            return StubResponse.error(400, 'Invalid Resource package, expected a zip including one of: {0}'.format(RESOURCE_DESCRIPTOR_PATHS))
+        self.sim.add_resource_package(descriptor['name'], package_content)
+        return StubResponse.created('/api/resource-manager/resource-packages/{0}'.format(descriptor['name']))
+
+    def __delete_resource_package(self, request):
+        self.sim.delete_resource_package(request.params['id'])
+        return StubResponse(204)
+
+    def __get_rm(self, request):
+        return StubResponse.json(200, self.sim.get_rm(request.params['id']))
+
+    def __update_rm(self, request):
+        self.sim.update_rm(request.json())
+        return StubResponse(200)
+
+    ########################
+    # Intents and processes
+    ########################
+
+    def __submit_intent(self, request):
+        process = self.sim.submit_intent(request.params['id'], request.json())
+        return StubResponse(202, headers={'Location': '/api/processes/{0}'.format(process['id'])})
+
+    def __get_processes(self, request):
+        return StubResponse.json(200, self.__padded_list(self.sim.get_processes()))
+
+    def __get_process(self, request):
+        return StubResponse.json(200, self.sim.get_process(request.params['id']))
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    stub = None
+
+    def __handle(self):
+        url = urlsplit(self.path)
+        body = b''
+        content_length = self.headers.get('Content-Length', None)
+        if content_length is not None:
+            body = self.rfile.read(int(content_length))
+        elif self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            body = self.__read_chunked()
+        request = StubRequest(self.command, url.path, parse_qs(url.query), self.headers, body)
+        response = self.stub.handle(request)
+        self.send_response(response.status)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        body = response.body if response.body is not None else b''
+        if len(body) > 0:
+            self.send_header('Content-Type', response.content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def __read_chunked(self):
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            if size == 0:
+                self.rfile.readline()
+                return b''.join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+    def do_GET(self):
+        self.__handle()
+
+    def do_POST(self):
+        self.__handle()
+
+    def do_PUT(self):
+        self.__handle()
+
+    def do_DELETE(self):
+        self.__handle()
+
+    def log_message(self, format, *args):
+        pass
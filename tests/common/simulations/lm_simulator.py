@@ -95,6 +95,7 @@ class SimulatedLm:
         self.lifecycle_drivers = {}
         self.resource_drivers = {}
         self.infrastructure_keys = {}
+        self.processes = {}
         self.mock = MagicMock()
 
     def __get(self, entity_map, entity_id):
@@ -166,6 +167,10 @@ class SimulatedLm:
         parsed_descriptor = descriptor_utils.DescriptorParser().read_from_str(descriptor)
         self.__update(self.descriptors, parsed_descriptor.get_name(), descriptor)
 
+    def get_descriptors(self):
+        self.mock.get_descriptors()
+        return list(self.descriptors.values())
+
     def get_descriptor_template(self, descriptor_name):
         self.mock.get_descriptor_template(descriptor_name)
         descriptor = self.__get(self.descriptor_templates, descriptor_name)
@@ -271,6 +276,7 @@ class SimulatedLm:
             assembly_configuration['id'] = str(uuid.uuid4())
         self.__add(self.assembly_configurations, assembly_configuration['id'], assembly_configuration)
         self.__add_relation(self.assembly_configurations_by_project, assembly_configuration['projectId'], self.projects, assembly_configuration['id'], self.assembly_configurations)
+        return assembly_configuration
 
     def update_assembly_configuration(self, assembly_configuration):
         self.mock.update_assembly_configuration(assembly_configuration)
@@ -296,6 +302,7 @@ class SimulatedLm:
             scenario['id'] = str(uuid.uuid4())
         self.__add(self.scenarios, scenario['id'], scenario)
         self.__add_relation(self.scenarios_by_project, scenario['projectId'], self.projects, scenario['id'], self.scenarios)
+        return scenario
 
     def update_scenario(self, scenario):
         self.mock.update_scenario(scenario)
@@ -406,6 +413,27 @@ class SimulatedLm:
                         step_report['status'] = 'PENDING'
         return stage_reports
 
+    def submit_intent(self, intent_type, intent):
+        self.mock.submit_intent(intent_type, intent)
+        process = {
+            'id': str(uuid.uuid4()),
+            'intentType': intent_type,
+            'assemblyName': intent.get('assemblyName', None),
+            'status': 'Completed',
+            'statusReason': None
+        }
+        self.__add(self.processes, process['id'], process)
+        return process
+
+    def get_process(self, process_id):
+        self.mock.get_process(process_id)
+        process = self.__get(self.processes, process_id)
+        return process
+
+    def get_processes(self):
+        self.mock.get_processes()
+        return list(self.processes.values())
+
     def get_resource_driver(self, driver_id):
         self.mock.get_resource_driver(driver_id)
         resource_driver = self.__get(self.resource_drivers, driver_id)
@@ -541,6 +569,7 @@ class SimulatedLmSession(LmSession):
         self.__resource_driver_mgmt_driver_sim = SimResourceDriverMgmtDriver(self.sim)
         self.__infrastructure_keys_driver = MagicMock()
         self.__infrastructure_keys_driver_sim = SimInfrastructureKeysDriver(self.sim)
+        self.__http_session = lm_drivers.LmHttpSession()
         self.__configure_mocks()
 
     def __configure_mocks(self):
@@ -591,6 +620,10 @@ class SimulatedLmSession(LmSession):
         self.__infrastructure_keys_driver.add_infrastructure_key.side_effect = self.__infrastructure_keys_driver_sim.add_infrastructure_key
         self.__infrastructure_keys_driver.delete_infrastructure_key.side_effect = self.__infrastructure_keys_driver_sim.delete_infrastructure_key
 
+    @property
+    def http_session(self):
+        return self.__http_session
+
     @property
     def descriptor_driver(self):
         return self.__descriptor_driver
@@ -836,7 +869,7 @@ class SimBehaviourDriver:
 
     def create_assembly_configuration(self, assembly_configuration):
         try:
-            self.sim_lm.add_assembly_configuration(assembly_configuration)
+            return self.sim_lm.add_assembly_configuration(assembly_configuration)
         except Exception as e:
             raise lm_drivers.LmDriverException('Error: {0}'.format(str(e))) from e
 
@@ -866,7 +899,7 @@ class SimBehaviourDriver:
 
     def create_scenario(self, scenario):
         try:
-            self.sim_lm.add_scenario(scenario)
+            return self.sim_lm.add_scenario(scenario)
         except Exception as e:
             raise lm_drivers.LmDriverException('Error: {0}'.format(str(e))) from e
 
@@ -923,8 +956,11 @@ class SimResourcePkgDriver:
         self.sim_lm = sim_lm
 
     def __get_resource_type_name(self, resource_pkg_path):
-        with open(resource_pkg_path, 'rb') as resource_pkg_contents:
-            pkg_content = resource_pkg_contents.read()
+        if hasattr(resource_pkg_path, 'read'):
+            pkg_content = resource_pkg_path.read()
+        else:
+            with open(resource_pkg_path, 'rb') as resource_pkg_contents:
+                pkg_content = resource_pkg_contents.read()
         tmp_dir = tempfile.mkdtemp()
         try:
             tmp_pkg = os.path.join(tmp_dir, 'tmp.zip')
@@ -939,7 +975,7 @@ class SimResourcePkgDriver:
         finally:
             shutil.rmtree(tmp_dir)
 
-    def onboard_package(self, resource_pkg_path, object_group_id = None):
+    def onboard_package(self, resource_pkg_path, object_group_id = None, progress_callback = None):
         package_name = self.__get_resource_type_name(resource_pkg_path)
         try:
             self.sim_lm.add_resource_package(package_name, resource_pkg_path)
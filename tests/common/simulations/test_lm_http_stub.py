@@ -0,0 +1,83 @@
+import unittest
+import requests
+from lmctl.client import TNCOClientBuilder, TNCOClientHttpError
+from tests.common.simulations.lm_simulator import SimulatedLm
+from tests.common.simulations.lm_http_stub import LmHttpStub, STUB_USERNAME, STUB_PASSWORD, STUB_CLIENT_ID, STUB_CLIENT_SECRET, STUB_API_KEY, BRENT_RM_NAME
+
+class TestLmHttpStub(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = LmHttpStub().start()
+
+    def tearDown(self):
+        self.stub.stop()
+
+    def __client(self):
+        return TNCOClientBuilder().address(self.stub.address).client_credentials_auth(STUB_CLIENT_ID, STUB_CLIENT_SECRET).build()
+
+    def test_legacy_login(self):
+        client = TNCOClientBuilder().address(self.stub.address).legacy_user_pass_auth(STUB_USERNAME, STUB_PASSWORD, legacy_auth_address=self.stub.address).build()
+        self.assertEqual(client.descriptors.all(), [])
+        self.assertEqual(self.stub.tokens_issued, 1)
+
+    def test_client_credentials_login(self):
+        self.assertEqual(self.__client().descriptors.all(), [])
+        self.assertEqual(self.stub.tokens_issued, 1)
+
+    def test_zen_login(self):
+        client = TNCOClientBuilder().address(self.stub.address).zen_api_key_auth(STUB_USERNAME, STUB_API_KEY, zen_auth_address=self.stub.zen_auth_address).build()
+        self.assertEqual(client.descriptors.all(), [])
+        self.assertEqual(self.stub.tokens_issued, 1)
+
+    def test_login_with_invalid_credentials(self):
+        client = TNCOClientBuilder().address(self.stub.address).client_credentials_auth(STUB_CLIENT_ID, 'not-the-secret').build()
+        with self.assertRaises(TNCOClientHttpError):
+            client.descriptors.all()
+        self.assertEqual(self.stub.tokens_issued, 0)
+
+    def test_request_without_token_is_unauthorized(self):
+        response = requests.get(self.stub.address + '/api/catalog/descriptors')
+        self.assertEqual(response.status_code, 401)
+
+    def test_request_without_token_when_not_secure(self):
+        with LmHttpStub(secure=False) as stub:
+            response = requests.get(stub.address + '/api/catalog/descriptors')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json(), [])
+
+    def test_descriptors(self):
+        client = self.__client()
+        client.descriptors.create({'name': 'assembly::test::1.0', 'description': 'testing'})
+        self.assertEqual(client.descriptors.get('assembly::test::1.0')['description'], 'testing')
+        client.descriptors.update({'name': 'assembly::test::1.0', 'description': 'updated'})
+        self.assertEqual(client.descriptors.get('assembly::test::1.0')['description'], 'updated')
+        client.descriptors.delete('assembly::test::1.0')
+        with self.assertRaises(TNCOClientHttpError) as context:
+            client.descriptors.get('assembly::test::1.0')
+        self.assertEqual(context.exception.status_code, 404)
+
+    def test_add_descriptors(self):
+        self.stub.add_descriptors(5)
+        descriptors = self.__client().descriptors.all()
+        self.assertEqual(len(descriptors), 5)
+        self.assertEqual(self.stub.request_count('GET', '/api/catalog/descriptors'), 1)
+
+    def test_payload_padding(self):
+        with LmHttpStub(payload_padding=1024, secure=False) as stub:
+            stub.add_descriptors(2)
+            response = requests.get(stub.address + '/api/catalog/descriptors')
+            self.assertEqual(len(response.json()), 2)
+            self.assertGreater(len(response.content), 2048)
+
+    def test_intent_creates_process(self):
+        client = self.__client()
+        process_id = client.assemblies.intent_create({'assemblyName': 'test', 'descriptorName': 'assembly::test::1.0', 'properties': {}})
+        self.assertEqual(client.processes.get(process_id)['status'], 'Completed')
+
+    def test_uses_given_simulator(self):
+        lm_sim = SimulatedLm()
+        lm_sim.add_descriptor('name: assembly::existing::1.0\ndescription: testing')
+        with LmHttpStub(lm_sim=lm_sim, secure=False) as stub:
+            response = requests.get(stub.address + '/api/catalog/descriptors')
+            self.assertEqual([descriptor['name'] for descriptor in response.json()], ['assembly::existing::1.0'])
+            self.assertIn(BRENT_RM_NAME, lm_sim.rms)
@@ -0,0 +1,137 @@
+import tests.unit.cli.commands.command_testing as command_testing
+import tempfile
+import os
+import shutil
+from unittest.mock import patch, MagicMock
+from lmctl.cli.controller import clear_global_controller
+from lmctl.cli.commands.actions import create, update, delete, heal, scale
+from lmctl.config import Config
+from lmctl.environment import EnvironmentGroup, TNCOEnvironment
+from lmctl.client import TNCOClientHttpError, ProcessWaitResult
+import lmctl.cli.commands.assemblies
+import lmctl.cli.commands.assembly_components
+import lmctl.cli.commands.resource_cluster
+
+
+class TestAssemblyIntentCommands(command_testing.CommandTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        clear_global_controller()
+
+        self.tnco_env_client_patcher = patch('lmctl.environment.lmenv.TNCOClientBuilder')
+        self.mock_tnco_client_builder_class = self.tnco_env_client_patcher.start()
+        self.addCleanup(self.tnco_env_client_patcher.stop)
+        self.mock_tnco_client_builder = self.mock_tnco_client_builder_class.return_value
+        self.mock_tnco_client = self.mock_tnco_client_builder.build.return_value
+        self.mock_tnco_client.get_access_token.return_value = '123'
+
+        # Setup Config Path location
+        self.tmp_dir = tempfile.mkdtemp(prefix='lmctl-test')
+        self.config_path = os.path.join(self.tmp_dir, 'lmctl-config.yaml')
+        self.orig_lm_config = os.environ.get('LMCONFIG')
+        os.environ['LMCONFIG'] = self.config_path
+
+        self.global_config_patcher = patch('lmctl.cli.controller.get_config_with_path')
+        self.mock_get_global_config = self.global_config_patcher.start()
+        self.addCleanup(self.global_config_patcher.stop)
+        self.mock_get_global_config.return_value = (Config(
+            active_environment='default',
+            environments={
+                'default': EnvironmentGroup(
+                    name='default',
+                    tnco=TNCOEnvironment(
+                        address='https://mock.example.com',
+                        secure=True,
+                        token='123',
+                        auth_mode='token'
+                    )
+                )
+            }
+        ), self.config_path)
+
+        self.process_status = 'Completed'
+        self.mock_tnco_client.processes.wait.side_effect = self._mock_wait
+
+    def tearDown(self):
+        super().tearDown()
+
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+        if self.orig_lm_config is not None:
+            os.environ['LMCONFIG'] = self.orig_lm_config
+
+    def _mock_wait(self, process_ids, timeout=None, on_change=None):
+        results = []
+        for process_id in process_ids:
+            result = ProcessWaitResult(process_id)
+            result.process = {'id': process_id, 'status': self.process_status, 'statusReason': 'Something went wrong'}
+            on_change(result)
+            results.append(result)
+        return results
+
+    def _assert_waited_on(self, process_id, timeout=None):
+        self.mock_tnco_client.processes.wait.assert_called_once()
+        args, kwargs = self.mock_tnco_client.processes.wait.call_args
+        self.assertEqual(list(args[0]), [process_id])
+        self.assertEqual(kwargs['timeout'], timeout)
+
+    def test_create_without_wait(self):
+        self.mock_tnco_client.assemblies.intent_create.return_value = '123'
+        result = self.runner.invoke(create, ['assembly', '--set', 'assemblyName=test'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123')
+        self.mock_tnco_client.processes.wait.assert_not_called()
+
+    def test_create_with_wait(self):
+        self.mock_tnco_client.assemblies.intent_create.return_value = '123'
+        result = self.runner.invoke(create, ['assembly', '--set', 'assemblyName=test', '--wait', '--timeout', '30'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123\nProcess 123: Completed')
+        self._assert_waited_on('123', timeout=30)
+
+    def test_create_with_wait_fails_when_process_fails(self):
+        self.process_status = 'Failed'
+        self.mock_tnco_client.assemblies.intent_create.return_value = '123'
+        result = self.runner.invoke(create, ['assembly', '--set', 'assemblyName=test', '--wait'])
+        self.assert_has_system_exit(result)
+        self.assertIn('Process 123: Failed', result.output)
+        self.assertIn('Error: Process 123 did not complete successfully: Failed - Something went wrong', result.output)
+
+    def test_update_with_wait(self):
+        self.mock_tnco_client.assemblies.intent_upgrade.return_value = '123'
+        result = self.runner.invoke(update, ['assembly', 'test', '--set', 'descriptorName=assembly::test::2.0', '--wait'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123\nProcess 123: Completed')
+        self._assert_waited_on('123')
+
+    def test_delete_with_wait(self):
+        self.mock_tnco_client.assemblies.intent_delete.return_value = '123'
+        result = self.runner.invoke(delete, ['assembly', 'test', '--wait'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123\nProcess 123: Completed')
+        self._assert_waited_on('123')
+
+    def test_delete_with_wait_ignores_missing(self):
+        mock_response = MagicMock(status_code=400, headers={'Content-Type': 'application/json'})
+        mock_response.json.return_value = {'localizedMessage': 'Cannot find assembly instance with name test'}
+        self.mock_tnco_client.assemblies.intent_delete.side_effect = TNCOClientHttpError('Mock error', cause=MagicMock(response=mock_response))
+        result = self.runner.invoke(delete, ['assembly', 'test', '--wait', '--ignore-missing'])
+        self.assert_no_errors(result)
+        self.assert_output(result, '(Ignored) Cannot find assembly instance with name test')
+        self.mock_tnco_client.processes.wait.assert_not_called()
+
+    def test_heal_with_wait(self):
+        self.mock_tnco_client.assemblies.intent_heal.return_value = '123'
+        result = self.runner.invoke(heal, ['resource', 'test-resource', '--assembly-name', 'test', '--wait'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123\nProcess 123: Completed')
+        self._assert_waited_on('123')
+
+    def test_scale_with_wait(self):
+        self.mock_tnco_client.assemblies.intent_scale_out.return_value = '123'
+        result = self.runner.invoke(scale, ['resourcecluster', 'test-cluster', '--assembly-name', 'test', '--out', '--wait', '--timeout', '5'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123\nProcess 123: Completed')
+        self._assert_waited_on('123', timeout=5)
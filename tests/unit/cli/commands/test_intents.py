@@ -0,0 +1,142 @@
+import tests.unit.cli.commands.command_testing as command_testing
+import tempfile
+import json
+import yaml
+import os
+import shutil
+from unittest.mock import patch
+from lmctl.cli.controller import clear_global_controller
+from lmctl.config import Config
+from lmctl.environment import EnvironmentGroup, TNCOEnvironment
+from lmctl.client import ProcessWaitResult, BulkIntentResult, BulkIntentResults
+import lmctl.cli.commands.intents as intent_cmds
+
+
+class TestIntentCommands(command_testing.CommandTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        clear_global_controller()
+
+        self.tnco_env_client_patcher = patch('lmctl.environment.lmenv.TNCOClientBuilder')
+        self.mock_tnco_client_builder_class = self.tnco_env_client_patcher.start()
+        self.addCleanup(self.tnco_env_client_patcher.stop)
+        self.mock_tnco_client_builder = self.mock_tnco_client_builder_class.return_value
+        self.mock_tnco_client = self.mock_tnco_client_builder.build.return_value
+        self.mock_tnco_client.get_access_token.return_value = '123'
+
+        # Setup Config Path location
+        self.tmp_dir = tempfile.mkdtemp(prefix='lmctl-test')
+        self.config_path = os.path.join(self.tmp_dir, 'lmctl-config.yaml')
+        self.orig_lm_config = os.environ.get('LMCONFIG')
+        os.environ['LMCONFIG'] = self.config_path
+
+        self.global_config_patcher = patch('lmctl.cli.controller.get_config_with_path')
+        self.mock_get_global_config = self.global_config_patcher.start()
+        self.addCleanup(self.global_config_patcher.stop)
+        self.mock_get_global_config.return_value = (Config(
+            active_environment='default',
+            environments={
+                'default': EnvironmentGroup(
+                    name='default',
+                    tnco=TNCOEnvironment(
+                        address='https://mock.example.com',
+                        secure=True,
+                        token='123',
+                        auth_mode='token'
+                    )
+                )
+            }
+        ), self.config_path)
+
+    def tearDown(self):
+        super().tearDown()
+
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+        if self.orig_lm_config is not None:
+            os.environ['LMCONFIG'] = self.orig_lm_config
+
+    def _write_manifest(self, intents):
+        path = os.path.join(self.tmp_dir, 'batch.yaml')
+        with open(path, 'w') as f:
+            yaml.safe_dump({'intents': intents}, f)
+        return path
+
+    def _bulk_results(self, *outcomes, timed_out=False):
+        results = []
+        for index, (process_id, status, error) in enumerate(outcomes):
+            result = BulkIntentResult(index, {'intentType': 'createAssembly', 'assemblyName': f'assembly-{index}'})
+            result.process_id = process_id
+            result.process_status = status
+            result.process_status_reason = 'Mock reason' if status == 'Failed' else None
+            result.error = error
+            results.append(result)
+        return BulkIntentResults(results, timed_out=timed_out)
+
+    def test_create_intent(self):
+        self.mock_tnco_client.assemblies.intent.return_value = '123'
+        result = self.runner.invoke(intent_cmds.create, ['intent', '--set', 'intentType=deleteAssembly', '--set', 'assemblyName=test'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123')
+        self.mock_tnco_client.assemblies.intent.assert_called_once_with('deleteAssembly', {'assemblyName': 'test'}, object_group_id=None)
+        self.mock_tnco_client.processes.wait.assert_not_called()
+
+    def test_create_intent_with_wait(self):
+        self.mock_tnco_client.assemblies.intent.return_value = '123'
+        def wait(process_ids, timeout=None, on_change=None):
+            result = ProcessWaitResult('123')
+            result.process = {'id': '123', 'status': 'Completed'}
+            on_change(result)
+            return [result]
+        self.mock_tnco_client.processes.wait.side_effect = wait
+        result = self.runner.invoke(intent_cmds.create, ['intent', '--set', 'intentType=deleteAssembly', '--set', 'assemblyName=test', '--wait'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Accepted - Process: 123\nProcess 123: Completed')
+
+    def test_create_intents_from_manifest(self):
+        intents = [{'intentType': 'createAssembly', 'assemblyName': f'assembly-{i}'} for i in range(2)]
+        self.mock_tnco_client.assemblies.submit_intents.return_value = self._bulk_results(('123', None, None), ('456', None, None))
+        result = self.runner.invoke(intent_cmds.create, ['intents', '-f', self._write_manifest(intents), '--concurrency', '4', '--rate-limit', '2.5', '--ogid', 'og'])
+        self.assert_no_errors(result)
+        self.mock_tnco_client.assemblies.submit_intents.assert_called_once_with(intents, concurrency=4, rate_limit=2.5, object_group_id='og', wait=False, wait_timeout=None)
+        self.mock_tnco_client.assemblies.intent.assert_not_called()
+        lines = result.output.splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertIn('Process', lines[0])
+        self.assertIn('assembly-0', lines[2])
+        self.assertIn('123', lines[2])
+        self.assertIn('456', lines[3])
+
+    def test_create_intents_from_manifest_as_json(self):
+        self.mock_tnco_client.assemblies.submit_intents.return_value = self._bulk_results(('123', 'Completed', None))
+        result = self.runner.invoke(intent_cmds.create, ['intents', '-f', self._write_manifest([{'intentType': 'createAssembly'}]), '--wait', '--timeout', '60', '-o', 'json'])
+        self.assert_no_errors(result)
+        self.assertEqual(self.mock_tnco_client.assemblies.submit_intents.call_args[1]['wait_timeout'], 60)
+        self.assertEqual(json.loads(result.output), {
+            'total': 1,
+            'failed': 0,
+            'timedOut': False,
+            'intents': [{'index': 0, 'intentType': 'createAssembly', 'assemblyName': 'assembly-0', 'processId': '123', 'processStatus': 'Completed', 'statusReason': None, 'error': None, 'waitError': None}]
+        })
+
+    def test_create_intents_from_manifest_with_failures(self):
+        self.mock_tnco_client.assemblies.submit_intents.return_value = self._bulk_results(('123', 'Completed', None), ('456', 'Failed', None), (None, None, 'Mock error'))
+        result = self.runner.invoke(intent_cmds.create, ['intents', '-f', self._write_manifest([{'intentType': 'createAssembly'}]), '--wait'])
+        self.assert_has_system_exit(result)
+        self.assertIn('Mock reason', result.output)
+        self.assertIn('Mock error', result.output)
+        self.assertIn('Error: 2 of 3 intent(s) did not succeed', result.output)
+
+    def test_create_intents_from_manifest_with_invalid_rate_limit(self):
+        result = self.runner.invoke(intent_cmds.create, ['intents', '-f', self._write_manifest([{'intentType': 'createAssembly'}]), '--rate-limit', '0'])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('must be greater than 0', result.output)
+        self.mock_tnco_client.assemblies.submit_intents.assert_not_called()
+
+    def test_create_intents_from_manifest_with_set_fails(self):
+        result = self.runner.invoke(intent_cmds.create, ['intents', '-f', self._write_manifest([{'intentType': 'createAssembly'}]), '--set', 'assemblyName=test'])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('Do not use "--set" with a manifest of intents', result.output)
+        self.mock_tnco_client.assemblies.submit_intents.assert_not_called()
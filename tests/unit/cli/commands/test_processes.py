@@ -1,8 +1,10 @@
 import tests.unit.cli.commands.command_testing as command_testing
 import tempfile
+import json
 import os
 import shutil
 from unittest.mock import patch
+from lmctl.client import ProcessWaitResult, ProcessWaitTimeoutError
 from lmctl.cli.controller import clear_global_controller
 from lmctl.cli.commands.login import login
 from lmctl.config import ConfigFinder, Config
@@ -75,4 +77,68 @@ class TestProcessCommands(command_testing.CommandTestCase):
         self.assert_no_errors(result)
         expected_output = 'Accepted - Rollback request for process: 8475f402-cb6f-4ef1-a379-77c7e20cdf72'
         self.assert_output(result, expected_output)
-        self.mock_tnco_client.assemblies.intent_rollback.assert_called_once_with({'processId': '8475f402-cb6f-4ef1-a379-77c7e20cdf72'})
\ No newline at end of file
+        self.mock_tnco_client.assemblies.intent_rollback.assert_called_once_with({'processId': '8475f402-cb6f-4ef1-a379-77c7e20cdf72'})
+
+    def test_get_processes_streams_pages(self):
+        processes = [{'id': str(i), 'status': 'Completed'} for i in range(3)]
+        def iter_processes():
+            for process in processes:
+                yield process
+        self.mock_tnco_client.processes.iter_query.return_value = iter_processes()
+        result = self.runner.invoke(process_cmds.get, ['process', '--assembly-name', 'Abc', '--limit', '3', '-o', 'json'])
+        self.assert_no_errors(result)
+        self.mock_tnco_client.processes.iter_query.assert_called_once_with(object_group_id=None, assemblyName='Abc', limit=3)
+        self.mock_tnco_client.processes.query.assert_not_called()
+        self.assertEqual(json.loads(result.output), {'items': processes})
+
+    def test_get_processes_as_ndjson(self):
+        processes = [{'id': str(i), 'status': 'Completed'} for i in range(3)]
+        self.mock_tnco_client.processes.iter_query.return_value = iter(processes)
+        result = self.runner.invoke(process_cmds.get, ['process', '-o', 'ndjson'])
+        self.assert_no_errors(result)
+        self.assertEqual(result.output, ''.join(json.dumps(p, separators=(',', ':')) + '\n' for p in processes))
+
+    def test_get_process_as_ndjson(self):
+        self.mock_tnco_client.processes.get.return_value = {'id': '123', 'status': 'Completed'}
+        result = self.runner.invoke(process_cmds.get, ['process', '123', '-o', 'ndjson'])
+        self.assert_no_errors(result)
+        self.assert_output(result, '{"id":"123","status":"Completed"}')
+
+    def _mock_wait(self, final_statuses):
+        def wait(process_ids, timeout=None, on_change=None):
+            results = []
+            for process_id in process_ids:
+                result = ProcessWaitResult(process_id)
+                result.process = {'id': process_id, 'status': final_statuses[process_id], 'statusReason': 'Reason for ' + process_id}
+                on_change(result)
+                results.append(result)
+            return results
+        self.mock_tnco_client.processes.wait.side_effect = wait
+
+    def test_wait_processes(self):
+        self._mock_wait({'123': 'Completed', '456': 'Completed'})
+        result = self.runner.invoke(process_cmds.wait, ['process', '123', '456', '--timeout', '60'])
+        self.assert_no_errors(result)
+        self.assert_output(result, 'Process 123: Completed\nProcess 456: Completed')
+        self.mock_tnco_client.processes.wait.assert_called_once()
+        args, kwargs = self.mock_tnco_client.processes.wait.call_args
+        self.assertEqual(list(args[0]), ['123', '456'])
+        self.assertEqual(kwargs['timeout'], 60)
+
+    def test_wait_processes_fails_when_process_not_completed(self):
+        self._mock_wait({'123': 'Completed', '456': 'Failed'})
+        result = self.runner.invoke(process_cmds.wait, ['process', '123', '456'])
+        self.assert_has_system_exit(result)
+        self.assertIn('Process 123: Completed\nProcess 456: Failed', result.output)
+        self.assertIn('Error: Process 456 did not complete successfully: Failed - Reason for 456', result.output)
+        self.assertNotIn('Process 123 did not complete', result.output)
+
+    def test_wait_processes_timeout(self):
+        self.mock_tnco_client.processes.wait.side_effect = ProcessWaitTimeoutError('Timed out after 1 seconds waiting for processes: 123 (In Progress)', [])
+        result = self.runner.invoke(process_cmds.wait, ['process', '123', '--timeout', '1'])
+        self.assertIsInstance(result.exception, ProcessWaitTimeoutError)
+
+    def test_wait_processes_requires_ids(self):
+        result = self.runner.invoke(process_cmds.wait, ['process'])
+        self.assertEqual(result.exit_code, 2)
+        self.mock_tnco_client.processes.wait.assert_not_called()
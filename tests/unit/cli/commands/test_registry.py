@@ -0,0 +1,59 @@
+import sys
+import json
+import unittest
+import subprocess
+import lmctl.cli.commands as lmctl_commands
+from lmctl.cli.commands.registry import COMMAND_MODULES, TOP_LEVEL_COMMANDS, render_registry
+
+# Invokes the CLI in a new interpreter, then prints the command modules imported
+INVOKE_SCRIPT = '''
+import sys, json
+from lmctl.cli.entry import cli
+try:
+    cli(sys.argv[1:], prog_name='lmctl')
+except SystemExit:
+    pass
+modules = [m for m in json.loads(sys.stdin.read()) if m in sys.modules]
+print(json.dumps(modules))
+'''
+
+class TestRegistry(unittest.TestCase):
+
+    def _imported_modules(self, *args):
+        all_modules = COMMAND_MODULES + [import_path.partition(':')[0] for import_path, _ in TOP_LEVEL_COMMANDS]
+        result = subprocess.run([sys.executable, '-c', INVOKE_SCRIPT] + list(args), input=json.dumps(all_modules), capture_output=True, text=True, check=True)
+        return json.loads(result.stdout.splitlines()[-1])
+
+    def test_registry_is_up_to_date(self):
+        result = subprocess.run([sys.executable, '-m', 'lmctl.cli.commands.registry', '--check'], capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, msg=result.stdout + result.stderr)
+
+    def test_render_registry(self):
+        registry = {
+            'TOP_LEVEL_COMMANDS': [{'name': 'pkg', 'aliases': [], 'tags': ['Projects'], 'help': 'It\'s "quoted"\nover lines', 'short_help': None, 'hidden': False}],
+            'ACTION_COMMANDS': {'get': [], 'create': [{'name': 'intent', 'aliases': ['intents'], 'tags': []}]}
+        }
+        data = {}
+        exec(render_registry(registry), data)
+        self.assertEqual(data['TOP_LEVEL_COMMANDS'], registry['TOP_LEVEL_COMMANDS'])
+        self.assertEqual(data['ACTION_COMMANDS'], registry['ACTION_COMMANDS'])
+
+    def test_help_does_not_import_command_modules(self):
+        self.assertEqual(self._imported_modules('--help'), [])
+        self.assertEqual(self._imported_modules('get', '--help'), [])
+
+    def test_invoke_imports_module_of_command_only(self):
+        self.assertEqual(self._imported_modules('get', 'processes', '--help'), ['lmctl.cli.commands.processes'])
+        self.assertEqual(self._imported_modules('genfile', 'descriptor', '--help'), ['lmctl.cli.commands.descriptors'])
+        self.assertEqual(self._imported_modules('project', '--help'), ['lmctl.cli.commands.project'])
+
+    def test_package_names_still_available(self):
+        from lmctl.cli.commands.pkg import pkg
+        from lmctl.cli.commands.actions import get
+        import lmctl.cli.commands.processes as processes
+        self.assertIs(lmctl_commands.pkg_group, pkg)
+        self.assertIs(lmctl_commands.get, get)
+        self.assertIn('get_process', processes.__all__)
+        self.assertIs(lmctl_commands.get_process, processes.get_process)
+        with self.assertRaises(AttributeError):
+            lmctl_commands.not_a_command
@@ -0,0 +1,88 @@
+import sys
+import types
+import click
+import tests.unit.cli.commands.command_testing as command_testing
+from unittest.mock import patch
+from lmctl.cli.commands.super_group import SuperGroup
+
+class TestSuperGroupLazyCommands(command_testing.CommandTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.group = SuperGroup('test', tag_order=['Tag A', 'Tag B'])
+        self.imports = []
+        self.module = types.ModuleType('lazy_commands_example')
+        self.module.__getattr__ = self._load_attribute
+        self.modules_patcher = patch.dict(sys.modules, {
+            'lazy_commands_example': self.module
+        })
+        self.modules_patcher.start()
+        self.addCleanup(self.modules_patcher.stop)
+
+    def _load_attribute(self, name):
+        self.imports.append(name)
+        @click.command(help='Say hello')
+        def hello():
+            click.echo('Hello')
+        return hello
+
+    def test_help_lists_lazy_commands_without_importing(self):
+        self.group.add_lazy_command('hello', 'lazy_commands_example:hello', tags=['Tag B'], help='Say hello')
+        self.group.add_lazy_command('secret', 'lazy_commands_example:secret', hidden=True)
+        self.group.add_command(click.Command('goodbye', help='Say goodbye'), tags=['Tag A'])
+        result = self.runner.invoke(self.group, ['--help'])
+        self.assert_no_errors(result)
+        self.assertIn('Tag A:\n  goodbye  Say goodbye\n\nTag B:\n  hello  Say hello\n', result.output)
+        self.assertNotIn('secret', result.output)
+        self.assertEqual(self.imports, [])
+
+    def test_help_shortens_lazy_help_as_click_does(self):
+        long_help = 'Say hello to ' + 'everyone and ' * 20 + 'goodbye'
+        self.group.add_lazy_command('hello', 'lazy_commands_example:hello', help=long_help)
+        self.group.add_command(click.Command('hi', help=long_help))
+        result = self.runner.invoke(self.group, ['--help'])
+        self.assert_no_errors(result)
+        rows = dict(line.split(None, 1) for line in result.output.splitlines() if line.startswith('  '))
+        self.assertTrue(rows['hello'].endswith('...'))
+        self.assertEqual(rows['hello'], rows['hi'])
+
+    def test_invoke_imports_lazy_command(self):
+        self.group.add_lazy_command('hello', 'lazy_commands_example:hello', aliases=['hi'], tags=['Tag A'])
+        result = self.runner.invoke(self.group, ['hello'])
+        self.assert_no_errors(result)
+        self.assertEqual(result.output, 'Hello\n')
+        self.assertEqual(self.imports, ['hello'])
+        cmd = self.group.commands['hello']
+        self.assertEqual(self.group.cmd_tags[cmd], ['Tag A'])
+        self.assertEqual(self.group.cmds_by_alias['hi'], cmd)
+        # Only imported once
+        result = self.runner.invoke(self.group, ['hello'])
+        self.assert_no_errors(result)
+        self.assertEqual(self.imports, ['hello'])
+
+    def test_invoke_by_alias_imports_lazy_command(self):
+        self.group.add_lazy_command('hello', 'lazy_commands_example:hello', aliases=['hi'])
+        result = self.runner.invoke(self.group, ['hi'])
+        self.assert_no_errors(result)
+        self.assertEqual(result.output, 'Hello\n')
+        self.assertEqual(self.imports, ['hello'])
+
+    def test_invoke_imports_module_registering_command(self):
+        group = self.group
+        def import_module(name):
+            self.imports.append(name)
+            @group.command(name='hello', aliases=['hi'])
+            def hello():
+                click.echo('Hello from module')
+        self.group.add_lazy_command('hello', 'lazy_commands_registering_example', aliases=['hi'])
+        with patch('lmctl.cli.commands.super_group.importlib.import_module', side_effect=import_module):
+            result = self.runner.invoke(self.group, ['hi'])
+        self.assert_no_errors(result)
+        self.assertEqual(result.output, 'Hello from module\n')
+        self.assertEqual(self.imports, ['lazy_commands_registering_example'])
+
+    def test_unknown_command(self):
+        self.group.add_lazy_command('hello', 'lazy_commands_example:hello')
+        result = self.runner.invoke(self.group, ['goodbye'])
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(self.imports, [])
@@ -27,6 +27,15 @@ class TestJsonFormat(unittest.TestCase):
         test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
         output = JsonFormat().convert_list(test_list)
         self.assertEqual(output, TEST_JSON_LIST)
+
+    def test_convert_iter(self):
+        test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
+        chunks = list(JsonFormat().convert_iter(iter(test_list)))
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(''.join(chunks), TEST_JSON_LIST)
+
+    def test_convert_iter_empty(self):
+        self.assertEqual(''.join(JsonFormat().convert_iter(iter([]))), JsonFormat().convert_list([]))
     
     def test_convert_element(self):
         element = {'someObject': {'data': 'some data'}}
@@ -0,0 +1,33 @@
+import unittest
+from lmctl.cli.format import NdjsonFormat, BadFormatError
+
+TEST_NDJSON_LIST = '''\
+"abc"
+123
+{"someObject":{"data":"some data"}}'''
+
+TEST_NDJSON_ELEMENT = '{"someObject":{"data":"some data"}}'
+
+class TestNdjsonFormat(unittest.TestCase):
+
+    def test_convert_list(self):
+        test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
+        output = NdjsonFormat().convert_list(test_list)
+        self.assertEqual(output, TEST_NDJSON_LIST)
+
+    def test_convert_iter(self):
+        test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
+        chunks = list(NdjsonFormat().convert_iter(iter(test_list)))
+        self.assertEqual(chunks, ['"abc"\n', '123\n', TEST_NDJSON_ELEMENT + '\n'])
+
+    def test_convert_iter_empty(self):
+        self.assertEqual(list(NdjsonFormat().convert_iter(iter([]))), [])
+
+    def test_convert_element(self):
+        element = {'someObject': {'data': 'some data'}}
+        output = NdjsonFormat().convert_element(element)
+        self.assertEqual(output, TEST_NDJSON_ELEMENT)
+
+    def test_convert_element_fails(self):
+        with self.assertRaises(BadFormatError):
+            NdjsonFormat().convert_element({'value': object()})
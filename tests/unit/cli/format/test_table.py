@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 from lmctl.cli.format import TableFormat, Table, Column
 
 DummyTable = Table(columns=[
@@ -42,6 +43,36 @@ class TestTableFormat(unittest.TestCase):
         output = TableFormat(table=DummyTable).convert_list(test_list)
         self.assertEqual(output, EXPECTED_LIST)
     
+    def test_convert_iter_single_batch(self):
+        test_list = [
+            {'name': 'A', 'status': 'Good'},
+            {'name': 'B', 'status': 'Bad'},
+            {'name': 'C', 'status': 'Excellent'},
+            {'name': 'D'}
+        ]
+        chunks = list(TableFormat(table=DummyTable).convert_iter(iter(test_list)))
+        self.assertEqual(chunks, [EXPECTED_LIST])
+
+    @patch('lmctl.cli.format.table.STREAM_BATCH_SIZE', 2)
+    def test_convert_iter_in_batches(self):
+        test_list = [
+            {'name': 'A', 'status': 'Good'},
+            {'name': 'B', 'status': 'Bad'},
+            {'name': 'C', 'status': 'Excellent'},
+            {'name': 'D'},
+            {'name': 'Longer than the first batch', 'status': 'Good'}
+        ]
+        chunks = list(TableFormat(table=DummyTable).convert_iter(iter(test_list)))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(''.join(chunks), '''\
+| Name   | Status    |
+|--------+-----------|
+| A      | OK        |
+| B      | Unhealthy |
+| C      | OK        |
+| D      | Unhealthy |
+| Longer than the first batch | OK        |''')
+
     def test_convert_element(self):
         element = {'name': 'A', 'status': 'Good'}
         output = TableFormat(table=DummyTable).convert_element(element)
@@ -20,6 +20,15 @@ class TestYamlFormat(unittest.TestCase):
         test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
         output = YamlFormat().convert_list(test_list)
         self.assertEqual(output, TEST_YAML_LIST)
+
+    def test_convert_iter(self):
+        test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
+        chunks = list(YamlFormat().convert_iter(iter(test_list)))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(''.join(chunks), TEST_YAML_LIST)
+
+    def test_convert_iter_empty(self):
+        self.assertEqual(''.join(YamlFormat().convert_iter(iter([]))), YamlFormat().convert_list([]))
     
     def test_convert_element(self):
         element = {'someObject': {'data': 'some data'}}
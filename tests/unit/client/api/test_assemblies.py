@@ -400,4 +400,27 @@ class TestAssembliesAPI(unittest.TestCase):
                                                         headers={'Content-Type': 'application/json'},
                                                         body={
                                                             'process_id': '8475f402-cb6f-4ef1-a379-77c7e20cdf72'
-                                                        }))
\ No newline at end of file
+                                                        }))
+    def test_iter_topN(self):
+        mock_response = [{'id': '123', 'name': 'Test'}]
+        self.mock_client.make_request.return_value.json.return_value = mock_response
+        response = self.assemblies.iter_topN(object_group_id='123-456')
+        self.assertEqual(list(response), mock_response)
+        self.mock_client.make_request.assert_called_once_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/topology/assemblies', query_params={'page': 0, 'size': 100}, object_group_id='123-456'))
+
+    def test_submit_intents(self):
+        self.mock_client.make_request.side_effect = [MagicMock(headers={'Location': '/api/processes/123'}), MagicMock(headers={'Location': '/api/processes/456'})]
+        intents = [
+            {'intentType': 'createAssembly', 'assemblyName': 'Test', 'descriptorName': 'assembly::Test::1.0'},
+            {'intentType': 'deleteAssembly', 'assemblyName': 'Other'}
+        ]
+        results = self.assemblies.submit_intents(intents, concurrency=1)
+        self.assertTrue(results.succeeded)
+        self.assertEqual([r.process_id for r in results], ['123', '456'])
+        self.mock_client.make_request.assert_called_with(TNCOClientRequest(method='POST', endpoint='api/intent/deleteAssembly', headers={'Content-Type': 'application/json'}, body={'assemblyName': 'Other'}))
+
+    def test_submit_intents_and_wait(self):
+        self.mock_client.make_request.return_value = MagicMock(headers={'Location': '/api/processes/123'})
+        self.mock_client.processes.wait.return_value = []
+        self.assemblies.submit_intents([{'intentType': 'createAssembly', 'assemblyName': 'Test'}], wait=True, wait_timeout=10)
+        self.mock_client.processes.wait.assert_called_once_with(['123'], timeout=10)
@@ -1,6 +1,7 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, call
 from lmctl.client.api import ProcessesAPI
+from lmctl.client.exceptions import TNCOClientError
 from lmctl.client.client_request import TNCOClientRequest
 
 class TestProcessesAPI(unittest.TestCase):
@@ -36,3 +37,77 @@ class TestProcessesAPI(unittest.TestCase):
         response = self.processes.query(object_group_id='123-456', assemblyName='Abc', intentTypes='healAssembly')
         self.assertEqual(response, mock_response)
         self.mock_client.make_request.assert_called_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', query_params={'assemblyName': 'Abc', 'intentTypes': 'healAssembly'}, object_group_id='123-456'))
+
+    def __mock_pages(self, *pages):
+        responses = []
+        for page in pages:
+            response = MagicMock()
+            response.json.return_value = page
+            responses.append(response)
+        self.mock_client.make_request.side_effect = responses
+
+    def __page_request(self, page, size, **query_params):
+        query_params.update({'page': page, 'size': size})
+        return TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', query_params=query_params)
+
+    def test_iter_query(self):
+        self.__mock_pages([{'id': '1'}, {'id': '2'}], [{'id': '3'}])
+        results = self.processes.iter_query(page_size=2, assemblyName='Abc')
+        self.mock_client.make_request.assert_not_called()
+        self.assertEqual(list(results), [{'id': '1'}, {'id': '2'}, {'id': '3'}])
+        self.assertEqual(self.mock_client.make_request.call_args_list, [
+            call(self.__page_request(0, 2, assemblyName='Abc')),
+            call(self.__page_request(1, 2, assemblyName='Abc'))
+        ])
+
+    def test_iter_query_stops_on_empty_page(self):
+        self.__mock_pages([{'id': '1'}, {'id': '2'}], [])
+        self.assertEqual(list(self.processes.iter_query(page_size=2)), [{'id': '1'}, {'id': '2'}])
+        self.assertEqual(self.mock_client.make_request.call_count, 2)
+
+    def test_iter_query_with_page_objects(self):
+        self.__mock_pages({'content': [{'id': '1'}, {'id': '2'}], 'last': False}, {'content': [{'id': '3'}, {'id': '4'}], 'last': True})
+        self.assertEqual(list(self.processes.iter_query(page_size=2)), [{'id': '1'}, {'id': '2'}, {'id': '3'}, {'id': '4'}])
+        self.assertEqual(self.mock_client.make_request.call_count, 2)
+
+    def test_iter_query_when_paging_ignored(self):
+        self.__mock_pages([{'id': '1'}, {'id': '2'}, {'id': '3'}])
+        self.assertEqual(list(self.processes.iter_query(page_size=2)), [{'id': '1'}, {'id': '2'}, {'id': '3'}])
+        self.assertEqual(self.mock_client.make_request.call_count, 1)
+
+    def test_iter_query_when_same_page_returned(self):
+        self.__mock_pages([{'id': '1'}, {'id': '2'}], [{'id': '1'}, {'id': '2'}])
+        self.assertEqual(list(self.processes.iter_query(page_size=2)), [{'id': '1'}, {'id': '2'}])
+        self.assertEqual(self.mock_client.make_request.call_count, 2)
+
+    def test_iter_query_with_limit(self):
+        self.__mock_pages([{'id': '1'}, {'id': '2'}], [{'id': '3'}, {'id': '4'}])
+        self.assertEqual(list(self.processes.iter_query(page_size=2, limit=3)), [{'id': '1'}, {'id': '2'}, {'id': '3'}])
+        self.assertEqual(self.mock_client.make_request.call_args_list, [
+            call(self.__page_request(0, 2, limit=3)),
+            call(self.__page_request(1, 2, limit=3))
+        ])
+
+    def test_iter_query_with_limit_smaller_than_page(self):
+        self.__mock_pages([{'id': '1'}, {'id': '2'}])
+        self.assertEqual(list(self.processes.iter_query(page_size=5, limit=2)), [{'id': '1'}, {'id': '2'}])
+        self.mock_client.make_request.assert_called_once_with(self.__page_request(0, 2, limit=2))
+
+    def test_iter_query_with_object_group_id(self):
+        self.__mock_pages([{'id': '1'}])
+        self.assertEqual(list(self.processes.iter_query(object_group_id='123-456')), [{'id': '1'}])
+        self.mock_client.make_request.assert_called_once_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', query_params={'page': 0, 'size': 100}, object_group_id='123-456'))
+
+    def test_iter_query_with_unexpected_response(self):
+        self.__mock_pages({'id': '1'})
+        with self.assertRaises(TNCOClientError):
+            list(self.processes.iter_query())
+
+    def test_wait(self):
+        self.mock_client.make_request.return_value.json.side_effect = [{'id': '123', 'status': 'In Progress'}, {'id': '123', 'status': 'Completed'}]
+        with patch('lmctl.client.process_watcher.time.sleep') as mock_sleep:
+            results = self.processes.wait(['123'], min_interval=0.5)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].status, 'Completed')
+        mock_sleep.assert_called_once_with(0.5)
+        self.mock_client.make_request.assert_called_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes/123', query_params={'shallow': True}))
@@ -1,6 +1,11 @@
 import unittest
 import time
+import tempfile
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from lmctl.client.auth_tracker import AuthTracker
+from lmctl.client.token_cache import TokenCache
 from .token_helper import build_a_token
 
 class TestAuthTracker(unittest.TestCase):
@@ -35,4 +40,141 @@ class TestAuthTracker(unittest.TestCase):
         # Expires in 10 minutes
         auth_response = {'token': build_a_token(expires_in=600)}
         tracker.accept_auth_response(auth_response)
-        self.assertFalse(tracker.has_access_expired)
\ No newline at end of file
+        self.assertFalse(tracker.has_access_expired)
+
+    def test_has_access_expired_true_within_refresh_ahead_window(self):
+        tracker = AuthTracker(refresh_ahead_seconds=60)
+        tracker.accept_auth_response({'token': build_a_token(expires_in=30)})
+        self.assertTrue(tracker.has_access_expired)
+
+    def test_has_access_expired_does_not_block(self):
+        tracker = AuthTracker()
+        tracker.accept_auth_response({'token': build_a_token(expires_in=0.5)})
+        start = time.monotonic()
+        self.assertTrue(tracker.has_access_expired)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+class TestAuthTrackerGetAccessToken(unittest.TestCase):
+
+    def test_authenticates_when_no_token(self):
+        tracker = AuthTracker()
+        token = build_a_token(expires_in=600)
+        self.assertEqual(tracker.get_access_token(lambda: {'token': token}), token)
+
+    def test_reuses_valid_token(self):
+        tracker = AuthTracker()
+        token = build_a_token(expires_in=600)
+        calls = []
+        def authenticate():
+            calls.append(1)
+            return {'token': token}
+        tracker.get_access_token(authenticate)
+        tracker.get_access_token(authenticate)
+        self.assertEqual(len(calls), 1)
+
+    def test_refreshes_token_within_refresh_ahead_window(self):
+        tracker = AuthTracker(refresh_ahead_seconds=60)
+        tracker.accept_auth_response({'token': build_a_token(expires_in=30)})
+        new_token = build_a_token(username='New', expires_in=600)
+        self.assertEqual(tracker.get_access_token(lambda: {'token': new_token}), new_token)
+
+    def test_proactive_refresh_failure_returns_current_token(self):
+        tracker = AuthTracker(refresh_ahead_seconds=60)
+        current_token = build_a_token(expires_in=30)
+        tracker.accept_auth_response({'token': current_token})
+        def authenticate():
+            raise ValueError('Mock error')
+        self.assertEqual(tracker.get_access_token(authenticate), current_token)
+
+    def test_auth_failure_raised_when_no_valid_token(self):
+        tracker = AuthTracker()
+        def authenticate():
+            raise ValueError('Mock error')
+        with self.assertRaises(ValueError):
+            tracker.get_access_token(authenticate)
+
+    def test_concurrent_callers_share_single_authentication(self):
+        tracker = AuthTracker()
+        token = build_a_token(expires_in=600)
+        calls = []
+        started = threading.Event()
+        def authenticate():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return {'token': token}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: tracker.get_access_token(authenticate), range(8)))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [token] * 8)
+
+    def test_concurrent_callers_continue_with_current_token_during_proactive_refresh(self):
+        tracker = AuthTracker(refresh_ahead_seconds=60)
+        current_token = build_a_token(expires_in=30)
+        tracker.accept_auth_response({'token': current_token})
+        new_token = build_a_token(username='New', expires_in=600)
+        refreshing = threading.Event()
+        release = threading.Event()
+        def authenticate():
+            refreshing.set()
+            release.wait(5)
+            return {'token': new_token}
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            refresh_future = executor.submit(tracker.get_access_token, authenticate)
+            refreshing.wait(5)
+            self.assertEqual(tracker.get_access_token(authenticate), current_token)
+            release.set()
+            self.assertEqual(refresh_future.result(), new_token)
+
+class TestAuthTrackerWithTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = TokenCache(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_accept_auth_response_stores_token_in_cache(self):
+        tracker = AuthTracker(token_cache=self.cache, cache_key='key')
+        token = build_a_token(expires_in=600)
+        tracker.accept_auth_response({'token': token})
+        self.assertEqual(self.cache.get('key'), token)
+
+    def test_has_access_expired_false_when_valid_token_cached(self):
+        token = build_a_token(expires_in=600)
+        self.cache.put('key', token)
+        tracker = AuthTracker(token_cache=self.cache, cache_key='key')
+        self.assertFalse(tracker.has_access_expired)
+        self.assertEqual(tracker.current_access_token, token)
+
+    def test_has_access_expired_true_when_cached_token_expires_soon(self):
+        self.cache.put('key', build_a_token(expires_in=5))
+        tracker = AuthTracker(token_cache=self.cache, cache_key='key')
+        self.assertTrue(tracker.has_access_expired)
+        self.assertIsNone(tracker.current_access_token)
+
+    def test_has_access_expired_true_when_cached_token_within_min_ttl(self):
+        # Outside of the refresh ahead window, but not valid for long enough to be re-used from the cache
+        self.cache.put('key', build_a_token(expires_in=20))
+        tracker = AuthTracker(token_cache=self.cache, cache_key='key', refresh_ahead_seconds=10)
+        self.assertTrue(tracker.has_access_expired)
+        self.assertIsNone(tracker.current_access_token)
+
+    def test_has_access_expired_true_when_cached_token_within_longer_refresh_ahead(self):
+        self.cache.put('key', build_a_token(expires_in=60))
+        tracker = AuthTracker(token_cache=self.cache, cache_key='key', refresh_ahead_seconds=90)
+        self.assertTrue(tracker.has_access_expired)
+
+    def test_has_access_expired_true_and_cache_cleared_when_cached_token_invalid(self):
+        self.cache.put('key', 'not-a-jwt')
+        tracker = AuthTracker(token_cache=self.cache, cache_key='key')
+        self.assertTrue(tracker.has_access_expired)
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_clear_removes_cached_token(self):
+        tracker = AuthTracker(token_cache=self.cache, cache_key='key')
+        tracker.accept_auth_response({'token': build_a_token(expires_in=600)})
+        tracker.clear()
+        self.assertIsNone(tracker.current_access_token)
+        self.assertIsNone(self.cache.get('key'))
@@ -0,0 +1,147 @@
+import unittest
+import threading
+import time
+from unittest.mock import patch, MagicMock
+from lmctl.client import BulkIntentSubmitter, RateLimiter, ProcessWaitResult, ProcessWaitTimeoutError, TNCOClientError
+
+def wait_result(process_id, status, status_reason=None):
+    result = ProcessWaitResult(process_id)
+    result.process = {'id': process_id, 'status': status, 'statusReason': status_reason}
+    return result
+
+
+class TestBulkIntentSubmitter(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_assemblies_api = MagicMock()
+        self.mock_processes_api = MagicMock()
+        self.mock_assemblies_api.intent.side_effect = lambda intent_type, intent, object_group_id=None: 'process-' + intent['assemblyName']
+
+    def _intents(self, count):
+        return [{'intentType': 'createAssembly', 'assemblyName': str(i), 'descriptorName': 'assembly::test::1.0'} for i in range(count)]
+
+    def test_submit(self):
+        intents = self._intents(3)
+        results = BulkIntentSubmitter(self.mock_assemblies_api, self.mock_processes_api, concurrency=2).submit(intents, object_group_id='og')
+        self.assertTrue(results.succeeded)
+        self.assertEqual([r.process_id for r in results], ['process-0', 'process-1', 'process-2'])
+        self.assertEqual(self.mock_assemblies_api.intent.call_count, 3)
+        self.mock_assemblies_api.intent.assert_any_call('createAssembly', {'assemblyName': '1', 'descriptorName': 'assembly::test::1.0'}, object_group_id='og')
+        # Original intents are not modified
+        self.assertEqual(intents[0]['intentType'], 'createAssembly')
+        self.mock_processes_api.wait.assert_not_called()
+
+    def test_submit_records_failures_without_stopping(self):
+        def intent(intent_type, intent, object_group_id=None):
+            if intent['assemblyName'] == '1':
+                raise TNCOClientError('Mock error')
+            return 'process-' + intent['assemblyName']
+        self.mock_assemblies_api.intent.side_effect = intent
+        intents = self._intents(3) + [{'assemblyName': 'no-type'}]
+        results = BulkIntentSubmitter(self.mock_assemblies_api, self.mock_processes_api).submit(intents)
+        self.assertFalse(results.succeeded)
+        self.assertEqual([r.index for r in results.failed], [1, 3])
+        self.assertEqual(results.results[1].error, 'Mock error')
+        self.assertEqual(results.results[3].error, 'Missing "intentType"')
+        self.assertEqual(results.results[2].process_id, 'process-2')
+        self.assertEqual(results.to_dict(), {
+            'total': 4,
+            'failed': 2,
+            'timedOut': False,
+            'intents': [
+                {'index': 0, 'intentType': 'createAssembly', 'assemblyName': '0', 'processId': 'process-0', 'processStatus': None, 'statusReason': None, 'error': None, 'waitError': None},
+                {'index': 1, 'intentType': 'createAssembly', 'assemblyName': '1', 'processId': None, 'processStatus': None, 'statusReason': None, 'error': 'Mock error', 'waitError': None},
+                {'index': 2, 'intentType': 'createAssembly', 'assemblyName': '2', 'processId': 'process-2', 'processStatus': None, 'statusReason': None, 'error': None, 'waitError': None},
+                {'index': 3, 'intentType': None, 'assemblyName': 'no-type', 'processId': None, 'processStatus': None, 'statusReason': None, 'error': 'Missing "intentType"', 'waitError': None},
+            ]
+        })
+
+    def test_submit_limits_concurrency(self):
+        lock = threading.Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+        def intent(intent_type, intent, object_group_id=None):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return 'process'
+        self.mock_assemblies_api.intent.side_effect = intent
+        BulkIntentSubmitter(self.mock_assemblies_api, self.mock_processes_api, concurrency=3).submit(self._intents(12))
+        self.assertEqual(self.mock_assemblies_api.intent.call_count, 12)
+        self.assertLessEqual(max_in_flight[0], 3)
+        self.assertGreater(max_in_flight[0], 1)
+
+    def test_submit_with_rate_limit(self):
+        with patch('lmctl.client.bulk_intents.RateLimiter') as mock_rate_limiter_class:
+            submitter = BulkIntentSubmitter(self.mock_assemblies_api, self.mock_processes_api, rate_limit=5)
+            submitter.submit(self._intents(3))
+        mock_rate_limiter_class.assert_called_once_with(5)
+        self.assertEqual(mock_rate_limiter_class.return_value.acquire.call_count, 3)
+
+    def test_submit_and_wait(self):
+        self.mock_processes_api.wait.return_value = [wait_result('process-0', 'Completed'), wait_result('process-2', 'Failed', 'Mock failure')]
+        intents = self._intents(3)
+        intents[1].pop('intentType')
+        results = BulkIntentSubmitter(self.mock_assemblies_api, self.mock_processes_api).submit(intents, wait=True, wait_timeout=60)
+        self.mock_processes_api.wait.assert_called_once_with(['process-0', 'process-2'], timeout=60)
+        self.assertTrue(results.results[0].succeeded)
+        self.assertEqual(results.results[2].process_status, 'Failed')
+        self.assertEqual(results.results[2].process_status_reason, 'Mock failure')
+        self.assertFalse(results.results[2].succeeded)
+        self.assertEqual([r.index for r in results.failed], [1, 2])
+
+    def test_submit_and_wait_timeout(self):
+        self.mock_processes_api.wait.side_effect = ProcessWaitTimeoutError('Mock timeout', [wait_result('process-0', 'Completed'), wait_result('process-1', 'In Progress')])
+        results = BulkIntentSubmitter(self.mock_assemblies_api, self.mock_processes_api).submit(self._intents(2), wait=True, wait_timeout=1)
+        self.assertTrue(results.timed_out)
+        self.assertEqual([r.process_status for r in results], ['Completed', 'In Progress'])
+        self.assertEqual([r.index for r in results.failed], [1])
+
+    def test_submit_and_wait_error(self):
+        self.mock_processes_api.wait.side_effect = TNCOClientError('Mock wait error')
+        intents = self._intents(2) + [{'assemblyName': 'no-type'}]
+        results = BulkIntentSubmitter(self.mock_assemblies_api, self.mock_processes_api).submit(intents, wait=True)
+        self.assertEqual([r.process_id for r in results], ['process-0', 'process-1', None])
+        self.assertEqual([r.wait_error for r in results], ['Mock wait error', 'Mock wait error', None])
+        self.assertEqual([r.index for r in results.failed], [0, 1, 2])
+
+    def test_submit_records_invalid_entries_without_stopping(self):
+        intents = [self._intents(1)[0], 'not-an-intent', ['also', 'not']]
+        results = BulkIntentSubmitter(self.mock_assemblies_api, self.mock_processes_api, concurrency=2).submit(intents)
+        self.assertEqual(results.results[0].process_id, 'process-0')
+        self.assertEqual(results.results[1].error, 'Intent must be an object but was: str')
+        self.assertEqual(results.results[2].error, 'Intent must be an object but was: list')
+        self.assertIsNone(results.results[1].intent_type)
+        self.assertEqual(results.to_dict()['failed'], 2)
+        self.assertEqual(self.mock_assemblies_api.intent.call_count, 1)
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            BulkIntentSubmitter(self.mock_assemblies_api, self.mock_processes_api, concurrency=0)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    @patch('lmctl.client.bulk_intents.time')
+    def test_acquire_spaces_calls(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        limiter = RateLimiter(4)
+        for _ in range(3):
+            limiter.acquire()
+        self.assertEqual([c[0][0] for c in mock_time.sleep.call_args_list], [0.25, 0.5])
+
+    @patch('lmctl.client.bulk_intents.time')
+    def test_acquire_does_not_wait_after_interval(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        limiter = RateLimiter(4)
+        limiter.acquire()
+        mock_time.monotonic.return_value = 101.0
+        limiter.acquire()
+        mock_time.sleep.assert_not_called()
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
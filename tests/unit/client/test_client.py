@@ -3,7 +3,7 @@ import requests
 import json
 import jwt
 from unittest.mock import patch, MagicMock, Mock
-from lmctl.client import TNCOClient, TNCOClientError, TNCOClientRequest
+from lmctl.client import TNCOClient, TNCOClientError, TNCOClientRequest, TNCOTransportOptions
 from datetime import datetime, timedelta
 
 class TestTNCOClient(unittest.TestCase):
@@ -32,6 +32,46 @@ class TestTNCOClient(unittest.TestCase):
         client = TNCOClient('https://test.example.com/')
         self.assertEqual(client.address, 'https://test.example.com')
 
+    @patch('lmctl.client.client.requests.Session')
+    def test_uses_pooled_session_by_default(self, requests_session_builder):
+        client = TNCOClient('https://test.example.com')
+        client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        requests_session_builder.assert_called_once()
+        mock_session = self._get_requests_session(requests_session_builder)
+        self.assertEqual(mock_session.request.call_count, 2)
+        mounted_prefixes = [c[0][0] for c in mock_session.mount.call_args_list]
+        self.assertEqual(mounted_prefixes, ['https://', 'http://'])
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_session_mounted_with_transport_options(self, requests_session_builder):
+        client = TNCOClient('https://test.example.com', transport_options=TNCOTransportOptions(pool_connections=2, pool_maxsize=25, max_retries=5, retry_backoff_factor=1))
+        client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        mock_session = self._get_requests_session(requests_session_builder)
+        adapter = mock_session.mount.call_args_list[0][0][1]
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 25)
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertEqual(adapter.max_retries.backoff_factor, 1)
+
+    @patch('lmctl.client.client.requests.request')
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_request_without_sessions(self, requests_session_builder, mock_request):
+        client = TNCOClient('https://test.example.com', use_sessions=False)
+        client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        requests_session_builder.assert_not_called()
+        mock_request.assert_called_with(method='GET', url='https://test.example.com/api/test', headers={}, verify=False)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_close_releases_session(self, requests_session_builder):
+        client = TNCOClient('https://test.example.com')
+        client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        mock_session = self._get_requests_session(requests_session_builder)
+        client.close()
+        mock_session.close.assert_called_once()
+        client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        self.assertEqual(requests_session_builder.call_count, 2)
+
     @patch('lmctl.client.client.requests.Session')
     def test_make_request(self, requests_session_builder):
         client = TNCOClient('https://test.example.com', use_sessions=True)
@@ -87,6 +127,17 @@ class TestTNCOClient(unittest.TestCase):
         mock_session = self._get_requests_session(requests_session_builder)
         mock_session.request.assert_called_with(method='GET', url='https://test.example.com/api/test', headers={}, verify=False)
 
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_request_clears_auth_on_unauthorized(self, requests_session_builder):
+        mock_auth = self._build_mocked_auth_type()
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.request.return_value.status_code = 401
+        mock_session.request.return_value.raise_for_status.side_effect = requests.HTTPError('Mock http error', response=MagicMock(status_code=401))
+        client = TNCOClient('https://test.example.com', auth_type=mock_auth)
+        with self.assertRaises(TNCOClientError):
+            client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        self.assertIsNone(client.auth_tracker.current_access_token)
+
     @patch('lmctl.client.client.requests.Session')
     def test_make_request_with_trace_ctx(self, requests_session_builder):
         from lmctl.utils.trace_ctx import trace_ctx
@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from lmctl.client import ProcessWatcher, ProcessWaitResult, ProcessWaitTimeoutError, TNCOClientError
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestProcessWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.time_patcher = patch('lmctl.client.process_watcher.time')
+        self.mock_time = self.time_patcher.start()
+        self.addCleanup(self.time_patcher.stop)
+        self.mock_time.monotonic.side_effect = self.clock.monotonic
+        self.mock_time.sleep.side_effect = self.clock.sleep
+        self.mock_processes_api = MagicMock()
+        self.statuses = {}
+        self.mock_processes_api.get.side_effect = self._get_process
+
+    def _get_process(self, process_id, shallow=None):
+        statuses = self.statuses[process_id]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return {'id': process_id, 'status': status, 'statusReason': f'{status} reason'}
+
+    def test_wait_for_completed_process(self):
+        self.statuses['123'] = ['Pending', 'In Progress', 'Completed']
+        results = ProcessWatcher(self.mock_processes_api).wait(['123'])
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].process_id, '123')
+        self.assertEqual(results[0].status, 'Completed')
+        self.assertTrue(results[0].finished)
+        self.assertTrue(results[0].completed)
+        self.assertEqual(self.mock_processes_api.get.call_count, 3)
+        self.mock_processes_api.get.assert_called_with('123', shallow=True)
+
+    def test_wait_for_failed_process(self):
+        self.statuses['123'] = ['In Progress', 'Failed']
+        results = ProcessWatcher(self.mock_processes_api).wait(['123'])
+        self.assertEqual(results[0].status, 'Failed')
+        self.assertEqual(results[0].status_reason, 'Failed reason')
+        self.assertTrue(results[0].finished)
+        self.assertFalse(results[0].completed)
+
+    def test_wait_for_many_processes_polls_each_until_finished(self):
+        self.statuses['1'] = ['Completed']
+        self.statuses['2'] = ['In Progress', 'In Progress', 'Cancelled']
+        self.statuses['3'] = ['In Progress', 'Completed']
+        results = ProcessWatcher(self.mock_processes_api).wait(['1', '2', '3'])
+        self.assertEqual([r.process_id for r in results], ['1', '2', '3'])
+        self.assertEqual([r.status for r in results], ['Completed', 'Cancelled', 'Completed'])
+        polled_ids = [c[0][0] for c in self.mock_processes_api.get.call_args_list]
+        self.assertEqual(polled_ids, ['1', '2', '3', '2', '3', '2'])
+        # One sleep per tick, not per process
+        self.assertEqual(len(self.clock.sleeps), 2)
+
+    def test_interval_grows_without_change_and_resets_on_change(self):
+        self.statuses['123'] = ['In Progress', 'In Progress', 'In Progress', 'In Progress', 'Completed']
+        watcher = ProcessWatcher(self.mock_processes_api, min_interval=1, max_interval=3, backoff_factor=2)
+        watcher.wait(['123'])
+        self.assertEqual(self.clock.sleeps, [1, 2, 3, 3])
+
+    def test_interval_resets_on_status_change(self):
+        self.statuses['123'] = ['Pending', 'Pending', 'Pending', 'In Progress', 'In Progress', 'Completed']
+        watcher = ProcessWatcher(self.mock_processes_api, min_interval=1, max_interval=10, backoff_factor=2)
+        watcher.wait(['123'])
+        self.assertEqual(self.clock.sleeps, [1, 2, 4, 1, 2])
+
+    def test_on_change_called_for_each_status_change(self):
+        self.statuses['123'] = ['Pending', 'Pending', 'In Progress', 'Completed']
+        changes = []
+        ProcessWatcher(self.mock_processes_api).wait(['123'], on_change=lambda r: changes.append((r.process_id, r.status)))
+        self.assertEqual(changes, [('123', 'Pending'), ('123', 'In Progress'), ('123', 'Completed')])
+
+    def test_timeout(self):
+        self.statuses['1'] = ['Completed']
+        self.statuses['2'] = ['In Progress']
+        watcher = ProcessWatcher(self.mock_processes_api, min_interval=1, max_interval=4, backoff_factor=2)
+        with self.assertRaises(ProcessWaitTimeoutError) as context:
+            watcher.wait(['1', '2'], timeout=5)
+        self.assertIsInstance(context.exception, TNCOClientError)
+        self.assertEqual(str(context.exception), 'Timed out after 5 seconds waiting for processes: 2 (In Progress)')
+        self.assertEqual([r.status for r in context.exception.results], ['Completed', 'In Progress'])
+        # Last sleep is cut short to end at the timeout
+        self.assertEqual(self.clock.sleeps, [1, 2, 2])
+
+    def test_invalid_intervals(self):
+        with self.assertRaises(ValueError):
+            ProcessWatcher(self.mock_processes_api, min_interval=0)
+        with self.assertRaises(ValueError):
+            ProcessWatcher(self.mock_processes_api, min_interval=5, max_interval=1)
+        with self.assertRaises(ValueError):
+            ProcessWatcher(self.mock_processes_api, backoff_factor=0.5)
+
+
+class TestProcessWaitResult(unittest.TestCase):
+
+    def test_before_first_poll(self):
+        result = ProcessWaitResult('123')
+        self.assertIsNone(result.status)
+        self.assertIsNone(result.status_reason)
+        self.assertFalse(result.finished)
+        self.assertFalse(result.completed)
@@ -0,0 +1,54 @@
+import unittest
+import tempfile
+import shutil
+import os
+import stat
+from lmctl.client import TokenCache
+
+class TestTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, 'tokens')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_build_key_differs_per_environment_auth_mode_and_principal(self):
+        key = TokenCache.build_key('dev', 'oauth', 'jack')
+        self.assertEqual(key, TokenCache.build_key('dev', 'oauth', 'jack'))
+        self.assertNotEqual(key, TokenCache.build_key('prod', 'oauth', 'jack'))
+        self.assertNotEqual(key, TokenCache.build_key('dev', 'zen', 'jack'))
+        self.assertNotEqual(key, TokenCache.build_key('dev', 'oauth', 'jill'))
+
+    def test_get_returns_none_when_not_cached(self):
+        cache = TokenCache(self.cache_dir)
+        self.assertIsNone(cache.get('missing'))
+
+    def test_put_and_get(self):
+        cache = TokenCache(self.cache_dir)
+        cache.put('abc', 'token-value')
+        self.assertEqual(TokenCache(self.cache_dir).get('abc'), 'token-value')
+
+    def test_put_restricts_permissions(self):
+        cache = TokenCache(self.cache_dir)
+        cache.put('abc', 'token-value')
+        dir_mode = stat.S_IMODE(os.stat(self.cache_dir).st_mode)
+        file_mode = stat.S_IMODE(os.stat(os.path.join(self.cache_dir, 'abc.json')).st_mode)
+        self.assertEqual(dir_mode, 0o700)
+        self.assertEqual(file_mode, 0o600)
+
+    def test_remove(self):
+        cache = TokenCache(self.cache_dir)
+        cache.put('abc', 'token-value')
+        cache.remove('abc')
+        self.assertIsNone(cache.get('abc'))
+        # No error when already removed
+        cache.remove('abc')
+
+    def test_get_ignores_corrupt_entry(self):
+        cache = TokenCache(self.cache_dir)
+        os.makedirs(self.cache_dir)
+        with open(os.path.join(self.cache_dir, 'abc.json'), 'w') as f:
+            f.write('not json{')
+        self.assertIsNone(cache.get('abc'))
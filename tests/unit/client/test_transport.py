@@ -0,0 +1,35 @@
+import unittest
+from lmctl.client import TNCOTransportOptions
+from lmctl.client.transport import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, DEFAULT_MAX_RETRIES, DEFAULT_RETRY_BACKOFF_FACTOR
+
+class TestTNCOTransportOptions(unittest.TestCase):
+
+    def test_defaults(self):
+        options = TNCOTransportOptions()
+        self.assertEqual(options.pool_connections, DEFAULT_POOL_CONNECTIONS)
+        self.assertEqual(options.pool_maxsize, DEFAULT_POOL_MAXSIZE)
+        self.assertEqual(options.max_retries, DEFAULT_MAX_RETRIES)
+        self.assertEqual(options.retry_backoff_factor, DEFAULT_RETRY_BACKOFF_FACTOR)
+
+    def test_build_retry_only_retries_idempotent_methods(self):
+        retry = TNCOTransportOptions(max_retries=2).build_retry()
+        self.assertEqual(retry.total, 2)
+        self.assertTrue(retry.is_retry('GET', 503))
+        self.assertTrue(retry.is_retry('PUT', 429))
+        self.assertTrue(retry.is_retry('DELETE', 503))
+        self.assertFalse(retry.is_retry('POST', 503))
+        self.assertFalse(retry.is_retry('GET', 500))
+
+    def test_build_retry_disabled(self):
+        retry = TNCOTransportOptions(max_retries=0).build_retry()
+        self.assertEqual(retry.total, 0)
+
+    def test_build_session_mounts_adapter(self):
+        session = TNCOTransportOptions(pool_connections=3, pool_maxsize=30).build_session()
+        try:
+            adapter = session.get_adapter('https://test.example.com')
+            self.assertIs(adapter, session.get_adapter('http://test.example.com'))
+            self.assertEqual(adapter._pool_connections, 3)
+            self.assertEqual(adapter._pool_maxsize, 30)
+        finally:
+            session.close()
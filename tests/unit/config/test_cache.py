@@ -0,0 +1,118 @@
+import unittest
+import tempfile
+import time
+import os
+import shutil
+from unittest.mock import patch
+from lmctl.config import ConfigIO, ConfigCache, build_config_cache
+from lmctl.config.cache import LazyEnvironmentGroups, _PickledGroup, CONFIG_CACHE_ENV_VAR
+from lmctl.environment import EnvironmentGroup
+from lmctl.utils.dcutils.dc_to_dict import asdict
+from .config_files import ConfigFileTestHelper
+
+class TestConfigCache(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.test_helper = ConfigFileTestHelper(self.tmp_dir)
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        self.cache = ConfigCache(directory=self.cache_dir)
+        self.config_path = self._prepare_file('simple-config')
+
+    def tearDown(self):
+        if self.tmp_dir and os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def _prepare_file(self, name: str, modified_ago: int = 60):
+        path = self.test_helper.prepare_file(name)
+        self._set_modified(path, modified_ago)
+        return path
+
+    def _set_modified(self, path: str, modified_ago: int):
+        modified = time.time() - modified_ago
+        os.utime(path, (modified, modified))
+
+    def test_get_without_entry(self):
+        self.assertIsNone(self.cache.get(self.config_path))
+
+    def test_put_and_get(self):
+        config = ConfigIO().file_to_config(self.config_path)
+        self.cache.put(self.config_path, config)
+        cached_config = self.cache.get(self.config_path)
+        self.assertIsInstance(cached_config.environments, LazyEnvironmentGroups)
+        self.assertEqual(asdict(cached_config), asdict(config))
+        self.assertEqual(cached_config.environments['test'].tnco.address, 'https://127.0.0.1:1111')
+        self.assertEqual(cached_config.environments['test2'].arms['first'].address, 'first')
+        self.assertIsNone(cached_config.environments.get('missing'))
+
+    def test_get_only_builds_environments_used(self):
+        self.cache.put(self.config_path, ConfigIO().file_to_config(self.config_path))
+        cached_config = self.cache.get(self.config_path)
+        test_env = cached_config.environments['test']
+        self.assertIsInstance(test_env, EnvironmentGroup)
+        self.assertEqual(list(cached_config.environments), ['test', 'test2'])
+        self.assertIsInstance(cached_config.environments._groups['test2'], _PickledGroup)
+        self.assertIs(cached_config.environments['test'], test_env)
+
+    def test_get_after_file_modified(self):
+        self.cache.put(self.config_path, ConfigIO().file_to_config(self.config_path))
+        self._set_modified(self.config_path, 30)
+        self.assertIsNone(self.cache.get(self.config_path))
+
+    def test_get_after_file_size_changed(self):
+        self.cache.put(self.config_path, ConfigIO().file_to_config(self.config_path))
+        stat = os.stat(self.config_path)
+        with open(self.config_path, 'a') as f:
+            f.write('\n')
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertIsNone(self.cache.get(self.config_path))
+
+    def test_put_ignores_recently_modified_file(self):
+        self._set_modified(self.config_path, 0)
+        self.cache.put(self.config_path, ConfigIO().file_to_config(self.config_path))
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_get_ignores_unreadable_entry(self):
+        self.cache.put(self.config_path, ConfigIO().file_to_config(self.config_path))
+        for entry_name in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, entry_name), 'wb') as f:
+                f.write(b'not a cache entry')
+        self.assertIsNone(self.cache.get(self.config_path))
+
+    def test_entries_only_readable_by_user(self):
+        self.cache.put(self.config_path, ConfigIO().file_to_config(self.config_path))
+        self.assertEqual(os.stat(self.cache_dir).st_mode & 0o777, 0o700)
+        for entry_name in os.listdir(self.cache_dir):
+            self.assertEqual(os.stat(os.path.join(self.cache_dir, entry_name)).st_mode & 0o777, 0o600)
+
+    def test_config_io_reads_from_cache(self):
+        config_io = ConfigIO(cache=self.cache)
+        config = config_io.file_to_config(self.config_path)
+        self.assertNotIsInstance(config.environments, LazyEnvironmentGroups)
+        with patch.object(config_io, 'file_to_dict') as mock_file_to_dict:
+            cached_config = config_io.file_to_config(self.config_path)
+            mock_file_to_dict.assert_not_called()
+        self.assertIsInstance(cached_config.environments, LazyEnvironmentGroups)
+        self.assertEqual(asdict(cached_config), asdict(config))
+
+    def test_config_io_write_of_cached_config(self):
+        config_io = ConfigIO(cache=self.cache)
+        config_io.file_to_config(self.config_path)
+        cached_config = config_io.file_to_config(self.config_path)
+        cached_config.active_environment = 'test2'
+        cached_config.environments['test3'] = EnvironmentGroup(name='test3')
+        config_io.config_to_file(cached_config, self.config_path)
+        self.assertIsNone(self.cache.get(self.config_path))
+        written = self.test_helper.read_workspace_yaml_file('simple-config.yaml')
+        expected = self.test_helper.read_yaml_file('simple-config')
+        self.assertEqual(written['active_environment'], 'test2')
+        self.assertEqual(written['environments']['test3'], {})
+        self.assertEqual(written['environments']['test']['tnco']['address'], expected['environments']['test']['tnco']['address'])
+        self.assertEqual(written['environments']['test2']['arms']['first'], {'address': 'first'})
+
+    def test_build_config_cache(self):
+        with patch.dict(os.environ, {CONFIG_CACHE_ENV_VAR: 'true'}):
+            self.assertIsInstance(build_config_cache(), ConfigCache)
+        with patch.dict(os.environ, {CONFIG_CACHE_ENV_VAR: 'false'}):
+            self.assertIsNone(build_config_cache())
@@ -0,0 +1,24 @@
+import unittest
+from unittest.mock import MagicMock
+from lmctl.drivers.lm import LmHttpSession, LmBehaviourDriver
+
+class TestLmBehaviourDriver(unittest.TestCase):
+
+    def setUp(self):
+        mock_options = MagicMock()
+        self.mock_requests_session = mock_options.build_session.return_value
+        self.driver = LmBehaviourDriver('https://test', http_session=LmHttpSession(mock_options))
+
+    def test_create_assembly_configuration_returns_created_with_id(self):
+        self.mock_requests_session.request.return_value.status_code = 201
+        self.mock_requests_session.request.return_value.headers = {'location': 'https://test/api/behaviour/assemblyConfigurations/123'}
+        configuration = {'name': 'simple'}
+        created = self.driver.create_assembly_configuration(configuration)
+        self.assertEqual(created, {'name': 'simple', 'id': '123'})
+        self.assertEqual(configuration, {'name': 'simple'})
+
+    def test_create_scenario_without_location_returns_created_without_id(self):
+        self.mock_requests_session.request.return_value.status_code = 201
+        self.mock_requests_session.request.return_value.headers = {}
+        created = self.driver.create_scenario({'name': 'test'})
+        self.assertEqual(created, {'name': 'test'})
@@ -0,0 +1,36 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from lmctl.drivers.lm import LmHttpSession, LmResourcePkgDriver
+from lmctl.utils.uploads import MultipartEncoder
+
+class TestLmResourcePkgDriver(unittest.TestCase):
+
+    def setUp(self):
+        mock_options = MagicMock()
+        self.mock_requests_session = mock_options.build_session.return_value
+        self.driver = LmResourcePkgDriver('https://test', http_session=LmHttpSession(mock_options))
+        self.tmp_dir = tempfile.mkdtemp()
+        self.pkg_path = os.path.join(self.tmp_dir, 'package.zip')
+        with open(self.pkg_path, 'wb') as f:
+            f.write(b'package-content')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_onboard_package_streams_multipart_body(self):
+        self.mock_requests_session.request.return_value.status_code = 201
+        sent_bodies = []
+        self.mock_requests_session.request.side_effect = lambda *args, **kwargs: sent_bodies.append((kwargs['data'].read(), kwargs['headers']['Content-Type'])) or self.mock_requests_session.request.return_value
+        progress = []
+        self.driver.onboard_package(self.pkg_path, object_group_id='123', progress_callback=lambda sent, total: progress.append((sent, total)))
+        args, kwargs = self.mock_requests_session.request.call_args
+        self.assertIsInstance(kwargs['data'], MultipartEncoder)
+        self.assertNotIn('files', kwargs)
+        self.assertEqual(kwargs['params'], {'objectGroupId': '123'})
+        body, content_type = sent_bodies[0]
+        self.assertEqual(content_type, kwargs['data'].content_type)
+        self.assertIn(b'name="file"; filename="package.zip"\r\n\r\npackage-content\r\n', body)
+        self.assertEqual(progress[-1], (len(body), len(body)))
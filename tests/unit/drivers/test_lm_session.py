@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from lmctl.drivers.lm import LmHttpSession, LmDescriptorDriver, LmBehaviourDriver
+from lmctl.client import TNCOTransportOptions
+
+class TestLmHttpSession(unittest.TestCase):
+
+    @patch('lmctl.drivers.lm.session.TNCOTransportOptions')
+    def test_request_uses_single_pooled_session(self, mock_options_init):
+        http_session = LmHttpSession()
+        mock_requests_session = mock_options_init.return_value.build_session.return_value
+        http_session.request('DriverA', 'GET', 'https://test/api/a', verify=False)
+        http_session.request('DriverB', 'POST', 'https://test/api/b', json={'a': 1})
+        mock_options_init.return_value.build_session.assert_called_once()
+        self.assertEqual(mock_requests_session.request.call_count, 2)
+        mock_requests_session.request.assert_called_with('POST', 'https://test/api/b', json={'a': 1})
+
+    def test_records_stats_per_driver(self):
+        mock_options = MagicMock()
+        http_session = LmHttpSession(mock_options)
+        http_session.request('DriverA', 'GET', 'https://test/api/a')
+        http_session.request('DriverA', 'GET', 'https://test/api/a')
+        http_session.request('DriverB', 'DELETE', 'https://test/api/b')
+        stats = {s.name: s for s in http_session.stats}
+        self.assertEqual(stats['DriverA'].request_count, 2)
+        self.assertEqual(stats['DriverB'].request_count, 1)
+        self.assertEqual(http_session.request_count, 3)
+        self.assertGreaterEqual(http_session.total_time, 0)
+
+    def test_records_stats_on_failed_request(self):
+        mock_options = MagicMock()
+        mock_options.build_session.return_value.request.side_effect = ValueError('Mock error')
+        http_session = LmHttpSession(mock_options)
+        with self.assertRaises(ValueError):
+            http_session.request('DriverA', 'GET', 'https://test/api/a')
+        self.assertEqual(http_session.request_count, 1)
+
+    def test_stats_since(self):
+        mock_options = MagicMock()
+        http_session = LmHttpSession(mock_options)
+        http_session.request('DriverA', 'GET', 'https://test/api/a')
+        snapshot = http_session.stats
+        http_session.request('DriverA', 'GET', 'https://test/api/a')
+        http_session.request('DriverB', 'GET', 'https://test/api/b')
+        since = {s.name: s for s in http_session.stats_since(snapshot)}
+        self.assertEqual(since['DriverA'].request_count, 1)
+        self.assertEqual(since['DriverB'].request_count, 1)
+
+    def test_stats_since_excludes_idle_drivers(self):
+        mock_options = MagicMock()
+        http_session = LmHttpSession(mock_options)
+        http_session.request('DriverA', 'GET', 'https://test/api/a')
+        snapshot = http_session.stats
+        self.assertEqual(http_session.stats_since(snapshot), [])
+
+    def test_drivers_route_requests_through_shared_session(self):
+        mock_options = MagicMock()
+        mock_requests_session = mock_options.build_session.return_value
+        mock_requests_session.request.return_value.status_code = 200
+        mock_requests_session.request.return_value.text = 'name: test'
+        http_session = LmHttpSession(mock_options)
+        LmDescriptorDriver('https://test', http_session=http_session).get_descriptor('test')
+        mock_requests_session.request.return_value.json.return_value = []
+        LmBehaviourDriver('https://test', http_session=http_session).get_scenarios('test')
+        mock_options.build_session.assert_called_once()
+        self.assertEqual([s.name for s in http_session.stats], ['LmDescriptorDriver', 'LmBehaviourDriver'])
+
+    def test_driver_without_session_creates_own(self):
+        driver = LmDescriptorDriver('https://test')
+        self.assertIsInstance(driver.http_session, LmHttpSession)
@@ -3,7 +3,7 @@ import unittest.mock as mock
 import os
 from pydantic import ValidationError
 from lmctl.environment import TNCOEnvironment, LmSessionConfig, LmSession, ALLOW_ALL_SCHEMES_ENV_VAR
-from lmctl.client import TNCOClient, LegacyUserPassAuth, UserPassAuth, ClientCredentialsAuth, JwtTokenAuth, ZenAPIKeyAuth, OktaUserPassAuth
+from lmctl.client import TNCOClient, TokenCache, LegacyUserPassAuth, UserPassAuth, ClientCredentialsAuth, JwtTokenAuth, ZenAPIKeyAuth, OktaUserPassAuth
 
 class TestTNCOEnvironment(unittest.TestCase):
     maxDiff = None
@@ -223,6 +223,52 @@ class TestTNCOEnvironment(unittest.TestCase):
         self.assertEqual(client.address, 'https://test:80/gateway')
         self.assertEqual(client.kami_address, 'http://test:31289')
 
+    def test_build_client_sets_transport_options(self):
+        config = TNCOEnvironment(
+                         address='https://testing',
+                         pool_connections=2,
+                         pool_maxsize=20,
+                         max_retries=0,
+                         retry_backoff_factor=1.5
+                         )
+        client = config.build_client()
+        self.assertTrue(client.use_sessions)
+        self.assertEqual(client.transport_options.pool_connections, 2)
+        self.assertEqual(client.transport_options.pool_maxsize, 20)
+        self.assertEqual(client.transport_options.max_retries, 0)
+        self.assertEqual(client.transport_options.retry_backoff_factor, 1.5)
+
+    def test_build_client_with_token_cache(self):
+        config = TNCOEnvironment(address='https://testing', secure=True, client_id='TNCOClient', client_secret='sosecret', token_cache=True)
+        client = config.build_client()
+        self.assertIsNotNone(client.auth_tracker.token_cache)
+        self.assertEqual(client.auth_tracker.cache_key, TokenCache.build_key('https://testing', 'oauth', 'TNCOClient'))
+
+    def test_build_client_without_token_cache_by_default(self):
+        config = TNCOEnvironment(address='https://testing', secure=True, client_id='TNCOClient', client_secret='sosecret')
+        client = config.build_client()
+        self.assertIsNone(client.auth_tracker.token_cache)
+
+    def test_build_client_ignores_token_cache_with_token_auth(self):
+        config = TNCOEnvironment(address='https://testing', secure=True, auth_mode='token', token='123', token_cache=True)
+        client = config.build_client()
+        self.assertIsNone(client.auth_tracker.token_cache)
+
+    def test_token_cache_key_includes_name(self):
+        config = TNCOEnvironment(address='https://testing', name='dev', secure=True, username='jack', token_cache=True)
+        self.assertEqual(config.token_cache_key(), TokenCache.build_key('dev@https://testing', 'oauth', 'jack'))
+
+    def test_token_cache_key_differs_by_principal(self):
+        config = TNCOEnvironment(address='https://testing', secure=True, username='jack', client_id='LmClient', token_cache=True)
+        self.assertEqual(config.token_cache_key(), TokenCache.build_key('https://testing', 'oauth', 'jack@LmClient'))
+        self.assertNotEqual(config.token_cache_key_for('oauth', username='jill', client_id='LmClient'), config.token_cache_key())
+        self.assertNotEqual(config.token_cache_key_for('oauth', client_id='LmClient'), config.token_cache_key())
+
+    def test_build_client_without_sessions(self):
+        config = TNCOEnvironment(address='https://testing', use_sessions=False)
+        client = config.build_client()
+        self.assertFalse(client.use_sessions)
+
     def test_build_client_legacy_auth(self):
         config = TNCOEnvironment(
                          address='https://testing',
@@ -462,27 +508,52 @@ class TestLmSession(unittest.TestCase):
         mock_client_builder.client_credentials_auth.assert_not_called()
         mock_client_builder.zen_api_key_auth.assert_called_once_with(username='user', api_key='123', zen_auth_address='https://zen:81')
 
+    def test_drivers_share_http_session(self):
+        session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', pool_maxsize=20), None, auth_mode='oauth'))
+        self.assertIs(session.descriptor_driver.http_session, session.http_session)
+        self.assertIs(session.behaviour_driver.http_session, session.http_session)
+        self.assertIs(session.resource_pkg_driver.http_session, session.http_session)
+        self.assertEqual(session.http_session.transport_options.pool_maxsize, 20)
+
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmDescriptorDriver')
     def test_descriptor_driver(self, descriptor_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None, auth_mode='oauth'))
         driver = session.descriptor_driver
-        descriptor_driver_init.assert_called_once_with('https://test:80', None)
+        descriptor_driver_init.assert_called_once_with('https://test:80', None, http_session=session.http_session)
         self.assertEqual(driver, descriptor_driver_init.return_value)
 
+    @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
+    def test_security_ctrl_with_token_cache(self, mock_security_ctrl_init):
+        env = TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', token_cache=True)
+        session = LmSession(LmSessionConfig(env, 'user', 'secret', auth_mode='oauth'))
+        driver = session.descriptor_driver
+        call_kwargs = mock_security_ctrl_init.call_args[1]
+        self.assertIsInstance(call_kwargs['token_cache'], TokenCache)
+        self.assertEqual(call_kwargs['token_cache_key'], env.token_cache_key())
+
+    @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
+    def test_security_ctrl_token_cache_key_uses_session_credentials(self, mock_security_ctrl_init):
+        env = TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', token_cache=True)
+        session = LmSession(LmSessionConfig(env, 'other-user', 'secret', auth_mode='oauth'))
+        driver = session.descriptor_driver
+        call_kwargs = mock_security_ctrl_init.call_args[1]
+        self.assertEqual(call_kwargs['token_cache_key'], env.token_cache_key_for('oauth', username='other-user'))
+        self.assertNotEqual(call_kwargs['token_cache_key'], env.token_cache_key())
+
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmDescriptorDriver')
     def test_descriptor_driver_with_security(self, descriptor_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.descriptor_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        descriptor_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, token_cache=None, token_cache_key=None, token_refresh_ahead=None)
+        descriptor_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, http_session=session.http_session)
         self.assertEqual(driver, descriptor_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmOnboardRmDriver')
     def test_onboard_rm_driver(self, onboard_rm_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.onboard_rm_driver
-        onboard_rm_driver_init.assert_called_once_with('https://test:80', None)
+        onboard_rm_driver_init.assert_called_once_with('https://test:80', None, http_session=session.http_session)
         self.assertEqual(driver, onboard_rm_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -490,15 +561,15 @@ class TestLmSession(unittest.TestCase):
     def test_onboard_rm_driver_with_security(self, onboard_rm_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.onboard_rm_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        onboard_rm_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, token_cache=None, token_cache_key=None, token_refresh_ahead=None)
+        onboard_rm_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, http_session=session.http_session)
         self.assertEqual(driver, onboard_rm_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmTopologyDriver')
     def test_topology_driver(self, topology_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.topology_driver
-        topology_driver_init.assert_called_once_with('https://test:80', None)
+        topology_driver_init.assert_called_once_with('https://test:80', None, http_session=session.http_session)
         self.assertEqual(driver, topology_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -506,15 +577,15 @@ class TestLmSession(unittest.TestCase):
     def test_topology_driver_with_security(self, topology_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.topology_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        topology_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, token_cache=None, token_cache_key=None, token_refresh_ahead=None)
+        topology_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, http_session=session.http_session)
         self.assertEqual(driver, topology_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmBehaviourDriver')
     def test_behaviour_driver(self, behaviour_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.behaviour_driver
-        behaviour_driver_init.assert_called_once_with('https://test:80', None)
+        behaviour_driver_init.assert_called_once_with('https://test:80', None, http_session=session.http_session)
         self.assertEqual(driver, behaviour_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -522,15 +593,15 @@ class TestLmSession(unittest.TestCase):
     def test_behaviour_driver_with_security(self, behaviour_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.behaviour_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        behaviour_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, token_cache=None, token_cache_key=None, token_refresh_ahead=None)
+        behaviour_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, http_session=session.http_session)
         self.assertEqual(driver, behaviour_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmDeploymentLocationDriver')
     def test_deployment_location_driver(self, deployment_location_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.deployment_location_driver
-        deployment_location_driver_init.assert_called_once_with('https://test:80', None)
+        deployment_location_driver_init.assert_called_once_with('https://test:80', None, http_session=session.http_session)
         self.assertEqual(driver, deployment_location_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -538,15 +609,15 @@ class TestLmSession(unittest.TestCase):
     def test_deployment_location_driver_with_security(self, deployment_location_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.deployment_location_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        deployment_location_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, token_cache=None, token_cache_key=None, token_refresh_ahead=None)
+        deployment_location_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, http_session=session.http_session)
         self.assertEqual(driver, deployment_location_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmInfrastructureKeysDriver')
     def test_infrastructure_keys_driver(self, infrastructure_keys_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.infrastructure_keys_driver
-        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', None)
+        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', None, http_session=session.http_session)
         self.assertEqual(driver, infrastructure_keys_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -554,6 +625,6 @@ class TestLmSession(unittest.TestCase):
     def test_infrastructure_keys_driver_with_security(self, infrastructure_keys_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='https'), 'user', 'secret', auth_mode='oauth'))
         driver = session.infrastructure_keys_driver
-        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None)
-        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('https://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', scope=None, auth_server_id=None, token_cache=None, token_cache_key=None, token_refresh_ahead=None)
+        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, http_session=session.http_session)
         self.assertEqual(driver, infrastructure_keys_driver_init.return_value)
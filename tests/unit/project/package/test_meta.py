@@ -3,7 +3,7 @@ import tempfile
 import os
 import yaml
 import shutil
-from lmctl.project.package.meta import PkgMetaRewriter
+from lmctl.project.package.meta import PkgMetaRewriter, PkgMetaParser, calculate_content_hashes, calculate_file_hash
 
 OLD_STYLE_META = """\
 name: testproject
@@ -124,4 +124,63 @@ class TestPkgMetaRewriter(unittest.TestCase):
             new_config = f.read()
         self.assertEqual(new_config, NEW_STYLE_NO_VNFCS)
 
-    
\ No newline at end of file
+    
+
+
+class TestPkgMetaContentHashes(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        if self.tmp_dir and os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def __write_file(self, content, *path):
+        full_path = os.path.join(self.tmp_dir, *path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'w') as f:
+            f.write(content)
+        return full_path
+
+    def test_calculate_content_hashes(self):
+        descriptor_path = self.__write_file('name: assembly::test::1.0', 'Descriptor', 'assembly.yml')
+        self.__write_file('{}', 'Behaviour', 'Tests', 'test.json')
+        self.__write_file('name: resource::sub::1.0', 'Contains', 'sub', 'Definitions', 'resource.yaml')
+        content_hashes = calculate_content_hashes(self.tmp_dir, excluded_dirs=['Contains'])
+        self.assertEqual(list(content_hashes.keys()), ['Behaviour/Tests/test.json', 'Descriptor/assembly.yml'])
+        self.assertEqual(content_hashes['Descriptor/assembly.yml'], calculate_file_hash(descriptor_path))
+
+    def test_parse_content_hashes(self):
+        meta = PkgMetaParser.from_dict({
+            'schema': '2.0',
+            'name': 'test',
+            'version': '1.0',
+            'content-hashes': {'Descriptor/assembly.yml': 'abc'},
+            'contains': [
+                {'name': 'sub', 'type': 'Assembly', 'content-hashes': {'Descriptor/assembly.yml': 'def'}}
+            ]
+        })
+        self.assertEqual(meta.content_hash('Descriptor/assembly.yml'), 'abc')
+        self.assertEqual(meta.content_hash(os.path.join('Descriptor', 'assembly.yml')), 'abc')
+        self.assertIsNone(meta.content_hash('Descriptor/missing.yml'))
+        self.assertEqual(meta.subpkgs[0].content_hash('Descriptor/assembly.yml'), 'def')
+
+    def test_parse_without_content_hashes(self):
+        meta = PkgMetaParser.from_dict({'schema': '2.0', 'name': 'test', 'version': '1.0'})
+        self.assertIsNone(meta.content_hash('Descriptor/assembly.yml'))
+        self.assertNotIn('content-hashes', meta.to_dict())
+
+    def test_to_dict_includes_content_hashes(self):
+        meta_dict = {
+            'schema': '2.0',
+            'name': 'test',
+            'version': '1.0',
+            'type': 'Assembly',
+            'contains': [
+                {'name': 'sub', 'type': 'Assembly', 'content-hashes': {'Descriptor/assembly.yml': 'def'}, 'directory': 'sub'}
+            ],
+            'content-hashes': {'Descriptor/assembly.yml': 'abc'}
+        }
+        self.assertEqual(PkgMetaParser.from_dict(meta_dict).to_dict(), meta_dict)
+
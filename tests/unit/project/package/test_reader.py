@@ -0,0 +1,113 @@
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from tests.common.project_testing import ProjectSimTestCase
+from lmctl.project.package.core import Pkg, InvalidPackageError
+from lmctl.project.package.reader import PkgArchiveReader
+
+META_YAML = b"""\
+schema: '2.0'
+name: basic
+version: '1.0'
+type: Assembly
+"""
+
+DEPRECATED_META_YAML = b"""\
+name: old
+"""
+
+def add_member(pkg_tar, name, content):
+    info = tarfile.TarInfo(name)
+    info.size = len(content)
+    pkg_tar.addfile(info, io.BytesIO(content))
+
+def tgz_bytes(members):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as pkg_tar:
+        for name, content in members:
+            add_member(pkg_tar, name, content)
+    return buffer.getvalue()
+
+
+class TestPkgArchiveReader(ProjectSimTestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(self.tmp_dir)
+
+    def __write(self, name, content):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def __inspect_by_extracting(self, pkg):
+        extract_dir = tempfile.mkdtemp()
+        try:
+            return pkg.open(extract_dir).inspect().to_dict()
+        finally:
+            shutil.rmtree(extract_dir)
+
+    def test_inspect_matches_extracted_content(self):
+        pkg_sims = [
+            self.simlab.simulate_pkg_assembly_basic(),
+            self.simlab.simulate_pkg_assembly_deprecated_content_basic(),
+            self.simlab.simulate_pkg_assembly_old_style(),
+            self.simlab.simulate_pkg_assembly_contains_brent_basic(),
+            self.simlab.simulate_pkg_assembly_contains_arm_basic(),
+            self.simlab.simulate_pkg_brent_2dot1_basic()
+        ]
+        for pkg_sim in pkg_sims:
+            with self.subTest(pkg=os.path.basename(pkg_sim.path)):
+                self.assertEqual(Pkg(pkg_sim.path).inspect().to_dict(), self.__inspect_by_extracting(Pkg(pkg_sim.path)))
+
+    def test_stops_reading_tgz_at_leading_meta(self):
+        # Anything after the leading meta is never read, so a corrupt remainder goes unnoticed
+        pkg_path = self.__write('pkg.tgz', tgz_bytes([('lmpkg.yml', META_YAML), ('Descriptor/assembly.yml', b'name: assembly::basic::1.0\n' * 10000)])[:200])
+        meta_dict, deprecated = PkgArchiveReader(pkg_path).read_meta_dict()
+        self.assertEqual(meta_dict['name'], 'basic')
+        self.assertFalse(deprecated)
+
+    def test_reads_trailing_meta_from_tgz(self):
+        pkg_path = self.__write('pkg.tgz', tgz_bytes([('Descriptor/assembly.yml', b'name: assembly::basic::1.0\n'), ('lmpkg.yml', META_YAML)]))
+        self.assertEqual(Pkg(pkg_path).inspect().name, 'basic')
+
+    def test_reads_meta_from_deprecated_content_tgz(self):
+        content_tgz = tgz_bytes([('lmpkg.yml', META_YAML), ('Descriptor/assembly.yml', b'name: assembly::basic::1.0\n')])
+        # As with extracting, the meta in content.tgz takes precedence
+        pkg_path = self.__write('pkg.tgz', tgz_bytes([('content.tgz', content_tgz), ('lmpkg.yml', META_YAML.replace(b'basic', b'outer'))]))
+        self.assertEqual(Pkg(pkg_path).inspect().name, 'basic')
+
+    def test_reads_deprecated_meta(self):
+        pkg_path = self.__write('pkg.tgz', tgz_bytes([('lmproject.yml', DEPRECATED_META_YAML)]))
+        meta_dict, deprecated = PkgArchiveReader(pkg_path).read_meta_dict()
+        self.assertTrue(deprecated)
+        report = Pkg(pkg_path).inspect()
+        self.assertEqual(report.name, 'old')
+        self.assertEqual(report.version, '1.0')
+
+    def test_reads_meta_from_csar(self):
+        pkg_path = os.path.join(self.tmp_dir, 'pkg.csar')
+        with zipfile.ZipFile(pkg_path, mode='w') as pkg_zip:
+            pkg_zip.writestr('Definitions/large.zip', b'0' * 100000)
+            pkg_zip.writestr('lmpkg.yml', META_YAML)
+        self.assertEqual(Pkg(pkg_path).inspect().name, 'basic')
+
+    def test_inspect_without_meta_raises_error(self):
+        pkg_path = self.__write('pkg.tgz', tgz_bytes([('Descriptor/assembly.yml', b'name: assembly::basic::1.0\n')]))
+        with self.assertRaises(InvalidPackageError) as context:
+            Pkg(pkg_path).inspect()
+        self.assertEqual(str(context.exception), 'Could not find meta file in pkg: {0}'.format(pkg_path))
+
+    def test_inspect_unknown_format_raises_error(self):
+        pkg_path = self.__write('pkg.tgz', b'not a package')
+        with self.assertRaises(InvalidPackageError) as context:
+            Pkg(pkg_path).inspect()
+        self.assertEqual(str(context.exception), 'Could not determine if pkg {0} was a tgz or csar'.format(pkg_path))
@@ -0,0 +1,208 @@
+import io
+import os
+import gc
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+from tests.common.project_testing import ProjectSimTestCase
+from lmctl.project.package.core import Pkg, PushOptions, PushError
+from lmctl.project.package.reader import PkgArchiveError
+from lmctl.project.package.workspace import (PushWorkspace, PushWorkspaceError, ArchiveContentFiles, default_push_workspace_limit,
+                                             PUSH_WORKSPACE_LIMIT_ENV_VAR)
+from lmctl.project.sessions import EnvironmentSessions
+
+RES_PKG_CONTENT = os.urandom(256 * 1024)
+DESCRIPTOR_CONTENT = b'name: resource::basic::1.0\n'
+
+def add_member(pkg_tar, name, content):
+    info = tarfile.TarInfo(name)
+    info.size = len(content)
+    pkg_tar.addfile(info, io.BytesIO(content))
+
+
+class TestPushWorkspace(unittest.TestCase):
+
+    def test_close_removes_directory(self):
+        workspace = PushWorkspace()
+        self.assertTrue(os.path.isdir(workspace.path))
+        workspace.close()
+        self.assertTrue(workspace.closed)
+        self.assertFalse(os.path.exists(workspace.path))
+
+    def test_removed_when_no_longer_referenced(self):
+        workspace = PushWorkspace()
+        path = workspace.path
+        del workspace
+        gc.collect()
+        self.assertFalse(os.path.exists(path))
+
+    def test_context_manager_removes_directory(self):
+        with PushWorkspace() as workspace:
+            path = workspace.path
+        self.assertFalse(os.path.exists(path))
+
+    def test_reserve_fails_over_limit(self):
+        with PushWorkspace(limit_bytes=100) as workspace:
+            workspace.reserve(60, 'a')
+            with self.assertRaises(PushWorkspaceError) as context:
+                workspace.reserve(60, 'b')
+            self.assertIn('would exceed the 100 byte limit', str(context.exception))
+            self.assertEqual(workspace.used_bytes, 60)
+
+    def test_reserve_unbounded(self):
+        with PushWorkspace() as workspace:
+            workspace.reserve(10 * 1024 * 1024 * 1024, 'a')
+
+    def test_default_limit(self):
+        with patch.dict(os.environ, {PUSH_WORKSPACE_LIMIT_ENV_VAR: ''}):
+            self.assertEqual(default_push_workspace_limit(), 1024 * 1024 * 1024)
+        with patch.dict(os.environ, {PUSH_WORKSPACE_LIMIT_ENV_VAR: '5'}):
+            self.assertEqual(default_push_workspace_limit(), 5 * 1024 * 1024)
+        with patch.dict(os.environ, {PUSH_WORKSPACE_LIMIT_ENV_VAR: '0'}):
+            self.assertIsNone(default_push_workspace_limit())
+        with patch.dict(os.environ, {PUSH_WORKSPACE_LIMIT_ENV_VAR: 'lots'}):
+            with self.assertRaises(PushWorkspaceError):
+                default_push_workspace_limit()
+
+
+class TestArchiveContentFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.workspace = PushWorkspace()
+
+    def tearDown(self):
+        self.workspace.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def __write_tgz(self, members):
+        path = os.path.join(self.tmp_dir, 'pkg.tgz')
+        with tarfile.open(path, mode='w:gz') as pkg_tar:
+            for name, content in members:
+                add_member(pkg_tar, name, content)
+        return path
+
+    def __write_csar(self, members):
+        path = os.path.join(self.tmp_dir, 'pkg.csar')
+        with zipfile.ZipFile(path, mode='w', compression=zipfile.ZIP_DEFLATED) as pkg_zip:
+            for name, content in members:
+                pkg_zip.writestr(name, content)
+        return path
+
+    def __members(self):
+        return [('lmpkg.yml', b'name: basic\n'), ('resource.yaml', DESCRIPTOR_CONTENT), ('basic.zip', RES_PKG_CONTENT)]
+
+    def __assert_deferred(self, pkg_path):
+        content_files = ArchiveContentFiles(pkg_path, self.workspace)
+        content_files.expand()
+        descriptor_path = os.path.join(self.workspace.path, 'resource.yaml')
+        res_pkg_path = os.path.join(self.workspace.path, 'basic.zip')
+        with open(descriptor_path, 'rb') as f:
+            self.assertEqual(f.read(), DESCRIPTOR_CONTENT)
+        self.assertFalse(os.path.exists(res_pkg_path))
+        self.assertTrue(content_files.exists(res_pkg_path))
+        self.assertFalse(content_files.exists(os.path.join(self.workspace.path, 'missing.zip')))
+        self.assertEqual(content_files.deferred_paths, [res_pkg_path])
+        self.assertEqual(self.workspace.used_bytes, len(b'name: basic\n') + len(DESCRIPTOR_CONTENT))
+        with content_files.open(res_pkg_path) as res_pkg:
+            self.assertEqual(res_pkg.name, res_pkg_path)
+            self.assertEqual(res_pkg.read(), RES_PKG_CONTENT)
+            # Re-read, as if an upload was retried
+            res_pkg.seek(1000)
+            self.assertEqual(res_pkg.read(10), RES_PKG_CONTENT[1000:1010])
+        return content_files
+
+    def test_defers_resource_packages_in_tgz(self):
+        self.__assert_deferred(self.__write_tgz(self.__members()))
+
+    def test_defers_resource_packages_in_csar(self):
+        self.__assert_deferred(self.__write_csar(self.__members()))
+
+    def test_local_path_writes_deferred_member_to_workspace(self):
+        content_files = self.__assert_deferred(self.__write_tgz(self.__members()))
+        res_pkg_path = os.path.join(self.workspace.path, 'basic.zip')
+        self.assertEqual(content_files.local_path(res_pkg_path), res_pkg_path)
+        with open(res_pkg_path, 'rb') as f:
+            self.assertEqual(f.read(), RES_PKG_CONTENT)
+        self.assertEqual(content_files.deferred_paths, [])
+        with content_files.open(res_pkg_path) as res_pkg:
+            self.assertEqual(res_pkg.read(), RES_PKG_CONTENT)
+
+    def test_local_path_fails_over_limit(self):
+        workspace = PushWorkspace(limit_bytes=1024)
+        try:
+            content_files = ArchiveContentFiles(self.__write_tgz(self.__members()), workspace)
+            content_files.expand()
+            with self.assertRaises(PushWorkspaceError):
+                content_files.local_path(os.path.join(workspace.path, 'basic.zip'))
+        finally:
+            workspace.close()
+
+    def test_expand_fails_over_limit(self):
+        workspace = PushWorkspace(limit_bytes=10)
+        try:
+            content_files = ArchiveContentFiles(self.__write_csar(self.__members()), workspace)
+            with self.assertRaises(PushWorkspaceError):
+                content_files.expand()
+        finally:
+            workspace.close()
+
+    def test_defers_members_of_deferred_dirs(self):
+        members = [('Definitions/lm/resource.yaml', DESCRIPTOR_CONTENT), ('Files/images/image.qcow2', RES_PKG_CONTENT)]
+        content_files = ArchiveContentFiles(self.__write_tgz(members), self.workspace, deferred_dirs=['Files'])
+        content_files.expand()
+        self.assertTrue(os.path.exists(os.path.join(self.workspace.path, 'Definitions', 'lm', 'resource.yaml')))
+        self.assertEqual(content_files.deferred_paths, [os.path.join(self.workspace.path, 'Files', 'images', 'image.qcow2')])
+
+    def test_moved_remaps_deferred_members(self):
+        members = [('VNFCs/vnfcA/vnfcA.csar', RES_PKG_CONTENT)]
+        content_files = ArchiveContentFiles(self.__write_tgz(members), self.workspace)
+        content_files.expand()
+        old_path = os.path.join(self.workspace.path, 'VNFCs')
+        new_path = os.path.join(self.workspace.path, 'Contains')
+        self.assertTrue(os.path.isdir(os.path.join(old_path, 'vnfcA')))
+        os.rename(old_path, new_path)
+        content_files.moved(old_path, new_path)
+        with content_files.open(os.path.join(new_path, 'vnfcA', 'vnfcA.csar')) as csar:
+            self.assertEqual(csar.read(), RES_PKG_CONTENT)
+
+    def test_rejects_members_outside_workspace(self):
+        content_files = ArchiveContentFiles(self.__write_tgz([('../escape.zip', RES_PKG_CONTENT)]), self.workspace)
+        with self.assertRaises(PkgArchiveError):
+            content_files.expand()
+
+
+class TestPushFromArchive(ProjectSimTestCase):
+
+    def __push(self, pkg_sim):
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_rm({'name': 'brent', 'url': 'http://brent:8443'})
+        lm_session = lm_sim.as_mocked_session()
+        return Pkg(pkg_sim.path).push(EnvironmentSessions(lm_session), PushOptions()), lm_session
+
+    def test_push_streams_resource_package_from_archive(self):
+        pkg_content, lm_session = self.__push(self.simlab.simulate_pkg_brent_2dot1_basic())
+        res_pkg_path = os.path.join(pkg_content.tree.root_path, 'basic.zip')
+        self.assertFalse(os.path.exists(res_pkg_path))
+        uploaded = lm_session.resource_pkg_driver.onboard_package.call_args[0][0]
+        self.assertEqual(uploaded.name, res_pkg_path)
+        self.assertTrue(uploaded.closed)
+        pkg_content.close()
+        self.assertFalse(os.path.exists(pkg_content.tree.root_path))
+
+    def test_push_validates_brent_resource_package_without_writing_it_to_workspace(self):
+        pkg_sim = self.simlab.simulate_pkg_brent_basic()
+        with patch('lmctl.project.package.workspace.default_push_workspace_limit', return_value=1024):
+            pkg_content, lm_session = self.__push(pkg_sim)
+        self.assertFalse(os.path.exists(os.path.join(pkg_content.tree.root_path, 'basic.zip')))
+        lm_session.resource_pkg_driver.onboard_package.assert_called_once()
+
+    def test_push_fails_when_workspace_limit_exceeded(self):
+        pkg_sim = self.simlab.simulate_pkg_brent_basic()
+        with patch('lmctl.project.package.workspace.default_push_workspace_limit', return_value=16):
+            with self.assertRaises(PushError) as context:
+                self.__push(pkg_sim)
+        self.assertIn('would exceed', str(context.exception))
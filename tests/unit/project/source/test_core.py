@@ -60,7 +60,7 @@ class TestProject(ProjectSimTestCase):
         result = project.validate(options)
         mock_proj_journal_init.assert_called_once_with(mock_consumer)
         mock_proj_journal = mock_proj_journal_init.return_value
-        mock_validation_process_init.assert_called_once_with(project, options, mock_proj_journal)
+        mock_validation_process_init.assert_called_once_with(project, options, mock_proj_journal, source_index=None)
         mock_validation_process = mock_validation_process_init.return_value
         mock_validation_process.execute.assert_called_once()
         self.assertEqual(result, mock_validation_process.execute.return_value)
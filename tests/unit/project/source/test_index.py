@@ -0,0 +1,111 @@
+import unittest
+import tempfile
+import shutil
+import json
+import os
+from unittest.mock import patch
+import lmctl.project.package.meta as pkg_metas
+import lmctl.utils.descriptors as descriptor_utils
+from lmctl.project.source.index import SourceIndex
+
+class TestSourceIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.__write('Descriptor/assembly.yml', 'name: assembly::test::1.0\ndescription: test\n')
+        self.__write('Behaviour/Configurations/config.json', '{"name": "config"}')
+        self.__write('Behaviour/Tests/nested/test.json', '{"name": "test"}')
+        self.__write('Behaviour/Tests/notes.txt', 'not json')
+        self.__write('_lmctl/staging/staged.json', '{}')
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def __path(self, relative_path):
+        return os.path.join(self.tmp_dir, *relative_path.split('/'))
+
+    def __write(self, relative_path, content):
+        path = self.__path(relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_files_under(self):
+        source_index = SourceIndex()
+        found = source_index.files_under(self.__path('Behaviour/Tests'))
+        self.assertEqual(sorted(found), [self.__path('Behaviour/Tests/nested/test.json'), self.__path('Behaviour/Tests/notes.txt')])
+
+    def test_files_under_walked_directory_does_not_walk_again(self):
+        source_index = SourceIndex()
+        source_index.walk(self.tmp_dir, excluded_dirs=['_lmctl'])
+        with patch('lmctl.project.source.index.os.walk') as mock_walk:
+            self.assertEqual(source_index.files_under(self.__path('Behaviour/Configurations')), [self.__path('Behaviour/Configurations/config.json')])
+            self.assertEqual(len(source_index.files_under(self.__path('Behaviour'))), 3)
+            mock_walk.assert_not_called()
+
+    def test_files_under_excluded_directory_walks_it(self):
+        source_index = SourceIndex()
+        source_index.walk(self.tmp_dir, excluded_dirs=['_lmctl'])
+        self.assertEqual(source_index.files_under(self.__path('_lmctl')), [self.__path('_lmctl/staging/staged.json')])
+
+    def test_read_json_parses_once(self):
+        source_index = SourceIndex()
+        path = self.__path('Behaviour/Configurations/config.json')
+        document = source_index.read_json(path)
+        self.assertEqual(document, {'name': 'config'})
+        with patch('lmctl.project.source.index.json.loads') as mock_loads:
+            self.assertIs(source_index.read_json(path), document)
+            mock_loads.assert_not_called()
+
+    def test_read_json_after_file_changed(self):
+        source_index = SourceIndex()
+        path = self.__path('Behaviour/Configurations/config.json')
+        source_index.read_json(path)
+        self.__write('Behaviour/Configurations/config.json', '{"name": "changed config"}')
+        self.assertEqual(source_index.read_json(path), {'name': 'changed config'})
+
+    def test_read_json_with_invalid_json(self):
+        source_index = SourceIndex()
+        with self.assertRaises(json.JSONDecodeError):
+            source_index.read_json(self.__path('Behaviour/Tests/notes.txt'))
+
+    def test_read_descriptor_returns_copy(self):
+        source_index = SourceIndex()
+        path = self.__path('Descriptor/assembly.yml')
+        descriptor = source_index.read_descriptor(path)
+        self.assertEqual(descriptor.get_name(), 'assembly::test::1.0')
+        descriptor.description = 'changed'
+        with patch('lmctl.project.source.index.descriptor_utils.DescriptorParser') as mock_parser:
+            self.assertEqual(source_index.read_descriptor(path).description, 'test')
+            mock_parser.assert_not_called()
+
+    def test_read_descriptor_not_found(self):
+        with self.assertRaises(descriptor_utils.DescriptorReaderException):
+            SourceIndex().read_descriptor(self.__path('Descriptor/missing.yml'))
+
+    def test_write_descriptor(self):
+        source_index = SourceIndex()
+        descriptor = source_index.read_descriptor(self.__path('Descriptor/assembly.yml'))
+        descriptor.description = 'written'
+        target_path = self.__path('written.yml')
+        source_index.write_descriptor(descriptor, target_path)
+        self.assertEqual(descriptor_utils.DescriptorParser().read_from_file(target_path).description, 'written')
+        with patch('lmctl.project.source.index.descriptor_utils.DescriptorParser') as mock_parser:
+            self.assertEqual(source_index.read_descriptor(target_path).description, 'written')
+            mock_parser.assert_not_called()
+
+    def test_write_json(self):
+        source_index = SourceIndex()
+        target_path = self.__path('written.json')
+        source_index.write_json({'name': 'written'}, target_path)
+        with open(target_path, 'r') as f:
+            self.assertEqual(f.read(), json.dumps({'name': 'written'}, indent=2))
+        self.assertEqual(source_index.file_hash(target_path), pkg_metas.calculate_file_hash(target_path))
+
+    def test_content_hashes_match_package_meta(self):
+        source_index = SourceIndex()
+        source_index.read_json(self.__path('Behaviour/Configurations/config.json'))
+        expected = pkg_metas.calculate_content_hashes(self.tmp_dir, excluded_dirs=['_lmctl', 'Descriptor'])
+        self.assertEqual(source_index.content_hashes(self.tmp_dir, excluded_dirs=['_lmctl', 'Descriptor']), expected)
@@ -0,0 +1,55 @@
+import unittest
+import threading
+from lmctl.journal import Consumer, Entry
+from lmctl.project.journal import ProjectJournal
+from lmctl.project.concurrency import run_concurrently
+
+
+class PlainJournalConsumer(Consumer):
+
+    def __init__(self):
+        self.entries = []
+        super().__init__()
+
+    def is_interested(self, entry: Entry):
+        return True
+
+    def consume(self, entry: Entry):
+        self.entries.append(entry)
+
+
+class TestRunConcurrently(unittest.TestCase):
+
+    def test_serial(self):
+        journal = ProjectJournal()
+        threads = []
+        def action(item, item_journal):
+            threads.append(threading.current_thread())
+            self.assertIs(item_journal, journal)
+            return item * 2
+        self.assertEqual(run_concurrently(journal, [1, 2, 3], action), [2, 4, 6])
+        self.assertEqual(set(threads), {threading.current_thread()})
+
+    def test_concurrent_results_and_journal_in_order(self):
+        consumer = PlainJournalConsumer()
+        journal = ProjectJournal(consumer)
+        all_started = threading.Barrier(3, timeout=5)
+        def action(item, item_journal):
+            item_journal.event('{0} started'.format(item))
+            # All run at once, so would interleave without buffering
+            all_started.wait()
+            item_journal.event('{0} finished'.format(item))
+            return item * 2
+        self.assertEqual(run_concurrently(journal, [1, 2, 3], action, parallelism=3), [2, 4, 6])
+        readable = [entry.to_readable() for entry in consumer.entries[1:]]
+        self.assertEqual(readable, ['1 started', '1 finished', '2 started', '2 finished', '3 started', '3 finished'])
+
+    def test_concurrent_raises_first_error(self):
+        journal = ProjectJournal()
+        def action(item, item_journal):
+            if item == 2:
+                raise ValueError('Mock error')
+            return item
+        with self.assertRaises(ValueError) as context:
+            run_concurrently(journal, [1, 2, 3], action, parallelism=2)
+        self.assertEqual(str(context.exception), 'Mock error')
@@ -0,0 +1,52 @@
+import unittest
+from lmctl.journal import Consumer, Entry
+from lmctl.project.journal import ProjectJournal, BufferedProjectJournal, SubprojectEvent, SubprojectEndEvent, Event
+
+
+class PlainJournalConsumer(Consumer):
+
+    def __init__(self):
+        self.entries = []
+        super().__init__()
+
+    def is_interested(self, entry: Entry):
+        return True
+
+    def consume(self, entry: Entry):
+        self.entries.append(entry)
+
+
+class TestBufferedProjectJournal(unittest.TestCase):
+
+    def test_holds_entries(self):
+        buffered_journal = BufferedProjectJournal()
+        buffered_journal.event('First')
+        buffered_journal.event('Second')
+        readable = [entry.to_readable() for entry in buffered_journal.entries if isinstance(entry, Event)]
+        self.assertEqual(readable, ['First', 'Second'])
+
+    def test_replay_adds_entries_in_order(self):
+        consumer = PlainJournalConsumer()
+        target_journal = ProjectJournal(consumer)
+        buffered_journal = BufferedProjectJournal()
+        buffered_journal.subproject('A')
+        buffered_journal.event('Pushing A')
+        buffered_journal.subproject_end('A')
+        target_journal.event('Before')
+        buffered_journal.replay(target_journal)
+        # Skip the Start chapter entry of the target journal
+        replayed = consumer.entries[1:]
+        self.assertEqual(len(replayed), 4)
+        self.assertEqual(replayed[0].to_readable(), 'Before')
+        self.assertIsInstance(replayed[1], SubprojectEvent)
+        self.assertEqual(replayed[2].to_readable(), 'Pushing A')
+        self.assertIsInstance(replayed[3], SubprojectEndEvent)
+
+    def test_replay_empties_buffer(self):
+        consumer = PlainJournalConsumer()
+        target_journal = ProjectJournal(consumer)
+        buffered_journal = BufferedProjectJournal()
+        buffered_journal.event('Once')
+        buffered_journal.replay(target_journal)
+        buffered_journal.replay(target_journal)
+        self.assertEqual(len(consumer.entries), 2)
@@ -0,0 +1,123 @@
+import unittest
+import tempfile
+import shutil
+import os
+from lmctl.project.ledger import PushLedger, calculate_data_hash
+from lmctl.project.handlers.interface import ContentPushOptions
+
+
+class DummyEnv:
+
+    def __init__(self, name, address):
+        self.name = name
+        self.address = address
+
+
+class TestPushLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def test_is_unchanged(self):
+        ledger = PushLedger()
+        self.assertFalse(ledger.is_unchanged('descriptor:a', 'hash1'))
+        ledger.record('descriptor:a', 'hash1')
+        self.assertTrue(ledger.is_unchanged('descriptor:a', 'hash1'))
+        self.assertFalse(ledger.is_unchanged('descriptor:a', 'hash2'))
+        self.assertFalse(ledger.is_unchanged('descriptor:a', None))
+
+    def test_forget(self):
+        ledger = PushLedger()
+        ledger.record('descriptor:a', 'hash1')
+        ledger.forget('descriptor:a')
+        self.assertFalse(ledger.is_unchanged('descriptor:a', 'hash1'))
+
+    def test_save_and_load(self):
+        env = DummyEnv('dev', 'https://dev.example.com')
+        ledger = PushLedger.for_environment(env, directory=self.tmp_dir)
+        ledger.record('descriptor:a', 'hash1')
+        ledger.save()
+        reloaded = PushLedger.for_environment(env, directory=self.tmp_dir)
+        self.assertTrue(reloaded.is_unchanged('descriptor:a', 'hash1'))
+
+    def test_ledger_per_environment(self):
+        ledger = PushLedger.for_environment(DummyEnv('dev', 'https://dev.example.com'), directory=self.tmp_dir)
+        ledger.record('descriptor:a', 'hash1')
+        ledger.save()
+        other_ledger = PushLedger.for_environment(DummyEnv('test', 'https://test.example.com'), directory=self.tmp_dir)
+        self.assertFalse(other_ledger.is_unchanged('descriptor:a', 'hash1'))
+
+    def test_for_environment_existing_only(self):
+        env = DummyEnv('dev', 'https://dev.example.com')
+        self.assertIsNone(PushLedger.for_environment(env, directory=self.tmp_dir, existing_only=True))
+        ledger = PushLedger.for_environment(env, directory=self.tmp_dir)
+        ledger.record('descriptor:a', 'hash1')
+        ledger.save()
+        existing = PushLedger.for_environment(env, directory=self.tmp_dir, existing_only=True)
+        self.assertTrue(existing.is_unchanged('descriptor:a', 'hash1'))
+
+    def test_ignores_unreadable_ledger(self):
+        path = os.path.join(self.tmp_dir, 'ledger.json')
+        with open(path, 'w') as f:
+            f.write('not json')
+        ledger = PushLedger(path)
+        self.assertFalse(ledger.is_unchanged('descriptor:a', 'hash1'))
+
+    def test_calculate_data_hash_ignores_key_order(self):
+        self.assertEqual(calculate_data_hash({'a': 1, 'b': 2}), calculate_data_hash({'b': 2, 'a': 1}))
+        self.assertNotEqual(calculate_data_hash({'a': 1}), calculate_data_hash({'a': 2}))
+
+
+class TestContentPushOptions(unittest.TestCase):
+
+    def test_skip_unchanged_without_ledger(self):
+        push_options = ContentPushOptions(changed_only=True)
+        self.assertFalse(push_options.skip_unchanged('descriptor:a', 'hash1'))
+
+    def test_skip_unchanged(self):
+        ledger = PushLedger()
+        ledger.record('descriptor:a', 'hash1')
+        push_options = ContentPushOptions(push_ledger=ledger, changed_only=True)
+        self.assertTrue(push_options.skip_unchanged('descriptor:a', 'hash1'))
+        self.assertEqual(ledger.skipped, ['descriptor:a'])
+
+    def test_not_changed_only_forgets_until_pushed(self):
+        ledger = PushLedger()
+        ledger.record('descriptor:a', 'hash1')
+        push_options = ContentPushOptions(push_ledger=ledger, changed_only=False)
+        self.assertFalse(push_options.skip_unchanged('descriptor:a', 'hash1'))
+        self.assertFalse(ledger.is_unchanged('descriptor:a', 'hash1'))
+        push_options.pushed('descriptor:a', 'hash1')
+        self.assertTrue(ledger.is_unchanged('descriptor:a', 'hash1'))
+
+    def test_skip_unchanged_treats_other_object_group_as_changed(self):
+        ledger = PushLedger()
+        ContentPushOptions(object_group_id='og1', push_ledger=ledger).pushed('descriptor:a', 'hash1')
+        self.assertTrue(ContentPushOptions(object_group_id='og1', push_ledger=ledger, changed_only=True).skip_unchanged('descriptor:a', 'hash1'))
+        self.assertFalse(ContentPushOptions(object_group_id='og2', push_ledger=ledger, changed_only=True).skip_unchanged('descriptor:a', 'hash1'))
+        self.assertEqual(ledger.skipped, ['descriptor:a'])
+
+    def test_skip_unchanged_after_push_to_other_object_group(self):
+        ledger = PushLedger()
+        # v1 to og1, then v2 to og2 (which updates the same artifact), then v1 to og1 again must not be skipped
+        for object_group_id, content_hash in [('og1', 'v1'), ('og2', 'v2')]:
+            push_options = ContentPushOptions(object_group_id=object_group_id, push_ledger=ledger, changed_only=True)
+            self.assertFalse(push_options.skip_unchanged('descriptor:a', content_hash))
+            push_options.pushed('descriptor:a', content_hash)
+        self.assertFalse(ContentPushOptions(object_group_id='og1', push_ledger=ledger, changed_only=True).skip_unchanged('descriptor:a', 'v1'))
+        self.assertEqual(ledger.skipped, [])
+
+    def test_is_unchanged_with_entry_saved_without_object_group(self):
+        path = os.path.join(tempfile.mkdtemp(), 'ledger.json')
+        try:
+            with open(path, 'w') as f:
+                f.write('{"descriptor:a": "hash1"}')
+            ledger = PushLedger(path)
+            self.assertTrue(ledger.is_unchanged('descriptor:a', 'hash1'))
+            self.assertFalse(ledger.is_unchanged('descriptor:a', 'hash1', object_group_id='og1'))
+        finally:
+            shutil.rmtree(os.path.dirname(path))
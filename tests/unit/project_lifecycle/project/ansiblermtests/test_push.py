@@ -4,6 +4,7 @@ from tests.common.project_testing import (ProjectSimTestCase, PROJECT_CONTAINS_D
 from lmctl.project.package.core import Pkg, PkgContent, PushOptions
 from lmctl.project.sessions import EnvironmentSessions
 import os
+from unittest.mock import ANY
 
 class TestPushAnsibleRmProjects(ProjectSimTestCase):
 
@@ -20,7 +21,8 @@ class TestPushAnsibleRmProjects(ProjectSimTestCase):
         result = pkg.push(env_sessions, push_options)
         self.assertIsInstance(result, PkgContent)
         csar_path = os.path.join(result.tree.root_path, 'basic.csar')
-        arm_session.arm_driver.onboard_type.assert_called_once_with('basic', '1.0', csar_path)
+        arm_session.arm_driver.onboard_type.assert_called_once_with('basic', '1.0', ANY, progress_callback=ANY)
+        self.assertEqual(arm_session.arm_driver.onboard_type.call_args[0][2].name, csar_path)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with(arm_session.env.name)
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': arm_session.env.name, 'url': arm_session.env.address})
         
@@ -39,7 +41,8 @@ class TestPushAnsibleRmSubprojects(ProjectSimTestCase):
         result = pkg.push(env_sessions, push_options)
         self.assertIsInstance(result, PkgContent)
         csar_path = os.path.join(result.tree.root_path, PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_ARM_BASIC, 'sub_basic-contains_basic.csar')
-        arm_session.arm_driver.onboard_type.assert_called_once_with('sub_basic-contains_basic', '1.0', csar_path)
+        arm_session.arm_driver.onboard_type.assert_called_once_with('sub_basic-contains_basic', '1.0', ANY, progress_callback=ANY)
+        self.assertEqual(arm_session.arm_driver.onboard_type.call_args[0][2].name, csar_path)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with(arm_session.env.name)
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': arm_session.env.name, 'url': arm_session.env.address})
         
\ No newline at end of file
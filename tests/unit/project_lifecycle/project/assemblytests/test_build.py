@@ -1,5 +1,8 @@
 import unittest
 import os
+import json
+from unittest import mock
+import lmctl.utils.descriptors as descriptor_utils
 import tests.common.simulations.project_lab as project_lab
 import lmctl.project.package.core as pkgs
 from tests.common.project_testing import (ProjectSimTestCase, PROJECT_VNFCS_DIR, PROJECT_CONTAINS_DIR,
@@ -253,6 +256,26 @@ class TestBuildAssemblyProjects(ProjectSimTestCase):
                 'version': '1.0',
                 'type': 'Assembly'
             })
+            pkg_tester.assert_has_content_hashes([
+                'Descriptor/assembly.yml',
+                'Behaviour/Configurations/simple.json',
+                'Behaviour/Runtime/runtime.json',
+                'Behaviour/Tests/test.json'
+            ])
+
+    def test_build_behaviour_parses_each_source_once(self):
+        project_sim = self.simlab.simulate_assembly_with_behaviour()
+        behaviour_files = []
+        for root, dirs, filelist in os.walk(os.path.join(project_sim.path, ASSEMBLY_BEHAVIOUR_DIR)):
+            behaviour_files.extend(os.path.join(root, file_name) for file_name in filelist if file_name.endswith('.json'))
+        project = Project(project_sim.path)
+        read_from_str = descriptor_utils.DescriptorParser.read_from_str
+        with mock.patch('lmctl.project.source.index.json.loads', side_effect=json.loads) as mock_json_loads, \
+                mock.patch.object(descriptor_utils.DescriptorParser, 'read_from_str', autospec=True, side_effect=read_from_str) as mock_read_descriptor:
+            project.build(BuildOptions())
+        self.assertEqual(mock_json_loads.call_count, len(behaviour_files))
+        # Parsed once by validation, then re-used by staging
+        self.assertEqual(mock_read_descriptor.call_count, 1)
 
 
 class TestBuildAssemblySubprojects(ProjectSimTestCase):
@@ -285,6 +308,8 @@ class TestBuildAssemblySubprojects(ProjectSimTestCase):
                     }
                 ]
             })
+            pkg_tester.assert_has_content_hashes(['Descriptor/assembly.yml'])
+            pkg_tester.assert_has_content_hashes(['Descriptor/assembly.yml'], subpkg_path=['sub_basic'])
 
     def test_build_behaviour(self):
         project_sim = self.simlab.simulate_assembly_contains_assembly_with_behaviour()
@@ -140,11 +140,12 @@ PULLED_TEST_SCENARIO_ACTORS_REPLACED = """\
 
 class TestPullAssemblyProjects(ProjectSimTestCase):
 
-    def __exec_pull(self, project_sim, lm_session):
+    def __exec_pull(self, project_sim, lm_session, parallelism=1):
         project = project_sim.as_project()
         pull_options = PullOptions()
+        pull_options.parallelism = parallelism
         env_sessions = EnvironmentSessions(lm_session)
-        project.pull(env_sessions, pull_options)
+        return project.pull(env_sessions, pull_options)
 
     def test_pull_descriptors_and_remove_name(self):
         project_sim = self.simlab.simulate_assembly_basic()
@@ -408,4 +409,49 @@ class TestPullAssemblyProjects(ProjectSimTestCase):
         project_assertions = self.assert_project(project_sim.as_project())
         project_assertions.assert_has_no_backup(os.path.join(ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_TESTS_DIR, 'test.json'))
         project_assertions.assert_has_file(os.path.join(ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_TESTS_DIR, 'test.json'), current_test_content)
-     
\ No newline at end of file
+     
+    def test_pull_leaves_unchanged_files_untouched(self):
+        project_sim = self.simlab.simulate_assembly_with_behaviour()
+        configuration_path = os.path.join(project_sim.path, ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_CONFIGURATIONS_DIR, 'simple.json')
+        with open(configuration_path, 'w') as current_configuration:
+            current_configuration.write('{"descriptorName": "$lmctl:/descriptor_name", "name": "simple", "projectId": "$lmctl:/descriptor_name"}')
+        with open(configuration_path, 'r') as current_configuration:
+            current_configuration_content = current_configuration.read()
+        modified_time = os.stat(configuration_path).st_mtime_ns
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_project({'id': 'assembly::with_behaviour::1.0', 'name': 'assembly::with_behaviour::1.0'})
+        lm_sim.add_assembly_configuration({'id': 'existing', 'projectId': 'assembly::with_behaviour::1.0', 'name': 'simple', 'descriptorName': 'assembly::with_behaviour::1.0'})
+        lm_session = lm_sim.as_mocked_session()
+        summary = self.__exec_pull(project_sim, lm_session)
+        self.assertIn(configuration_path, summary.unchanged)
+        self.assertEqual(os.stat(configuration_path).st_mtime_ns, modified_time)
+        project_assertions = self.assert_project(project_sim.as_project())
+        project_assertions.assert_has_no_backup(os.path.join(ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_CONFIGURATIONS_DIR, 'simple.json'))
+        project_assertions.assert_has_file(os.path.join(ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_CONFIGURATIONS_DIR, 'simple.json'), current_configuration_content)
+
+    def test_pull_summary(self):
+        project_sim = self.simlab.simulate_assembly_with_behaviour()
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_descriptor('name: assembly::with_behaviour::1.0\ndescription: descriptor content pulled from the environment\n')
+        lm_sim.add_assembly_configuration({'id': 'existing', 'projectId': 'assembly::with_behaviour::1.0', 'name': 'simple', 'descriptorName': 'assembly::with_behaviour::1.0'})
+        lm_sim.add_assembly_configuration({'id': 'existing2', 'projectId': 'assembly::with_behaviour::1.0', 'name': 'simple-2', 'descriptorName': 'assembly::with_behaviour::1.0'})
+        lm_session = lm_sim.as_mocked_session()
+        summary = self.__exec_pull(project_sim, lm_session)
+        self.assertEqual(summary.updated, [
+            os.path.join(project_sim.path, ASSEMBLY_DESCRIPTOR_DIR, ASSEMBLY_DESCRIPTOR_YML_FILE),
+            os.path.join(project_sim.path, ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_CONFIGURATIONS_DIR, 'simple.json')
+        ])
+        self.assertEqual(summary.new, [os.path.join(project_sim.path, ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_CONFIGURATIONS_DIR, 'simple-2.json')])
+        self.assertEqual(summary.unchanged, [])
+
+    def test_pull_subprojects_with_parallelism(self):
+        project_sim = self.simlab.simulate_assembly_contains_assembly_basic()
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_descriptor('name: assembly::contains_basic::1.0\ndescription: parent pulled from the environment\n')
+        lm_sim.add_descriptor('name: assembly::sub_basic-contains_basic::1.0\ndescription: subproject pulled from the environment\n')
+        lm_session = lm_sim.as_mocked_session()
+        summary = self.__exec_pull(project_sim, lm_session, parallelism=4)
+        self.assertEqual(len(summary.updated), 2)
+        project_assertions = self.assert_project(project_sim.as_project())
+        project_assertions.assert_has_file(os.path.join(ASSEMBLY_DESCRIPTOR_DIR, ASSEMBLY_DESCRIPTOR_YML_FILE), 'description: parent pulled from the environment\n')
+        project_assertions.assert_has_file(os.path.join('Contains', 'sub_basic', ASSEMBLY_DESCRIPTOR_DIR, ASSEMBLY_DESCRIPTOR_YML_FILE), 'description: subproject pulled from the environment\n')
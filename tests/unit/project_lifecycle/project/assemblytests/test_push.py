@@ -1,11 +1,13 @@
 import unittest
-from unittest.mock import call
+from unittest.mock import call, MagicMock, ANY
 import os
 import tests.common.simulations.project_lab as project_lab
 from tests.common.project_testing import (ProjectSimTestCase, PROJECT_CONTAINS_DIR)
 from lmctl.project.sessions import EnvironmentSessions
+from lmctl.project.ledger import PushLedger
 from lmctl.project.package.core import Pkg, PkgContent, PushOptions
 from lmctl.project.handlers.assembly.assembly_src import TEMPLATE_CONTENT
+from lmctl.project.handlers.assembly.assembly_content import BehaviourIndex
 
 WITH_TEMPLATE_ASSEMBLY_TEMPLATE_DESCRIPTOR_YAML = "name: assembly-template::with_template::1.0"
 WITH_TEMPLATE_ASSEMBLY_TEMPLATE_DESCRIPTOR_YAML += "\n"
@@ -313,6 +315,59 @@ class TestPushAssemblyPkgs(ProjectSimTestCase):
         lm_session.descriptor_driver.get_descriptor.assert_called_once_with('assembly::basic::1.0')
         lm_session.descriptor_driver.create_descriptor.assert_called_once_with('name: assembly::basic::1.0\ndescription: basic_assembly\n', object_group_id='123')
 
+    def test_push_fetches_behaviour_once(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour()
+        pkg = Pkg(pkg_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_session = lm_sim.as_mocked_session()
+        pkg.push(EnvironmentSessions(lm_session), PushOptions())
+        lm_session.behaviour_driver.get_assembly_configurations.assert_called_once_with('assembly::with_behaviour::1.0')
+        lm_session.behaviour_driver.get_scenarios.assert_called_once_with('assembly::with_behaviour::1.0')
+        lm_session.behaviour_driver.create_assembly_configuration.assert_called_once()
+        self.assertEqual(lm_session.behaviour_driver.create_scenario.call_count, 2)
+
+    def test_push_behaviour_in_parallel(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour_multi_tests()
+        pkg = Pkg(pkg_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_session = lm_sim.as_mocked_session()
+        pkg.push(EnvironmentSessions(lm_session), PushOptions(parallelism=4))
+        serial_lm_sim = self.simlab.simulate_lm()
+        serial_lm_session = serial_lm_sim.as_mocked_session()
+        pkg.push(EnvironmentSessions(serial_lm_session), PushOptions())
+        project_id = 'assembly::with_behaviour_multi_tests::1.0'
+        scenario_names = sorted(s['name'] for s in lm_sim.get_scenarios_on_project(project_id))
+        self.assertEqual(scenario_names, sorted(s['name'] for s in serial_lm_sim.get_scenarios_on_project(project_id)))
+        self.assertEqual(lm_session.behaviour_driver.create_scenario.call_count, serial_lm_session.behaviour_driver.create_scenario.call_count)
+
+    def test_push_changed_only_skips_unchanged_content(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour()
+        pkg = Pkg(pkg_sim.path)
+        push_ledger = PushLedger()
+        lm_sim = self.simlab.simulate_lm()
+        pkg.push(EnvironmentSessions(lm_sim.as_mocked_session()), PushOptions(changed_only=True, push_ledger=push_ledger))
+        lm_session = lm_sim.as_mocked_session()
+        pkg.push(EnvironmentSessions(lm_session), PushOptions(changed_only=True, push_ledger=push_ledger))
+        lm_session.descriptor_driver.get_descriptor.assert_not_called()
+        lm_session.descriptor_driver.update_descriptor.assert_not_called()
+        lm_session.behaviour_driver.update_assembly_configuration.assert_not_called()
+        lm_session.behaviour_driver.update_scenario.assert_not_called()
+        self.assertIn('descriptor:assembly::with_behaviour::1.0', push_ledger.skipped)
+        self.assertIn('assembly-configuration:assembly::with_behaviour::1.0:simple', push_ledger.skipped)
+
+    def test_push_changed_only_pushes_content_missing_from_environment(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour()
+        pkg = Pkg(pkg_sim.path)
+        push_ledger = PushLedger()
+        pkg.push(EnvironmentSessions(self.simlab.simulate_lm().as_mocked_session()), PushOptions(changed_only=True, push_ledger=push_ledger))
+        # The behaviour has since been removed from the environment, so must be created again despite the ledger
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_descriptor('name: assembly::with_behaviour::1.0\ndescription: a simple assembly with behaviour\n')
+        lm_session = lm_sim.as_mocked_session()
+        pkg.push(EnvironmentSessions(lm_session), PushOptions(changed_only=True, push_ledger=push_ledger))
+        lm_session.behaviour_driver.create_assembly_configuration.assert_called_once()
+        lm_session.behaviour_driver.create_scenario.assert_called()
+
 
 class TestPushAssemblyPkgsSubcontent(ProjectSimTestCase):
 
@@ -553,4 +608,59 @@ class TestPushOldStyle(ProjectSimTestCase):
         self.assertIsInstance(result, PkgContent)
         csar_a_path = os.path.join(result.tree.root_path, PROJECT_CONTAINS_DIR, 'vnfcA', 'vnfcA.csar')
         csar_b_path = os.path.join(result.tree.root_path, PROJECT_CONTAINS_DIR, 'vnfcB', 'vnfcB.csar')
-        arm_session.arm_driver.onboard_type.assert_has_calls([call('vnfcA', '1.0', csar_a_path), call('vnfcB', '2.0', csar_b_path)])
+        arm_session.arm_driver.onboard_type.assert_has_calls([call('vnfcA', '1.0', ANY, progress_callback=ANY), call('vnfcB', '2.0', ANY, progress_callback=ANY)])
+        self.assertEqual(sorted(onboard_call[0][2].name for onboard_call in arm_session.arm_driver.onboard_type.call_args_list), [csar_a_path, csar_b_path])
+
+    def test_push_in_parallel(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_old_style()
+        pkg = Pkg(pkg_sim.path)
+        push_options = PushOptions(parallelism=2)
+        arm_sim = self.simlab.simulate_arm()
+        arm_session = arm_sim.as_mocked_session()
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_rm({'name': arm_session.env.name, 'url': arm_session.env.address})
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session, arm_session)
+        result = pkg.push(env_sessions, push_options)
+        self.assertIsInstance(result, PkgContent)
+        csar_a_path = os.path.join(result.tree.root_path, PROJECT_CONTAINS_DIR, 'vnfcA', 'vnfcA.csar')
+        csar_b_path = os.path.join(result.tree.root_path, PROJECT_CONTAINS_DIR, 'vnfcB', 'vnfcB.csar')
+        arm_session.arm_driver.onboard_type.assert_has_calls([call('vnfcA', '1.0', ANY, progress_callback=ANY), call('vnfcB', '2.0', ANY, progress_callback=ANY)], any_order=True)
+        self.assertEqual(sorted(onboard_call[0][2].name for onboard_call in arm_session.arm_driver.onboard_type.call_args_list), [csar_a_path, csar_b_path])
+        lm_session.descriptor_driver.create_descriptor.assert_called()
+
+
+class TestBehaviourIndex(unittest.TestCase):
+
+    def test_finds_by_name(self):
+        behaviour_driver = MagicMock()
+        behaviour_driver.get_assembly_configurations.return_value = [{'id': '1', 'name': 'configA'}]
+        behaviour_driver.get_scenarios.return_value = [{'id': '2', 'name': 'scenarioA'}]
+        behaviour_index = BehaviourIndex(behaviour_driver, 'project')
+        self.assertEqual(behaviour_index.find_configuration('configA'), {'id': '1', 'name': 'configA'})
+        self.assertIsNone(behaviour_index.find_configuration('configB'))
+        self.assertEqual(behaviour_index.find_scenario('scenarioA'), {'id': '2', 'name': 'scenarioA'})
+        self.assertIsNone(behaviour_index.find_scenario('scenarioB'))
+
+    def test_put_adds_to_index_without_fetching(self):
+        behaviour_driver = MagicMock()
+        behaviour_driver.get_assembly_configurations.return_value = []
+        behaviour_driver.get_scenarios.return_value = []
+        behaviour_index = BehaviourIndex(behaviour_driver, 'project')
+        behaviour_index.put_configuration({'id': '1', 'name': 'configA'})
+        behaviour_index.put_scenario({'id': '2', 'name': 'scenarioA'})
+        self.assertEqual(behaviour_index.configurations, [{'id': '1', 'name': 'configA'}])
+        self.assertEqual(behaviour_index.find_scenario('scenarioA'), {'id': '2', 'name': 'scenarioA'})
+        behaviour_driver.get_assembly_configurations.assert_called_once_with('project')
+        behaviour_driver.get_scenarios.assert_called_once_with('project')
+
+    def test_configurations_fetched_again_if_created_without_id(self):
+        behaviour_driver = MagicMock()
+        behaviour_driver.get_assembly_configurations.return_value = []
+        behaviour_driver.get_scenarios.return_value = []
+        behaviour_index = BehaviourIndex(behaviour_driver, 'project')
+        behaviour_index.put_configuration({'name': 'configA'})
+        behaviour_driver.get_assembly_configurations.return_value = [{'id': '1', 'name': 'configA'}]
+        self.assertEqual(behaviour_index.configurations, [{'id': '1', 'name': 'configA'}])
+        self.assertEqual(behaviour_index.configurations, [{'id': '1', 'name': 'configA'}])
+        self.assertEqual(behaviour_driver.get_assembly_configurations.call_count, 2)
@@ -123,6 +123,56 @@ class TestTestAssemblyPkgs(ProjectSimTestCase):
         self.assertIsNone(test3_entry.detail)
 
 
+    def test_runs_multi_tests_in_parallel(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour_multi_tests() 
+        pkg = Pkg(pkg_sim.path)
+        push_options = PushOptions()
+        lm_sim = self.simlab.simulate_lm()
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        pkg_content = pkg.push(env_sessions, push_options)
+        serial_result = pkg_content.test(env_sessions, TestOptions())
+        lm_session.behaviour_driver.reset_mock()
+        result = pkg_content.test(env_sessions, TestOptions(parallelism=3))
+        self.assertEqual([entry.test_name for entry in result.suite_report.entries], [entry.test_name for entry in serial_result.suite_report.entries])
+        for entry in result.suite_report.entries:
+            self.assertEqual(entry.result, TEST_STATUS_PASSED)
+            self.assertIsNone(entry.detail)
+        # All tests are started before any execution is checked on
+        driver_calls = [name for name, args, kwargs in lm_session.behaviour_driver.method_calls if name in ['execute_scenario', 'get_execution']]
+        self.assertEqual(driver_calls[:3], ['execute_scenario', 'execute_scenario', 'execute_scenario'])
+        self.assertEqual(lm_session.behaviour_driver.execute_scenario.call_count, 3)
+
+    def test_runs_tests_in_parallel_with_fewer_workers_than_tests(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour_multi_tests() 
+        pkg = Pkg(pkg_sim.path)
+        push_options = PushOptions()
+        lm_sim = self.simlab.simulate_lm()
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        result = pkg.push(env_sessions, push_options).test(env_sessions, TestOptions(parallelism=2))
+        self.assertEqual(len(result.suite_report.entries), 3)
+        for entry in result.suite_report.entries:
+            self.assertEqual(entry.result, TEST_STATUS_PASSED)
+        self.assertEqual(lm_session.behaviour_driver.execute_scenario.call_count, 3)
+
+    def test_reports_test_failure_in_parallel(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour_multi_tests() 
+        pkg = Pkg(pkg_sim.path)
+        push_options = PushOptions()
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.execution_listener.add_step_failure_trigger('assembly::with_behaviour_multi_tests::1.0', 'test2', 1, 0, 'Mocked Error')
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        result = pkg.push(env_sessions, push_options).test(env_sessions, TestOptions(parallelism=3))
+        self.assertEqual(len(result.suite_report.entries), 3)
+        entries = {entry.test_name: entry for entry in result.suite_report.entries}
+        self.assertEqual(entries['test'].result, TEST_STATUS_PASSED)
+        self.assertEqual(entries['test2'].result, TEST_STATUS_FAILED)
+        self.assertEqual(entries['test2'].detail, 'test2 failed: Mocked Error')
+        self.assertEqual(entries['test3'].result, TEST_STATUS_PASSED)
+
+
 class TestTestAssemblyPkgsSubcontent(ProjectSimTestCase):
 
     def setUp(self):
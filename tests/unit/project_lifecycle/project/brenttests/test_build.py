@@ -1,13 +1,18 @@
 import os
+import shutil
+import tempfile
+import tarfile
 import zipfile
+from unittest.mock import patch
 from tests.common.project_testing import (ProjectSimTestCase,
                                           PROJECT_CONTAINS_DIR, BRENT_DEFINITIONS_DIR, BRENT_INFRASTRUCTURE_DIR, BRENT_DESCRIPTOR_DIR,
                                           BRENT_LIFECYCLE_DIR, BRENT_DESCRIPTOR_YML_FILE, 
                                           BRENT_OPENSTACK_DIR, BRENT_OPENSTACK_TOSCA_YAML_FILE,
                                           BRENT_LIFECYCLE_ANSIBLE_DIR, BRENT_LIFECYCLE_ANSIBLE_SCRIPTS_DIR,
                                           BRENT_LIFECYCLE_ANSIBLE_CONFIG_DIR)
-from lmctl.project.source.core import Project, BuildResult, Options, BuildOptions
+from lmctl.project.source.core import Project, BuildResult, Options, BuildOptions, RecursiveBuildOptions, PROJECT_BUILT, PROJECT_SKIPPED, PROJECT_FAILED
 from lmctl.project.validation import ValidationResult
+from lmctl.project.processes.common import BUILD_COPY_STRATEGY_ENV_VAR
 import tests.common.simulations.project_lab as project_lab
 import lmctl.project.package.core as pkgs
 
@@ -201,3 +206,192 @@ class TestBuildBrentSubprojects(ProjectSimTestCase):
                 zip_tester.assert_has_directory(ansible_config_dir)
                 zip_tester.assert_has_file(os.path.join(ansible_config_dir, 'inventory'), BASIC_INVENTORY)
                 zip_tester.assert_has_file(os.path.join(ansible_config_dir, 'host_vars', 'example-host.yml'), BASIC_EXAMPLE_HOST_YAML)
+
+
+class TestIncrementalBuildBrentSubprojects(ProjectSimTestCase):
+
+    def __build(self, project_path, incremental=True):
+        build_options = BuildOptions()
+        build_options.incremental = incremental
+        return Project(project_path).build(build_options)
+
+    def __compiled_res_pkg_path(self, project_path):
+        return os.path.join(project_path, '_lmctl', 'compile', PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_BRENT_BASIC, 'sub_basic-contains_basic.zip')
+
+    def __install_playbook_path(self, project_path):
+        return os.path.join(project_path, PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_BRENT_BASIC, BRENT_LIFECYCLE_DIR, BRENT_LIFECYCLE_ANSIBLE_DIR, BRENT_LIFECYCLE_ANSIBLE_SCRIPTS_DIR, 'Install.yaml')
+
+    def test_rebuild_reuses_unchanged_resource_package(self):
+        project_sim = self.simlab.simulate_assembly_contains_brent_basic()
+        self.__build(project_sim.path)
+        res_pkg_path = self.__compiled_res_pkg_path(project_sim.path)
+        first_stat = os.stat(res_pkg_path)
+        result = self.__build(project_sim.path)
+        second_stat = os.stat(res_pkg_path)
+        self.assertEqual(second_stat.st_ino, first_stat.st_ino)
+        self.assertEqual(second_stat.st_mtime_ns, first_stat.st_mtime_ns)
+        sub_brent_basic_path = os.path.join(PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_BRENT_BASIC)
+        with self.assert_package(result.pkg) as pkg_tester:
+            pkg_tester.assert_has_file(os.path.join(sub_brent_basic_path, BRENT_DESCRIPTOR_YML_FILE), SUB_BASIC_DESCRIPTOR_YAML)
+            pkg_tester.assert_has_content_hashes(['sub_basic-contains_basic.zip', BRENT_DESCRIPTOR_YML_FILE], subpkg_path=['sub_basic'])
+
+    def test_rebuild_recompiles_changed_subproject(self):
+        project_sim = self.simlab.simulate_assembly_contains_brent_basic()
+        self.__build(project_sim.path)
+        with open(self.__install_playbook_path(project_sim.path), 'w') as f:
+            f.write('changed: true\n')
+        result = self.__build(project_sim.path)
+        sub_brent_basic_path = os.path.join(PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_BRENT_BASIC)
+        with self.assert_package(result.pkg) as pkg_tester:
+            with self.assert_zip(pkg_tester.get_file_path(os.path.join(sub_brent_basic_path, 'sub_basic-contains_basic.zip'))) as zip_tester:
+                ansible_scripts_dir = os.path.join(BRENT_LIFECYCLE_DIR, BRENT_LIFECYCLE_ANSIBLE_DIR, BRENT_LIFECYCLE_ANSIBLE_SCRIPTS_DIR)
+                zip_tester.assert_has_file(os.path.join(ansible_scripts_dir, 'Install.yaml'), 'changed: true\n')
+
+    def test_rebuild_after_project_file_change_recompiles_all(self):
+        project_sim = self.simlab.simulate_assembly_contains_brent_basic()
+        self.__build(project_sim.path)
+        res_pkg_path = self.__compiled_res_pkg_path(project_sim.path)
+        first_mtime = os.stat(res_pkg_path).st_mtime_ns
+        with open(os.path.join(project_sim.path, 'lmproject.yml'), 'a') as f:
+            f.write('\n')
+        os.utime(res_pkg_path, ns=(first_mtime - 1000000000, first_mtime - 1000000000))
+        self.__build(project_sim.path)
+        self.assertNotEqual(os.stat(res_pkg_path).st_mtime_ns, first_mtime - 1000000000)
+
+    def test_full_build_removes_index(self):
+        project_sim = self.simlab.simulate_assembly_contains_brent_basic()
+        self.__build(project_sim.path)
+        index_path = os.path.join(project_sim.path, '_lmctl', 'build-index.json')
+        self.assertTrue(os.path.exists(index_path))
+        self.__build(project_sim.path, incremental=False)
+        self.assertFalse(os.path.exists(index_path))
+        self.assertFalse(os.path.exists(os.path.join(project_sim.path, '_lmctl', 'compile')))
+
+
+class TestBuildCompressionBrent(ProjectSimTestCase):
+
+    def __build(self, project_path, compression_level=None):
+        build_options = BuildOptions()
+        build_options.compression_level = compression_level
+        return Project(project_path).build(build_options)
+
+    def __res_pkg_compress_types(self, result):
+        with self.assert_package(result.pkg) as pkg_tester:
+            with zipfile.ZipFile(pkg_tester.get_file_path('basic.zip')) as res_zip:
+                return {info.compress_type for info in res_zip.infolist() if not info.is_dir()}
+
+    def test_build_stores_resource_package_by_default(self):
+        project_sim = self.simlab.simulate_brent_basic()
+        result = self.__build(project_sim.path)
+        self.assertEqual(self.__res_pkg_compress_types(result), {zipfile.ZIP_STORED})
+
+    def test_build_with_compression_level(self):
+        project_sim = self.simlab.simulate_brent_basic()
+        result = self.__build(project_sim.path, compression_level=6)
+        self.assertEqual(self.__res_pkg_compress_types(result), {zipfile.ZIP_DEFLATED})
+        with self.assert_package(result.pkg) as pkg_tester:
+            with self.assert_zip(pkg_tester.get_file_path('basic.zip')) as zip_tester:
+                zip_tester.assert_has_file(os.path.join(BRENT_LIFECYCLE_DIR, BRENT_OPENSTACK_DIR, BRENT_OPENSTACK_TOSCA_YAML_FILE), BASIC_INFRASTRUCTURE_TOSCA)
+
+
+class TestBuildCopyStrategyBrent(ProjectSimTestCase):
+
+    def __install_playbook_path(self, root_path):
+        return os.path.join(root_path, BRENT_LIFECYCLE_DIR, BRENT_LIFECYCLE_ANSIBLE_DIR, BRENT_LIFECYCLE_ANSIBLE_SCRIPTS_DIR, 'Install.yaml')
+
+    def __staging_path(self, project_path):
+        return os.path.join(project_path, '_lmctl', 'staging')
+
+    def test_build_links_staged_sources(self):
+        project_sim = self.simlab.simulate_brent_basic()
+        descriptor_path = os.path.join(project_sim.path, BRENT_DEFINITIONS_DIR, BRENT_DESCRIPTOR_DIR, BRENT_DESCRIPTOR_YML_FILE)
+        with open(descriptor_path, 'r') as f:
+            original_descriptor = f.read()
+        result = Project(project_sim.path).build(BuildOptions())
+        source_stat = os.stat(self.__install_playbook_path(project_sim.path))
+        staged_stat = os.stat(self.__install_playbook_path(self.__staging_path(project_sim.path)))
+        self.assertEqual(staged_stat.st_ino, source_stat.st_ino)
+        # The staged descriptor is re-written, which must not change the source
+        with open(descriptor_path, 'r') as f:
+            self.assertEqual(f.read(), original_descriptor)
+        self.assertEqual(os.stat(descriptor_path).st_nlink, 1)
+        with tarfile.open(result.pkg.path, mode='r:gz') as pkg_tar:
+            self.assertTrue(all(member.isfile() or member.isdir() for member in pkg_tar.getmembers()))
+
+    def test_build_with_copy_strategy(self):
+        project_sim = self.simlab.simulate_brent_basic()
+        with patch.dict(os.environ, {BUILD_COPY_STRATEGY_ENV_VAR: 'copy'}):
+            Project(project_sim.path).build(BuildOptions())
+        source_stat = os.stat(self.__install_playbook_path(project_sim.path))
+        staged_stat = os.stat(self.__install_playbook_path(self.__staging_path(project_sim.path)))
+        self.assertNotEqual(staged_stat.st_ino, source_stat.st_ino)
+
+
+class TestRecursiveBuildBrent(ProjectSimTestCase):
+
+    def setUp(self):
+        self.root_path = tempfile.mkdtemp()
+        self.basic_path = self.__add_project(self.simlab.simulate_brent_basic(), 'resources', 'basic')
+        self.assembly_path = self.__add_project(self.simlab.simulate_assembly_contains_brent_basic(), 'assemblies', 'with-brent')
+
+    def tearDown(self):
+        super().tearDown()
+        if os.path.exists(self.root_path):
+            shutil.rmtree(self.root_path)
+
+    def __add_project(self, project_sim, *path):
+        project_path = os.path.join(self.root_path, *path)
+        shutil.copytree(project_sim.path, project_path)
+        return project_path
+
+    def __build(self, parallelism=1):
+        build_options = RecursiveBuildOptions()
+        build_options.parallelism = parallelism
+        return Project.build_recursive(self.root_path, build_options)
+
+    def __statuses(self, result):
+        return {outcome.name: outcome.status for outcome in result.outcomes}
+
+    def test_discover(self):
+        os.makedirs(os.path.join(self.root_path, '.hidden'))
+        shutil.copy(os.path.join(self.basic_path, 'lmproject.yml'), os.path.join(self.root_path, '.hidden', 'lmproject.yml'))
+        shutil.copy(os.path.join(self.basic_path, 'lmproject.yml'), os.path.join(self.basic_path, BRENT_DEFINITIONS_DIR, 'lmproject.yml'))
+        self.assertEqual(Project.discover(self.root_path), [self.assembly_path, self.basic_path])
+
+    def test_build_recursive(self):
+        result = self.__build(parallelism=2)
+        self.assertEqual(self.__statuses(result), {'assemblies/with-brent': PROJECT_BUILT, 'resources/basic': PROJECT_BUILT})
+        for outcome in result.outcomes:
+            self.assertTrue(os.path.exists(outcome.pkg_path))
+            self.assertTrue(len(outcome.entries) > 0)
+        self.assertFalse(result.has_failures())
+
+    def test_rebuild_skips_unchanged_projects(self):
+        first_result = self.__build()
+        pkg_stat = os.stat(first_result.outcomes[1].pkg_path)
+        with open(os.path.join(self.assembly_path, PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_BRENT_BASIC, BRENT_LIFECYCLE_DIR, BRENT_LIFECYCLE_ANSIBLE_DIR, BRENT_LIFECYCLE_ANSIBLE_SCRIPTS_DIR, 'Install.yaml'), 'w') as f:
+            f.write('changed: true\n')
+        result = self.__build()
+        self.assertEqual(self.__statuses(result), {'assemblies/with-brent': PROJECT_BUILT, 'resources/basic': PROJECT_SKIPPED})
+        self.assertEqual(result.outcomes[1].pkg_path, first_result.outcomes[1].pkg_path)
+        self.assertEqual(os.stat(result.outcomes[1].pkg_path).st_mtime_ns, pkg_stat.st_mtime_ns)
+
+    def test_rebuild_after_package_removed(self):
+        first_result = self.__build()
+        os.remove(first_result.outcomes[1].pkg_path)
+        result = self.__build()
+        self.assertEqual(self.__statuses(result), {'assemblies/with-brent': PROJECT_SKIPPED, 'resources/basic': PROJECT_BUILT})
+
+    def test_build_of_one_project_discards_record(self):
+        self.__build()
+        Project(self.basic_path).build(BuildOptions())
+        result = self.__build()
+        self.assertEqual(self.__statuses(result), {'assemblies/with-brent': PROJECT_SKIPPED, 'resources/basic': PROJECT_BUILT})
+
+    def test_failed_project_does_not_stop_others(self):
+        os.remove(os.path.join(self.basic_path, BRENT_DEFINITIONS_DIR, BRENT_DESCRIPTOR_DIR, BRENT_DESCRIPTOR_YML_FILE))
+        result = self.__build(parallelism=2)
+        self.assertEqual(self.__statuses(result), {'assemblies/with-brent': PROJECT_BUILT, 'resources/basic': PROJECT_FAILED})
+        failed = result.failed[0]
+        self.assertEqual(failed.error, 'Build failed with validation errors')
+        self.assertTrue(len(failed.validation_errors) > 0)
@@ -1,8 +1,14 @@
 import os
+import io
+import tarfile
+import zipfile
+from unittest.mock import ANY
 import tests.common.simulations.project_lab as project_lab
 from tests.common.project_testing import (ProjectSimTestCase, PROJECT_CONTAINS_DIR) 
 from lmctl.project.package.core import Pkg, PkgContent, PushOptions
 from lmctl.project.sessions import EnvironmentSessions
+from lmctl.project.source.core import Project, BuildOptions
+from lmctl.project.ledger import PushLedger
 
 class TestPushBrentProjects(ProjectSimTestCase):
 
@@ -19,7 +25,8 @@ class TestPushBrentProjects(ProjectSimTestCase):
         res_pkg_path = os.path.join(result.tree.root_path, 'basic.zip')
         lm_session.descriptor_driver.delete_descriptor.assert_called_once_with('resource::basic::1.0')
         lm_session.resource_pkg_driver.delete_package.assert_called_once_with('resource::basic::1.0')
-        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path, object_group_id=None)
+        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(ANY, object_group_id=None, progress_callback=ANY)
+        self.assertEqual(lm_session.resource_pkg_driver.onboard_package.call_args[0][0].name, res_pkg_path)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with('brent')
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': 'brent', 'url': 'http://brent:8443'})
     
@@ -36,7 +43,8 @@ class TestPushBrentProjects(ProjectSimTestCase):
         res_pkg_path = os.path.join(result.tree.root_path, 'with_tosca.zip')
         lm_session.descriptor_driver.delete_descriptor.assert_called_once_with('resource::with_tosca::1.0')
         lm_session.resource_pkg_driver.delete_package.assert_called_once_with('resource::with_tosca::1.0')
-        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path, object_group_id=None)
+        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(ANY, object_group_id=None, progress_callback=ANY)
+        self.assertEqual(lm_session.resource_pkg_driver.onboard_package.call_args[0][0].name, res_pkg_path)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with('brent')
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': 'brent', 'url': 'http://brent:8443'})
 
@@ -53,10 +61,97 @@ class TestPushBrentProjects(ProjectSimTestCase):
         res_pkg_path = os.path.join(result.tree.root_path, 'basic.zip')
         lm_session.descriptor_driver.delete_descriptor.assert_called_once_with('resource::basic::1.0')
         lm_session.resource_pkg_driver.delete_package.assert_called_once_with('resource::basic::1.0')
-        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path, object_group_id='123')
+        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(ANY, object_group_id='123', progress_callback=ANY)
+        self.assertEqual(lm_session.resource_pkg_driver.onboard_package.call_args[0][0].name, res_pkg_path)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with('brent')
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': 'brent', 'url': 'http://brent:8443'})
      
+
+    def test_push_changed_only_skips_unchanged_res_pkg(self):
+        project_sim = self.simlab.simulate_brent_basic()
+        pkg = Project(project_sim.path).build(BuildOptions()).pkg
+        push_ledger = PushLedger()
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_rm({'name': 'brent', 'url': 'http://brent:8443'})
+        first_lm_session = lm_sim.as_mocked_session()
+        pkg.push(EnvironmentSessions(first_lm_session), PushOptions(changed_only=True, push_ledger=push_ledger))
+        first_lm_session.resource_pkg_driver.onboard_package.assert_called_once()
+        second_lm_session = lm_sim.as_mocked_session()
+        pkg.push(EnvironmentSessions(second_lm_session), PushOptions(changed_only=True, push_ledger=push_ledger))
+        second_lm_session.descriptor_driver.delete_descriptor.assert_not_called()
+        second_lm_session.resource_pkg_driver.delete_package.assert_not_called()
+        second_lm_session.resource_pkg_driver.onboard_package.assert_not_called()
+        second_lm_session.onboard_rm_driver.update_rm.assert_not_called()
+        self.assertEqual(push_ledger.skipped, ['resource-package:resource::basic::1.0'])
+
+    def test_push_without_changed_only_pushes_unchanged_res_pkg(self):
+        project_sim = self.simlab.simulate_brent_basic()
+        pkg = Project(project_sim.path).build(BuildOptions()).pkg
+        push_ledger = PushLedger()
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_rm({'name': 'brent', 'url': 'http://brent:8443'})
+        pkg.push(EnvironmentSessions(lm_sim.as_mocked_session()), PushOptions(push_ledger=push_ledger))
+        second_lm_session = lm_sim.as_mocked_session()
+        pkg.push(EnvironmentSessions(second_lm_session), PushOptions(push_ledger=push_ledger))
+        second_lm_session.resource_pkg_driver.onboard_package.assert_called_once()
+
+    def __replace_res_pkg(self, pkg_path, res_pkg_name, res_project_path):
+        """
+        Re-write a package with its Resource package replaced by the Definitions and Lifecycle of another project
+        """
+        res_pkg_buffer = io.BytesIO()
+        with zipfile.ZipFile(res_pkg_buffer, 'w') as res_pkg:
+            for directory in ['Definitions', 'Lifecycle']:
+                for root, dirs, filenames in os.walk(os.path.join(res_project_path, directory)):
+                    for filename in filenames:
+                        full_path = os.path.join(root, filename)
+                        res_pkg.write(full_path, arcname=os.path.relpath(full_path, res_project_path))
+        with tarfile.open(pkg_path, 'r:gz') as pkg_tar:
+            members = [(member, pkg_tar.extractfile(member).read() if member.isfile() else None) for member in pkg_tar]
+        with tarfile.open(pkg_path, 'w:gz') as pkg_tar:
+            for member, content in members:
+                if member.name.endswith(res_pkg_name):
+                    content = res_pkg_buffer.getvalue()
+                    member.size = len(content)
+                pkg_tar.addfile(member, io.BytesIO(content) if content is not None else None)
+
+    def __autocorrect_push_options(self):
+        push_options = PushOptions()
+        push_options.allow_autocorrect = True
+        return push_options
+
+    def test_push_reads_res_pkg_from_archive(self):
+        pkg_sim = self.simlab.simulate_pkg_brent_basic()
+        pkg = Pkg(pkg_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_rm({'name': 'brent', 'url': 'http://brent:8443'})
+        result = pkg.push(EnvironmentSessions(lm_sim.as_mocked_session()), self.__autocorrect_push_options())
+        res_pkg_path = os.path.join(result.tree.root_path, 'basic.zip')
+        # Nothing needed correcting, so the Resource package was never written to the workspace
+        self.assertEqual(result.content_files.deferred_paths, [res_pkg_path])
+        self.assertFalse(os.path.exists(res_pkg_path))
+
+    def test_push_with_autocorrect_writes_corrected_res_pkg(self):
+        project_sim = self.simlab.simulate_brent_basic()
+        pkg = Project(project_sim.path).build(BuildOptions()).pkg
+        res_project_path = self.simlab.simulate_brent_with_infrastructure_templates().path
+        descriptor_path = os.path.join(res_project_path, 'Definitions', 'lm', 'resource.yaml')
+        with open(descriptor_path, 'r') as f:
+            descriptor_content = f.read()
+        with open(descriptor_path, 'w') as f:
+            f.write('name: resource::basic::1.0\n' + descriptor_content)
+        self.__replace_res_pkg(pkg.path, 'basic.zip', res_project_path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_rm({'name': 'brent', 'url': 'http://brent:8443'})
+        lm_session = lm_sim.as_mocked_session()
+        result = pkg.push(EnvironmentSessions(lm_session), self.__autocorrect_push_options())
+        res_pkg_path = os.path.join(result.tree.root_path, 'basic.zip')
+        self.assertEqual(result.content_files.deferred_paths, [])
+        with zipfile.ZipFile(res_pkg_path) as res_pkg:
+            names = res_pkg.namelist()
+        self.assertNotIn('Definitions/infrastructure/openstack.yaml', names)
+        self.assertEqual(lm_session.resource_pkg_driver.onboard_package.call_args[0][0].name, res_pkg_path)
+
 class TestPushBrentSubprojects(ProjectSimTestCase):
 
     def test_push(self):
@@ -72,7 +167,8 @@ class TestPushBrentSubprojects(ProjectSimTestCase):
         res_pkg_path = os.path.join(result.tree.root_path, PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_BRENT_BASIC, 'sub_basic-contains_basic.zip')
         lm_session.descriptor_driver.delete_descriptor.assert_called_once_with('resource::sub_basic-contains_basic::1.0')
         lm_session.resource_pkg_driver.delete_package.assert_called_once_with('resource::sub_basic-contains_basic::1.0')
-        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path, object_group_id=None)
+        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(ANY, object_group_id=None, progress_callback=ANY)
+        self.assertEqual(lm_session.resource_pkg_driver.onboard_package.call_args[0][0].name, res_pkg_path)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with('brent')
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': 'brent', 'url': 'http://brent:8443'})
-        
\ No newline at end of file
+        
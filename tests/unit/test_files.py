@@ -3,8 +3,9 @@ import tempfile
 import os
 import shutil
 import tarfile
+from unittest.mock import patch
 
-from lmctl.files import safely_extract_tar
+from lmctl.files import safely_extract_tar, FileCopier, unshare_file, write_file_atomically, AUTO_STRATEGY, HARDLINK_STRATEGY, COPY_STRATEGY
 
 class TestFileUtils(unittest.TestCase):
 
@@ -60,4 +61,111 @@ class TestFileUtils(unittest.TestCase):
                 safely_extract_tar(tar, self.tmp_dir)
         
         expected_path_in_error = '..' + self.tmp_dir + os.sep + file_name
-        self.assertEqual(str(ctx.exception), f'TAR contains a file which attempts to traverse to a path outside of the target extraction path: {expected_path_in_error}')
\ No newline at end of file
+        self.assertEqual(str(ctx.exception), f'TAR contains a file which attempts to traverse to a path outside of the target extraction path: {expected_path_in_error}')
+
+class TestFileCopier(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.src_dir = os.path.join(self.tmp_dir, 'src')
+        os.makedirs(os.path.join(self.src_dir, 'Lifecycle', 'ansible'))
+        self.src_file = os.path.join(self.src_dir, 'Lifecycle', 'ansible', 'Install.yaml')
+        with open(self.src_file, 'w') as f:
+            f.write('install: true\n')
+        with open(os.path.join(self.src_dir, 'image.qcow2'), 'wb') as f:
+            f.write(os.urandom(1024))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __shares_content(self, path_a, path_b):
+        return os.stat(path_a).st_ino == os.stat(path_b).st_ino
+
+    def test_invalid_strategy(self):
+        with self.assertRaises(ValueError):
+            FileCopier('symlink')
+
+    def test_copy_strategy_copies(self):
+        copier = FileCopier(COPY_STRATEGY)
+        dest_file = os.path.join(self.tmp_dir, 'Install.yaml')
+        copier.copy_file(self.src_file, dest_file)
+        self.assertFalse(self.__shares_content(self.src_file, dest_file))
+        self.assertEqual(copier.bytes_copied, len('install: true\n'))
+        self.assertEqual(copier.bytes_linked, 0)
+
+    def test_hardlink_strategy_links_file(self):
+        copier = FileCopier(HARDLINK_STRATEGY)
+        dest_file = os.path.join(self.tmp_dir, 'Install.yaml')
+        with open(dest_file, 'w') as f:
+            f.write('existing')
+        copier.copy_file(self.src_file, dest_file)
+        self.assertTrue(self.__shares_content(self.src_file, dest_file))
+        self.assertEqual(copier.bytes_copied, 0)
+        self.assertEqual(copier.bytes_linked, len('install: true\n'))
+
+    def test_hardlink_strategy_links_tree(self):
+        copier = FileCopier(HARDLINK_STRATEGY)
+        dest_dir = os.path.join(self.tmp_dir, 'dest')
+        copier.copy_tree(self.src_dir, dest_dir)
+        self.assertTrue(self.__shares_content(self.src_file, os.path.join(dest_dir, 'Lifecycle', 'ansible', 'Install.yaml')))
+        self.assertTrue(self.__shares_content(os.path.join(self.src_dir, 'image.qcow2'), os.path.join(dest_dir, 'image.qcow2')))
+        self.assertEqual(copier.bytes_linked, 1024 + len('install: true\n'))
+
+    def test_falls_back_to_copy(self):
+        copier = FileCopier(AUTO_STRATEGY)
+        dest_dir = os.path.join(self.tmp_dir, 'dest')
+        with patch('lmctl.files._reflink', side_effect=OSError('Not supported')), patch('lmctl.files.os.link', side_effect=OSError('Cross-device link')) as mock_link:
+            copier.copy_tree(self.src_dir, dest_dir)
+        # A strategy which fails is not attempted again
+        self.assertEqual(mock_link.call_count, 1)
+        dest_file = os.path.join(dest_dir, 'Lifecycle', 'ansible', 'Install.yaml')
+        self.assertFalse(self.__shares_content(self.src_file, dest_file))
+        with open(dest_file, 'r') as f:
+            self.assertEqual(f.read(), 'install: true\n')
+        self.assertEqual(copier.bytes_copied, 1024 + len('install: true\n'))
+
+    def test_unshare_file(self):
+        dest_file = os.path.join(self.tmp_dir, 'Install.yaml')
+        FileCopier(HARDLINK_STRATEGY).copy_file(self.src_file, dest_file)
+        unshare_file(dest_file)
+        self.assertFalse(os.path.exists(dest_file))
+        self.assertTrue(os.path.exists(self.src_file))
+        # Files with no other links are left as they are
+        unshare_file(self.src_file)
+        self.assertTrue(os.path.exists(self.src_file))
+
+class TestWriteFileAtomically(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'entry.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_writes_content(self):
+        write_file_atomically(self.path, lambda f: f.write('content'))
+        with open(self.path, 'r') as f:
+            self.assertEqual(f.read(), 'content')
+        self.assertEqual(os.listdir(self.tmp_dir), ['entry.json'])
+
+    def test_writes_binary_content(self):
+        write_file_atomically(self.path, lambda f: f.write(b'\x00\x01'), binary=True)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), b'\x00\x01')
+
+    def test_applies_mode(self):
+        write_file_atomically(self.path, lambda f: f.write('secret'), mode=0o600)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+    def test_failed_write_leaves_existing_file_and_no_temp_file(self):
+        with open(self.path, 'w') as f:
+            f.write('original')
+        def fail(f):
+            f.write('partial')
+            raise ValueError('write failed')
+        with self.assertRaises(ValueError):
+            write_file_atomically(self.path, fail)
+        with open(self.path, 'r') as f:
+            self.assertEqual(f.read(), 'original')
+        self.assertEqual(os.listdir(self.tmp_dir), ['entry.json'])
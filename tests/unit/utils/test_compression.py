@@ -0,0 +1,139 @@
+import io
+import os
+import gzip
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from lmctl.utils.compression import ParallelGzipWriter, ArchiveCompression, is_compressible, MIN_SAMPLED_FILE_SIZE
+
+COMPRESSIBLE_CONTENT = b'lifecycle: Install\n' * 200000
+INCOMPRESSIBLE_CONTENT = os.urandom(2 * MIN_SAMPLED_FILE_SIZE)
+
+
+class TestParallelGzipWriter(unittest.TestCase):
+
+    def __write(self, chunks, **kwargs):
+        buffer = io.BytesIO()
+        writer = ParallelGzipWriter(buffer, **kwargs)
+        for chunk in chunks:
+            if isinstance(chunk, int):
+                writer.set_level(chunk)
+            else:
+                writer.write(chunk)
+        writer.close()
+        return buffer.getvalue()
+
+    def test_output_is_standard_gzip(self):
+        content = INCOMPRESSIBLE_CONTENT + COMPRESSIBLE_CONTENT
+        compressed = self.__write([content], workers=4, block_size=64 * 1024)
+        self.assertEqual(gzip.decompress(compressed), content)
+        self.assertLess(len(compressed), len(content))
+
+    def test_output_is_the_same_size_as_one_stream(self):
+        compressed = self.__write([COMPRESSIBLE_CONTENT], level=6, workers=4)
+        # The window of each block is primed with the previous block, so little is lost by splitting the content
+        self.assertLess(len(compressed), len(gzip.compress(COMPRESSIBLE_CONTENT, compresslevel=6)) * 1.05)
+
+    def test_single_worker(self):
+        compressed = self.__write([COMPRESSIBLE_CONTENT], workers=1, block_size=64 * 1024)
+        self.assertEqual(gzip.decompress(compressed), COMPRESSIBLE_CONTENT)
+
+    def test_empty(self):
+        self.assertEqual(gzip.decompress(self.__write([])), b'')
+
+    def test_set_level_stores_content(self):
+        stored = self.__write([0, COMPRESSIBLE_CONTENT], workers=2)
+        compressed = self.__write([COMPRESSIBLE_CONTENT], workers=2)
+        self.assertEqual(gzip.decompress(stored), COMPRESSIBLE_CONTENT)
+        self.assertGreater(len(stored), len(COMPRESSIBLE_CONTENT))
+        self.assertLess(len(compressed), len(COMPRESSIBLE_CONTENT) / 10)
+
+    def test_error_while_writing_propagates(self):
+        buffer = io.BytesIO()
+        with self.assertRaises(ValueError):
+            with ParallelGzipWriter(buffer, workers=2, block_size=64 * 1024) as writer:
+                writer.write(COMPRESSIBLE_CONTENT)
+                raise ValueError('Failed')
+
+    def test_set_level_between_writes(self):
+        content = [b'start', 0, INCOMPRESSIBLE_CONTENT, 9, COMPRESSIBLE_CONTENT, 1, b'end']
+        compressed = self.__write(content, workers=3, block_size=100000)
+        self.assertEqual(gzip.decompress(compressed), b'start' + INCOMPRESSIBLE_CONTENT + COMPRESSIBLE_CONTENT + b'end')
+
+
+class TestArchiveCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.compressible_path = self.__write('Install.yaml', COMPRESSIBLE_CONTENT)
+        self.incompressible_path = self.__write('image.qcow2', INCOMPRESSIBLE_CONTENT)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __write(self, name, content):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def test_is_compressible(self):
+        self.assertTrue(is_compressible(self.compressible_path))
+        self.assertFalse(is_compressible(self.incompressible_path))
+        self.assertTrue(is_compressible(self.__write('small.bin', os.urandom(1024))))
+
+    def test_invalid_level(self):
+        with self.assertRaises(ValueError):
+            ArchiveCompression(level=10)
+
+    def test_default_compresses_every_file(self):
+        compression = ArchiveCompression()
+        self.assertFalse(compression.store_incompressible)
+        self.assertEqual(compression.gzip_level_for(self.incompressible_path), 9)
+        self.assertEqual(compression.gzip_level_for(self.compressible_path), 9)
+
+    def test_level_stores_incompressible_files(self):
+        compression = ArchiveCompression(level=6)
+        self.assertTrue(compression.store_incompressible)
+        self.assertEqual(compression.gzip_level_for(self.incompressible_path), 0)
+        self.assertEqual(compression.gzip_level_for(self.compressible_path), 6)
+        self.assertEqual(ArchiveCompression(store_incompressible=True).gzip_level_for(self.incompressible_path), 0)
+
+    def test_tgz(self):
+        pkg_path = os.path.join(self.tmp_dir, 'pkg.tgz')
+        with ArchiveCompression(level=9, workers=2).open_tgz(pkg_path) as pkg_tar:
+            pkg_tar.add(self.compressible_path, arcname='Install.yaml')
+            pkg_tar.add(self.incompressible_path, arcname='image.qcow2')
+        # Already compressed content is stored, so adds little more than its own size
+        self.assertLess(os.path.getsize(pkg_path), len(INCOMPRESSIBLE_CONTENT) + len(COMPRESSIBLE_CONTENT) / 10)
+        for mode in ['r:gz', 'r|gz']:
+            with tarfile.open(pkg_path, mode=mode) as pkg_tar:
+                contents = {member.name: pkg_tar.extractfile(member).read() for member in pkg_tar}
+            self.assertEqual(contents, {'Install.yaml': COMPRESSIBLE_CONTENT, 'image.qcow2': INCOMPRESSIBLE_CONTENT})
+
+    def test_zip_stored_by_default(self):
+        zip_path = os.path.join(self.tmp_dir, 'res.zip')
+        with ArchiveCompression().open_zip(zip_path) as res_zip:
+            res_zip.write(self.compressible_path, arcname='Install.yaml')
+        with zipfile.ZipFile(zip_path) as res_zip:
+            self.assertEqual(res_zip.getinfo('Install.yaml').compress_type, zipfile.ZIP_STORED)
+
+    def test_zip_with_level(self):
+        zip_path = os.path.join(self.tmp_dir, 'res.zip')
+        with ArchiveCompression(level=1).open_zip(zip_path) as res_zip:
+            res_zip.write(self.tmp_dir, arcname='Lifecycle')
+            res_zip.write(self.compressible_path, arcname='Lifecycle/Install.yaml')
+            res_zip.write(self.incompressible_path, arcname='Lifecycle/image.qcow2')
+        with zipfile.ZipFile(zip_path) as res_zip:
+            self.assertEqual(res_zip.getinfo('Lifecycle/Install.yaml').compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(res_zip.getinfo('Lifecycle/image.qcow2').compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(res_zip.read('Lifecycle/Install.yaml'), COMPRESSIBLE_CONTENT)
+
+    def test_zip_with_level_0(self):
+        zip_path = os.path.join(self.tmp_dir, 'res.zip')
+        with ArchiveCompression(level=0).open_zip(zip_path) as res_zip:
+            res_zip.write(self.compressible_path, arcname='Install.yaml')
+        with zipfile.ZipFile(zip_path) as res_zip:
+            self.assertEqual(res_zip.getinfo('Install.yaml').compress_type, zipfile.ZIP_STORED)
@@ -0,0 +1,51 @@
+import unittest
+import tempfile
+import shutil
+import os
+from lmctl.utils.descriptors import DescriptorParser, DescriptorParsingError
+
+DESCRIPTOR_YAML = """\
+name: assembly::test::1.0
+description: test descriptor
+properties:
+  deploymentLocation:
+    type: string
+    required: true
+composition:
+  first:
+    type: resource::first::1.0
+"""
+
+class TestDescriptorParser(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.descriptor_path = os.path.join(self.tmp_dir, 'assembly.yml')
+        with open(self.descriptor_path, 'w') as f:
+            f.write(DESCRIPTOR_YAML)
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def test_read_only_matches_round_trip(self):
+        round_trip = DescriptorParser().read_from_file(self.descriptor_path)
+        read_only = DescriptorParser(read_only=True).read_from_file(self.descriptor_path)
+        self.assertEqual(read_only.get_name(), 'assembly::test::1.0')
+        self.assertEqual(read_only.get_split_name(), round_trip.get_split_name())
+        self.assertEqual(read_only.raw, round_trip.raw)
+        self.assertIs(type(read_only.raw), dict)
+
+    def test_read_only_with_raw(self):
+        descriptor, descriptor_yml_str = DescriptorParser(read_only=True).read_from_file_with_raw(self.descriptor_path)
+        self.assertEqual(descriptor.description, 'test descriptor')
+        self.assertEqual(descriptor_yml_str, DESCRIPTOR_YAML)
+
+    def test_read_only_empty_descriptor(self):
+        descriptor = DescriptorParser(read_only=True).read_from_str('')
+        self.assertEqual(descriptor.raw, {'description': None})
+
+    def test_read_only_invalid_yaml(self):
+        with self.assertRaises(DescriptorParsingError):
+            DescriptorParser(read_only=True).read_from_str('name: [unclosed')
+
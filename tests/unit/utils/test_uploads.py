@@ -0,0 +1,113 @@
+import io
+import os
+import tempfile
+import unittest
+import requests
+from lmctl.utils.uploads import UploadStream, MultipartEncoder, UploadProgressReporter, format_size
+
+class TestUploadStream(unittest.TestCase):
+
+    def test_reads_segments_in_order(self):
+        stream = UploadStream([b'start-', (io.BytesIO(b'middle'), 6), b'-end'])
+        self.assertEqual(len(stream), 16)
+        self.assertEqual(stream.read(), b'start-middle-end')
+        self.assertEqual(stream.read(), b'')
+
+    def test_reads_in_chunks_across_segments(self):
+        stream = UploadStream([b'abc', (io.BytesIO(b'defgh'), 5), b'ij'])
+        chunks = []
+        while True:
+            chunk = stream.read(4)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        self.assertEqual(chunks, [b'abcd', b'efgh', b'ij'])
+
+    def test_for_file_streams_remaining_content(self):
+        file_obj = io.BytesIO(b'skip-content')
+        file_obj.seek(5)
+        stream = UploadStream.for_file(file_obj)
+        self.assertEqual(len(stream), 7)
+        self.assertEqual(b''.join(stream), b'content')
+
+    def test_seek_and_tell_allow_rewind(self):
+        stream = UploadStream([b'abc', (io.BytesIO(b'def'), 3)])
+        self.assertEqual(stream.read(4), b'abcd')
+        self.assertEqual(stream.tell(), 4)
+        stream.seek(0)
+        self.assertEqual(stream.read(), b'abcdef')
+        stream.seek(-2, os.SEEK_END)
+        self.assertEqual(stream.read(), b'ef')
+
+    def test_reports_progress(self):
+        progress = []
+        stream = UploadStream([b'abc', (io.BytesIO(b'def'), 3)], progress_callback=lambda sent, total: progress.append((sent, total)))
+        stream.read(2)
+        stream.read(2)
+        stream.read(2)
+        stream.read(2)
+        self.assertEqual(progress, [(2, 6), (4, 6), (6, 6)])
+
+    def test_reads_large_file_without_loading_it(self):
+        with tempfile.TemporaryFile() as large_file:
+            large_file.truncate(10 * 1024 * 1024)
+            stream = UploadStream.for_file(large_file)
+            self.assertEqual(len(stream), 10 * 1024 * 1024)
+            largest_chunk = max(len(chunk) for chunk in stream)
+            self.assertLessEqual(largest_chunk, 1024 * 1024)
+
+
+class TestMultipartEncoder(unittest.TestCase):
+
+    def _requests_body(self, data, files, boundary):
+        body, content_type = requests.models.RequestEncodingMixin._encode_files(files, data)
+        requests_boundary = content_type.split('boundary=')[1]
+        return body.replace(requests_boundary.encode(), boundary.encode())
+
+    def test_matches_requests_encoding_of_file(self):
+        file_obj = io.BytesIO(b'zip-content')
+        file_obj.name = '/tmp/example/package.zip'
+        expected_body = self._requests_body({}, {'file': file_obj}, 'test-boundary')
+        file_obj.seek(0)
+        encoder = MultipartEncoder({}, files={'file': file_obj}, boundary='test-boundary')
+        self.assertEqual(encoder.read(), expected_body)
+        self.assertEqual(encoder.content_type, 'multipart/form-data; boundary=test-boundary')
+
+    def test_matches_requests_encoding_of_fields_and_file_tuple(self):
+        fields = {'resource_name': 'example', 'resource_version': '1.0'}
+        files = {'upfile': ('example.csar', io.BytesIO(b'csar-content'), 'application/zip')}
+        expected_body = self._requests_body(fields, files, 'test-boundary')
+        files['upfile'][1].seek(0)
+        encoder = MultipartEncoder(fields, files=files, boundary='test-boundary')
+        self.assertEqual(encoder.read(), expected_body)
+
+    def test_len_matches_content(self):
+        encoder = MultipartEncoder({'name': 'value'}, files={'file': ('a.zip', io.BytesIO(b'123456789'))})
+        self.assertEqual(len(encoder), len(encoder.read()))
+
+
+class TestUploadProgressReporter(unittest.TestCase):
+
+    def test_reports_each_step(self):
+        messages = []
+        reporter = UploadProgressReporter(messages.append, 'package.zip', step=25)
+        for sent in range(0, 101, 5):
+            reporter(sent, 100)
+        self.assertEqual(messages, [
+            'Uploading package.zip: 25% (25 B of 100 B)',
+            'Uploading package.zip: 50% (50 B of 100 B)',
+            'Uploading package.zip: 75% (75 B of 100 B)',
+            'Uploading package.zip: 100% (100 B of 100 B)'
+        ])
+
+    def test_reports_once_for_large_reads(self):
+        messages = []
+        reporter = UploadProgressReporter(messages.append, 'package.zip')
+        reporter(100, 100)
+        reporter(100, 100)
+        self.assertEqual(messages, ['Uploading package.zip: 100% (100 B of 100 B)'])
+
+    def test_format_size(self):
+        self.assertEqual(format_size(512), '512 B')
+        self.assertEqual(format_size(2048), '2.0 KB')
+        self.assertEqual(format_size(2 * 1024 * 1024 * 1024), '2.0 GB')